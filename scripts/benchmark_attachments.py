@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+"""
+Throughput benchmark of Jira attachment downloads.
+
+Serves the attachments of one issue from a local HTTP stand-in that adds a
+fixed latency to every response, and downloads them with the attachments
+mixin. Reports the mean and p95 time per round and the throughput for:
+
+- sync: download_issue_attachments, one file after another
+- async: download_issue_attachments_async, files downloaded concurrently
+- unchanged: a second async download into the same directory, where the
+  manifest lets every file be skipped
+
+Each sync and async round downloads into a fresh directory. With --baseline,
+the sync workload also runs against the AttachmentsMixin of another git
+revision (e.g. the commit before the transfer engine).
+
+Usage:
+    uv run python scripts/benchmark_attachments.py [--files 20] [--size-kb 512]
+        [--latency-ms 50] [--repeat 5] [--baseline REV]
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import tempfile
+import threading
+import time
+import types
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import anyio
+import requests
+
+from mcp_atlassian.jira.attachments import AttachmentsMixin
+from mcp_atlassian.jira.config import JiraConfig
+
+
+def make_handler(files: dict[str, bytes], latency: float) -> type:
+    """Build a request handler serving files by id, honouring Range headers."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802 - http.server API
+            time.sleep(latency)
+            body = files.get(self.path.rsplit("/", 1)[-1])
+            if body is None:
+                self.send_error(404)
+                return
+            status = 200
+            match = re.fullmatch(r"bytes=(\d+)-", self.headers.get("Range", ""))
+            if match:
+                body = body[int(match.group(1)) :]
+                status = 206
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+            pass
+
+    return Handler
+
+
+class StandInJira:
+    """Jira client stand-in listing the attachments served by the stand-in."""
+
+    def __init__(self, base_url: str, files: dict[str, bytes]) -> None:
+        self._session = requests.Session()
+        self.attachments = [
+            {
+                "id": attachment_id,
+                "filename": f"file-{attachment_id}.bin",
+                "content": f"{base_url}/attachment/{attachment_id}",
+                "size": len(body),
+                "created": "2024-01-01T10:00:00.000+0000",
+            }
+            for attachment_id, body in files.items()
+        ]
+
+    def issue(self, issue_key: str, fields: str) -> dict[str, Any]:
+        return {"fields": {"attachment": self.attachments}}
+
+
+def load_baseline(revision: str) -> type:
+    """Load AttachmentsMixin as it was at a git revision."""
+    source = subprocess.run(  # noqa: S603
+        ["git", "show", f"{revision}:src/mcp_atlassian/jira/attachments.py"],  # noqa: S607
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    module = types.ModuleType("baseline_attachments")
+    module.__package__ = "mcp_atlassian.jira"
+    exec(compile(source, f"{revision}:attachments.py", "exec"), module.__dict__)  # noqa: S102
+    return module.AttachmentsMixin
+
+
+def build_mixin(mixin_class: type, jira: StandInJira) -> Any:
+    """Create an attachments mixin wired to the stand-in client."""
+    mixin = mixin_class.__new__(mixin_class)
+    mixin.config = JiraConfig(url="https://example.atlassian.net", auth_type="basic")
+    mixin.jira = jira
+    return mixin
+
+
+def measure(func: Callable[[], object], repeat: int) -> tuple[float, float]:
+    """Return the mean and p95 time of func in milliseconds."""
+    func()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return (
+        statistics.mean(timings) * 1000,
+        timings[int(len(timings) * 0.95)] * 1000,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=20, help="Attachments")
+    parser.add_argument("--size-kb", type=int, default=512, help="Attachment size")
+    parser.add_argument(
+        "--latency-ms", type=float, default=50, help="Latency per response"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Timed rounds")
+    parser.add_argument(
+        "--baseline", help="Git revision to compare against, e.g. HEAD~1"
+    )
+    args = parser.parse_args()
+
+    files = {
+        str(10000 + n): bytes([n % 256]) * (args.size_kb * 1024)
+        for n in range(args.files)
+    }
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0), make_handler(files, args.latency_ms / 1000)
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    jira = StandInJira(f"http://127.0.0.1:{server.server_address[1]}", files)
+    total_mb = args.files * args.size_kb / 1024
+
+    def sync_round(mixin: Any) -> Callable[[], object]:
+        def run() -> None:
+            with tempfile.TemporaryDirectory() as target_dir:
+                mixin.download_issue_attachments("BENCH-1", target_dir)
+
+        return run
+
+    def async_round(mixin: Any) -> Callable[[], object]:
+        def run() -> None:
+            with tempfile.TemporaryDirectory() as target_dir:
+                anyio.run(mixin.download_issue_attachments_async, "BENCH-1", target_dir)
+
+        return run
+
+    current = build_mixin(AttachmentsMixin, jira)
+    workloads = {"sync": sync_round(current), "async": async_round(current)}
+    if args.baseline:
+        baseline = build_mixin(load_baseline(args.baseline), jira)
+        workloads[f"sync {args.baseline}"] = sync_round(baseline)
+
+    with tempfile.TemporaryDirectory() as warm_dir:
+        anyio.run(current.download_issue_attachments_async, "BENCH-1", warm_dir)
+        workloads["unchanged"] = lambda: anyio.run(
+            current.download_issue_attachments_async, "BENCH-1", warm_dir
+        )
+
+        print(f"{'workload':<16} {'mean ms':>9} {'p95 ms':>9} {'MB/s':>9}")
+        for name, func in workloads.items():
+            mean_ms, p95_ms = measure(func, args.repeat)
+            throughput = total_mb / (mean_ms / 1000)
+            print(f"{name:<16} {mean_ms:>9.2f} {p95_ms:>9.2f} {throughput:>9.1f}")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+"""
+Benchmark of Confluence search result processing at large limits.
+
+Runs SearchMixin.search against a stand-in client that returns a canned CQL
+response, then serializes every result as the search tool does, and
+reports the mean and p95 time per round. Each excerpt mentions a user, so
+user lookups are counted as well: the stand-in answers the bulk user API
+and the per-user endpoints and records how many requests were made.
+
+With --baseline, the same workload also runs against the SearchMixin of
+another git revision (e.g. the commit before excerpt matching changed).
+
+Usage:
+    uv run python scripts/benchmark_confluence_search.py [--limit 250]
+        [--repeat 20] [--converter markdownify|lxml] [--baseline REV]
+"""
+
+import argparse
+import statistics
+import subprocess
+import time
+import types
+from collections.abc import Callable
+from typing import Any
+
+from mcp_atlassian.confluence.config import ConfluenceConfig
+from mcp_atlassian.confluence.search import SearchMixin
+from mcp_atlassian.preprocessing.confluence import ConfluencePreprocessor
+
+EXCERPT = (
+    "Rollout of <b>api_gateway</b> in @@@hl@@@eu-west-1@@@endhl@@@ by "
+    '<ac:link><ri:user ri:account-id="user-{user}" /></ac:link> &hellip; see '
+    '<a href="https://example.com/runbooks/{n}">runbook {n}</a>'
+)
+
+
+class StandInConfluence:
+    """Confluence client stand-in returning a canned CQL response."""
+
+    cloud = True
+
+    def __init__(self, limit: int) -> None:
+        self.requests = 0
+        self.response = {
+            "results": [
+                {
+                    "content": {
+                        "id": str(100000 + n),
+                        "type": "page",
+                        "title": f"Rollout {n}",
+                        "space": {"key": "OPS", "name": "Operations"},
+                        "version": {"number": 3},
+                    },
+                    "excerpt": EXCERPT.format(n=n, user=n % 40),
+                    "url": f"/spaces/OPS/pages/{100000 + n}",
+                }
+                for n in range(limit)
+            ],
+            "start": 0,
+            "limit": limit,
+            "size": limit,
+            "totalSize": limit,
+        }
+
+    def cql(self, cql: str, limit: int = 10, **kwargs: Any) -> dict[str, Any]:
+        self.requests += 1
+        return self.response
+
+    def get(self, path: str, params: dict[str, Any]) -> dict[str, Any]:
+        self.requests += 1
+        ids = params["accountId"].split(",")
+        return {"results": [{"accountId": a, "displayName": a.title()} for a in ids]}
+
+    def get_user_details_by_accountid(self, account_id: str) -> dict[str, Any]:
+        self.requests += 1
+        return {"displayName": account_id.title()}
+
+
+def load_baseline(revision: str) -> type:
+    """Load SearchMixin as it was at a git revision."""
+    source = subprocess.run(  # noqa: S603
+        ["git", "show", f"{revision}:src/mcp_atlassian/confluence/search.py"],  # noqa: S607
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    module = types.ModuleType("baseline_search")
+    module.__package__ = "mcp_atlassian.confluence"
+    exec(compile(source, f"{revision}:search.py", "exec"), module.__dict__)  # noqa: S102
+    return module.SearchMixin
+
+
+def build_mixin(mixin_class: type, limit: int, converter: str) -> Any:
+    """Create a search mixin wired to the stand-in client."""
+    mixin = mixin_class.__new__(mixin_class)
+    mixin.config = ConfluenceConfig(
+        url="https://example.atlassian.net/wiki", auth_type="basic"
+    )
+    mixin.confluence = StandInConfluence(limit)
+    mixin.preprocessor = ConfluencePreprocessor(
+        base_url=mixin.config.url, content_converter=converter
+    )
+    return mixin
+
+
+def measure(func: Callable[[], object], repeat: int) -> tuple[float, float]:
+    """Return the mean and p95 time of func in milliseconds."""
+    func()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return (
+        statistics.mean(timings) * 1000,
+        timings[int(len(timings) * 0.95)] * 1000,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--limit", type=int, default=250, help="Search results")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed rounds")
+    parser.add_argument(
+        "--converter",
+        choices=["markdownify", "lxml"],
+        default="markdownify",
+        help="Excerpt to Markdown converter",
+    )
+    parser.add_argument(
+        "--baseline", help="Git revision to compare against, e.g. HEAD~1"
+    )
+    args = parser.parse_args()
+
+    candidates = {"current": SearchMixin}
+    if args.baseline:
+        candidates[args.baseline] = load_baseline(args.baseline)
+
+    print(f"{'version':<10} {'mean ms':>9} {'p95 ms':>9} {'requests':>9}")
+    for name, mixin_class in candidates.items():
+        mixin = build_mixin(mixin_class, args.limit, args.converter)
+
+        def run(mixin: Any = mixin) -> None:
+            for page in mixin.search("text ~ rollout", limit=args.limit):
+                page.to_simplified_dict()
+
+        # Count the requests of one cold round, before the user cache is warm
+        run()
+        cold_requests = mixin.confluence.requests
+        mean_ms, p95_ms = measure(run, args.repeat)
+        print(f"{name:<10} {mean_ms:>9.2f} {p95_ms:>9.2f} {cold_requests:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+"""
+Throughput benchmark for the Jira wiki markup <-> Markdown converter.
+
+Runs three workloads and reports the mean and p95 time per round:
+
+- large description: one ~200 KB Jira description to Markdown
+- 100-issue convert / clean: jira_to_markdown and the full clean_jira_text
+  (mentions, smart links and HTML cleanup included) over the descriptions
+  and comments of a 100-issue search result
+- markdown to jira: one ~200 KB Markdown document to Jira markup
+
+With --baseline, the same workloads also run against the JiraPreprocessor of
+another git revision (e.g. the commit before the converter was replaced).
+
+Usage:
+    uv run python scripts/benchmark_jira_markup.py [--repeat 20] [--baseline REV]
+"""
+
+import argparse
+import statistics
+import subprocess
+import time
+import types
+from collections.abc import Callable
+
+from mcp_atlassian.preprocessing.jira import JiraPreprocessor
+
+JIRA_SECTION = """h2. Steps to reproduce
+# Open the *Settings* page as [~accountid:5b10a2844c20165700ede21g]
+# Click _Save_ without changes, see [PROJ-12|https://example.atlassian.net/browse/PROJ-12|smart-link]
+## Observe the {{ERR-42}} error
+* check the +logs+ and ??runbooks??
+
+||Component||Owner||Status||
+|API|alice|done|
+|UI|bob|{color:red}blocked{color}|
+
+{code:python}
+def handler(event, context):
+    return {"status": 200, "body": event["body"] * 2}
+{code}
+
+{quote}
+The export fails every night with !error.png|alt=Error dialog!.
+{quote}
+See [the runbook|https://wiki.example.com/rb] and [https://status.example.com].
+"""
+
+MARKDOWN_SECTION = """## Steps to reproduce
+1. Open the **Settings** page
+2. Click *Save* without changes
+    1. Observe the `ERR-42` error
+- check the <ins>logs</ins>
+
+|Component|Owner|Status|
+|---|---|---|
+|API|alice|done|
+
+```python
+def handler(event, context):
+    return {"status": 200}
+```
+
+See [the runbook](https://wiki.example.com/runbook) and <https://status.example.com>.
+"""
+
+COMMENT = (
+    "Thanks *Bob*, merged in [PR-7|https://git.example.com/pr/7]. {{make test}} passes."
+)
+
+
+def load_baseline(revision: str) -> type:
+    """Load JiraPreprocessor as it was at a git revision."""
+    source = subprocess.run(  # noqa: S603
+        ["git", "show", f"{revision}:src/mcp_atlassian/preprocessing/jira.py"],  # noqa: S607
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    module = types.ModuleType("baseline_jira")
+    module.__package__ = "mcp_atlassian.preprocessing"
+    exec(compile(source, f"{revision}:jira.py", "exec"), module.__dict__)  # noqa: S102
+    return module.JiraPreprocessor
+
+
+def measure(func: Callable[[], object], repeat: int) -> tuple[float, float]:
+    """Return the mean and p95 time of func in milliseconds."""
+    func()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return (
+        statistics.mean(timings) * 1000,
+        timings[int(len(timings) * 0.95)] * 1000,
+    )
+
+
+def workloads(preprocessor: JiraPreprocessor) -> dict[str, Callable[[], object]]:
+    """Build the benchmark workloads for a preprocessor."""
+    description = JIRA_SECTION * 250
+    document = MARKDOWN_SECTION * 300
+    issues = [(JIRA_SECTION * 3, [COMMENT] * 5) for _ in range(100)]
+
+    def search_results(convert: Callable[[str], str]) -> None:
+        for issue_description, comments in issues:
+            convert(issue_description)
+            for comment in comments:
+                convert(comment)
+
+    return {
+        "large description": lambda: preprocessor.jira_to_markdown(description),
+        "100-issue convert": lambda: search_results(preprocessor.jira_to_markdown),
+        "100-issue clean": lambda: search_results(preprocessor.clean_jira_text),
+        "markdown to jira": lambda: preprocessor.markdown_to_jira(document),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20, help="Timed rounds")
+    parser.add_argument(
+        "--baseline", help="Git revision to compare against, e.g. HEAD~1"
+    )
+    args = parser.parse_args()
+
+    candidates = {"current": JiraPreprocessor()}
+    if args.baseline:
+        candidates[args.baseline] = load_baseline(args.baseline)()
+
+    print(f"{'workload':<20} {'version':<10} {'mean ms':>9} {'p95 ms':>9}")
+    results = {name: workloads(p) for name, p in candidates.items()}
+    for workload in results["current"]:
+        for name, funcs in results.items():
+            mean_ms, p95_ms = measure(funcs[workload], args.repeat)
+            print(f"{workload:<20} {name:<10} {mean_ms:>9.2f} {p95_ms:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+"""
+Throughput benchmark for the Confluence storage format converters.
+
+Runs each workload with the markdownify and lxml converters of
+process_html_content and reports the mean and p95 time per round:
+
+- large page: one storage format page of about --size MB to Markdown
+- large page html: the same page with only the HTML representation
+- 50-page space: 50 pages of about 40 KB each to Markdown
+- 250 excerpts: the short excerpts of a 250-result search to Markdown
+
+Pages mix headings, paragraphs with user mentions, tables, lists, code and
+panel macros, task lists and layouts, as found in runbooks and design docs.
+Mentioned users are served from the preprocessor cache, so no API requests
+are made.
+
+Usage:
+    uv run python scripts/benchmark_storage_markdown.py [--repeat 10] [--size 2]
+"""
+
+import argparse
+import statistics
+import time
+from collections.abc import Callable
+
+from mcp_atlassian.preprocessing.confluence import ConfluencePreprocessor
+
+ACCOUNT_IDS = [f"5b10a2844c20165700ede2{i:02d}" for i in range(20)]
+
+STORAGE_SECTION = """<h2>Rollout {n}</h2>
+<p>Owner: <ac:link><ri:user ri:account-id="{account_id}" /></ac:link>, reviewed by
+<ac:structured-macro ac:name="profile"><ac:parameter ac:name="user">
+<ri:user ri:account-id="{reviewer}" /></ac:parameter></ac:structured-macro>.
+Status <ac:structured-macro ac:name="status"><ac:parameter ac:name="title">IN PROGRESS
+</ac:parameter></ac:structured-macro>, see <a href="https://example.com/runbooks/{n}">the
+runbook</a> and <ac:link><ri:page ri:content-title="Deploy checklist" /></ac:link>.</p>
+<ac:structured-macro ac:name="info"><ac:parameter ac:name="title">Before you start
+</ac:parameter><ac:rich-text-body><p>Freeze <strong>merges</strong> to <code>main</code>
+and announce the window in <em>#deployments</em>.</p></ac:rich-text-body>
+</ac:structured-macro>
+<table><tbody><tr><th>Service</th><th>Region</th><th>Version</th><th>Result</th></tr>
+<tr><td>api_gateway</td><td>eu-west-1</td><td>2.14.{n}</td><td>ok</td></tr>
+<tr><td>billing</td><td>us-east-1</td><td>7.2.{n}</td><td><s>failed</s> rerun</td></tr>
+<tr><td>search</td><td>ap-south-1</td><td>1.0.{n}</td><td>ok</td></tr></tbody></table>
+<ol><li>Drain the <b>canary</b> pool<ul><li>check error rates</li>
+<li>check p99 latency</li></ul></li><li>Promote the build</li></ol>
+<ac:structured-macro ac:name="code"><ac:parameter ac:name="language">bash
+</ac:parameter><ac:plain-text-body><![CDATA[kubectl rollout status deploy/api -n prod
+if [ "$?" -ne 0 ]; then echo "<rollback>" && exit 1; fi]]></ac:plain-text-body>
+</ac:structured-macro>
+<ac:task-list><ac:task><ac:task-id>{n}</ac:task-id>
+<ac:task-status>incomplete</ac:task-status><ac:task-body>Update the
+<a href="https://status.example.com">status page</a></ac:task-body></ac:task>
+</ac:task-list>
+<ac:layout><ac:layout-section ac:type="two_equal"><ac:layout-cell><p>Notes
+<br />left</p></ac:layout-cell><ac:layout-cell><p>Notes right</p></ac:layout-cell>
+</ac:layout-section></ac:layout>
+"""
+
+EXCERPT = (
+    "Rollout of <b>api_gateway</b> to eu-west-1 by "
+    '<ac:link><ri:user ri:account-id="{account_id}" /></ac:link> &hellip;'
+)
+
+
+def storage_page(size: int) -> str:
+    """Build a storage format page of about size bytes."""
+    sections = []
+    total = 0
+    n = 0
+    while total < size:
+        section = STORAGE_SECTION.format(
+            n=n,
+            account_id=ACCOUNT_IDS[n % len(ACCOUNT_IDS)],
+            reviewer=ACCOUNT_IDS[(n + 7) % len(ACCOUNT_IDS)],
+        )
+        sections.append(section)
+        total += len(section)
+        n += 1
+    return "".join(sections)
+
+
+class CachedUsersClient:
+    """Confluence client stand-in; every mentioned user is already cached."""
+
+    def get_user_details_by_accountid(self, account_id: str) -> dict:
+        return {}
+
+    def get_user_details_by_username(self, username: str) -> dict:
+        return {}
+
+
+def measure(func: Callable[[], object], repeat: int) -> tuple[float, float]:
+    """Return the mean and p95 time of func in milliseconds."""
+    func()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return (
+        statistics.mean(timings) * 1000,
+        timings[int(len(timings) * 0.95)] * 1000,
+    )
+
+
+def workloads(
+    preprocessor: ConfluencePreprocessor, size_mb: float
+) -> dict[str, Callable[[], object]]:
+    """Build the benchmark workloads for a preprocessor."""
+    page = storage_page(int(size_mb * 1024 * 1024))
+    space = [storage_page(40 * 1024) for _ in range(50)]
+    excerpts = [
+        EXCERPT.format(account_id=ACCOUNT_IDS[i % len(ACCOUNT_IDS)]) for i in range(250)
+    ]
+
+    client = CachedUsersClient()
+
+    def convert(document: str, output: str = "markdown") -> None:
+        preprocessor.process_html_content(
+            document, confluence_client=client, output=output
+        )
+
+    def convert_all(documents: list[str]) -> None:
+        for document in documents:
+            convert(document)
+
+    return {
+        "large page": lambda: convert(page),
+        "large page html": lambda: convert(page, output="html"),
+        "50-page space": lambda: convert_all(space),
+        "250 excerpts": lambda: convert_all(excerpts),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=10, help="Timed rounds")
+    parser.add_argument(
+        "--size", type=float, default=2, help="Size of the large page in MB"
+    )
+    args = parser.parse_args()
+
+    candidates = {}
+    for converter in ("markdownify", "lxml"):
+        preprocessor = ConfluencePreprocessor(
+            base_url="https://example.atlassian.net", content_converter=converter
+        )
+        # Serve every mention from the cache, as after the first request
+        for i, account_id in enumerate(ACCOUNT_IDS):
+            preprocessor._user_cache[("accountid", account_id)] = f"User {i}"
+        candidates[converter] = preprocessor
+
+    print(f"{'workload':<18} {'converter':<12} {'mean ms':>9} {'p95 ms':>9}")
+    results = {name: workloads(p, args.size) for name, p in candidates.items()}
+    for workload in results["markdownify"]:
+        for name, funcs in results.items():
+            mean_ms, p95_ms = measure(funcs[workload], args.repeat)
+            print(f"{workload:<18} {name:<12} {mean_ms:>9.2f} {p95_ms:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+"""
+Relevance and latency benchmark for the discover_tools ranking engines.
+
+Runs a fixed set of task descriptions, each labelled with the tools that
+answer it, against every ranking engine and reports:
+
+- hit@1 / hit@3: share of queries with a relevant tool in the top 1 / 3
+- MRR: mean reciprocal rank of the first relevant tool (top 7)
+- latency: mean and p95 time per query with the result memo cleared,
+  plus the one-off cost of building the engine's index
+
+Usage:
+    uv run python scripts/benchmark_tool_discovery.py [--repeat 20]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from mcp_atlassian.servers.discovery.index import DISCOVERY_RANKERS, ToolDiscoveryIndex
+from mcp_atlassian.servers.main import main_mcp
+
+# (task description, relevant tools)
+QUERIES: list[tuple[str, set[str]]] = [
+    ("get issue details", {"jira_get_issue"}),
+    ("what's the status of PROJ-123", {"jira_get_issue"}),
+    ("find all open bugs assigned to me", {"jira_search"}),
+    ("search jira issues with jql", {"jira_search"}),
+    ("create a new ticket", {"jira_create_issue"}),
+    ("create several issues at once", {"jira_batch_create_issues"}),
+    ("change the priority of a ticket", {"jira_update_issue"}),
+    ("delete an issue", {"jira_delete_issue"}),
+    ("add a comment to the ticket", {"jira_add_comment"}),
+    ("read the comments on an issue", {"jira_get_comments"}),
+    ("move ticket to done", {"jira_transition_issue", "jira_get_transitions"}),
+    ("log 3 hours of work", {"jira_add_worklog"}),
+    ("how much time was spent on this issue", {"jira_get_worklog"}),
+    ("download attachments from an issue", {"jira_download_attachments"}),
+    ("show the scrum boards", {"jira_get_agile_boards"}),
+    ("list sprints on a board", {"jira_get_sprints_from_board"}),
+    ("issues in the current sprint", {"jira_get_sprint_issues"}),
+    ("start a new sprint", {"jira_create_sprint"}),
+    ("link an issue to an epic", {"jira_link_to_epic"}),
+    ("mark issue as blocking another", {"jira_create_issue_link"}),
+    ("release versions of a project", {"jira_get_project_versions"}),
+    ("find the custom field id for story points", {"jira_search_fields"}),
+    ("who is john@example.com", {"jira_get_user_profile", "confluence_search_user"}),
+    ("list all jira projects", {"jira_get_all_projects"}),
+    (
+        "which pull requests and commits are linked to PROJ-1",
+        {
+            "jira_get_development_information",
+            "composite_get_issue_with_development_context",
+        },
+    ),
+    ("find documentation about the api", {"confluence_search"}),
+    ("read a confluence page", {"confluence_get_page"}),
+    ("write a new wiki article", {"confluence_create_page"}),
+    ("edit the content of a page", {"confluence_update_page"}),
+    ("remove a confluence page", {"confluence_delete_page"}),
+    ("child pages of a document", {"confluence_get_page_children"}),
+    ("tag a page with a label", {"confluence_add_label"}),
+    ("list open pull requests in the repo", {"bitbucket_list_pull_requests"}),
+    (
+        "review the code changes in a pull request",
+        {
+            "bitbucket_get_pull_request_diff",
+            "bitbucket_get_pull_request",
+        },
+    ),
+    ("comment on a pull request", {"bitbucket_add_pull_request_comment"}),
+    ("list branches of a repository", {"bitbucket_list_branches"}),
+    ("show the contents of a file in the repository", {"bitbucket_get_file_content"}),
+    ("what repositories exist", {"bitbucket_list_repositories"}),
+    (
+        "jira tickets mentioned by a pull request",
+        {"composite_get_pr_with_jira_context"},
+    ),
+]
+
+
+def evaluate(index: ToolDiscoveryIndex, repeat: int) -> dict[str, float]:
+    """Measure relevance and latency of the index's current ranker."""
+    reciprocal_ranks = []
+    hits_at_1 = hits_at_3 = 0
+    for query, relevant in QUERIES:
+        names = [r.name for r in index.search(query)]
+        rank = next((i + 1 for i, n in enumerate(names) if n in relevant), None)
+        reciprocal_ranks.append(1.0 / rank if rank else 0.0)
+        hits_at_1 += rank == 1
+        hits_at_3 += rank is not None and rank <= 3
+
+    timings = []
+    for _ in range(repeat):
+        for query, _relevant in QUERIES:
+            index._query_cache.clear()
+            start = time.perf_counter()
+            index.search(query)
+            timings.append(time.perf_counter() - start)
+    timings.sort()
+
+    return {
+        "hit@1": hits_at_1 / len(QUERIES),
+        "hit@3": hits_at_3 / len(QUERIES),
+        "mrr": statistics.mean(reciprocal_ranks),
+        "mean_ms": statistics.mean(timings) * 1000,
+        "p95_ms": timings[int(len(timings) * 0.95)] * 1000,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--repeat", type=int, default=20, help="Timing rounds over the query set"
+    )
+    args = parser.parse_args()
+
+    ToolDiscoveryIndex.reset()
+    index = ToolDiscoveryIndex()
+    await index.build_index(main_mcp)
+    print(f"{len(index.get_all_tools())} tools, {len(QUERIES)} queries\n")
+    print(
+        f"{'ranker':<10} {'hit@1':>6} {'hit@3':>6} {'mrr':>6} "
+        f"{'build ms':>9} {'mean ms':>8} {'p95 ms':>7}"
+    )
+
+    for ranker in DISCOVERY_RANKERS:
+        index.set_ranker(ranker)
+        # Drop derived state so the first search includes the build cost
+        index._features = {}
+        start = time.perf_counter()
+        index.search("warm up")
+        build_ms = (time.perf_counter() - start) * 1000
+        result = evaluate(index, args.repeat)
+        print(
+            f"{ranker:<10} {result['hit@1']:>6.2f} {result['hit@3']:>6.2f} "
+            f"{result['mrr']:>6.2f} {build_ms:>9.1f} "
+            f"{result['mean_ms']:>8.3f} {result['p95_ms']:>7.3f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
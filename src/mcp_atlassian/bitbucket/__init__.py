@@ -6,6 +6,7 @@ including projects, repositories, branches, and pull requests.
 
 from .client import BitbucketClient
 from .config import BitbucketConfig
+from .key_index import KeyIndexMixin
 from .projects import ProjectsMixin
 from .pull_requests import PullRequestsMixin
 from .repositories import RepositoriesMixin
@@ -15,6 +16,7 @@ class BitbucketFetcher(
     ProjectsMixin,
     RepositoriesMixin,
     PullRequestsMixin,
+    KeyIndexMixin,
     BitbucketClient,
 ):
     """Complete Bitbucket client combining all operation mixins.
@@ -23,6 +25,7 @@ class BitbucketFetcher(
     - Project operations (list, get)
     - Repository operations (list, get, file content, branches)
     - Pull request operations (list, get, diff, comments)
+    - Jira key index operations (refresh, lookup)
     """
 
     pass
@@ -32,6 +35,7 @@ __all__ = [
     "BitbucketClient",
     "BitbucketConfig",
     "BitbucketFetcher",
+    "KeyIndexMixin",
     "ProjectsMixin",
     "PullRequestsMixin",
     "RepositoriesMixin",
@@ -2,6 +2,9 @@
 
 import logging
 import os
+from collections.abc import Callable, Iterator
+from functools import partial
+from itertools import islice
 from typing import Any
 
 from atlassian import Bitbucket
@@ -14,7 +17,9 @@ from mcp_atlassian.utils.logging import (
     log_config_param,
     mask_sensitive,
 )
+from mcp_atlassian.utils.paging import iter_paged, next_offset
 from mcp_atlassian.utils.rate_limit import configure_rate_limiting
+from mcp_atlassian.utils.response_cache import configure_response_cache
 from mcp_atlassian.utils.ssl import configure_ssl_verification
 
 from .config import BitbucketConfig
@@ -22,6 +27,9 @@ from .config import BitbucketConfig
 # Configure logging
 logger = logging.getLogger("mcp-bitbucket")
 
+# Items requested per page when following paged resources
+DEFAULT_PAGE_SIZE = 100
+
 
 class BitbucketClient:
     """Base client for Bitbucket Server/Data Center API interactions."""
@@ -110,6 +118,9 @@ class BitbucketClient:
         configure_rate_limiting(self.bitbucket._session, "bitbucket")
         logger.debug("Rate limiting configured for Bitbucket session")
 
+        # Serve repeated reads from the response cache (if enabled)
+        configure_response_cache(self.bitbucket._session, "bitbucket")
+
         # Apply custom headers if configured
         if self.config.custom_headers:
             self._apply_custom_headers()
@@ -184,3 +195,82 @@ class BitbucketClient:
             if limit and len(results) >= limit:
                 break
         return results
+
+    def _fetch_page(
+        self,
+        path: str,
+        params: dict[str, Any],
+        start: int,
+        limit: int,
+    ) -> tuple[list[dict[str, Any]], int | None]:
+        """Fetch one page of a paged Bitbucket Server resource.
+
+        Args:
+            path: REST path of the resource, relative to the base URL
+            params: Query parameters, e.g. server-side filters
+            start: Start index of the page
+            limit: Number of items to request
+
+        Returns:
+            The values of the page and the start index of the next page
+            (None on the last page), from ``isLastPage``/``nextPageStart``.
+
+        Raises:
+            TypeError: If the API returns an unexpected response
+        """
+        response = self.bitbucket.get(
+            path, params={**params, "start": start, "limit": limit}
+        )
+        if not isinstance(response, dict):
+            msg = f"Unexpected response type from {path}: {type(response)}"
+            raise TypeError(msg)
+        values = response.get("values") or []
+        next_start = response.get("nextPageStart")
+        is_last = response.get("isLastPage", next_start is None)
+        if is_last or not values:
+            return values, None
+        if next_start is not None:
+            return values, next_start
+        return values, next_offset(start, len(values), None, is_last=False)
+
+    def _iter_paged(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        *,
+        start: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_items: int | None = None,
+        predicate: Callable[[dict[str, Any]], bool] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Lazily yield the values of a paged Bitbucket Server resource.
+
+        A page is only requested once the previous one has been consumed, so
+        a caller that stops iterating never requests further pages. Filters
+        the REST API supports should be passed in ``params``; ``predicate``
+        is for the ones it does not, and counts towards ``max_items`` only
+        for the values it keeps.
+
+        Args:
+            path: REST path of the resource, relative to the base URL
+            params: Query parameters; None values are left out
+            start: Start index of the first page
+            page_size: Maximum number of items to request per page
+            max_items: Maximum number of values to yield, None for all
+            predicate: Optional client-side filter of the values
+
+        Yields:
+            The values of each page, in order.
+        """
+        query = {
+            key: value for key, value in (params or {}).items() if value is not None
+        }
+        fetch_page = partial(self._fetch_page, path, query)
+        if predicate is None:
+            yield from iter_paged(
+                fetch_page, start, page_size=page_size, max_items=max_items
+            )
+            return
+        # The budget counts kept values, so pages are requested in full
+        values = filter(predicate, iter_paged(fetch_page, start, page_size=page_size))
+        yield from islice(values, max_items)
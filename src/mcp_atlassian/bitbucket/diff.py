@@ -0,0 +1,201 @@
+"""Streaming and slicing of Bitbucket pull request diffs.
+
+The raw diff of a large pull request easily exceeds what fits in an MCP
+message. ``slice_diff`` reads a unified diff line by line, keeps only the
+selected files and stops at a byte or hunk budget, so the part of the diff
+that is returned is the only part held in memory. When the diff is cut, a
+truncation marker line is appended and the files it touched are flagged.
+"""
+
+import fnmatch
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+# Default size of the diff text returned to a client
+DEFAULT_DIFF_MAX_BYTES = 64 * 1024
+
+# Line prefixes of the segment types of the structured diff API
+_SEGMENT_PREFIXES = {"ADDED": "+", "REMOVED": "-", "CONTEXT": " "}
+
+
+def iter_text_lines(chunks: Iterable[bytes]) -> Iterator[str]:
+    """Split a stream of bytes into lines, without their line feed.
+
+    Unlike ``Response.iter_lines``, only ``\\n`` ends a line, so carriage
+    returns in the diffed files are preserved.
+
+    Args:
+        chunks: Byte chunks, e.g. from ``Response.iter_content``
+
+    Yields:
+        Each line, decoded as UTF-8 (invalid bytes are replaced).
+    """
+    pending = b""
+    for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            yield line.decode("utf-8", errors="replace")
+    if pending:
+        yield pending.decode("utf-8", errors="replace")
+
+
+def iter_structured_diff_lines(diff_data: dict[str, Any]) -> Iterator[str]:
+    """Render the response of the structured diff API as unified diff lines.
+
+    Args:
+        diff_data: Response of the pull request ``/diff`` endpoint
+
+    Yields:
+        The lines of the equivalent unified diff.
+    """
+    for file_diff in diff_data.get("diffs") or []:
+        source = (file_diff.get("source") or {}).get("toString")
+        destination = (file_diff.get("destination") or {}).get("toString")
+        old_path = f"a/{source}" if source else "/dev/null"
+        new_path = f"b/{destination}" if destination else "/dev/null"
+        yield f"diff --git a/{source or destination} b/{destination or source}"
+        if file_diff.get("binary"):
+            yield f"Binary files {old_path} and {new_path} differ"
+            continue
+        yield f"--- {old_path}"
+        yield f"+++ {new_path}"
+        for hunk in file_diff.get("hunks") or []:
+            yield (
+                f"@@ -{hunk.get('sourceLine', 0)},{hunk.get('sourceSpan', 0)} "
+                f"+{hunk.get('destinationLine', 0)},"
+                f"{hunk.get('destinationSpan', 0)} @@"
+            )
+            for segment in hunk.get("segments") or []:
+                prefix = _SEGMENT_PREFIXES.get(segment.get("type"), " ")
+                for line in segment.get("lines") or []:
+                    yield prefix + line.get("line", "")
+
+
+def _file_path(header: list[str]) -> str:
+    """Get the path of a file from the header lines of its diff."""
+    for prefix in ("+++ b/", "--- a/", "rename to ", "copy to "):
+        for line in header:
+            if line.startswith(prefix):
+                return line[len(prefix) :].rstrip("\t")
+    # "diff --git a/<path> b/<path>", e.g. for binary files
+    _, _, path = header[0].rpartition(" b/")
+    return path
+
+
+def path_selected(path: str, paths: list[str] | None) -> bool:
+    """Check whether a file path matches a selection.
+
+    Args:
+        path: Path of a file in the diff
+        paths: Selected file paths, directories (ending in "/") or glob
+            patterns; None selects every file
+
+    Returns:
+        True if the file is selected.
+    """
+    if not paths:
+        return True
+    return any(
+        path == selected
+        or (selected.endswith("/") and path.startswith(selected))
+        or fnmatch.fnmatchcase(path, selected)
+        for selected in paths
+    )
+
+
+def slice_diff(
+    lines: Iterable[str],
+    *,
+    paths: list[str] | None = None,
+    max_bytes: int = DEFAULT_DIFF_MAX_BYTES,
+    max_hunks: int | None = None,
+) -> dict[str, Any]:
+    """Select files from a unified diff and cut it at a budget.
+
+    Reading stops as soon as the budget is reached, so with a streamed
+    diff the rest is never downloaded. Only whole lines are returned.
+
+    Args:
+        lines: Lines of a unified diff, without line feeds
+        paths: Optional file selection (see ``path_selected``)
+        max_bytes: Maximum size of the returned diff text in UTF-8 bytes
+        max_hunks: Optional maximum number of hunks returned
+
+    Returns:
+        Dictionary with the diff text, the returned files with their number
+        of hunks, whether the diff was truncated and why ("max_bytes" or
+        "max_hunks"), and the size of the diff text.
+    """
+    output: list[str] = []
+    files: list[dict[str, Any]] = []
+    size = 0
+    hunks = 0
+    truncation: str | None = None
+    header: list[str] = []
+    selected = False
+
+    def _emit(line: str) -> bool:
+        nonlocal size, truncation
+        line_size = len(line.encode()) + (1 if output else 0)
+        if size + line_size > max_bytes:
+            truncation = "max_bytes"
+            return False
+        output.append(line)
+        size += line_size
+        return True
+
+    def _open_file() -> bool:
+        """Decide on the pending header, emitting it if the file is selected."""
+        nonlocal selected
+        path = _file_path(header)
+        selected = path_selected(path, paths)
+        if selected:
+            files.append({"path": path, "hunks": 0})
+            if not all(_emit(line) for line in header):
+                return False
+        header.clear()
+        return True
+
+    for line in lines:
+        if line.startswith("diff --git "):
+            if header and not _open_file():
+                break
+            header.append(line)
+            selected = False
+            continue
+        if header:
+            if not line.startswith("@@"):
+                header.append(line)
+                continue
+            if not _open_file():
+                break
+        if not selected:
+            continue
+        if line.startswith("@@"):
+            if max_hunks is not None and hunks >= max_hunks:
+                truncation = "max_hunks"
+                break
+            hunks += 1
+            files[-1]["hunks"] += 1
+        if not _emit(line):
+            break
+    else:
+        if header:
+            _open_file()
+
+    if truncation:
+        if files:
+            files[-1]["truncated"] = True
+        limit = (
+            f"{max_bytes} bytes" if truncation == "max_bytes" else f"{max_hunks} hunks"
+        )
+        output.append(f"[... diff truncated: limit of {limit} reached ...]")
+
+    return {
+        "diff": "\n".join(output),
+        "files": files,
+        "truncated": truncation is not None,
+        "truncation": truncation,
+        "bytes": size,
+    }
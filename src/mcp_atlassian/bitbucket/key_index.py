@@ -0,0 +1,740 @@
+"""Local index of Jira key references in Bitbucket projects.
+
+Finding the pull requests of a Jira issue otherwise means listing the pull
+requests of every repository in a project and extracting Jira keys from
+their titles, descriptions and branch names on each request. The key index
+keeps the result in a SQLite database instead:
+
+- For every pull request mentioning Jira keys it stores one reference per
+  key, plus a reference for the source branch if the branch name contains
+  the key and, optionally, one for each commit of the pull request whose
+  message mentions it.
+- Each repository has a watermark, the newest ``updatedDate`` indexed.
+  Refreshing a repository lists its pull requests newest first and stops
+  once it reaches pull requests that were not updated since, so an
+  unchanged repository costs a single page request.
+- References are kept per credential scope (a hash of the Bitbucket URL
+  and credentials), so users never see pull requests of repositories they
+  cannot access.
+
+The index is enabled by ``BITBUCKET_KEY_INDEX_PATH``. The server refreshes
+the configured projects in the background, and lookups refresh repositories
+whose index is older than the refresh interval first.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+import anyio
+
+from mcp_atlassian.models.bitbucket import BitbucketPullRequest
+from mcp_atlassian.utils.env import get_env_float, is_env_extended_truthy
+from mcp_atlassian.utils.executor import run_blocking, run_blocking_cancellable
+from mcp_atlassian.utils.fan_out import fan_out
+from mcp_atlassian.utils.jira_keys import extract_jira_keys
+
+from .config import BitbucketConfig
+
+if TYPE_CHECKING:
+    from . import BitbucketFetcher
+
+logger = logging.getLogger("mcp-bitbucket.key_index")
+
+# Pull requests requested per page while indexing
+INDEX_PAGE_SIZE = 100
+
+# Most pull requests indexed per repository and refresh
+MAX_INDEXED_PULL_REQUESTS = 2000
+
+# Consecutive pull requests not updated since the watermark after which an
+# incremental refresh stops, tolerating pull requests updated at the same time
+UNCHANGED_PULL_REQUESTS_TO_STOP = 25
+
+# Reference kinds and the lookup result groups they are reported in
+REFERENCE_GROUPS = {
+    "pull_request": "pull_requests",
+    "branch": "branches",
+    "commit": "commits",
+}
+
+
+@dataclass
+class KeyIndexConfig:
+    """Configuration of the Jira key index.
+
+    Attributes:
+        path: SQLite database of the index (default None, index disabled)
+        refresh_interval: Seconds between background refreshes, and the age
+            after which a lookup refreshes a repository first (default 900,
+            0 disables the background refresh)
+        projects: Bitbucket projects refreshed in the background, in
+            addition to the projects already in the index
+        index_commits: Whether the commits of changed pull requests are
+            indexed too (default False, one more request per pull request)
+    """
+
+    path: str | None = None
+    refresh_interval: float = 900.0
+    projects: list[str] = field(default_factory=list)
+    index_commits: bool = False
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the index is enabled."""
+        return bool(self.path)
+
+
+def get_key_index_config() -> KeyIndexConfig:
+    """Load the Jira key index configuration from environment variables.
+
+    Returns:
+        KeyIndexConfig with values from environment or defaults.
+
+    Environment Variables:
+        BITBUCKET_KEY_INDEX_PATH: SQLite file of the index
+        BITBUCKET_KEY_INDEX_REFRESH_INTERVAL: Refresh interval in seconds
+            (default 900)
+        BITBUCKET_KEY_INDEX_PROJECTS: Comma-separated projects refreshed in
+            the background
+        BITBUCKET_KEY_INDEX_COMMITS: Index commit messages (default false)
+    """
+    projects = os.getenv("BITBUCKET_KEY_INDEX_PROJECTS", "")
+    return KeyIndexConfig(
+        path=os.getenv("BITBUCKET_KEY_INDEX_PATH") or None,
+        refresh_interval=get_env_float(
+            "BITBUCKET_KEY_INDEX_REFRESH_INTERVAL", 900.0, minimum=0
+        ),
+        projects=[p.strip() for p in projects.split(",") if p.strip()],
+        index_commits=is_env_extended_truthy("BITBUCKET_KEY_INDEX_COMMITS"),
+    )
+
+
+def credential_scope(config: BitbucketConfig) -> str:
+    """Get the scope of the index entries visible to a Bitbucket user.
+
+    Args:
+        config: Bitbucket configuration with the user's credentials
+
+    Returns:
+        A hash of the Bitbucket URL and credentials.
+    """
+    material = "\n".join(
+        [
+            config.url.rstrip("/"),
+            config.auth_type,
+            config.username or "",
+            config.api_token or "",
+            config.personal_token or "",
+        ]
+    )
+    return hashlib.sha256(material.encode()).hexdigest()[:32]
+
+
+@dataclass
+class KeyReference:
+    """A reference to a Jira key in a Bitbucket repository.
+
+    Attributes:
+        project_key: Bitbucket project key
+        repository_slug: Repository slug
+        pull_request_id: Pull request the reference was found in
+        kind: "pull_request", "branch" or "commit"
+        ref_id: Pull request ID, branch name or commit hash
+        jira_key: The referenced Jira key
+        updated: Last update of the pull request (epoch milliseconds)
+        data: Summary of the pull request, branch or commit
+    """
+
+    project_key: str
+    repository_slug: str
+    pull_request_id: int
+    kind: str
+    ref_id: str
+    jira_key: str
+    updated: int
+    data: dict[str, Any]
+
+
+@dataclass
+class RepositoryState:
+    """Index state of a repository.
+
+    Attributes:
+        watermark: Newest pull request update indexed (epoch milliseconds)
+        indexed_at: When the repository was last refreshed (epoch seconds)
+    """
+
+    watermark: int
+    indexed_at: float
+
+
+class JiraKeyIndex:
+    """SQLite store of Jira key references, shared by local processes."""
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """Open (and create if needed) the index database.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = Lock()
+        self._conn = sqlite3.connect(
+            self.path, timeout=5.0, check_same_thread=False, isolation_level=None
+        )
+        os.chmod(self.path, 0o600)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS refs (
+                scope TEXT NOT NULL,
+                project_key TEXT NOT NULL,
+                repo_slug TEXT NOT NULL,
+                pr_id INTEGER NOT NULL,
+                kind TEXT NOT NULL,
+                ref_id TEXT NOT NULL,
+                jira_key TEXT NOT NULL,
+                updated_ms INTEGER NOT NULL,
+                data TEXT NOT NULL,
+                PRIMARY KEY (scope, project_key, repo_slug, kind, ref_id, jira_key)
+            );
+            CREATE INDEX IF NOT EXISTS refs_key ON refs(scope, jira_key);
+            CREATE INDEX IF NOT EXISTS refs_pr
+                ON refs(scope, project_key, repo_slug, pr_id);
+            CREATE TABLE IF NOT EXISTS repos (
+                scope TEXT NOT NULL,
+                project_key TEXT NOT NULL,
+                repo_slug TEXT NOT NULL,
+                watermark_ms INTEGER NOT NULL,
+                indexed_at REAL NOT NULL,
+                PRIMARY KEY (scope, project_key, repo_slug)
+            );
+            """
+        )
+
+    def repository_states(
+        self, scope: str, project_key: str
+    ) -> dict[str, RepositoryState]:
+        """Get the index state of the repositories of a project, by slug."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT repo_slug, watermark_ms, indexed_at FROM repos "
+                "WHERE scope = ? AND project_key = ?",
+                (scope, project_key),
+            ).fetchall()
+        return {slug: RepositoryState(mark, at) for slug, mark, at in rows}
+
+    def projects(self, scope: str) -> list[str]:
+        """Get the projects with indexed repositories."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT project_key FROM repos WHERE scope = ? "
+                "ORDER BY project_key",
+                (scope,),
+            ).fetchall()
+        return [project for (project,) in rows]
+
+    def store(
+        self,
+        scope: str,
+        project_key: str,
+        repo_slug: str,
+        pull_request_ids: Iterable[int],
+        references: Iterable[KeyReference],
+        watermark: int,
+        *,
+        replace_all: bool = False,
+    ) -> None:
+        """Store the references of re-indexed pull requests.
+
+        The previous references of the pull requests are replaced, and the
+        repository watermark is updated, in one transaction.
+
+        Args:
+            scope: Credential scope
+            project_key: Bitbucket project key
+            repo_slug: Repository slug
+            pull_request_ids: Pull requests that were indexed
+            references: Their references
+            watermark: Newest pull request update indexed
+            replace_all: Whether to drop all previous references of the
+                repository, not only those of the indexed pull requests
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                if replace_all:
+                    self._conn.execute(
+                        "DELETE FROM refs WHERE scope = ? AND project_key = ? "
+                        "AND repo_slug = ?",
+                        (scope, project_key, repo_slug),
+                    )
+                else:
+                    self._conn.executemany(
+                        "DELETE FROM refs WHERE scope = ? AND project_key = ? "
+                        "AND repo_slug = ? AND pr_id = ?",
+                        [(scope, project_key, repo_slug, i) for i in pull_request_ids],
+                    )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO refs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            scope,
+                            ref.project_key,
+                            ref.repository_slug,
+                            ref.pull_request_id,
+                            ref.kind,
+                            ref.ref_id,
+                            ref.jira_key,
+                            ref.updated,
+                            json.dumps(ref.data),
+                        )
+                        for ref in references
+                    ],
+                )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO repos VALUES (?, ?, ?, ?, ?)",
+                    (scope, project_key, repo_slug, watermark, time.time()),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def forget_repositories(
+        self, scope: str, project_key: str, repo_slugs: Iterable[str]
+    ) -> None:
+        """Drop the references and state of repositories, e.g. deleted ones."""
+        params = [(scope, project_key, slug) for slug in repo_slugs]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for table in ("refs", "repos"):
+                    self._conn.executemany(
+                        f"DELETE FROM {table} WHERE scope = ? AND project_key = ? "  # noqa: S608 - fixed table names
+                        "AND repo_slug = ?",
+                        params,
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def find(
+        self, scope: str, jira_key: str, project_key: str | None = None
+    ) -> list[KeyReference]:
+        """Find the references to a Jira key, most recently updated first.
+
+        Args:
+            scope: Credential scope
+            jira_key: Jira key to look up
+            project_key: Optional Bitbucket project to restrict the lookup to
+
+        Returns:
+            The matching references.
+        """
+        query = (
+            "SELECT project_key, repo_slug, pr_id, kind, ref_id, jira_key, "
+            "updated_ms, data FROM refs WHERE scope = ? AND jira_key = ?"
+        )
+        params: list[Any] = [scope, jira_key.upper()]
+        if project_key:
+            query += " AND project_key = ?"
+            params.append(project_key)
+        with self._lock:
+            rows = self._conn.execute(
+                query + " ORDER BY updated_ms DESC", params
+            ).fetchall()
+        return [
+            KeyReference(
+                project, repo, pr_id, kind, ref_id, key, updated, json.loads(data)
+            )
+            for project, repo, pr_id, kind, ref_id, key, updated, data in rows
+        ]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_key_index: JiraKeyIndex | None = None
+_key_index_lock = Lock()
+
+
+def get_key_index() -> JiraKeyIndex | None:
+    """Get the process-wide Jira key index, opening it on first use.
+
+    Returns:
+        The shared JiraKeyIndex, or None if the index is not enabled.
+    """
+    global _key_index
+    if _key_index is None:
+        config = get_key_index_config()
+        if not config.enabled:
+            return None
+        with _key_index_lock:
+            if _key_index is None:
+                _key_index = JiraKeyIndex(config.path)
+    return _key_index
+
+
+def reset_key_index() -> None:
+    """Close and forget the process-wide key index (primarily for testing)."""
+    global _key_index
+    with _key_index_lock:
+        if _key_index is not None:
+            _key_index.close()
+        _key_index = None
+
+
+def _pull_request_references(
+    project_key: str, repo_slug: str, pr_data: dict[str, Any]
+) -> list[KeyReference]:
+    """Extract the Jira key references of a pull request and its branch."""
+    pr = BitbucketPullRequest.from_api_response(pr_data)
+    branch = pr.from_ref.display_id if pr.from_ref else None
+    matches = extract_jira_keys(
+        title=pr.title, description=pr.description, branch_name=branch
+    )
+    if not matches or pr.id is None:
+        return []
+
+    pr_dict = pr.to_simplified_dict()
+    summary = {
+        "project_key": project_key,
+        "repository_slug": repo_slug,
+        "id": pr.id,
+        "title": pr.title,
+        "state": pr.state,
+        "author": pr_dict.get("author"),
+        "source_branch": branch,
+        "target_branch": pr.to_ref.display_id if pr.to_ref else None,
+        "updated_date": pr_dict.get("updated_date"),
+        "url": pr_dict.get("url"),
+    }
+    updated = pr_data.get("updatedDate") or 0
+
+    def _ref(kind: str, ref_id: str, key: str, data: dict[str, Any]) -> KeyReference:
+        return KeyReference(
+            project_key, repo_slug, pr.id, kind, ref_id, key, updated, data
+        )
+
+    references = [
+        _ref(
+            "pull_request",
+            str(pr.id),
+            match.key,
+            {**summary, "match_source": match.source, "confidence": match.confidence},
+        )
+        for match in matches
+    ]
+    if branch:
+        references.extend(
+            _ref(
+                "branch",
+                branch,
+                match.key,
+                {
+                    "project_key": project_key,
+                    "repository_slug": repo_slug,
+                    "name": branch,
+                    "pull_request_id": pr.id,
+                },
+            )
+            for match in extract_jira_keys(branch_name=branch)
+        )
+    return references
+
+
+def _commit_references(
+    project_key: str, repo_slug: str, pr_id: int, updated: int, commits: list[dict]
+) -> list[KeyReference]:
+    """Extract the Jira key references of the commits of a pull request."""
+    references = []
+    for commit in commits:
+        message = commit.get("message") or ""
+        for match in extract_jira_keys(title=message):
+            references.append(
+                KeyReference(
+                    project_key,
+                    repo_slug,
+                    pr_id,
+                    "commit",
+                    commit.get("id") or "",
+                    match.key,
+                    updated,
+                    {
+                        "project_key": project_key,
+                        "repository_slug": repo_slug,
+                        "id": commit.get("id"),
+                        "display_id": commit.get("display_id"),
+                        "message": message.splitlines()[0] if message else "",
+                        "author": (commit.get("author") or {}).get("name"),
+                        "pull_request_id": pr_id,
+                    },
+                )
+            )
+    return references
+
+
+class KeyIndexMixin:
+    """Mixin maintaining and querying the Jira key index of Bitbucket projects."""
+
+    def _get_key_index(self) -> JiraKeyIndex:
+        """Get the key index, raising if it is not enabled."""
+        index = get_key_index()
+        if index is None:
+            raise ValueError(
+                "The Jira key index is not enabled. Set BITBUCKET_KEY_INDEX_PATH "
+                "to enable it."
+            )
+        return index
+
+    def index_repository_keys(
+        self: "BitbucketFetcher",
+        project_key: str,
+        repository_slug: str,
+        *,
+        full: bool = False,
+    ) -> dict[str, Any]:
+        """Index the Jira keys of the pull requests updated since the last run.
+
+        Pull requests are listed newest first. An incremental run stops once
+        it reaches pull requests not updated since the repository watermark.
+
+        Args:
+            project_key: The project key
+            repository_slug: The repository slug
+            full: Whether to re-index all pull requests and drop references
+                of pull requests that no longer exist
+
+        Returns:
+            Dictionary with the repository and the number of pull requests
+            scanned and re-indexed, and of references stored.
+        """
+        index = self._get_key_index()
+        scope = credential_scope(self.config)
+        state = index.repository_states(scope, project_key).get(repository_slug)
+        watermark = None if full or state is None else state.watermark
+
+        newest = watermark or 0
+        changed: list[dict[str, Any]] = []
+        scanned = 0
+        unchanged = 0
+        for pr_data in self.bitbucket.get_pull_requests(
+            project_key,
+            repository_slug,
+            state="ALL",
+            order="newest",
+            limit=INDEX_PAGE_SIZE,
+        ):
+            scanned += 1
+            updated = pr_data.get("updatedDate") or 0
+            if watermark is not None and updated <= watermark:
+                unchanged += 1
+                if unchanged >= UNCHANGED_PULL_REQUESTS_TO_STOP:
+                    break
+            else:
+                unchanged = 0
+                newest = max(newest, updated)
+                changed.append(pr_data)
+            if scanned >= MAX_INDEXED_PULL_REQUESTS:
+                logger.warning(
+                    f"Indexed the newest {scanned} pull requests of "
+                    f"{project_key}/{repository_slug} only"
+                )
+                break
+
+        references = []
+        index_commits = get_key_index_config().index_commits
+        for pr_data in changed:
+            pr_refs = _pull_request_references(project_key, repository_slug, pr_data)
+            if index_commits and pr_data.get("id") is not None:
+                commits = self.get_pull_request_commits(
+                    project_key, repository_slug, pr_data["id"]
+                )
+                pr_refs.extend(
+                    _commit_references(
+                        project_key,
+                        repository_slug,
+                        pr_data["id"],
+                        pr_data.get("updatedDate") or 0,
+                        commits,
+                    )
+                )
+            references.extend(pr_refs)
+
+        index.store(
+            scope,
+            project_key,
+            repository_slug,
+            [pr["id"] for pr in changed if pr.get("id") is not None],
+            references,
+            newest,
+            replace_all=full,
+        )
+        logger.debug(
+            f"Indexed {len(changed)} of {scanned} pull requests scanned in "
+            f"{project_key}/{repository_slug}"
+        )
+        return {
+            "repository_slug": repository_slug,
+            "scanned": scanned,
+            "reindexed": len(changed),
+            "references": len(references),
+        }
+
+    async def refresh_key_index_async(
+        self: "BitbucketFetcher",
+        project_key: str,
+        *,
+        full: bool = False,
+        max_age: float | None = None,
+    ) -> dict[str, Any]:
+        """Refresh the Jira key index of the repositories of a project.
+
+        Repositories are refreshed concurrently. Repositories that no longer
+        exist are dropped from the index.
+
+        Args:
+            project_key: The project key
+            full: Whether to re-index all pull requests (see
+                ``index_repository_keys``)
+            max_age: Only refresh repositories whose index is at least this
+                many seconds old (defaults to refreshing all of them)
+
+        Returns:
+            Dictionary with the number of repositories, the statistics of
+            each refreshed repository, the number of repositories that were
+            fresh enough, the repositories dropped and the repositories
+            that failed or timed out.
+        """
+        index = self._get_key_index()
+        scope = credential_scope(self.config)
+        repos = await run_blocking("bitbucket", self.get_repositories, project_key)
+        states = await run_blocking(
+            "bitbucket", index.repository_states, scope, project_key
+        )
+
+        now = time.time()
+        slugs = [repo.slug for repo in repos if repo.slug]
+        due = [
+            slug
+            for slug in slugs
+            if full
+            or max_age is None
+            or slug not in states
+            or now - states[slug].indexed_at >= max_age
+        ]
+        removed = sorted(set(states) - set(slugs))
+        if removed:
+            await run_blocking(
+                "bitbucket", index.forget_repositories, scope, project_key, removed
+            )
+
+        # A timed out repository keeps indexing in its worker thread, and its
+        # references are stored once it completes.
+        branches = await fan_out(
+            [
+                (
+                    f"{project_key}/{slug}",
+                    partial(
+                        run_blocking_cancellable,
+                        "bitbucket",
+                        self.index_repository_keys,
+                        project_key,
+                        slug,
+                        full=full,
+                    ),
+                )
+                for slug in due
+            ]
+        )
+        return {
+            "project_key": project_key,
+            "repositories": len(slugs),
+            "refreshed": [branch.value for branch in branches if branch.ok],
+            "fresh": len(slugs) - len(due),
+            "removed": removed,
+            "incomplete": [branch.to_dict() for branch in branches if not branch.ok],
+        }
+
+    def find_jira_key_references(
+        self: "BitbucketFetcher", jira_key: str, project_key: str | None = None
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Find the indexed pull requests, branches and commits of a Jira key.
+
+        Only reads the index; see ``refresh_key_index_async`` to update it.
+
+        Args:
+            jira_key: The Jira issue key
+            project_key: Optional Bitbucket project to restrict the lookup to
+
+        Returns:
+            Dictionary with the "pull_requests", "branches" and "commits"
+            referencing the key, most recently updated first.
+        """
+        index = self._get_key_index()
+        found = index.find(credential_scope(self.config), jira_key, project_key)
+        references: dict[str, list[dict[str, Any]]] = {
+            group: [] for group in REFERENCE_GROUPS.values()
+        }
+        for ref in found:
+            references[REFERENCE_GROUPS[ref.kind]].append(ref.data)
+        return references
+
+
+async def run_key_index_refresher(
+    fetcher_factory: Callable[[], "BitbucketFetcher"], config: KeyIndexConfig
+) -> None:
+    """Refresh the key index periodically, until cancelled.
+
+    Refreshes the configured projects and the projects already in the index
+    for the fetcher's credentials, one project at a time.
+
+    Args:
+        fetcher_factory: Callable creating the Bitbucket fetcher to index with
+        config: Key index configuration
+    """
+    try:
+        fetcher = await run_blocking("bitbucket", fetcher_factory)
+    except Exception as e:  # noqa: BLE001 - the server keeps running
+        logger.error(f"Jira key index refresher could not start: {e}")
+        return
+
+    scope = credential_scope(fetcher.config)
+    while True:
+        # A failing pass (e.g. the shared database is locked by another
+        # process) must not end the refresher, nor the server it runs in
+        try:
+            index = fetcher._get_key_index()
+            known = await run_blocking("bitbucket", index.projects, scope)
+        except Exception as e:  # noqa: BLE001 - retried next interval
+            logger.warning(f"Failed to read the projects of the Jira key index: {e}")
+            known = []
+        for project_key in sorted({*config.projects, *known}):
+            try:
+                stats = await fetcher.refresh_key_index_async(project_key)
+                reindexed = sum(repo["reindexed"] for repo in stats["refreshed"])
+                logger.info(
+                    f"Refreshed Jira key index of {project_key}: "
+                    f"{reindexed} pull requests re-indexed in "
+                    f"{stats['repositories']} repositories"
+                )
+            except Exception as e:  # noqa: BLE001 - retried next interval
+                logger.warning(
+                    f"Failed to refresh Jira key index of {project_key}: {e}"
+                )
+        await anyio.sleep(config.refresh_interval)
@@ -1,10 +1,13 @@
 """Projects mixin for Bitbucket client."""
 
 import logging
-from typing import TYPE_CHECKING
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any
 
 from mcp_atlassian.models.bitbucket import BitbucketProject
 
+from .client import DEFAULT_PAGE_SIZE
+
 if TYPE_CHECKING:
     from .client import BitbucketClient
 
@@ -14,6 +17,50 @@ logger = logging.getLogger("mcp-bitbucket.projects")
 class ProjectsMixin:
     """Mixin providing project-related operations for BitbucketClient."""
 
+    def iter_projects(
+        self: "BitbucketClient",
+        *,
+        name: str | None = None,
+        start: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_items: int | None = None,
+    ) -> Iterator[BitbucketProject]:
+        """Iterate over the accessible projects, following pages lazily.
+
+        Projects outside the configured projects filter are skipped and do
+        not count towards ``max_items``.
+
+        Args:
+            name: Optional text the project names must contain, filtered by
+                the server (keyword-only)
+            start: Starting index for pagination (keyword-only)
+            page_size: Maximum number of projects to request at a time
+                (keyword-only)
+            max_items: Maximum number of projects to yield, None for all
+                (keyword-only)
+
+        Yields:
+            BitbucketProject objects
+        """
+        predicate = None
+        if self.config.projects_filter:
+            allowed_keys = {
+                k.strip().upper() for k in self.config.projects_filter.split(",")
+            }
+
+            def predicate(project_data: dict[str, Any]) -> bool:
+                return str(project_data.get("key", "")).upper() in allowed_keys
+
+        for project_data in self._iter_paged(
+            self.bitbucket._url_projects(),
+            {"name": name},
+            start=start,
+            page_size=page_size,
+            max_items=max_items,
+            predicate=predicate,
+        ):
+            yield BitbucketProject.from_api_response(project_data)
+
     def get_projects(
         self: "BitbucketClient",
         limit: int | None = None,
@@ -28,31 +75,12 @@ class ProjectsMixin:
         Returns:
             List of BitbucketProject objects
         """
-        projects = []
-
         try:
-            for project_data in self.bitbucket.project_list(start=start, limit=limit):
-                project = BitbucketProject.from_api_response(project_data)
-                projects.append(project)
-
-                # Apply project filter if configured
-                if self.config.projects_filter:
-                    allowed_keys = {
-                        k.strip().upper()
-                        for k in self.config.projects_filter.split(",")
-                    }
-                    if project.key.upper() not in allowed_keys:
-                        projects.pop()
-                        continue
-
-                if limit and len(projects) >= limit:
-                    break
+            return list(self.iter_projects(start=start, max_items=limit or None))
         except Exception as e:
             logger.error(f"Error fetching projects: {e}")
             raise
 
-        return projects
-
     def get_project(self: "BitbucketClient", project_key: str) -> BitbucketProject:
         """Get a specific project by key.
 
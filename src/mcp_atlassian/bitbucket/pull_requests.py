@@ -1,19 +1,76 @@
 """Pull requests mixin for Bitbucket client."""
 
 import logging
+from collections.abc import Iterator
+from contextlib import closing
 from typing import TYPE_CHECKING, Any
 
 from mcp_atlassian.models.bitbucket import BitbucketComment, BitbucketPullRequest
 
+from .client import DEFAULT_PAGE_SIZE
+from .diff import (
+    DEFAULT_DIFF_MAX_BYTES,
+    iter_structured_diff_lines,
+    iter_text_lines,
+    slice_diff,
+)
+
 if TYPE_CHECKING:
     from .client import BitbucketClient
 
 logger = logging.getLogger("mcp-bitbucket.pull_requests")
 
 
+def _is_comment_activity(activity: dict[str, Any]) -> bool:
+    """Check whether a pull request activity added a comment."""
+    return activity.get("action") == "COMMENTED" and bool(activity.get("comment"))
+
+
 class PullRequestsMixin:
     """Mixin providing pull request-related operations for BitbucketClient."""
 
+    def iter_pull_requests(
+        self: "BitbucketClient",
+        project_key: str,
+        repository_slug: str,
+        *,
+        state: str = "OPEN",
+        order: str = "newest",
+        filter_text: str | None = None,
+        start: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_items: int | None = None,
+    ) -> Iterator[BitbucketPullRequest]:
+        """Iterate over the pull requests of a repository, following pages lazily.
+
+        Args:
+            project_key: The project key
+            repository_slug: The repository slug
+            state: Filter by state (OPEN, MERGED, DECLINED, ALL) (keyword-only)
+            order: Order by (newest, oldest) (keyword-only)
+            filter_text: Optional text the titles or descriptions must
+                contain, filtered by the server (keyword-only)
+            start: Starting index for pagination (keyword-only)
+            page_size: Maximum number of pull requests to request at a time
+                (keyword-only)
+            max_items: Maximum number of pull requests to yield, None for all
+                (keyword-only)
+
+        Yields:
+            BitbucketPullRequest objects
+        """
+        params = {"state": state.upper(), "order": order.upper()}
+        if filter_text:
+            params["filterText"] = filter_text
+        for pr_data in self._iter_paged(
+            self.bitbucket._url_pull_requests(project_key, repository_slug),
+            params,
+            start=start,
+            page_size=page_size,
+            max_items=max_items,
+        ):
+            yield BitbucketPullRequest.from_api_response(pr_data)
+
     def get_pull_requests(
         self: "BitbucketClient",
         project_key: str,
@@ -36,30 +93,23 @@ class PullRequestsMixin:
         Returns:
             List of BitbucketPullRequest objects
         """
-        pull_requests = []
-
         try:
-            for pr_data in self.bitbucket.get_pull_requests(
-                project_key,
-                repository_slug,
-                state=state,
-                order=order,
-                start=start,
-                limit=limit or 100,
-            ):
-                pr = BitbucketPullRequest.from_api_response(pr_data)
-                pull_requests.append(pr)
-
-                if limit and len(pull_requests) >= limit:
-                    break
+            return list(
+                self.iter_pull_requests(
+                    project_key,
+                    repository_slug,
+                    state=state,
+                    order=order,
+                    start=start,
+                    max_items=limit or None,
+                )
+            )
         except Exception as e:
             logger.error(
                 f"Error fetching pull requests for {project_key}/{repository_slug}: {e}"
             )
             raise
 
-        return pull_requests
-
     def get_pull_request(
         self: "BitbucketClient",
         project_key: str,
@@ -152,56 +202,74 @@ class PullRequestsMixin:
         project_key: str,
         repository_slug: str,
         pull_request_id: int,
-    ) -> str:
-        """Get the diff for a pull request.
-
-        Note: This returns a textual diff if available, otherwise returns
-        a summary of changes.
+        *,
+        paths: list[str] | None = None,
+        context_lines: int | None = None,
+        ignore_whitespace: bool = False,
+        max_bytes: int = DEFAULT_DIFF_MAX_BYTES,
+        max_hunks: int | None = None,
+    ) -> dict[str, Any]:
+        """Get the unified diff of a pull request, cut to a budget.
+
+        The raw diff is streamed and sliced while it is read (see
+        ``slice_diff``), so only the returned part is held in memory and the
+        download stops once the budget is reached. Servers without the raw
+        diff endpoint fall back to the structured diff API, whose response
+        is loaded in full.
 
         Args:
             project_key: The project key
             repository_slug: The repository slug
             pull_request_id: The pull request ID
+            paths: Optional file paths, directories (ending in "/") or glob
+                patterns to include
+            context_lines: Number of context lines around changes (server
+                default if None)
+            ignore_whitespace: Whether to ignore whitespace changes
+            max_bytes: Maximum size of the returned diff text in bytes
+            max_hunks: Optional maximum number of hunks returned
 
         Returns:
-            Diff content as string
+            Dictionary with the diff text, the files it covers, and whether
+            and why it was truncated
         """
-        try:
-            # Get the PR details first to get source and target refs
-            pr = self.get_pull_request(project_key, repository_slug, pull_request_id)
-
-            if not pr.from_ref or not pr.to_ref:
-                raise ValueError("Pull request refs not available")
-
-            # Get the diff between the branches
-            source_commit = pr.from_ref.latest_commit
-            target_commit = pr.to_ref.latest_commit
-
-            if not source_commit or not target_commit:
-                # Fall back to getting changes list
-                changes = self.get_pull_request_changes(
-                    project_key, repository_slug, pull_request_id
-                )
-                return "\n".join(f"{c['type']}: {c['path']}" for c in changes)
+        params: dict[str, Any] = {}
+        if context_lines is not None:
+            params["contextLines"] = context_lines
+        if ignore_whitespace:
+            params["whitespace"] = "ignore-all"
+        pr_path = self.bitbucket._url_pull_request(
+            project_key, repository_slug, pull_request_id
+        )
 
-            # Get changes between the commits
-            changes = self.get_pull_request_changes(
-                project_key, repository_slug, pull_request_id
+        try:
+            response = self.bitbucket._session.get(
+                self.bitbucket.url_joiner(self.bitbucket.url, f"{pr_path}.diff"),
+                params=params,
+                headers={"Accept": "text/plain"},
+                stream=True,
+                timeout=self.bitbucket.timeout,
+            )
+            with closing(response):
+                if response.status_code != 404:
+                    response.raise_for_status()
+                    return slice_diff(
+                        iter_text_lines(response.iter_content(chunk_size=8192)),
+                        paths=paths,
+                        max_bytes=max_bytes,
+                        max_hunks=max_hunks,
+                    )
+
+            logger.debug("Raw diff endpoint unavailable, using the structured diff API")
+            diff_data = self.bitbucket.get(
+                f"{pr_path}/diff", params={**params, "withComments": "false"}
+            )
+            return slice_diff(
+                iter_structured_diff_lines(diff_data or {}),
+                paths=paths,
+                max_bytes=max_bytes,
+                max_hunks=max_hunks,
             )
-
-            # Format as a simple diff summary
-            diff_lines = [
-                f"Pull Request #{pull_request_id}: {pr.title}",
-                f"Source: {pr.from_ref.display_id} ({source_commit[:8]})",
-                f"Target: {pr.to_ref.display_id} ({target_commit[:8]})",
-                "",
-                "Changed files:",
-            ]
-            for change in changes:
-                diff_lines.append(f"  {change['type']}: {change['path']}")
-
-            return "\n".join(diff_lines)
-
         except Exception as e:
             logger.error(
                 f"Error fetching diff for PR {pull_request_id} "
@@ -209,6 +277,48 @@ class PullRequestsMixin:
             )
             raise
 
+    def iter_pull_request_comments(
+        self: "BitbucketClient",
+        project_key: str,
+        repository_slug: str,
+        pull_request_id: int,
+        *,
+        start: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_items: int | None = None,
+    ) -> Iterator[BitbucketComment]:
+        """Iterate over the comments on a pull request, following pages lazily.
+
+        Comments are read from the activities of the pull request, which the
+        server cannot filter by type. Other activities are skipped and do not
+        count towards ``max_items``, and paging stops as soon as enough
+        comments were found.
+
+        Args:
+            project_key: The project key
+            repository_slug: The repository slug
+            pull_request_id: The pull request ID
+            start: Starting index of the activities (keyword-only)
+            page_size: Maximum number of activities to request at a time
+                (keyword-only)
+            max_items: Maximum number of comments to yield, None for all
+                (keyword-only)
+
+        Yields:
+            BitbucketComment objects
+        """
+        pr_path = self.bitbucket._url_pull_request(
+            project_key, repository_slug, pull_request_id
+        )
+        for activity in self._iter_paged(
+            f"{pr_path}/activities",
+            start=start,
+            page_size=page_size,
+            max_items=max_items,
+            predicate=_is_comment_activity,
+        ):
+            yield BitbucketComment.from_api_response(activity["comment"])
+
     def get_pull_request_comments(
         self: "BitbucketClient",
         project_key: str,
@@ -229,26 +339,16 @@ class PullRequestsMixin:
         Returns:
             List of BitbucketComment objects
         """
-        comments = []
-
         try:
-            # Get activities which include comments
-            for activity in self.bitbucket.get_pull_requests_activities(
-                project_key,
-                repository_slug,
-                pull_request_id,
-                start=start,
-                limit=limit,
-            ):
-                # Filter to only comment activities
-                if activity.get("action") == "COMMENTED":
-                    comment_data = activity.get("comment")
-                    if comment_data:
-                        comment = BitbucketComment.from_api_response(comment_data)
-                        comments.append(comment)
-
-                        if limit and len(comments) >= limit:
-                            break
+            return list(
+                self.iter_pull_request_comments(
+                    project_key,
+                    repository_slug,
+                    pull_request_id,
+                    start=start,
+                    max_items=limit or None,
+                )
+            )
         except Exception as e:
             logger.error(
                 f"Error fetching comments for PR {pull_request_id} "
@@ -256,8 +356,6 @@ class PullRequestsMixin:
             )
             raise
 
-        return comments
-
     def add_pull_request_comment(
         self: "BitbucketClient",
         project_key: str,
@@ -317,14 +415,13 @@ class PullRequestsMixin:
             List of commit objects
         """
         commits = []
+        pr_path = self.bitbucket._url_pull_request(
+            project_key, repository_slug, pull_request_id
+        )
 
         try:
-            for commit_data in self.bitbucket.get_pull_requests_commits(
-                project_key,
-                repository_slug,
-                pull_request_id,
-                start=start,
-                limit=limit,
+            for commit_data in self._iter_paged(
+                f"{pr_path}/commits", start=start, max_items=limit or None
             ):
                 commit = {
                     "id": commit_data.get("id"),
@@ -344,9 +441,6 @@ class PullRequestsMixin:
                     else None,
                 }
                 commits.append(commit)
-
-                if limit and len(commits) >= limit:
-                    break
         except Exception as e:
             logger.error(
                 f"Error fetching commits for PR {pull_request_id} "
@@ -1,10 +1,13 @@
 """Repositories mixin for Bitbucket client."""
 
 import logging
+from collections.abc import Iterator
 from typing import TYPE_CHECKING
 
 from mcp_atlassian.models.bitbucket import BitbucketBranch, BitbucketRepository
 
+from .client import DEFAULT_PAGE_SIZE
+
 if TYPE_CHECKING:
     from .client import BitbucketClient
 
@@ -14,6 +17,42 @@ logger = logging.getLogger("mcp-bitbucket.repositories")
 class RepositoriesMixin:
     """Mixin providing repository-related operations for BitbucketClient."""
 
+    def iter_repositories(
+        self: "BitbucketClient",
+        project_key: str,
+        *,
+        name: str | None = None,
+        start: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_items: int | None = None,
+    ) -> Iterator[BitbucketRepository]:
+        """Iterate over the repositories of a project, following pages lazily.
+
+        Args:
+            project_key: The project key
+            name: Optional text the repository names must contain, filtered
+                by the server (keyword-only)
+            start: Starting index for pagination (keyword-only)
+            page_size: Maximum number of repositories to request at a time
+                (keyword-only)
+            max_items: Maximum number of repositories to yield, None for all
+                (keyword-only)
+
+        Yields:
+            BitbucketRepository objects
+        """
+        if name:
+            # Only the global repository search filters by name
+            path = self.bitbucket.resource_url("repos")
+            params = {"projectkey": project_key, "name": name}
+        else:
+            path = self.bitbucket._url_repos(project_key)
+            params = {}
+        for repo_data in self._iter_paged(
+            path, params, start=start, page_size=page_size, max_items=max_items
+        ):
+            yield BitbucketRepository.from_api_response(repo_data)
+
     def get_repositories(
         self: "BitbucketClient",
         project_key: str,
@@ -30,23 +69,16 @@ class RepositoriesMixin:
         Returns:
             List of BitbucketRepository objects
         """
-        repositories = []
-
         try:
-            for repo_data in self.bitbucket.repo_list(
-                project_key, start=start, limit=limit or 25
-            ):
-                repo = BitbucketRepository.from_api_response(repo_data)
-                repositories.append(repo)
-
-                if limit and len(repositories) >= limit:
-                    break
+            return list(
+                self.iter_repositories(
+                    project_key, start=start, max_items=limit or None
+                )
+            )
         except Exception as e:
             logger.error(f"Error fetching repositories for project {project_key}: {e}")
             raise
 
-        return repositories
-
     def get_repository(
         self: "BitbucketClient",
         project_key: str,
@@ -130,6 +162,50 @@ class RepositoriesMixin:
             logger.error(f"Error fetching file {file_path} from {repo_path}: {e}")
             raise
 
+    def iter_branches(
+        self: "BitbucketClient",
+        project_key: str,
+        repository_slug: str,
+        *,
+        filter_text: str | None = None,
+        order_by: str = "MODIFICATION",
+        start: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_items: int | None = None,
+    ) -> Iterator[BitbucketBranch]:
+        """Iterate over the branches of a repository, following pages lazily.
+
+        Args:
+            project_key: The project key
+            repository_slug: The repository slug
+            filter_text: Optional text the branch names must contain, filtered
+                by the server (keyword-only)
+            order_by: Order by MODIFICATION or ALPHABETICAL (keyword-only)
+            start: Starting index for pagination (keyword-only)
+            page_size: Maximum number of branches to request at a time
+                (keyword-only)
+            max_items: Maximum number of branches to yield, None for all
+                (keyword-only)
+
+        Yields:
+            BitbucketBranch objects
+        """
+        params = {
+            "filterText": filter_text,
+            "orderBy": order_by,
+            # Branch metadata (ahead/behind counts, linked issues) is unused
+            # and expensive for the server to compute
+            "details": "false",
+        }
+        for branch_data in self._iter_paged(
+            self.bitbucket._url_repo_branches(project_key, repository_slug),
+            params,
+            start=start,
+            page_size=page_size,
+            max_items=max_items,
+        ):
+            yield BitbucketBranch.from_api_response(branch_data)
+
     def get_branches(
         self: "BitbucketClient",
         project_key: str,
@@ -152,30 +228,23 @@ class RepositoriesMixin:
         Returns:
             List of BitbucketBranch objects
         """
-        branches = []
-
         try:
-            for branch_data in self.bitbucket.get_branches(
-                project_key,
-                repository_slug,
-                filter=filter_text,
-                start=start,
-                limit=limit,
-                order_by=order_by,
-            ):
-                branch = BitbucketBranch.from_api_response(branch_data)
-                branches.append(branch)
-
-                if limit and len(branches) >= limit:
-                    break
+            return list(
+                self.iter_branches(
+                    project_key,
+                    repository_slug,
+                    filter_text=filter_text,
+                    order_by=order_by,
+                    start=start,
+                    max_items=limit or None,
+                )
+            )
         except Exception as e:
             logger.error(
                 f"Error fetching branches for {project_key}/{repository_slug}: {e}"
             )
             raise
 
-        return branches
-
     def get_default_branch(
         self: "BitbucketClient",
         project_key: str,
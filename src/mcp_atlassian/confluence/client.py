@@ -2,6 +2,7 @@
 
 import logging
 import os
+from collections.abc import Callable
 
 from atlassian import Confluence
 from requests import Session
@@ -11,6 +12,7 @@ from ..utils.auth import configure_server_pat_auth
 from ..utils.logging import get_masked_session_headers, log_config_param, mask_sensitive
 from ..utils.oauth import configure_oauth_session
 from ..utils.rate_limit import configure_rate_limiting
+from ..utils.response_cache import configure_response_cache
 from ..utils.ssl import configure_ssl_verification
 from .config import ConfluenceConfig
 
@@ -142,6 +144,9 @@ class ConfluenceClient:
         configure_rate_limiting(self.confluence._session, "confluence")
         logger.debug("Rate limiting configured for Confluence session")
 
+        # Serve repeated reads from the response cache (if enabled)
+        configure_response_cache(self.confluence._session, "confluence")
+
         # Apply custom headers if configured
         if self.config.custom_headers:
             self._apply_custom_headers()
@@ -149,7 +154,10 @@ class ConfluenceClient:
         # Import here to avoid circular imports
         from ..preprocessing.confluence import ConfluencePreprocessor
 
-        self.preprocessor = ConfluencePreprocessor(base_url=self.config.url)
+        self.preprocessor = ConfluencePreprocessor(
+            base_url=self.config.url,
+            content_converter=self.config.content_converter,
+        )
 
         # Test authentication during initialization (in debug mode only)
         if logger.isEnabledFor(logging.DEBUG):
@@ -215,3 +223,39 @@ class ConfluenceClient:
         return self.preprocessor.process_html_content(
             html_content, space_key, self.confluence
         )
+
+    def _content_loader(
+        self,
+        html_content: str,
+        space_key: str,
+        *,
+        convert_to_markdown: bool = True,
+        before: Callable[[], object] | None = None,
+    ) -> Callable[[], str]:
+        """Defer processing HTML content until the content is first read.
+
+        Args:
+            html_content: Raw HTML content from Confluence
+            space_key: The key of the space containing the content
+            convert_to_markdown: Whether to produce markdown or processed HTML
+            before: Optional callable run before processing, e.g. to look up
+                the users mentioned in a whole result set at once
+
+        Returns:
+            A callable returning the processed content
+        """
+
+        def load() -> str:
+            if before is not None:
+                before()
+            processed_html, processed_markdown = (
+                self.preprocessor.process_html_content(
+                    html_content,
+                    space_key=space_key,
+                    confluence_client=self.confluence,
+                    output="markdown" if convert_to_markdown else "html",
+                )
+            )
+            return processed_markdown if convert_to_markdown else processed_html
+
+        return load
@@ -37,14 +37,24 @@ class CommentsMixin(ConfluenceClient):
                 content_id=page_id, expand="body.view.value,version", depth="all"
             )
 
+            # Look up every mentioned user once for all comments
+            comments = comments_response.get("results", [])
+            self.preprocessor.prefetch_user_display_names(
+                (comment["body"]["view"]["value"] for comment in comments),
+                confluence_client=self.confluence,
+            )
+
             # Process each comment
             comment_models = []
-            for comment_data in comments_response.get("results", []):
+            for comment_data in comments:
                 # Get the content based on format
                 body = comment_data["body"]["view"]["value"]
                 processed_html, processed_markdown = (
                     self.preprocessor.process_html_content(
-                        body, space_key=space_key, confluence_client=self.confluence
+                        body,
+                        space_key=space_key,
+                        confluence_client=self.confluence,
+                        output="markdown" if return_markdown else "html",
                     )
                 )
 
@@ -120,6 +130,7 @@ class CommentsMixin(ConfluenceClient):
                 response.get("body", {}).get("view", {}).get("value", ""),
                 space_key=space_key,
                 confluence_client=self.confluence,
+                output="markdown",
             )
 
             # Modify the response to include processed content
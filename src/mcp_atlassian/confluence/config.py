@@ -5,6 +5,7 @@ import os
 from dataclasses import dataclass
 from typing import Literal
 
+from ..preprocessing.base import CONTENT_CONVERTERS, ContentConverter
 from ..utils.env import get_custom_headers, is_env_ssl_verify
 from ..utils.oauth import (
     BYOAccessTokenOAuthConfig,
@@ -36,6 +37,8 @@ class ConfluenceConfig:
     no_proxy: str | None = None  # Comma-separated list of hosts to bypass proxy
     socks_proxy: str | None = None  # SOCKS proxy URL (optional)
     custom_headers: dict[str, str] | None = None  # Custom HTTP headers
+    # Storage format to Markdown engine, "markdownify" or "lxml"
+    content_converter: ContentConverter = "markdownify"
 
     @property
     def is_cloud(self) -> bool:
@@ -127,6 +130,16 @@ class ConfluenceConfig:
         # Custom headers - service-specific only
         custom_headers = get_custom_headers("CONFLUENCE_CUSTOM_HEADERS")
 
+        content_converter = (
+            os.getenv("CONFLUENCE_CONTENT_CONVERTER", "markdownify").strip().lower()
+        )
+        if content_converter not in CONTENT_CONVERTERS:
+            logging.getLogger("mcp-atlassian.confluence.config").warning(
+                f"Invalid value for CONFLUENCE_CONTENT_CONVERTER: {content_converter}, "
+                f"expected one of {', '.join(CONTENT_CONVERTERS)}"
+            )
+            content_converter = "markdownify"
+
         return cls(
             url=url,
             auth_type=auth_type,
@@ -141,6 +154,7 @@ class ConfluenceConfig:
             no_proxy=no_proxy,
             socks_proxy=socks_proxy,
             custom_headers=custom_headers,
+            content_converter=content_converter,  # type: ignore[arg-type]
         )
 
     def is_auth_configured(self) -> bool:
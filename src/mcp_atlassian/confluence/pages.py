@@ -1,12 +1,15 @@
 """Module for Confluence page operations."""
 
 import logging
+from collections.abc import Iterator
+from functools import cache
 
 import requests
 from requests.exceptions import HTTPError
 
 from ..exceptions import MCPAtlassianAuthenticationError
 from ..models.confluence import ConfluencePage
+from ..utils.paging import iter_paged, next_offset
 from .client import ConfluenceClient
 from .v2_adapter import ConfluenceV2Adapter
 
@@ -70,7 +73,10 @@ class PagesMixin(ConfluenceClient):
             space_key = page.get("space", {}).get("key", "")
             content = page["body"]["storage"]["value"]
             processed_html, processed_markdown = self.preprocessor.process_html_content(
-                content, space_key=space_key, confluence_client=self.confluence
+                content,
+                space_key=space_key,
+                confluence_client=self.confluence,
+                output="markdown" if convert_to_markdown else "html",
             )
 
             # Use the appropriate content format based on the convert_to_markdown flag
@@ -185,7 +191,10 @@ class PagesMixin(ConfluenceClient):
 
             content = page["body"]["storage"]["value"]
             processed_html, processed_markdown = self.preprocessor.process_html_content(
-                content, space_key=space_key, confluence_client=self.confluence
+                content,
+                space_key=space_key,
+                confluence_client=self.confluence,
+                output="markdown" if convert_to_markdown else "html",
             )
 
             # Use the appropriate content format based on the convert_to_markdown flag
@@ -224,6 +233,7 @@ class PagesMixin(ConfluenceClient):
         limit: int = 10,
         *,
         convert_to_markdown: bool = True,
+        include_content: bool = True,
     ) -> list[ConfluencePage]:
         """
         Get all pages from a specific space.
@@ -234,45 +244,123 @@ class PagesMixin(ConfluenceClient):
             limit: Maximum number of pages to return
             convert_to_markdown: When True, returns content in markdown format,
                                otherwise returns raw HTML (keyword-only)
+            include_content: When False, the page bodies are not requested and
+                only metadata is returned (keyword-only)
 
         Returns:
-            List of ConfluencePage models containing page content and metadata
+            List of ConfluencePage models containing page content and metadata.
+            The content of each page is processed the first time it is read.
         """
         pages = self.confluence.get_all_pages_from_space(
-            space=space_key, start=start, limit=limit, expand="body.storage"
+            space=space_key,
+            start=start,
+            limit=limit,
+            expand="body.storage" if include_content else None,
         )
 
-        page_models = []
-        for page in pages:
-            content = page["body"]["storage"]["value"]
-            processed_html, processed_markdown = self.preprocessor.process_html_content(
-                content, space_key=space_key, confluence_client=self.confluence
+        return [
+            self._space_page_model(
+                page,
+                space_key,
+                convert_to_markdown=convert_to_markdown,
+                include_content=include_content,
             )
+            for page in pages
+        ]
 
-            # Use the appropriate content format based on the convert_to_markdown flag
-            page_content = processed_markdown if convert_to_markdown else processed_html
+    def iter_space_pages(
+        self,
+        space_key: str,
+        *,
+        convert_to_markdown: bool = True,
+        include_content: bool = True,
+        page_size: int = 25,
+        max_items: int | None = None,
+    ) -> Iterator[ConfluencePage]:
+        """
+        Iterate over all pages of a space, following `start` across requests.
 
-            # Ensure space information is included
-            if "space" not in page:
-                page["space"] = {
-                    "key": space_key,
-                    "name": space_key,  # Use space_key as name if not available
-                }
+        Pages of results are requested lazily: the next one is only fetched
+        once the pages of the current one have been consumed.
 
-            # Create the ConfluencePage model
-            page_model = ConfluencePage.from_api_response(
-                page,
-                base_url=self.config.url,
-                include_body=True,
-                # Override content with our processed version
-                content_override=page_content,
-                content_format="storage" if not convert_to_markdown else "markdown",
-                is_cloud=self.config.is_cloud,
+        Args:
+            space_key: The key of the space to get pages from
+            convert_to_markdown: When True, returns content in markdown format,
+                otherwise returns raw HTML (keyword-only)
+            include_content: When False, the page bodies are not requested and
+                only metadata is returned (keyword-only)
+            page_size: Maximum number of pages to request at a time (keyword-only)
+            max_items: Maximum number of pages to yield in total, None for all
+                (keyword-only)
+
+        Yields:
+            ConfluencePage models. The content of each page is processed the
+            first time it is read.
+
+        Raises:
+            HTTPError: If a request fails
+        """
+
+        def fetch_page(
+            start: int, limit: int
+        ) -> tuple[list[ConfluencePage], int | None]:
+            pages = self.confluence.get_all_pages_from_space(
+                space=space_key,
+                start=start,
+                limit=limit,
+                expand="body.storage" if include_content else None,
             )
+            page_models = [
+                self._space_page_model(
+                    page,
+                    space_key,
+                    convert_to_markdown=convert_to_markdown,
+                    include_content=include_content,
+                )
+                for page in pages or []
+            ]
+            # The API does not report the total, so stop at the first empty page
+            return page_models, next_offset(
+                start, len(page_models), None, is_last=False
+            )
+
+        yield from iter_paged(fetch_page, 0, page_size=page_size, max_items=max_items)
 
-            page_models.append(page_model)
+    def _space_page_model(
+        self,
+        page: dict,
+        space_key: str,
+        *,
+        convert_to_markdown: bool,
+        include_content: bool,
+    ) -> ConfluencePage:
+        """Create the model of a page listed by get_all_pages_from_space."""
+        content = page.get("body", {}).get("storage", {}).get("value", "")
+        content_loader = (
+            self._content_loader(
+                content, space_key, convert_to_markdown=convert_to_markdown
+            )
+            if include_content and content
+            else None
+        )
 
-        return page_models
+        # Ensure space information is included
+        if "space" not in page:
+            page["space"] = {
+                "key": space_key,
+                "name": space_key,  # Use space_key as name if not available
+            }
+
+        # Create the ConfluencePage model
+        return ConfluencePage.from_api_response(
+            page,
+            base_url=self.config.url,
+            include_body=False,
+            # Process the content only once it is read
+            content_loader=content_loader,
+            content_format="storage" if not convert_to_markdown else "markdown",
+            is_cloud=self.config.is_cloud,
+        )
 
     def create_page(
         self,
@@ -449,6 +537,7 @@ class PagesMixin(ConfluenceClient):
         expand: str = "version",
         *,
         convert_to_markdown: bool = True,
+        include_content: bool = True,
     ) -> list[ConfluencePage]:
         """
         Get child pages of a specific Confluence page.
@@ -460,9 +549,12 @@ class PagesMixin(ConfluenceClient):
             expand: Fields to expand in the response
             convert_to_markdown: When True, returns content in markdown format,
                                otherwise returns raw HTML (keyword-only)
+            include_content: When False, page bodies are left out even if
+                expanded (keyword-only)
 
         Returns:
-            List of ConfluencePage models containing the child pages
+            List of ConfluencePage models containing the child pages.
+            Markdown content is converted the first time it is read.
         """
         try:
             # Use the Atlassian Python API's get_page_child_by_type method
@@ -485,26 +577,36 @@ class PagesMixin(ConfluenceClient):
             if child_pages and "space" in child_pages[0]:
                 space_key = child_pages[0].get("space", {}).get("key", "")
 
+            # The first page whose content is read looks up every user
+            # mentioned in all child pages at once
+            bodies = [
+                page.get("body", {}).get("storage", {}).get("value", "")
+                for page in child_pages
+                if "body" in page
+            ]
+            prefetch_users = cache(
+                lambda: self.preprocessor.prefetch_user_display_names(
+                    bodies, confluence_client=self.confluence
+                )
+            )
+
             # Process each child page
             for page in child_pages:
                 # Only process content if we have "body" expanded
-                content_override = None
-                if "body" in page and convert_to_markdown:
+                content_loader = None
+                if "body" in page and convert_to_markdown and include_content:
                     content = page.get("body", {}).get("storage", {}).get("value", "")
                     if content:
-                        _, processed_markdown = self.preprocessor.process_html_content(
-                            content,
-                            space_key=space_key,
-                            confluence_client=self.confluence,
+                        content_loader = self._content_loader(
+                            content, space_key, before=prefetch_users
                         )
-                        content_override = processed_markdown
 
                 # Create the page model
                 page_model = ConfluencePage.from_api_response(
                     page,
                     base_url=self.config.url,
-                    include_body=True,
-                    content_override=content_override,
+                    include_body=include_content,
+                    content_loader=content_loader,
                     content_format="markdown" if convert_to_markdown else "storage",
                 )
 
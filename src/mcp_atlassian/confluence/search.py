@@ -1,6 +1,9 @@
 """Module for Confluence search operations."""
 
 import logging
+from collections.abc import Iterator
+from functools import cache
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 from ..models.confluence import (
     ConfluencePage,
@@ -9,6 +12,7 @@ from ..models.confluence import (
     ConfluenceUserSearchResults,
 )
 from ..utils.decorators import handle_atlassian_api_errors
+from ..utils.paging import iter_paged
 from .client import ConfluenceClient
 from .utils import quote_cql_identifier_if_needed
 
@@ -20,7 +24,12 @@ class SearchMixin(ConfluenceClient):
 
     @handle_atlassian_api_errors("Confluence API")
     def search(
-        self, cql: str, limit: int = 10, spaces_filter: str | None = None
+        self,
+        cql: str,
+        limit: int = 10,
+        spaces_filter: str | None = None,
+        *,
+        include_content: bool = True,
     ) -> list[ConfluencePage]:
         """
         Search content using Confluence Query Language (CQL).
@@ -30,14 +39,89 @@ class SearchMixin(ConfluenceClient):
             limit: Maximum number of results to return
             spaces_filter: Optional comma-separated list of space keys to filter by,
                 overrides config
+            include_content: When False, result excerpts are left out
+                (keyword-only)
 
         Returns:
-            List of ConfluencePage models containing search results
+            List of ConfluencePage models containing search results. Excerpts
+            are converted to markdown the first time the content is read.
 
         Raises:
             MCPAtlassianAuthenticationError: If authentication fails with the
                 Confluence API (401/403)
         """
+        cql = self._apply_spaces_filter(cql, spaces_filter)
+
+        # Execute the CQL search query
+        results = self.confluence.cql(cql=cql, limit=limit)
+
+        return self._search_result_pages(results, cql, include_content=include_content)
+
+    def iter_search(
+        self,
+        cql: str,
+        spaces_filter: str | None = None,
+        *,
+        include_content: bool = True,
+        page_size: int = 25,
+        max_items: int | None = None,
+    ) -> Iterator[ConfluencePage]:
+        """
+        Iterate over all results of a CQL search, following `_links.next`.
+
+        Result pages are requested lazily: the next one is only fetched once
+        the results of the current one have been consumed.
+
+        Args:
+            cql: Confluence Query Language string
+            spaces_filter: Optional comma-separated list of space keys to filter by,
+                overrides config
+            include_content: When False, result excerpts are left out
+                (keyword-only)
+            page_size: Maximum number of results to request at a time
+                (keyword-only)
+            max_items: Maximum number of results to yield in total, None for
+                all (keyword-only)
+
+        Yields:
+            ConfluencePage models of the search results. Excerpts are
+            converted to markdown the first time the content is read.
+
+        Raises:
+            HTTPError: If a request fails
+        """
+        cql = self._apply_spaces_filter(cql, spaces_filter)
+
+        def fetch_page(
+            next_link: str, limit: int
+        ) -> tuple[list[ConfluencePage], str | None]:
+            if next_link:
+                results = self.confluence.get(_with_limit(next_link, limit))
+            else:
+                results = self.confluence.cql(cql=cql, limit=limit)
+            if not isinstance(results, dict):
+                msg = f"Unexpected return value type from CQL search: {type(results)}"
+                logger.error(msg)
+                raise TypeError(msg)
+            pages = self._search_result_pages(
+                results, cql, include_content=include_content
+            )
+            return pages, results.get("_links", {}).get("next")
+
+        yield from iter_paged(fetch_page, "", page_size=page_size, max_items=max_items)
+
+    def _apply_spaces_filter(self, cql: str, spaces_filter: str | None) -> str:
+        """
+        Restrict a CQL query to the filtered spaces.
+
+        Args:
+            cql: Confluence Query Language string
+            spaces_filter: Optional comma-separated list of space keys,
+                overrides config
+
+        Returns:
+            The CQL query, restricted to the filtered spaces if any
+        """
         # Use spaces_filter parameter if provided, otherwise fall back to config
         filter_to_use = spaces_filter or self.config.spaces_filter
 
@@ -60,9 +144,23 @@ class SearchMixin(ConfluenceClient):
 
             logger.info(f"Applied spaces filter to query: {cql}")
 
-        # Execute the CQL search query
-        results = self.confluence.cql(cql=cql, limit=limit)
+        return cql
+
+    def _search_result_pages(
+        self, results: dict, cql: str, *, include_content: bool
+    ) -> list[ConfluencePage]:
+        """
+        Convert one page of a CQL search response to page models.
+
+        Args:
+            results: The CQL search response
+            cql: The CQL query that was run
+            include_content: When False, result excerpts are left out
 
+        Returns:
+            List of ConfluencePage models. Excerpts are converted to markdown
+            the first time the content is read.
+        """
         # Convert the response to a search result model
         search_result = ConfluenceSearchResult.from_api_response(
             results,
@@ -71,28 +169,36 @@ class SearchMixin(ConfluenceClient):
             is_cloud=self.config.is_cloud,
         )
 
-        # Process result excerpts as content
-        processed_pages = []
-        for page in search_result.results:
-            # Get the excerpt from the original search results
+        # Map each result to its excerpt once. The first result for an ID wins.
+        excerpts: dict[str, str] = {}
+        if include_content:
             for result_item in results.get("results", []):
-                if result_item.get("content", {}).get("id") == page.id:
-                    excerpt = result_item.get("excerpt", "")
-                    if excerpt:
-                        # Process the excerpt as HTML content
-                        space_key = page.space.key if page.space else ""
-                        _, processed_markdown = self.preprocessor.process_html_content(
-                            excerpt,
-                            space_key=space_key,
-                            confluence_client=self.confluence,
-                        )
-                        # Create a new page with processed content
-                        page.content = processed_markdown
-                    break
+                content_id = result_item.get("content", {}).get("id")
+                if content_id is not None:
+                    excerpts.setdefault(str(content_id), result_item.get("excerpt", ""))
+
+        # The first excerpt that is read looks up the users mentioned in all
+        # excerpts with one bulk request
+        prefetch_users = cache(
+            lambda: self.preprocessor.prefetch_user_display_names(
+                excerpts.values(), confluence_client=self.confluence
+            )
+        )
 
+        # Use result excerpts as content, processed once they are read
+        processed_pages = []
+        for page in search_result.results:
+            excerpt = excerpts.get(page.id)
+            if excerpt:
+                space_key = page.space.key if page.space else ""
+                page.set_content_loader(
+                    self._content_loader(excerpt, space_key, before=prefetch_users)
+                )
+            elif not include_content:
+                page.content = ""
             processed_pages.append(page)
 
-        # Return the list of result pages with processed content
+        # Return the list of result pages
         return processed_pages
 
     @handle_atlassian_api_errors("Confluence API")
@@ -123,3 +229,11 @@ class SearchMixin(ConfluenceClient):
 
         # Return the list of user search results
         return search_result.results
+
+
+def _with_limit(link: str, limit: int) -> str:
+    """Replace the limit parameter of a `_links.next` link."""
+    parts = urlsplit(link)
+    query = [(k, v) for k, v in parse_qsl(parts.query) if k != "limit"]
+    query.append(("limit", str(limit)))
+    return urlunsplit(parts._replace(query=urlencode(query)))
@@ -1,28 +1,116 @@
 """Attachment operations for Jira API."""
 
+import base64
+import io
+import json
 import logging
 import os
+import shutil
+import zipfile
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+import anyio
+
 from ..models.jira import JiraAttachment
+from ..utils.executor import run_blocking
 from .client import JiraClient
+from .constants import ATTACHMENT_MANIFEST_NAME, ATTACHMENT_ZIP_MAX_BYTES
 from .protocols import AttachmentsOperationsProto
 
 # Configure logging
 logger = logging.getLogger("mcp-jira")
 
 
+@dataclass
+class _DownloadPlan:
+    """Attachments of an issue to download, and those already up to date."""
+
+    issue_key: str
+    target_path: Path
+    total: int
+    manifest: dict[str, dict[str, Any]]
+    pending: list[tuple[JiraAttachment, Path]] = field(default_factory=list)
+    skipped: list[dict[str, Any]] = field(default_factory=list)
+    failed: list[dict[str, Any]] = field(default_factory=list)
+
+
+def _manifest_entry(attachment: JiraAttachment) -> dict[str, Any]:
+    """Get the manifest record of an attachment."""
+    return {
+        "filename": attachment.filename,
+        "size": attachment.size,
+        "created": str(attachment.created),
+    }
+
+
+def _load_manifest(target_path: Path) -> dict[str, dict[str, Any]]:
+    """Read the download manifest of a directory, if any."""
+    try:
+        manifest = json.loads((target_path / ATTACHMENT_MANIFEST_NAME).read_text())
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def _save_manifest(target_path: Path, manifest: dict[str, dict[str, Any]]) -> None:
+    """Write the download manifest of a directory.
+
+    The manifest only saves requests on the next download, so failing to
+    write it is logged rather than raised.
+    """
+    try:
+        (target_path / ATTACHMENT_MANIFEST_NAME).write_text(
+            json.dumps(manifest, indent=2, sort_keys=True)
+        )
+    except OSError as e:
+        logger.warning(f"Could not write attachment manifest in {target_path}: {e}")
+
+
+def _is_unchanged(
+    attachment: JiraAttachment,
+    file_path: Path,
+    manifest: dict[str, dict[str, Any]],
+) -> bool:
+    """Check whether a previously downloaded attachment is still current.
+
+    The attachment is current if the manifest recorded the same size and
+    creation time for it, and the file on disk still has that size.
+    """
+    if manifest.get(str(attachment.id)) != _manifest_entry(attachment):
+        return False
+    try:
+        return file_path.stat().st_size == attachment.size
+    except OSError:
+        return False
+
+
 class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
     """Mixin for Jira attachment operations."""
 
-    def download_attachment(self, url: str, target_path: str) -> bool:
+    def download_attachment(
+        self,
+        url: str,
+        target_path: str,
+        *,
+        expected_size: int | None = None,
+        chunk_size: int | None = None,
+    ) -> bool:
         """
         Download a Jira attachment to the specified path.
 
+        The file is streamed to ``<target_path>.part`` and renamed once
+        complete. If a partial file is left over from an interrupted
+        download, only the missing bytes are requested with an HTTP Range
+        header; servers that ignore the header send the whole file again.
+
         Args:
             url: The URL of the attachment to download
             target_path: The path where the attachment should be saved
+            expected_size: Size reported by Jira, to resume and verify the download
+            chunk_size: Bytes read per chunk (defaults to the configured
+                attachment chunk size)
 
         Returns:
             True if successful, False otherwise
@@ -36,48 +124,166 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
             if not os.path.isabs(target_path):
                 target_path = os.path.abspath(target_path)
 
-            logger.info(f"Downloading attachment from {url} to {target_path}")
-
             # Create the directory if it doesn't exist
             os.makedirs(os.path.dirname(target_path), exist_ok=True)
 
+            part_path = f"{target_path}.part"
+            offset = self._resume_offset(part_path, expected_size)
+            request_kwargs: dict[str, Any] = {}
+            if offset:
+                logger.info(f"Resuming download of {url} at byte {offset}")
+                request_kwargs["headers"] = {"Range": f"bytes={offset}-"}
+            else:
+                logger.info(f"Downloading attachment from {url} to {target_path}")
+
             # Use the Jira session to download the file
-            response = self.jira._session.get(url, stream=True)
+            response = self.jira._session.get(url, stream=True, **request_kwargs)
             response.raise_for_status()
 
-            # Write the file to disk
-            with open(target_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
+            # Append only if the server honoured the range request
+            mode = "ab" if offset and response.status_code == 206 else "wb"
+            with open(part_path, mode) as f:
+                for chunk in response.iter_content(
+                    chunk_size=chunk_size or self.config.attachment_chunk_size
+                ):
                     f.write(chunk)
 
             # Verify the file was created
-            if os.path.exists(target_path):
-                file_size = os.path.getsize(target_path)
-                logger.info(
-                    f"Successfully downloaded attachment to {target_path} (size: {file_size} bytes)"
+            if not os.path.exists(part_path):
+                logger.error(f"File was not created at {part_path}")
+                return False
+
+            file_size = os.path.getsize(part_path)
+            if expected_size is not None and file_size != expected_size:
+                logger.error(
+                    f"Downloaded {file_size} of {expected_size} bytes to {part_path}"
                 )
-                return True
-            else:
-                logger.error(f"File was not created at {target_path}")
+                if file_size > expected_size:
+                    # A larger file cannot be resumed, start over next time
+                    os.remove(part_path)
                 return False
 
+            os.replace(part_path, target_path)
+            logger.info(
+                f"Successfully downloaded attachment to {target_path} (size: {file_size} bytes)"
+            )
+            return True
+
         except Exception as e:
             logger.error(f"Error downloading attachment: {str(e)}")
             return False
 
+    @staticmethod
+    def _resume_offset(part_path: str, expected_size: int | None) -> int:
+        """
+        Get the byte offset to resume a partial download at.
+
+        Args:
+            part_path: Path of the partial file
+            expected_size: Size of the complete file, if known
+
+        Returns:
+            The size of the partial file, or 0 to download from the start.
+        """
+        try:
+            size = os.stat(part_path).st_size
+        except OSError:
+            return 0
+        if expected_size is not None and size >= expected_size:
+            return 0
+        return size
+
     def download_issue_attachments(
         self, issue_key: str, target_dir: str
     ) -> dict[str, Any]:
         """
         Download all attachments for a Jira issue.
 
+        Attachments are downloaded one after another. Files recorded in the
+        directory manifest with an unchanged size and creation time are
+        skipped; see ``download_issue_attachments_async`` to download the
+        others concurrently.
+
+        Args:
+            issue_key: The Jira issue key (e.g., 'PROJ-123')
+            target_dir: The directory where attachments should be saved
+
+        Returns:
+            A dictionary with download results
+        """
+        plan = self._plan_issue_download(issue_key, target_dir)
+        if isinstance(plan, dict):
+            return plan
+        results = [
+            self._download_planned(attachment, file_path)
+            for attachment, file_path in plan.pending
+        ]
+        return self._finish_issue_download(plan, results)
+
+    async def download_issue_attachments_async(
+        self, issue_key: str, target_dir: str, *, as_zip: bool = False
+    ) -> dict[str, Any]:
+        """
+        Download all attachments for a Jira issue concurrently.
+
+        Same result as download_issue_attachments, but each attachment is
+        downloaded by its own call in the Jira worker pool, so as many files
+        as the pool has workers are transferred at once. Every request still
+        draws from the Jira rate limiter.
+
         Args:
             issue_key: The Jira issue key (e.g., 'PROJ-123')
             target_dir: The directory where attachments should be saved
+            as_zip: Also return the downloaded files as a base64 encoded
+                zip archive, see ``zip_attachments``
 
         Returns:
             A dictionary with download results
         """
+        plan = await run_blocking(
+            "jira", self._plan_issue_download, issue_key, target_dir
+        )
+        if isinstance(plan, dict):
+            return plan
+
+        results = [False] * len(plan.pending)
+
+        async def download(index: int, attachment: JiraAttachment, path: Path) -> None:
+            results[index] = await run_blocking(
+                "jira", self._download_planned, attachment, path
+            )
+
+        async with anyio.create_task_group() as tg:
+            for index, (attachment, file_path) in enumerate(plan.pending):
+                tg.start_soon(download, index, attachment, file_path)
+
+        result = await run_blocking("jira", self._finish_issue_download, plan, results)
+        if as_zip:
+            result["zip"] = await run_blocking(
+                "jira",
+                self.zip_attachments,
+                f"{issue_key}-attachments.zip",
+                result["downloaded"] + result["skipped"],
+            )
+        return result
+
+    def _plan_issue_download(
+        self, issue_key: str, target_dir: str
+    ) -> _DownloadPlan | dict[str, Any]:
+        """
+        Fetch the attachments of an issue and decide which to download.
+
+        Args:
+            issue_key: The Jira issue key (e.g., 'PROJ-123')
+            target_dir: The directory where attachments should be saved
+
+        Returns:
+            The download plan, or the final result if there is nothing to
+            download.
+
+        Raises:
+            TypeError: If the issue response is not a dictionary
+        """
         # Convert to absolute path if relative
         if not os.path.isabs(target_dir):
             target_dir = os.path.abspath(target_dir)
@@ -103,10 +309,6 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
             logger.error(f"Could not retrieve issue {issue_key}")
             return {"success": False, "error": f"Could not retrieve issue {issue_key}"}
 
-        # Process attachments
-        attachments = []
-        results = []
-
         # Extract attachments from the API response
         attachment_data = issue_data.get("fields", {}).get("attachment", [])
 
@@ -119,31 +321,38 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
             }
 
         # Create JiraAttachment objects for each attachment
-        for attachment in attachment_data:
-            if isinstance(attachment, dict):
-                attachments.append(JiraAttachment.from_api_response(attachment))
-
-        # Download each attachment
-        downloaded = []
-        failed = []
-
+        attachments = [
+            JiraAttachment.from_api_response(attachment)
+            for attachment in attachment_data
+            if isinstance(attachment, dict)
+        ]
+
+        plan = _DownloadPlan(
+            issue_key=issue_key,
+            target_path=target_path,
+            total=len(attachments),
+            manifest=_load_manifest(target_path),
+        )
+        used_names: set[str] = set()
         for attachment in attachments:
             if not attachment.url:
                 logger.warning(f"No URL for attachment {attachment.filename}")
-                failed.append(
+                plan.failed.append(
                     {"filename": attachment.filename, "error": "No URL available"}
                 )
                 continue
 
-            # Create a safe filename
+            # Create a safe filename, unique within the issue so that
+            # concurrent downloads never write to the same file
             safe_filename = Path(attachment.filename).name
+            if safe_filename in used_names:
+                stem, suffix = os.path.splitext(safe_filename)
+                safe_filename = f"{stem}-{attachment.id}{suffix}"
+            used_names.add(safe_filename)
             file_path = target_path / safe_filename
 
-            # Download the attachment
-            success = self.download_attachment(attachment.url, str(file_path))
-
-            if success:
-                downloaded.append(
+            if _is_unchanged(attachment, file_path, plan.manifest):
+                plan.skipped.append(
                     {
                         "filename": attachment.filename,
                         "path": str(file_path),
@@ -151,18 +360,114 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
                     }
                 )
             else:
+                plan.pending.append((attachment, file_path))
+
+        if plan.skipped:
+            logger.info(
+                f"Skipping {len(plan.skipped)} unchanged attachments of {issue_key}"
+            )
+        return plan
+
+    def _download_planned(self, attachment: JiraAttachment, file_path: Path) -> bool:
+        """Download one attachment of a download plan, verifying its size."""
+        return self.download_attachment(
+            attachment.url or "", str(file_path), expected_size=attachment.size or None
+        )
+
+    def _finish_issue_download(
+        self, plan: _DownloadPlan, results: list[bool]
+    ) -> dict[str, Any]:
+        """
+        Record the downloaded attachments and build the download result.
+
+        Args:
+            plan: The executed download plan
+            results: Whether each pending attachment was downloaded, in order
+
+        Returns:
+            A dictionary with download results
+        """
+        downloaded = []
+        failed = list(plan.failed)
+        for (attachment, file_path), success in zip(plan.pending, results, strict=True):
+            if not success:
                 failed.append(
                     {"filename": attachment.filename, "error": "Download failed"}
                 )
+                continue
+            plan.manifest[str(attachment.id)] = _manifest_entry(attachment)
+            downloaded.append(
+                {
+                    "filename": attachment.filename,
+                    "path": str(file_path),
+                    "size": attachment.size,
+                }
+            )
+
+        if downloaded:
+            _save_manifest(plan.target_path, plan.manifest)
 
         return {
             "success": True,
-            "issue_key": issue_key,
-            "total": len(attachments),
+            "issue_key": plan.issue_key,
+            "total": plan.total,
             "downloaded": downloaded,
+            "skipped": plan.skipped,
             "failed": failed,
         }
 
+    def zip_attachments(
+        self,
+        archive_name: str,
+        files: list[dict[str, Any]],
+        max_bytes: int = ATTACHMENT_ZIP_MAX_BYTES,
+    ) -> dict[str, Any]:
+        """
+        Pack downloaded attachments into an in-memory zip archive.
+
+        Files are streamed into the archive in chunks. Files that would take
+        the uncompressed total over ``max_bytes`` are left out and listed in
+        the result.
+
+        Args:
+            archive_name: File name to report for the archive
+            files: Download result entries with "filename" and "path"
+            max_bytes: Maximum uncompressed size of the archived files
+
+        Returns:
+            A dictionary with the archive name, its size, the archived and
+            omitted file names, and the archive as base64.
+        """
+        buffer = io.BytesIO()
+        archived: list[str] = []
+        omitted: list[str] = []
+        total = 0
+        with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for entry in files:
+                path = Path(entry["path"])
+                size = path.stat().st_size
+                if total + size > max_bytes:
+                    omitted.append(entry["filename"])
+                    continue
+                with path.open("rb") as src, archive.open(path.name, "w") as dst:
+                    shutil.copyfileobj(src, dst, self.config.attachment_chunk_size)
+                archived.append(path.name)
+                total += size
+
+        if omitted:
+            logger.warning(
+                f"Left {len(omitted)} attachments out of {archive_name}, "
+                f"the archive is limited to {max_bytes} bytes"
+            )
+        data = buffer.getvalue()
+        return {
+            "filename": archive_name,
+            "size": len(data),
+            "files": archived,
+            "omitted": omitted,
+            "content_base64": base64.b64encode(data).decode("ascii"),
+        }
+
     def upload_attachment(self, issue_key: str, file_path: str) -> dict[str, Any]:
         """
         Upload a single attachment to a Jira issue.
@@ -251,12 +556,70 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
         logger.info(f"Uploading {len(file_paths)} attachments to issue {issue_key}")
 
         # Upload each attachment
+        results = [
+            self.upload_attachment(issue_key, file_path) for file_path in file_paths
+        ]
+        return self._upload_results(issue_key, file_paths, results)
+
+    async def upload_attachments_async(
+        self, issue_key: str, file_paths: list[str]
+    ) -> dict[str, Any]:
+        """
+        Upload multiple attachments to a Jira issue concurrently.
+
+        Same result as upload_attachments, but each file is uploaded by its
+        own call in the Jira worker pool, so as many files as the pool has
+        workers are transferred at once.
+
+        Args:
+            issue_key: The Jira issue key (e.g., 'PROJ-123')
+            file_paths: List of paths to files to upload
+
+        Returns:
+            A dictionary with upload results
+        """
+        if not issue_key:
+            logger.error("No issue key provided for attachment upload")
+            return {"success": False, "error": "No issue key provided"}
+
+        if not file_paths:
+            logger.error("No file paths provided for attachment upload")
+            return {"success": False, "error": "No file paths provided"}
+
+        logger.info(f"Uploading {len(file_paths)} attachments to issue {issue_key}")
+
+        results: list[dict[str, Any]] = [{} for _ in file_paths]
+
+        async def upload(index: int, file_path: str) -> None:
+            results[index] = await run_blocking(
+                "jira", self.upload_attachment, issue_key, file_path
+            )
+
+        async with anyio.create_task_group() as tg:
+            for index, file_path in enumerate(file_paths):
+                tg.start_soon(upload, index, file_path)
+
+        return self._upload_results(issue_key, file_paths, results)
+
+    @staticmethod
+    def _upload_results(
+        issue_key: str, file_paths: list[str], results: list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """
+        Build the result of a multi-file upload.
+
+        Args:
+            issue_key: The Jira issue key
+            file_paths: The uploaded paths
+            results: The results of ``upload_attachment``, in path order
+
+        Returns:
+            A dictionary with upload results
+        """
         uploaded = []
         failed = []
 
-        for file_path in file_paths:
-            result = self.upload_attachment(issue_key, file_path)
-
+        for file_path, result in zip(file_paths, results, strict=True):
             if result.get("success"):
                 uploaded.append(
                     {
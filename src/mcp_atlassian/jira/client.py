@@ -2,13 +2,19 @@
 
 import logging
 import os
+from threading import Lock
 from typing import Any, Literal
 
 from atlassian import Jira
+from cachetools import TTLCache
 from requests import Session
 
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.preprocessing import JiraPreprocessor
+from mcp_atlassian.utils.async_http import (
+    AsyncAtlassianClient,
+    create_async_client,
+)
 from mcp_atlassian.utils.auth import configure_server_pat_auth
 from mcp_atlassian.utils.logging import (
     get_masked_session_headers,
@@ -17,10 +23,18 @@ from mcp_atlassian.utils.logging import (
 )
 from mcp_atlassian.utils.oauth import configure_oauth_session
 from mcp_atlassian.utils.rate_limit import configure_rate_limiting
+from mcp_atlassian.utils.response_cache import configure_response_cache
 from mcp_atlassian.utils.ssl import configure_ssl_verification
 
 from .config import JiraConfig
+from .constants import (
+    EPIC_DETAILS_CACHE_SIZE,
+    EPIC_DETAILS_CACHE_TTL_SECONDS,
+    SEARCH_TOTAL_CACHE_SIZE,
+    SEARCH_TOTAL_CACHE_TTL_SECONDS,
+)
 from .development import DevelopmentMixin
+from .field_registry import FieldRegistry
 
 # Configure logging
 logger = logging.getLogger("mcp-jira")
@@ -30,7 +44,12 @@ class JiraClient(DevelopmentMixin):
     """Base client for Jira API interactions with development information support."""
 
     _field_ids_cache: list[dict[str, Any]] | None
+    _field_registry: FieldRegistry | None
     _current_user_account_id: str | None
+    _epic_details_cache: TTLCache[str, dict[str, Any]]
+    _epic_details_lock: Lock
+    _search_total_cache: TTLCache[tuple[str, str], int]
+    _search_total_lock: Lock
 
     config: JiraConfig
     preprocessor: JiraPreprocessor
@@ -157,14 +176,31 @@ class JiraClient(DevelopmentMixin):
         configure_rate_limiting(self.jira._session, "jira")
         logger.debug("Rate limiting configured for Jira session")
 
+        # Serve repeated reads from the response cache (if enabled)
+        configure_response_cache(self.jira._session, "jira")
+
         # Apply custom headers if configured
         if self.config.custom_headers:
             self._apply_custom_headers()
 
+        # Native async HTTP client, created on first use
+        self._async_client: AsyncAtlassianClient | None = None
+
         # Initialize the text preprocessor for text processing capabilities
         self.preprocessor = JiraPreprocessor(base_url=self.config.url)
         self._field_ids_cache = None
+        self._field_registry = None
         self._current_user_account_id = None
+        # Epic lookups made while reading issues, shared across calls
+        self._epic_details_cache = TTLCache(
+            maxsize=EPIC_DETAILS_CACHE_SIZE, ttl=EPIC_DETAILS_CACHE_TTL_SECONDS
+        )
+        self._epic_details_lock = Lock()
+        # Cloud search totals, keyed by count mode and normalized JQL
+        self._search_total_cache = TTLCache(
+            maxsize=SEARCH_TOTAL_CACHE_SIZE, ttl=SEARCH_TOTAL_CACHE_TTL_SECONDS
+        )
+        self._search_total_lock = Lock()
 
         # Test authentication during initialization (in debug mode only)
         if logger.isEnabledFor(logging.DEBUG):
@@ -215,6 +251,31 @@ class JiraClient(DevelopmentMixin):
             self.jira._session.headers[header_name] = header_value
             logger.debug(f"Applied custom header: {header_name}")
 
+    @property
+    def uses_async_backend(self) -> bool:
+        """Whether bulk operations should use the native async HTTP backend."""
+        return self.config.http_backend == "async"
+
+    def get_async_client(self) -> AsyncAtlassianClient:
+        """Get the native async HTTP client for this Jira instance.
+
+        The client applies the same auth, proxy, SSL and custom header settings
+        as the synchronous session and is created on first use, so its
+        connection pool is shared by subsequent calls.
+
+        Returns:
+            The AsyncAtlassianClient for this instance.
+        """
+        if self._async_client is None or self._async_client.is_closed:
+            self._async_client = create_async_client("jira", self.config)
+        return self._async_client
+
+    async def close_async_client(self) -> None:
+        """Close the native async HTTP client, if one was created."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
     def _clean_text(self, text: str) -> str:
         """Clean text content by:
         1. Processing user mentions and links
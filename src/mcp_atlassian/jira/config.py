@@ -5,13 +5,15 @@ import os
 from dataclasses import dataclass
 from typing import Literal
 
-from ..utils.env import get_custom_headers, is_env_ssl_verify
+from ..utils.async_http import HttpBackend, get_http_backend
+from ..utils.env import get_custom_headers, get_env_int, is_env_ssl_verify
 from ..utils.oauth import (
     BYOAccessTokenOAuthConfig,
     OAuthConfig,
     get_oauth_config_from_env,
 )
 from ..utils.urls import is_atlassian_cloud_url
+from .constants import ATTACHMENT_CHUNK_SIZE
 
 
 @dataclass
@@ -36,6 +38,8 @@ class JiraConfig:
     no_proxy: str | None = None  # Comma-separated list of hosts to bypass proxy
     socks_proxy: str | None = None  # SOCKS proxy URL (optional)
     custom_headers: dict[str, str] | None = None  # Custom HTTP headers
+    http_backend: HttpBackend = "sync"  # "sync" (requests) or "async" (httpx)
+    attachment_chunk_size: int = ATTACHMENT_CHUNK_SIZE  # Bytes per transfer chunk
 
     @property
     def is_cloud(self) -> bool:
@@ -141,6 +145,10 @@ class JiraConfig:
             no_proxy=no_proxy,
             socks_proxy=socks_proxy,
             custom_headers=custom_headers,
+            http_backend=get_http_backend("JIRA"),
+            attachment_chunk_size=get_env_int(
+                "JIRA_ATTACHMENT_CHUNK_SIZE", ATTACHMENT_CHUNK_SIZE, minimum=1024
+            ),
         )
 
     def is_auth_configured(self) -> bool:
@@ -13,3 +13,27 @@ DEFAULT_READ_JIRA_FIELDS: set[str] = {
     "updated",
     "issuetype",
 }
+
+# Maximum number of issues requested per call when fetching issues in bulk.
+# Matches the limit of the Cloud bulk fetch endpoint and keeps Server/DC
+# `key in (...)` JQL queries short.
+BATCH_GET_ISSUES_CHUNK_SIZE = 100
+
+# Epic summaries and names looked up while reading issues are cached per client
+EPIC_DETAILS_CACHE_SIZE = 256
+EPIC_DETAILS_CACHE_TTL_SECONDS = 300
+
+# Totals of Jira Cloud searches are cached per client and normalized JQL, so
+# paging through the results of a query counts its matches only once
+SEARCH_TOTAL_CACHE_SIZE = 256
+SEARCH_TOTAL_CACHE_TTL_SECONDS = 60
+
+# Attachments are streamed to and from disk in chunks of this many bytes
+ATTACHMENT_CHUNK_SIZE = 1024 * 1024
+
+# Downloaded attachments are recorded in this file of the target directory,
+# so files whose size and creation time are unchanged are not fetched again
+ATTACHMENT_MANIFEST_NAME = ".jira-attachments.json"
+
+# Upper bound of the uncompressed size of attachments returned as a zip archive
+ATTACHMENT_ZIP_MAX_BYTES = 50 * 1024 * 1024
@@ -0,0 +1,371 @@
+"""Registry of Jira field definitions with role detection.
+
+Field IDs differ between Jira instances, especially for custom fields such as
+Epic Link or Story Points. The registry is built once from the field list
+returned by the Jira API and indexes it by ID, lowercase name and JQL clause
+name, and detects which fields play well-known roles (epic link, epic name,
+sprint, story points, ...). Every lookup is a dictionary access.
+
+Registries can be persisted to disk so that new processes do not have to
+download the field list again until it expires.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from ..utils.env import get_env_int
+
+logger = logging.getLogger("mcp-jira")
+
+# Default time in seconds before a field list is downloaded again
+DEFAULT_FIELD_CACHE_TTL = 3600
+
+# Shortest time in seconds between refreshes caused by unknown field names
+MIN_FIELD_REFRESH_INTERVAL = 60
+
+# Custom field types that identify a field role regardless of its name
+ROLE_CUSTOM_TYPES: dict[str, str] = {
+    "com.pyxis.greenhopper.jira:gh-epic-link": "epic_link",
+    "com.pyxis.greenhopper.jira:gh-epic-label": "epic_name",
+    "com.pyxis.greenhopper.jira:gh-epic-status": "epic_status",
+    "com.pyxis.greenhopper.jira:gh-epic-color": "epic_color",
+    "com.pyxis.greenhopper.jira:gh-sprint": "sprint",
+    "com.pyxis.greenhopper.jira:gh-lexo-rank": "rank",
+}
+
+# Field names that identify a field role when no custom type matches
+ROLE_NAMES: dict[str, str] = {
+    "sprint": "sprint",
+    "story points": "story_points",
+    "story point estimate": "story_points",
+    "rank": "rank",
+}
+
+
+def get_field_cache_ttl() -> int:
+    """Get the field list TTL from the environment.
+
+    Returns:
+        Seconds before a field list is downloaded again (JIRA_FIELD_CACHE_TTL,
+        default 3600)
+    """
+    return get_env_int("JIRA_FIELD_CACHE_TTL", DEFAULT_FIELD_CACHE_TTL, minimum=0)
+
+
+def get_credential_identity(config: Any) -> str:
+    """Get a string identifying the credentials of a Jira configuration.
+
+    Field visibility depends on the permissions of the caller, so persisted
+    field lists must not be shared between credentials. PAT and OAuth
+    configurations usually have no username, so the identity is built from
+    the token, the OAuth client and the cloud ID instead. Secrets are hashed.
+
+    Args:
+        config: JiraConfig (or any object with the same credential attributes)
+
+    Returns:
+        Auth type followed by a digest of the credential identity
+    """
+    auth_type = getattr(config, "auth_type", None) or "basic"
+    if auth_type == "oauth":
+        oauth_config = getattr(config, "oauth_config", None)
+        parts = [
+            getattr(oauth_config, "client_id", None),
+            getattr(oauth_config, "cloud_id", None),
+            getattr(oauth_config, "access_token", None),
+        ]
+    elif auth_type == "pat":
+        parts = [getattr(config, "personal_token", None)]
+    else:
+        parts = [getattr(config, "username", None)]
+    secret = "|".join(str(part) for part in parts if part)
+    return f"{auth_type}:{hashlib.sha256(secret.encode()).hexdigest()}"
+
+
+def get_field_cache_path(url: str, identity: str | None = None) -> Path | None:
+    """Get the file a registry for a Jira instance is persisted to.
+
+    Args:
+        url: Jira base URL
+        identity: Credentials the field list was fetched with (see
+            get_credential_identity), since field visibility can depend on
+            permissions
+
+    Returns:
+        Path inside JIRA_FIELD_CACHE_DIR, or None if persistence is disabled
+    """
+    directory = os.getenv("JIRA_FIELD_CACHE_DIR")
+    if not directory:
+        return None
+    digest = hashlib.sha256(f"{url}|{identity or ''}".encode()).hexdigest()[:16]
+    return Path(directory).expanduser() / f"jira-fields-{digest}.json"
+
+
+def _detect_epic_fields(fields: list[dict[str, Any]]) -> dict[str, str]:
+    """Map field names and epic roles to field IDs.
+
+    Args:
+        fields: Field definitions from the Jira API
+
+    Returns:
+        Field names mapped to IDs, plus epic_link, epic_name, epic_status,
+        epic_color, parent and epic_* keys for the fields that play those roles
+    """
+    field_ids: dict[str, str] = {}
+    for field in fields:
+        field_name = field.get("name", "").lower()
+        original_name = field.get("name", "")
+        field_id = field.get("id", "")
+        field_custom = (field.get("schema") or {}).get("custom", "")
+
+        if original_name and field_id:
+            field_ids[original_name] = field_id
+
+        # Epic Link field - used to link issues to epics
+        if (
+            field_name == "epic link"
+            or field_name == "epic"
+            or "epic link" in field_name
+            or field_custom == "com.pyxis.greenhopper.jira:gh-epic-link"
+            or field_id == "customfield_10014"
+        ):  # Common in Jira Cloud
+            field_ids["epic_link"] = field_id
+            # For backward compatibility
+            field_ids["Epic Link"] = field_id
+
+        # Epic Name field - used when creating epics
+        elif (
+            field_name == "epic name"
+            or field_name == "epic title"
+            or "epic name" in field_name
+            or field_custom == "com.pyxis.greenhopper.jira:gh-epic-label"
+            or field_id == "customfield_10011"
+        ):  # Common in Jira Cloud
+            field_ids["epic_name"] = field_id
+            # For backward compatibility
+            field_ids["Epic Name"] = field_id
+
+        # Epic Status field
+        elif (
+            field_name == "epic status"
+            or "epic status" in field_name
+            or field_custom == "com.pyxis.greenhopper.jira:gh-epic-status"
+        ):
+            field_ids["epic_status"] = field_id
+
+        # Epic Color field
+        elif (
+            field_name == "epic color"
+            or field_name == "epic colour"
+            or "epic color" in field_name
+            or "epic colour" in field_name
+            or field_custom == "com.pyxis.greenhopper.jira:gh-epic-color"
+        ):
+            field_ids["epic_color"] = field_id
+
+        # Parent field - sometimes used instead of Epic Link
+        elif (
+            field_name == "parent"
+            or field_name == "parent issue"
+            or "parent issue" in field_name
+        ):
+            field_ids["parent"] = field_id
+
+        # Any other fields that might be related to Epics
+        elif "epic" in field_name and field_id.startswith("customfield_"):
+            key = f"epic_{field_name.replace(' ', '_').replace('-', '_')}"
+            field_ids[key] = field_id
+    return field_ids
+
+
+def fingerprint_fields(fields: list[dict[str, Any]]) -> str:
+    """Compute a fingerprint that changes when field definitions change.
+
+    Args:
+        fields: Field definitions from the Jira API
+
+    Returns:
+        Hex digest of the field definitions
+    """
+    payload = json.dumps(fields, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class FieldRegistry:
+    """Indexed Jira field definitions.
+
+    Attributes:
+        fields: Field definitions as returned by the Jira API
+        fetched_at: When the field list was downloaded (epoch seconds), or
+            None if unknown
+        fingerprint: Fingerprint of the field definitions
+        roles: Role name (e.g., "epic_link", "story_points") to field ID
+        epic_field_ids: Field names and epic roles mapped to IDs, in the
+            format returned by get_field_ids_to_epic
+        discovered_epic_field_ids: epic_field_ids completed by discovery
+            from existing epics, once that has run
+    """
+
+    def __init__(
+        self, fields: list[dict[str, Any]], fetched_at: float | None = None
+    ) -> None:
+        """Index a field list.
+
+        Args:
+            fields: Field definitions from the Jira API
+            fetched_at: When the field list was downloaded (epoch seconds)
+        """
+        self.fields = fields
+        self.fetched_at = fetched_at
+        self.fingerprint = fingerprint_fields(fields)
+        self.discovered_epic_field_ids: dict[str, str] | None = None
+
+        self._by_id: dict[str, dict[str, Any]] = {}
+        self._by_name: dict[str, str] = {}
+        self._by_clause: dict[str, str] = {}
+        self.roles: dict[str, str] = {}
+        for field in fields:
+            field_id = field.get("id")
+            if not field_id:
+                continue
+            self._by_id[field_id] = field
+            name = field.get("name")
+            if name:
+                # Keep the first field for duplicate names
+                self._by_name.setdefault(name.lower(), field_id)
+            for clause in field.get("clauseNames") or []:
+                self._by_clause.setdefault(clause.lower(), field_id)
+
+            custom_type = (field.get("schema") or {}).get("custom", "")
+            role = ROLE_CUSTOM_TYPES.get(custom_type)
+            if role:
+                self.roles[role] = field_id
+            elif name and ROLE_NAMES.get(name.lower()):
+                self.roles.setdefault(ROLE_NAMES[name.lower()], field_id)
+
+        self.epic_field_ids = _detect_epic_fields(fields)
+        for role in ("epic_link", "epic_name", "epic_status", "epic_color"):
+            if role in self.epic_field_ids:
+                self.roles.setdefault(role, self.epic_field_ids[role])
+
+    @property
+    def name_map(self) -> dict[str, str]:
+        """Lowercase field names and field IDs mapped to field IDs."""
+        return self._by_name | {field_id: field_id for field_id in self._by_id}
+
+    def resolve(self, name_or_id: str) -> str | None:
+        """Resolve a field ID, name or JQL clause name to a field ID.
+
+        Args:
+            name_or_id: Field ID, name (case-insensitive) or clause name
+
+        Returns:
+            Field ID, or None if no field matches
+        """
+        if name_or_id in self._by_id:
+            return name_or_id
+        normalized = name_or_id.lower()
+        return self._by_name.get(normalized) or self._by_clause.get(normalized)
+
+    def get(self, field_id: str) -> dict[str, Any] | None:
+        """Get a field definition by ID.
+
+        Args:
+            field_id: Field ID
+
+        Returns:
+            Field definition, or None if unknown
+        """
+        return self._by_id.get(field_id)
+
+    def schema(self, field_id: str) -> dict[str, Any]:
+        """Get the schema of a field.
+
+        Args:
+            field_id: Field ID
+
+        Returns:
+            Field schema, or an empty dict if unknown
+        """
+        return (self._by_id.get(field_id) or {}).get("schema") or {}
+
+    def role(self, role: str) -> str | None:
+        """Get the ID of the field playing a role.
+
+        Args:
+            role: Role name, e.g. "epic_link", "epic_name", "sprint" or
+                "story_points"
+
+        Returns:
+            Field ID, or None if the instance has no such field
+        """
+        return self.roles.get(role)
+
+    def age(self, now: float | None = None) -> float | None:
+        """Get the age of the field list in seconds, if known."""
+        if self.fetched_at is None:
+            return None
+        return (now if now is not None else time.time()) - self.fetched_at
+
+    def is_expired(self, ttl: int) -> bool:
+        """Check whether the field list is older than a TTL.
+
+        Args:
+            ttl: Time to live in seconds; 0 means never expire
+
+        Returns:
+            True if the field list should be downloaded again
+        """
+        age = self.age()
+        return bool(ttl) and age is not None and age >= ttl
+
+    def save(self, path: Path) -> None:
+        """Persist the field list to a file, readable only by the owner.
+
+        Args:
+            path: Destination file
+        """
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            payload = {"fetched_at": self.fetched_at, "fields": self.fields}
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(payload, file)
+            os.chmod(tmp_name, 0o600)
+            os.replace(tmp_name, path)
+        except OSError as e:
+            logger.warning(f"Could not persist Jira field list to {path}: {e}")
+
+    @classmethod
+    def load(cls, path: Path, ttl: int) -> "FieldRegistry | None":
+        """Load a persisted field list if it has not expired.
+
+        Args:
+            path: File written by save
+            ttl: Time to live in seconds; 0 means never expire
+
+        Returns:
+            FieldRegistry, or None if the file is missing, invalid or expired
+        """
+        try:
+            with path.open(encoding="utf-8") as file:
+                payload = json.load(file)
+            fields = payload["fields"]
+            fetched_at = float(payload["fetched_at"])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring invalid Jira field cache {path}: {e}")
+            return None
+        if not isinstance(fields, list):
+            return None
+        registry = cls(fields, fetched_at=fetched_at)
+        if registry.is_expired(ttl):
+            return None
+        return registry
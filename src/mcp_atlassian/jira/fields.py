@@ -1,11 +1,21 @@
 """Module for Jira field operations."""
 
 import logging
+import time
+from pathlib import Path
 from typing import Any
 
 from thefuzz import fuzz
 
 from .client import JiraClient
+from .field_registry import (
+    MIN_FIELD_REFRESH_INTERVAL,
+    FieldRegistry,
+    fingerprint_fields,
+    get_credential_identity,
+    get_field_cache_path,
+    get_field_cache_ttl,
+)
 from .protocols import EpicOperationsProto, UsersOperationsProto
 
 logger = logging.getLogger("mcp-jira")
@@ -20,11 +30,16 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
     """
 
     _field_name_to_id_map: dict[str, str] | None = None  # Cache for name -> id mapping
+    _field_registry: FieldRegistry | None = None  # Indexed field definitions
 
     def get_fields(self, refresh: bool = False) -> list[dict[str, Any]]:
         """
         Get all available fields from Jira.
 
+        The field list is cached in memory and, when JIRA_FIELD_CACHE_DIR is
+        set, on disk. It is downloaded again once older than
+        JIRA_FIELD_CACHE_TTL seconds.
+
         Args:
             refresh: When True, forces a refresh from the server instead of using cache
 
@@ -34,12 +49,22 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
         try:
             # Use cached field data if available and refresh is not requested
             if self._field_ids_cache is not None and not refresh:
-                return self._field_ids_cache
+                registry = self._field_registry
+                if (
+                    registry is None
+                    or registry.fields is not self._field_ids_cache
+                    or not registry.is_expired(get_field_cache_ttl())
+                ):
+                    return self._field_ids_cache
 
-            if refresh:
-                self._field_name_to_id_map = (
-                    None  # Clear name map cache if refreshing fields
-                )
+            # Use a field list persisted by an earlier process
+            cache_path = self._field_cache_path()
+            if self._field_ids_cache is None and not refresh and cache_path:
+                persisted = FieldRegistry.load(cache_path, get_field_cache_ttl())
+                if persisted is not None:
+                    logger.debug(f"Loaded Jira field list from {cache_path}")
+                    self._set_field_registry(persisted)
+                    return persisted.fields
 
             # Fetch fields from Jira API
             fields = self.jira.get_all_fields()
@@ -48,47 +73,71 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
                 logger.error(msg)
                 raise TypeError(msg)
 
-            # Cache the fields
-            self._field_ids_cache = fields
-
-            # Regenerate the name map upon fetching new fields
-            self._generate_field_map(force_regenerate=True)
-
-            # Log available fields for debugging
-            self._log_available_fields(fields)
+            registry = self._field_registry
+            if registry is not None and registry.fingerprint == fingerprint_fields(
+                fields
+            ):
+                # Unchanged since the last download: keep the existing indexes
+                registry.fetched_at = time.time()
+            else:
+                registry = FieldRegistry(fields, fetched_at=time.time())
+                # Log available fields for debugging
+                self._log_available_fields(fields)
+            self._set_field_registry(registry)
+            if cache_path:
+                registry.save(cache_path)
 
-            return fields
+            return registry.fields
 
         except Exception as e:
             logger.error(f"Error getting Jira fields: {str(e)}")
             return []
 
+    def _field_cache_path(self) -> Path | None:
+        """Get the file the field list is persisted to, if enabled."""
+        config = getattr(self, "config", None)
+        if config is None:
+            return None
+        return get_field_cache_path(str(config.url), get_credential_identity(config))
+
+    def _set_field_registry(self, registry: FieldRegistry) -> None:
+        """Make a registry the source of all cached field data."""
+        self._field_registry = registry
+        self._field_ids_cache = registry.fields
+        self._field_name_to_id_map = registry.name_map
+
+    def get_field_registry(self, refresh: bool = False) -> FieldRegistry | None:
+        """
+        Get the indexed field definitions of this Jira instance.
+
+        Args:
+            refresh: When True, forces a refresh from the server
+
+        Returns:
+            FieldRegistry, or None if the field list could not be loaded
+        """
+        fields = self.get_fields(refresh=refresh)
+        if not fields:
+            return None
+        registry = self._field_registry
+        if registry is None or registry.fields is not fields:
+            # Field list set without a registry (e.g. assigned directly)
+            registry = FieldRegistry(fields)
+            self._field_registry = registry
+        return registry
+
     def _generate_field_map(self, force_regenerate: bool = False) -> dict[str, str]:
         """Generates and caches a map of lowercase field names to field IDs."""
         if self._field_name_to_id_map is not None and not force_regenerate:
             return self._field_name_to_id_map
 
-        # Ensure fields are loaded into cache first
-        fields = (
-            self.get_fields()
-        )  # Uses cache if available unless force_regenerate was True
-        if not fields:
+        registry = self.get_field_registry()
+        if registry is None:
             self._field_name_to_id_map = {}
             return {}
 
-        name_map: dict[str, str] = {}
-        id_map: dict[str, str] = {}  # Also map ID to ID for consistency
-        for field in fields:
-            field_id = field.get("id")
-            field_name = field.get("name")
-            if field_id:
-                id_map[field_id] = field_id  # Map ID to itself
-                if field_name:
-                    # Store lowercase name -> ID. Handle potential name collisions if necessary.
-                    name_map.setdefault(field_name.lower(), field_id)
-
-        # Combine maps, ensuring IDs can also be looked up directly
-        self._field_name_to_id_map = name_map | id_map
+        # Lowercase names and IDs, so IDs can also be looked up directly
+        self._field_name_to_id_map = registry.name_map
         logger.debug(
             f"Generated/Updated field name map: {len(self._field_name_to_id_map)} entries"
         )
@@ -99,28 +148,29 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
         Get the ID for a specific field by name.
 
         Args:
-            field_name: The name of the field to look for (case-insensitive)
+            field_name: The name (case-insensitive), JQL clause name or ID of the field
             refresh: When True, forces a refresh from the server
 
         Returns:
             Field ID if found, None otherwise
         """
         try:
-            # Ensure the map is generated/cached
-            field_map = self._generate_field_map(force_regenerate=refresh)
-            if not field_map:
+            registry = self.get_field_registry(refresh=refresh)
+            if registry is None:
                 logger.error("Field map could not be generated.")
                 return None
 
-            normalized_name = field_name.lower()
-            if normalized_name in field_map:
-                return field_map[normalized_name]
-            # Fallback: Check if the input IS an ID (using original casing)
-            elif field_name in field_map:  # Checks the id_map part
-                return field_map[field_name]
-            else:
+            field_id = registry.resolve(field_name)
+            if field_id is None and not refresh:
+                # The field may have been created since the list was downloaded
+                age = registry.age()
+                if age is not None and age >= MIN_FIELD_REFRESH_INTERVAL:
+                    registry = self.get_field_registry(refresh=True)
+                    field_id = registry.resolve(field_name) if registry else None
+
+            if field_id is None:
                 logger.warning(f"Field '{field_name}' not found in generated map.")
-                return None
+            return field_id
 
         except Exception as e:
             logger.error(f"Error getting field ID for '{field_name}': {str(e)}")
@@ -140,11 +190,10 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
             Field definition if found, None otherwise
         """
         try:
-            fields = self.get_fields(refresh=refresh)
-
-            for field in fields:
-                if field.get("id") == field_id:
-                    return field
+            registry = self.get_field_registry(refresh=refresh)
+            field = registry.get(field_id) if registry else None
+            if field is not None:
+                return field
 
             logger.warning(f"Field with ID '{field_id}' not found")
             return None
@@ -275,119 +324,27 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
             (e.g., {'epic_link': 'customfield_10014', 'epic_name': 'customfield_10011'})
         """
         try:
-            # Ensure field list and map are cached/generated
-            self._generate_field_map()  # Generates map and ensures fields are cached
-
-            # Get all fields (uses cache if available)
-            fields = self.get_fields()
-            if not fields:  # Check if get_fields failed or returned empty
+            registry = self.get_field_registry()
+            if registry is None:  # Check if get_fields failed or returned empty
                 logger.error(
                     "Could not load field definitions for epic field discovery."
                 )
                 return {}
 
-            field_ids = {}
-
-            # Log the complete list of fields for debugging
-            all_field_names = [field.get("name", "").lower() for field in fields]
-            logger.debug(f"All field names: {all_field_names}")
-
-            # Enhanced logging for debugging
-            custom_fields = {
-                field.get("id", ""): field.get("name", "")
-                for field in fields
-                if field.get("id", "").startswith("customfield_")
-            }
-            logger.debug(f"Custom fields: {custom_fields}")
-
-            # Look for Epic-related fields - use multiple strategies to identify them
-            for field in fields:
-                field_name = field.get("name", "").lower()
-                original_name = field.get("name", "")
-                field_id = field.get("id", "")
-                field_schema = field.get("schema", {})
-                field_custom = field_schema.get("custom", "")
+            if registry.discovered_epic_field_ids is None:
+                field_ids = dict(registry.epic_field_ids)
 
-                if original_name and field_id:
-                    field_ids[original_name] = field_id
-
-                # Epic Link field - used to link issues to epics
-                if (
-                    field_name == "epic link"
-                    or field_name == "epic"
-                    or "epic link" in field_name
-                    or field_custom == "com.pyxis.greenhopper.jira:gh-epic-link"
-                    or field_id == "customfield_10014"
-                ):  # Common in Jira Cloud
-                    field_ids["epic_link"] = field_id
-                    # For backward compatibility
-                    field_ids["Epic Link"] = field_id
-                    logger.debug(f"Found Epic Link field: {field_id} ({original_name})")
-
-                # Epic Name field - used when creating epics
-                elif (
-                    field_name == "epic name"
-                    or field_name == "epic title"
-                    or "epic name" in field_name
-                    or field_custom == "com.pyxis.greenhopper.jira:gh-epic-label"
-                    or field_id == "customfield_10011"
-                ):  # Common in Jira Cloud
-                    field_ids["epic_name"] = field_id
-                    # For backward compatibility
-                    field_ids["Epic Name"] = field_id
-                    logger.debug(f"Found Epic Name field: {field_id} ({original_name})")
-
-                # Epic Status field
-                elif (
-                    field_name == "epic status"
-                    or "epic status" in field_name
-                    or field_custom == "com.pyxis.greenhopper.jira:gh-epic-status"
-                ):
-                    field_ids["epic_status"] = field_id
+                # If we couldn't find certain key fields, try alternative approaches
+                if "epic_name" not in field_ids or "epic_link" not in field_ids:
                     logger.debug(
-                        f"Found Epic Status field: {field_id} ({original_name})"
+                        "Standard field search didn't find all Epic fields, trying alternative approaches"
                     )
+                    self._try_discover_fields_from_existing_epic(field_ids)
 
-                # Epic Color field
-                elif (
-                    field_name == "epic color"
-                    or field_name == "epic colour"
-                    or "epic color" in field_name
-                    or "epic colour" in field_name
-                    or field_custom == "com.pyxis.greenhopper.jira:gh-epic-color"
-                ):
-                    field_ids["epic_color"] = field_id
-                    logger.debug(
-                        f"Found Epic Color field: {field_id} ({original_name})"
-                    )
-
-                # Parent field - sometimes used instead of Epic Link
-                elif (
-                    field_name == "parent"
-                    or field_name == "parent issue"
-                    or "parent issue" in field_name
-                ):
-                    field_ids["parent"] = field_id
-                    logger.debug(f"Found Parent field: {field_id} ({original_name})")
-
-                # Try to detect any other fields that might be related to Epics
-                elif "epic" in field_name and field_id.startswith("customfield_"):
-                    key = f"epic_{field_name.replace(' ', '_').replace('-', '_')}"
-                    field_ids[key] = field_id
-                    logger.debug(
-                        f"Found potential Epic-related field: {field_id} ({original_name})"
-                    )
-
-            # If we couldn't find certain key fields, try alternative approaches
-            if "epic_name" not in field_ids or "epic_link" not in field_ids:
-                logger.debug(
-                    "Standard field search didn't find all Epic fields, trying alternative approaches"
-                )
-                self._try_discover_fields_from_existing_epic(field_ids)
-
-            logger.debug(f"Discovered field IDs: {field_ids}")
+                logger.debug(f"Discovered field IDs: {field_ids}")
+                registry.discovered_epic_field_ids = field_ids
 
-            return field_ids
+            return dict(registry.discovered_epic_field_ids)
 
         except Exception as e:
             logger.error(f"Error discovering Jira field IDs: {str(e)}")
@@ -401,6 +358,8 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
         Args:
             fields: List of field definitions
         """
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         logger.debug("Available Jira fields:")
         for field in fields:
             field_id = field.get("id", "")
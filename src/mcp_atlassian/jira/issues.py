@@ -2,16 +2,19 @@
 
 import logging
 from collections import defaultdict
-from typing import Any
+from typing import Any, NoReturn
 
+import anyio
+import httpx
 from requests.exceptions import HTTPError
 
 from ..exceptions import MCPAtlassianAuthenticationError
 from ..models.jira import JiraIssue
 from ..models.jira.common import JiraChangelog
 from ..utils import parse_date
+from ..utils.executor import get_executor_registry, run_blocking
 from .client import JiraClient
-from .constants import DEFAULT_READ_JIRA_FIELDS
+from .constants import BATCH_GET_ISSUES_CHUNK_SIZE, DEFAULT_READ_JIRA_FIELDS
 from .protocols import (
     AttachmentsOperationsProto,
     EpicOperationsProto,
@@ -165,7 +168,7 @@ class IssuesMixin(
             if "comment" in fields_data:
                 comment_limit_int = self._normalize_comment_limit(comment_limit)
                 comments = self._get_issue_comments_if_needed(
-                    issue_key, comment_limit_int
+                    issue_key, comment_limit_int, fields_data["comment"]
                 )
                 # Add comments to the issue data for processing by the model
                 fields_data["comment"]["comments"] = comments
@@ -208,6 +211,7 @@ class IssuesMixin(
                 issue,
                 base_url=self.config.url if hasattr(self, "config") else None,
                 requested_fields=fields,
+                field_registry=self._field_registry,
             )
         except HTTPError as http_err:
             if http_err.response is not None and http_err.response.status_code in [
@@ -255,42 +259,130 @@ class IssuesMixin(
             return 10
 
     def _get_issue_comments_if_needed(
-        self, issue_key: str, comment_limit: int | None
+        self,
+        issue_key: str,
+        comment_limit: int | None,
+        inline_comments: dict | None = None,
     ) -> list[dict]:
         """
         Get comments for an issue if needed.
 
+        The comment field returned with the issue is used when it already
+        holds enough comments; otherwise only the required number of comments
+        is requested from the comment endpoint.
+
         Args:
             issue_key: The issue key
             comment_limit: Maximum number of comments to include
+            inline_comments: The comment field returned with the issue, if any
 
         Returns:
             List of comments
         """
-        if comment_limit is None or comment_limit > 0:
-            try:
+        if comment_limit is not None and comment_limit <= 0:
+            return []
+
+        if isinstance(inline_comments, dict) and isinstance(
+            inline_comments.get("comments"), list
+        ):
+            comments = inline_comments["comments"]
+            total = inline_comments.get("total", len(comments))
+            if len(comments) >= total or (
+                comment_limit is not None and len(comments) >= comment_limit
+            ):
+                return comments[:comment_limit]
+
+        try:
+            if comment_limit is None:
                 response = self.jira.issue_get_comments(issue_key)
-                if not isinstance(response, dict):
-                    msg = f"Unexpected return value type from `jira.issue_get_comments`: {type(response)}"
-                    logger.error(msg)
-                    raise TypeError(msg)
+            else:
+                response = self.jira.get(
+                    self.jira.resource_url(f"issue/{issue_key}/comment"),
+                    params={"startAt": 0, "maxResults": comment_limit},
+                )
+            if not isinstance(response, dict):
+                msg = f"Unexpected return value type from comment request: {type(response)}"
+                logger.error(msg)
+                raise TypeError(msg)
 
-                comments = response["comments"]
+            return response["comments"][:comment_limit]
+        except Exception as e:
+            logger.warning(f"Error getting comments for {issue_key}: {str(e)}")
+            return []
 
-                # Limit comments if needed
-                if comment_limit is not None:
-                    comments = comments[:comment_limit]
+    def _get_epic_details(
+        self, epic_keys: list[str], field_ids: dict[str, str]
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Get the summary and Epic Name of epics.
 
-                return comments
-            except Exception as e:
-                logger.warning(f"Error getting comments for {issue_key}: {str(e)}")
-                return []
-        return []
+        Only those two fields are requested. Results are cached on the client,
+        and epics missing from the cache are fetched together in as few
+        requests as possible.
+
+        Args:
+            epic_keys: Epic issue keys
+            field_ids: Epic field IDs from get_field_ids_to_epic
+
+        Returns:
+            Dictionary mapping epic keys to {"summary", "epic_name"}. Epics
+            that could not be retrieved are left out.
+        """
+        epic_name_field = field_ids.get("epic_name")
+        details: dict[str, dict[str, Any]] = {}
+        with self._epic_details_lock:
+            for key in epic_keys:
+                if key in self._epic_details_cache:
+                    details[key] = self._epic_details_cache[key]
+
+        missing = [key for key in dict.fromkeys(epic_keys) if key not in details]
+        if not missing:
+            return details
+
+        fields = ["summary"] + ([epic_name_field] if epic_name_field else [])
+        if len(missing) == 1:
+            epic = self.jira.get_issue(
+                missing[0],
+                expand=None,
+                fields=",".join(fields),
+                properties=None,
+                update_history=False,
+            )
+            if not isinstance(epic, dict):
+                msg = (
+                    f"Unexpected return value type from `jira.get_issue`: {type(epic)}"
+                )
+                logger.error(msg)
+                raise TypeError(msg)
+            epics = [{"key": missing[0], **epic}]
+        else:
+            epics = []
+            for i in range(0, len(missing), BATCH_GET_ISSUES_CHUNK_SIZE):
+                chunk = missing[i : i + BATCH_GET_ISSUES_CHUNK_SIZE]
+                epics.extend(self._fetch_issue_chunk(chunk, fields, None))
+
+        with self._epic_details_lock:
+            for epic in epics:
+                epic_fields = epic.get("fields", {}) or {}
+                entry = {
+                    "summary": epic_fields.get("summary", ""),
+                    "epic_name": (
+                        epic_fields.get(epic_name_field, "")
+                        if epic_name_field
+                        else None
+                    ),
+                }
+                self._epic_details_cache[epic["key"]] = entry
+                details[epic["key"]] = entry
+        return details
 
     def _extract_epic_information(self, issue: dict) -> dict[str, str | None]:
         """
         Extract epic information from an issue.
 
+        The linked epic is only looked up when the instance has an Epic Name
+        field, since its name is the only detail added to the issue.
+
         Args:
             issue: The issue data
 
@@ -333,32 +425,18 @@ class IssuesMixin(
                     epic_info["epic_key"] = epic_key
 
                     # Try to get epic details
-                    try:
-                        epic = self.jira.get_issue(
-                            epic_key,
-                            expand=None,
-                            fields=None,
-                            properties=None,
-                            update_history=True,
-                        )
-                        if not isinstance(epic, dict):
-                            msg = f"Unexpected return value type from `jira.get_issue`: {type(epic)}"
-                            logger.error(msg)
-                            raise TypeError(msg)
-
-                        epic_fields = epic.get("fields", {}) or {}
-
-                        # Get epic name using the discovered field ID
-                        if "epic_name" in field_ids:
-                            epic_info["epic_name"] = epic_fields.get(
-                                field_ids["epic_name"], ""
+                    if "epic_name" in field_ids:
+                        try:
+                            epic = self._get_epic_details([epic_key], field_ids).get(
+                                epic_key
+                            )
+                            if epic:
+                                epic_info["epic_name"] = epic["epic_name"]
+                                epic_info["epic_summary"] = epic["summary"]
+                        except Exception as e:
+                            logger.warning(
+                                f"Error getting epic details for {epic_key}: {str(e)}"
                             )
-
-                        epic_info["epic_summary"] = epic_fields.get("summary", "")
-                    except Exception as e:
-                        logger.warning(
-                            f"Error getting epic details for {epic_key}: {str(e)}"
-                        )
         except Exception as e:
             logger.warning(f"Error extracting epic information: {str(e)}")
 
@@ -1538,3 +1616,422 @@ class IssuesMixin(
         ]
 
         return issues
+
+    def get_issues(
+        self,
+        issue_keys: list[str],
+        fields: str | list[str] | tuple[str, ...] | set[str] | None = None,
+        expand: str | None = None,
+        chunk_size: int = BATCH_GET_ISSUES_CHUNK_SIZE,
+    ) -> list[JiraIssue]:
+        """
+        Get multiple Jira issues by key in as few requests as possible.
+
+        Keys are split into chunks of up to chunk_size keys. On Jira Cloud each
+        chunk is one call to the bulk fetch endpoint; on Server/Data Center
+        each chunk is one `key in (...)` JQL search. Requests go through the
+        client session, so they are throttled by the service rate limiter.
+
+        Unlike get_issue, no extra requests are made per issue: comments are
+        limited to what the API returns inline, and when the Epic Link field is
+        requested the names of linked epics are resolved in one batched lookup.
+
+        Args:
+            issue_keys: Issue keys (e.g., ['PROJ-1', 'PROJ-2']). Duplicates are
+                fetched once.
+            fields: Fields to return (comma-separated string, list, tuple, set, or "*all")
+            expand: Fields to expand in the response
+            chunk_size: Maximum number of issues per request
+
+        Returns:
+            JiraIssue models in the order of issue_keys. Keys that were not
+            found, not accessible, or restricted by the projects filter are
+            left out.
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
+            HTTPError: If a chunk request fails for another reason
+        """
+        return list(
+            self.get_issues_by_key(
+                issue_keys, fields=fields, expand=expand, chunk_size=chunk_size
+            ).values()
+        )
+
+    def get_issues_by_key(
+        self,
+        issue_keys: list[str],
+        fields: str | list[str] | tuple[str, ...] | set[str] | None = None,
+        expand: str | None = None,
+        chunk_size: int = BATCH_GET_ISSUES_CHUNK_SIZE,
+    ) -> dict[str, JiraIssue]:
+        """
+        Get multiple Jira issues keyed by the key they were requested with.
+
+        Works like get_issues, but keeps track of which requested key each
+        issue answers. An issue that was moved or renamed is returned under
+        the key it was requested with even though its model carries the
+        current key.
+
+        Args:
+            issue_keys: Issue keys (e.g., ['PROJ-1', 'PROJ-2']). Duplicates are
+                fetched once.
+            fields: Fields to return (comma-separated string, list, tuple, set, or "*all")
+            expand: Fields to expand in the response
+            chunk_size: Maximum number of issues per request
+
+        Returns:
+            Mapping of requested key (stripped, in the order of issue_keys) to
+            JiraIssue. Keys that were not found, not accessible, or restricted
+            by the projects filter are left out.
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
+            HTTPError: If a chunk request fails for another reason
+        """
+        keys, fields_list = self._prepare_batch(issue_keys, fields)
+        if not keys:
+            return {}
+
+        step = max(1, chunk_size)
+        try:
+            # Chunks run one after another: this method already runs in a
+            # worker of the shared Jira pool, so it must not fan out further
+            raw_issues = [
+                issue
+                for i in range(0, len(keys), step)
+                for issue in self._fetch_issue_chunk(
+                    keys[i : i + step], fields_list, expand
+                )
+            ]
+        except HTTPError as http_err:
+            response = http_err.response
+            status = response.status_code if response is not None else None
+            self._raise_batch_error(http_err, status)
+
+        return self._order_batch_issues(keys, raw_issues, fields, fields_list)
+
+    async def get_issues_by_key_async(
+        self,
+        issue_keys: list[str],
+        fields: str | list[str] | tuple[str, ...] | set[str] | None = None,
+        expand: str | None = None,
+        chunk_size: int = BATCH_GET_ISSUES_CHUNK_SIZE,
+    ) -> dict[str, JiraIssue]:
+        """
+        Get multiple Jira issues keyed by requested key with the async backend.
+
+        Same result as get_issues_by_key, but the chunk requests are sent
+        concurrently through the native async HTTP client (see
+        ``get_async_client``) instead of one after another in a worker
+        thread. At most as many chunks as the Jira worker pool has workers
+        are in flight, and every request draws from the Jira rate limiter.
+        Building the models, which may need a few follow-up requests, runs
+        in the Jira worker pool.
+
+        Args:
+            issue_keys: Issue keys (e.g., ['PROJ-1', 'PROJ-2']). Duplicates are
+                fetched once.
+            fields: Fields to return (comma-separated string, list, tuple, set, or "*all")
+            expand: Fields to expand in the response
+            chunk_size: Maximum number of issues per request
+
+        Returns:
+            Mapping of requested key to JiraIssue, as get_issues_by_key.
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
+            httpx.HTTPStatusError: If a chunk request fails for another reason
+        """
+        keys, fields_list = self._prepare_batch(issue_keys, fields)
+        if not keys:
+            return {}
+
+        step = max(1, chunk_size)
+        chunks = [keys[i : i + step] for i in range(0, len(keys), step)]
+        results: list[list[dict]] = [[] for _ in chunks]
+        client = self.get_async_client()
+        limiter = anyio.CapacityLimiter(
+            get_executor_registry().get_executor("jira").config.max_workers
+        )
+
+        errors: list[httpx.HTTPStatusError] = []
+
+        async def fetch(index: int, chunk: list[str], scope: anyio.CancelScope) -> None:
+            path, payload = self._issue_chunk_request(chunk, fields_list, expand)
+            try:
+                async with limiter:
+                    response = await client.post(path, json=payload)
+            except httpx.HTTPStatusError as http_err:
+                # Fail fast: the remaining chunks are of no use
+                errors.append(http_err)
+                scope.cancel()
+                return
+            results[index] = self._parse_issue_chunk(response)
+
+        async with anyio.create_task_group() as tg:
+            for index, chunk in enumerate(chunks):
+                tg.start_soon(fetch, index, chunk, tg.cancel_scope)
+        if errors:
+            self._raise_batch_error(errors[0], errors[0].response.status_code)
+
+        raw_issues = [issue for chunk_issues in results for issue in chunk_issues]
+        return await run_blocking(
+            "jira",
+            self._order_batch_issues,
+            keys,
+            raw_issues,
+            fields,
+            fields_list,
+        )
+
+    def _prepare_batch(
+        self,
+        issue_keys: list[str],
+        fields: str | list[str] | tuple[str, ...] | set[str] | None,
+    ) -> tuple[list[str], list[str]]:
+        """
+        Normalize the keys and fields of a batch fetch.
+
+        Args:
+            issue_keys: Requested issue keys
+            fields: Fields as passed by the caller
+
+        Returns:
+            The deduplicated keys allowed by the projects filter, and the
+            field list to send to the API
+        """
+        keys = list(dict.fromkeys(k.strip() for k in issue_keys if k and k.strip()))
+
+        if self.config.projects_filter:
+            projects = {p.strip() for p in self.config.projects_filter.split(",")}
+            restricted = [k for k in keys if k.split("-")[0] not in projects]
+            if restricted:
+                logger.warning(
+                    f"Skipping issues restricted by configuration: {restricted}"
+                )
+                keys = [k for k in keys if k not in restricted]
+
+        if fields is None:
+            fields_list = list(DEFAULT_READ_JIRA_FIELDS)
+        elif isinstance(fields, str):
+            fields_list = [f.strip() for f in fields.split(",") if f.strip()]
+        else:
+            fields_list = list(fields)
+        return keys, fields_list
+
+    def _raise_batch_error(self, error: Exception, status_code: int | None) -> NoReturn:
+        """
+        Re-raise a failed chunk request, converting auth failures.
+
+        Args:
+            error: The HTTP error of the chunk request
+            status_code: Its HTTP status code, if known
+
+        Raises:
+            MCPAtlassianAuthenticationError: For 401 and 403 responses
+        """
+        if status_code in [401, 403]:
+            error_msg = (
+                f"Authentication failed for Jira API ({status_code}). "
+                "Token may be expired or invalid. Please verify credentials."
+            )
+            logger.error(error_msg)
+            raise MCPAtlassianAuthenticationError(error_msg) from error
+        logger.error(f"HTTP error during batch issue fetch: {error}")
+        raise error
+
+    def _order_batch_issues(
+        self,
+        keys: list[str],
+        raw_issues: list[dict],
+        fields: str | list[str] | tuple[str, ...] | set[str] | None,
+        fields_list: list[str],
+    ) -> dict[str, JiraIssue]:
+        """
+        Match raw batch results to the requested keys and build the models.
+
+        Args:
+            keys: Requested issue keys, deduplicated and in request order
+            raw_issues: Raw issue data returned by the chunk requests
+            fields: Fields as passed by the caller
+            fields_list: Fields as sent to the API
+
+        Returns:
+            Mapping of requested key to JiraIssue
+        """
+        if "*all" in fields_list or any(
+            f.startswith("customfield_") for f in fields_list
+        ):
+            self._add_linked_epic_names(raw_issues)
+
+        # Index by key and id: Cloud may return the current key of a moved issue
+        by_key: dict[str, dict] = {}
+        for issue in raw_issues:
+            for identifier in (issue.get("key"), issue.get("id")):
+                if identifier:
+                    by_key[str(identifier).upper()] = issue
+
+        self._match_moved_issues(keys, raw_issues, by_key)
+
+        base_url = self.config.url if hasattr(self, "config") else None
+        ordered: dict[str, JiraIssue] = {}
+        for key in keys:
+            issue = by_key.get(key.upper())
+            if issue is None:
+                logger.debug(f"Issue {key} not returned by batch fetch")
+                continue
+            ordered[key] = JiraIssue.from_api_response(
+                issue,
+                base_url=base_url,
+                requested_fields=fields,
+                field_registry=self._field_registry,
+            )
+        return ordered
+
+    def _match_moved_issues(
+        self, keys: list[str], raw_issues: list[dict], by_key: dict[str, dict]
+    ) -> None:
+        """
+        Match requested keys of moved issues to the issues returned for them.
+
+        A moved or renamed issue comes back under its current key, so neither
+        its key nor its id matches the key it was requested with. A single
+        leftover issue can only answer a single unmatched key; otherwise the
+        id behind each unmatched key is looked up, which Jira resolves through
+        the key history.
+
+        Args:
+            keys: Requested issue keys
+            raw_issues: Raw issue data returned by the chunk requests
+            by_key: Index of raw issues by upper-cased key and id, updated in place
+        """
+        unmatched = [key for key in keys if key.upper() not in by_key]
+        if not unmatched:
+            return
+        matched_ids = {
+            str(by_key[key.upper()].get("id")) for key in keys if key.upper() in by_key
+        }
+        leftovers = {
+            str(issue.get("id")): issue
+            for issue in raw_issues
+            if str(issue.get("id")) not in matched_ids
+        }
+        if not leftovers:
+            return
+        if len(leftovers) == len(unmatched) == 1:
+            by_key[unmatched[0].upper()] = next(iter(leftovers.values()))
+            return
+
+        for key in unmatched:
+            try:
+                current = self.jira.get_issue(key, fields="id")
+            except HTTPError as http_err:
+                logger.debug(f"Could not resolve moved issue {key}: {http_err}")
+                continue
+            issue = leftovers.get(str((current or {}).get("id")))
+            if issue is not None:
+                by_key[key.upper()] = issue
+
+    def _add_linked_epic_names(self, issues: list[dict]) -> None:
+        """
+        Add the Epic Name of linked epics to raw issues with a batched lookup.
+
+        Args:
+            issues: Raw issue data, updated in place
+        """
+        try:
+            field_ids = self.get_field_ids_to_epic()
+            link_field = field_ids.get("epic_link")
+            name_field = field_ids.get("epic_name")
+            if not link_field or not name_field:
+                return
+
+            linked = [
+                issue
+                for issue in issues
+                if (issue.get("fields") or {}).get(link_field)
+                and name_field not in issue["fields"]
+            ]
+            if not linked:
+                return
+
+            details = self._get_epic_details(
+                [issue["fields"][link_field] for issue in linked], field_ids
+            )
+            for issue in linked:
+                epic = details.get(issue["fields"][link_field])
+                if epic and epic["epic_name"]:
+                    issue["fields"][name_field] = epic["epic_name"]
+        except Exception as e:
+            logger.warning(f"Error adding epic information: {str(e)}")
+
+    def _fetch_issue_chunk(
+        self, keys: list[str], fields: list[str], expand: str | None
+    ) -> list[dict]:
+        """
+        Fetch one chunk of issues in a single request.
+
+        Args:
+            keys: Issue keys in the chunk
+            fields: Fields to return
+            expand: Fields to expand in the response
+
+        Returns:
+            Raw issue data returned by the API
+        """
+        path, payload = self._issue_chunk_request(keys, fields, expand)
+        return self._parse_issue_chunk(self.jira.post(path, data=payload))
+
+    def _issue_chunk_request(
+        self, keys: list[str], fields: list[str], expand: str | None
+    ) -> tuple[str, dict[str, Any]]:
+        """
+        Build the request that fetches one chunk of issues.
+
+        On Jira Cloud this is the bulk fetch endpoint; on Server/Data Center
+        a `key in (...)` JQL search.
+
+        Args:
+            keys: Issue keys in the chunk
+            fields: Fields to return
+            expand: Fields to expand in the response
+
+        Returns:
+            The REST path and the JSON payload to POST to it
+        """
+        if self.config.is_cloud:
+            payload: dict[str, Any] = {"issueIdsOrKeys": keys, "fields": fields}
+            if expand:
+                payload["expand"] = [e.strip() for e in expand.split(",")]
+            return self.jira.resource_url("issue/bulkfetch"), payload
+
+        # JQL rejects keys that do not exist unless query validation is off
+        quoted_keys = ", ".join(f'"{key}"' for key in keys)
+        jql = f"key in ({quoted_keys})"
+        payload = {
+            "jql": jql,
+            "fields": fields,
+            "startAt": 0,
+            "maxResults": len(keys),
+            "validateQuery": False,
+        }
+        if expand:
+            payload["expand"] = [e.strip() for e in expand.split(",")]
+        return self.jira.resource_url("search"), payload
+
+    def _parse_issue_chunk(self, response: Any) -> list[dict]:
+        """
+        Extract the raw issues from the response of a chunk request.
+
+        Args:
+            response: Decoded response body
+
+        Returns:
+            Raw issue data returned by the API
+        """
+        if not isinstance(response, dict):
+            return []
+        for error in response.get("issueErrors", []) or []:
+            logger.debug(f"Batch fetch error: {error}")
+        return response.get("issues", []) or []
@@ -1,22 +1,278 @@
 """Module for Jira search operations."""
 
 import logging
+import re
+from collections.abc import Callable, Iterator
+from typing import Literal
 
 import requests
 from requests.exceptions import HTTPError
 
 from ..exceptions import MCPAtlassianAuthenticationError
-from ..models.jira import JiraSearchResult
+from ..models.jira import JiraIssue, JiraSearchResult
+from ..utils.paging import iter_paged, next_offset
 from .client import JiraClient
 from .constants import DEFAULT_READ_JIRA_FIELDS
 from .protocols import IssueOperationsProto
 
 logger = logging.getLogger("mcp-jira")
 
+SearchTotalMode = Literal["approximate", "exact", "none"]
+
+# Trailing ORDER BY clause, which does not change the number of matches.
+# Clauses containing quotes are kept, as they may be part of a value.
+_ORDER_BY_RE = re.compile(r"(?:^|\s)ORDER\s+BY\s+[^\"']*$", re.IGNORECASE)
+
+
+def normalize_jql(jql: str) -> str:
+    """
+    Normalize a JQL query for caching its total.
+
+    Collapses whitespace and drops a trailing ORDER BY clause, so queries
+    that only differ in formatting or ordering share a cached total.
+
+    Args:
+        jql: JQL query string
+
+    Returns:
+        The normalized JQL query
+    """
+    return _ORDER_BY_RE.sub("", " ".join(jql.split())).strip()
+
 
 class SearchMixin(JiraClient, IssueOperationsProto):
     """Mixin for Jira search operations."""
 
+    def _apply_projects_filter(self, jql: str, projects_filter: str | None) -> str:
+        """
+        Restrict a JQL query to the filtered projects.
+
+        Args:
+            jql: JQL query string
+            projects_filter: Optional comma-separated list of project keys,
+                overrides config
+
+        Returns:
+            The JQL query, restricted to the filtered projects if any
+        """
+        # Use projects_filter parameter if provided, otherwise fall back to config
+        filter_to_use = projects_filter or self.config.projects_filter
+
+        # Apply projects filter if present
+        if filter_to_use:
+            # Split projects filter by commas and handle possible whitespace
+            projects = [p.strip() for p in filter_to_use.split(",")]
+
+            # Build the project filter query part
+            if len(projects) == 1:
+                project_query = f'project = "{projects[0]}"'
+            else:
+                quoted_projects = [f'"{p}"' for p in projects]
+                projects_list = ", ".join(quoted_projects)
+                project_query = f"project IN ({projects_list})"
+
+            # Add the project filter to existing query
+            if not jql:
+                # Empty JQL - just use project filter
+                jql = project_query
+            elif jql.strip().upper().startswith("ORDER BY"):
+                # JQL starts with ORDER BY - prepend project filter
+                jql = f"{project_query} {jql}"
+            elif "project = " not in jql and "project IN" not in jql:
+                # Only add if not already filtering by project
+                jql = f"({jql}) AND {project_query}"
+
+            logger.info(f"Applied projects filter to query: {jql}")
+
+        return jql
+
+    @staticmethod
+    def _fields_param(
+        fields: list[str] | tuple[str, ...] | set[str] | str | None,
+    ) -> str:
+        """Convert the requested fields to the comma-separated API format."""
+        if fields is None:  # Use default if None
+            return ",".join(DEFAULT_READ_JIRA_FIELDS)
+        if isinstance(fields, list | tuple | set):
+            return ",".join(fields)
+        return fields
+
+    def _search_result(
+        self, response: object, fields_param: str, source: str
+    ) -> JiraSearchResult:
+        """
+        Convert one page of an issue search response to a search result model.
+
+        Args:
+            response: The response returned by the API call
+            fields_param: The comma-separated fields that were requested
+            source: Name of the API call, for the error message
+
+        Returns:
+            JiraSearchResult object for the page
+
+        Raises:
+            TypeError: If the response is not a dictionary
+        """
+        if not isinstance(response, dict):
+            msg = f"Unexpected return value type from `{source}`: {type(response)}"
+            logger.error(msg)
+            raise TypeError(msg)
+        return JiraSearchResult.from_api_response(
+            response,
+            base_url=self.config.url,
+            requested_fields=fields_param,
+            field_registry=self._field_registry,
+        )
+
+    def _iter_offset_issues(
+        self,
+        fetch: Callable[[int, int], object],
+        fields_param: str,
+        source: str,
+        start: int,
+        page_size: int,
+        max_items: int | None,
+    ) -> Iterator[JiraIssue]:
+        """Iterate over the issues of an API call paged with `startAt`."""
+
+        def fetch_page(
+            page_start: int, limit: int
+        ) -> tuple[list[JiraIssue], int | None]:
+            page = self._search_result(fetch(page_start, limit), fields_param, source)
+            total = page.total if page.total >= 0 else None
+            return page.issues, next_offset(
+                page_start, len(page.issues), total, is_last=False
+            )
+
+        yield from iter_paged(
+            fetch_page, start, page_size=page_size, max_items=max_items
+        )
+
+    def iter_issues(
+        self,
+        jql: str,
+        fields: list[str] | tuple[str, ...] | set[str] | str | None = None,
+        expand: str | None = None,
+        projects_filter: str | None = None,
+        *,
+        page_size: int = 50,
+        max_items: int | None = None,
+    ) -> Iterator[JiraIssue]:
+        """
+        Iterate over all issues matching a JQL query, page by page.
+
+        Pages are requested lazily: the next page is only fetched once the
+        issues of the current one have been consumed. Cloud follows
+        `nextPageToken`, Server/DC follows `startAt`.
+
+        Args:
+            jql: JQL query string
+            fields: Fields to return (comma-separated string, list, tuple, set,
+                or "*all")
+            expand: Optional items to expand (comma-separated)
+            projects_filter: Optional comma-separated list of project keys to
+                filter by, overrides config
+            page_size: Maximum issues to request per page (keyword-only)
+            max_items: Maximum issues to yield in total, None for all (keyword-only)
+
+        Yields:
+            JiraIssue models, in search order
+
+        Raises:
+            TypeError: If the API returns an unexpected response
+            HTTPError: If a page request fails
+        """
+        jql = self._apply_projects_filter(jql, projects_filter)
+        fields_param = self._fields_param(fields)
+
+        if not self.config.is_cloud:
+            yield from self._iter_offset_issues(
+                lambda start, limit: self.jira.jql(
+                    jql, fields=fields_param, start=start, limit=limit, expand=expand
+                ),
+                fields_param,
+                "jira.jql",
+                0,
+                page_size,
+                max_items,
+            )
+            return
+
+        def fetch_page(token: str, limit: int) -> tuple[list[JiraIssue], str | None]:
+            response = self.jira.enhanced_jql(
+                jql,
+                fields=fields_param,
+                nextPageToken=token or None,
+                limit=limit,
+                expand=expand,
+            )
+            page = self._search_result(response, fields_param, "jira.enhanced_jql")
+            next_token = response.get("nextPageToken")
+            if response.get("isLast") or not next_token:
+                return page.issues, None
+            return page.issues, next_token
+
+        yield from iter_paged(fetch_page, "", page_size=page_size, max_items=max_items)
+
+    def _cloud_search_total(self, jql: str, total_mode: SearchTotalMode) -> int:
+        """
+        Count the issues matching a JQL query on Jira Cloud.
+
+        Totals are cached per count mode and normalized JQL, so paging through
+        the results of a query counts its matches only once. Failed counts are
+        not cached.
+
+        Args:
+            jql: JQL query string
+            total_mode: "approximate", "exact" or "none"
+
+        Returns:
+            The total number of matching issues, or -1 if it was not counted
+        """
+        if total_mode == "none":
+            return -1
+
+        cache_key = (total_mode, normalize_jql(jql))
+        with self._search_total_lock:
+            cached_total = self._search_total_cache.get(cache_key)
+        if cached_total is not None:
+            return cached_total
+
+        try:
+            if total_mode == "approximate":
+                response = self.jira.post(
+                    self.jira.resource_url("search/approximate-count"),
+                    json={"jql": jql},
+                )
+                count_field = "count"
+            else:
+                response = self.jira.get(
+                    self.jira.resource_url("search"),
+                    params={"jql": jql, "maxResults": 0},
+                )
+                count_field = "total"
+        except Exception as count_err:  # noqa: BLE001 - the total is optional
+            logger.error(f"Error counting issues for JQL '{jql}': {str(count_err)}")
+            return -1
+
+        if not isinstance(response, dict) or count_field not in response:
+            logger.warning(
+                f"Could not retrieve total count for JQL: {jql}. Response type: {type(response)}"
+            )
+            return -1
+        try:
+            total = int(response[count_field])
+        except (ValueError, TypeError):
+            logger.warning(
+                f"Could not parse '{count_field}' from count response for JQL: {jql}. Received: {response.get(count_field)}"
+            )
+            return -1
+
+        with self._search_total_lock:
+            self._search_total_cache[cache_key] = total
+        return total
+
     def search_issues(
         self,
         jql: str,
@@ -25,6 +281,8 @@ class SearchMixin(JiraClient, IssueOperationsProto):
         limit: int = 50,
         expand: str | None = None,
         projects_filter: str | None = None,
+        *,
+        total_mode: SearchTotalMode = "approximate",
     ) -> JiraSearchResult:
         """
         Search for issues using JQL (Jira Query Language).
@@ -38,6 +296,11 @@ class SearchMixin(JiraClient, IssueOperationsProto):
             limit: Maximum issues to return
             expand: Optional items to expand (comma-separated)
             projects_filter: Optional comma-separated list of project keys to filter by, overrides config
+            total_mode: How Cloud counts the total matches (keyword-only):
+                "approximate" uses the approximate count endpoint, "exact" the
+                legacy search endpoint and "none" skips counting (total is -1).
+                Counts are cached per JQL for a short time. Ignored on
+                Server/DC, where the total comes with the results.
 
         Returns:
             JiraSearchResult object containing issues and metadata (total, start_at, max_results)
@@ -47,73 +310,13 @@ class SearchMixin(JiraClient, IssueOperationsProto):
             Exception: If there is an error searching for issues
         """
         try:
-            # Use projects_filter parameter if provided, otherwise fall back to config
-            filter_to_use = projects_filter or self.config.projects_filter
-
-            # Apply projects filter if present
-            if filter_to_use:
-                # Split projects filter by commas and handle possible whitespace
-                projects = [p.strip() for p in filter_to_use.split(",")]
-
-                # Build the project filter query part
-                if len(projects) == 1:
-                    project_query = f'project = "{projects[0]}"'
-                else:
-                    quoted_projects = [f'"{p}"' for p in projects]
-                    projects_list = ", ".join(quoted_projects)
-                    project_query = f"project IN ({projects_list})"
-
-                # Add the project filter to existing query
-                if not jql:
-                    # Empty JQL - just use project filter
-                    jql = project_query
-                elif jql.strip().upper().startswith("ORDER BY"):
-                    # JQL starts with ORDER BY - prepend project filter
-                    jql = f"{project_query} {jql}"
-                elif "project = " not in jql and "project IN" not in jql:
-                    # Only add if not already filtering by project
-                    jql = f"({jql}) AND {project_query}"
-
-                logger.info(f"Applied projects filter to query: {jql}")
-
-            # Convert fields to proper format if it's a list/tuple/set
-            fields_param: str | None
-            if fields is None:  # Use default if None
-                fields_param = ",".join(DEFAULT_READ_JIRA_FIELDS)
-            elif isinstance(fields, list | tuple | set):
-                fields_param = ",".join(fields)
-            else:
-                fields_param = fields
+            jql = self._apply_projects_filter(jql, projects_filter)
+            fields_param = self._fields_param(fields)
 
             if self.config.is_cloud:
-                actual_total = -1
-                try:
-                    # Call 1: Get metadata (including total) using standard search API
-                    metadata_params = {"jql": jql, "maxResults": 0}
-                    metadata_response = self.jira.get(
-                        self.jira.resource_url("search"), params=metadata_params
-                    )
-
-                    if (
-                        isinstance(metadata_response, dict)
-                        and "total" in metadata_response
-                    ):
-                        try:
-                            actual_total = int(metadata_response["total"])
-                        except (ValueError, TypeError):
-                            logger.warning(
-                                f"Could not parse 'total' from metadata response for JQL: {jql}. Received: {metadata_response.get('total')}"
-                            )
-                    else:
-                        logger.warning(
-                            f"Could not retrieve total count from metadata response for JQL: {jql}. Response type: {type(metadata_response)}"
-                        )
-                except Exception as meta_err:
-                    logger.error(
-                        f"Error fetching metadata for JQL '{jql}': {str(meta_err)}"
-                    )
-
-                # Call 2: Get the actual issues using the enhanced method
+                actual_total = self._cloud_search_total(jql, total_mode)
+
+                # Get the actual issues using the enhanced method
                 issues_response_list = self.jira.enhanced_jql_get_list_of_tickets(
                     jql, fields=fields_param, limit=limit, expand=expand
                 )
@@ -132,6 +335,7 @@ class SearchMixin(JiraClient, IssueOperationsProto):
                     response_dict_for_model,
                     base_url=self.config.url,
                     requested_fields=fields_param,
+                    field_registry=self._field_registry,
                 )
 
                 # Return the full search result object
@@ -148,7 +352,10 @@ class SearchMixin(JiraClient, IssueOperationsProto):
 
                 # Convert the response to a search result model
                 search_result = JiraSearchResult.from_api_response(
-                    response, base_url=self.config.url, requested_fields=fields_param
+                    response,
+                    base_url=self.config.url,
+                    requested_fields=fields_param,
+                    field_registry=self._field_registry,
                 )
 
                 # Return the full search result object
@@ -219,7 +426,10 @@ class SearchMixin(JiraClient, IssueOperationsProto):
 
             # Convert the response to a search result model
             search_result = JiraSearchResult.from_api_response(
-                response, base_url=self.config.url, requested_fields=fields_param
+                response,
+                base_url=self.config.url,
+                requested_fields=fields_param,
+                field_registry=self._field_registry,
             )
             return search_result
         except requests.HTTPError as e:
@@ -275,7 +485,10 @@ class SearchMixin(JiraClient, IssueOperationsProto):
 
             # Convert the response to a search result model
             search_result = JiraSearchResult.from_api_response(
-                response, base_url=self.config.url, requested_fields=fields_param
+                response,
+                base_url=self.config.url,
+                requested_fields=fields_param,
+                field_registry=self._field_registry,
             )
             return search_result
         except requests.HTTPError as e:
@@ -288,3 +501,84 @@ class SearchMixin(JiraClient, IssueOperationsProto):
         except Exception as e:
             logger.error(f"Error searching issues for sprint: {sprint_id}': {str(e)}")
             raise Exception(f"Error searching issues for sprint: {str(e)}") from e
+
+    def iter_board_issues(
+        self,
+        board_id: str,
+        jql: str,
+        fields: str | None = None,
+        expand: str | None = None,
+        *,
+        page_size: int = 50,
+        max_items: int | None = None,
+    ) -> Iterator[JiraIssue]:
+        """
+        Iterate over all issues linked to a board, page by page.
+
+        Args:
+            board_id: The ID of the board
+            jql: JQL query string
+            fields: Fields to return (comma-separated string or "*all")
+            expand: Optional items to expand (comma-separated)
+            page_size: Maximum issues to request per page (keyword-only)
+            max_items: Maximum issues to yield in total, None for all (keyword-only)
+
+        Yields:
+            JiraIssue models linked to the board
+
+        Raises:
+            TypeError: If the API returns an unexpected response
+            HTTPError: If a page request fails
+        """
+        fields_param = self._fields_param(fields)
+        yield from self._iter_offset_issues(
+            lambda start, limit: self.jira.get_issues_for_board(
+                board_id=board_id,
+                jql=jql,
+                fields=fields_param,
+                start=start,
+                limit=limit,
+                expand=expand,
+            ),
+            fields_param,
+            "jira.get_issues_for_board",
+            0,
+            page_size,
+            max_items,
+        )
+
+    def iter_sprint_issues(
+        self,
+        sprint_id: str,
+        fields: str | None = None,
+        *,
+        page_size: int = 50,
+        max_items: int | None = None,
+    ) -> Iterator[JiraIssue]:
+        """
+        Iterate over all issues linked to a sprint, page by page.
+
+        Args:
+            sprint_id: The ID of the sprint
+            fields: Fields to return (comma-separated string or "*all")
+            page_size: Maximum issues to request per page (keyword-only)
+            max_items: Maximum issues to yield in total, None for all (keyword-only)
+
+        Yields:
+            JiraIssue models linked to the sprint
+
+        Raises:
+            TypeError: If the API returns an unexpected response
+            HTTPError: If a page request fails
+        """
+        fields_param = self._fields_param(fields)
+        yield from self._iter_offset_issues(
+            lambda start, limit: self.jira.get_sprint_issues(
+                sprint_id=sprint_id, start=start, limit=limit
+            ),
+            fields_param,
+            "jira.get_sprint_issues",
+            0,
+            page_size,
+            max_items,
+        )
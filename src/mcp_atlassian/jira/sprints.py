@@ -2,12 +2,14 @@
 
 import datetime
 import logging
+from collections.abc import Iterator
 from typing import Any
 
 import requests
 
 from ..models.jira import JiraSprint
 from ..utils import parse_date
+from ..utils.paging import iter_paged, next_offset
 from .client import JiraClient
 
 logger = logging.getLogger("mcp-jira")
@@ -71,6 +73,55 @@ class SprintsMixin(JiraClient):
         )
         return [JiraSprint.from_api_response(sprint) for sprint in sprints]
 
+    def iter_sprints_from_board(
+        self,
+        board_id: str,
+        state: str | None = None,
+        *,
+        page_size: int = 50,
+        max_items: int | None = None,
+    ) -> Iterator[JiraSprint]:
+        """
+        Iterate over all sprints of a board, page by page.
+
+        Unlike get_all_sprints_from_board, errors are raised rather than
+        returned as an empty list, so a failing page cannot be mistaken for
+        the end of the sprints.
+
+        Args:
+            board_id: Board ID
+            state: Sprint state (e.g., active, future, closed) if None, return
+                all state sprints
+            page_size: Maximum number of sprints to request per page (keyword-only)
+            max_items: Maximum number of sprints to yield in total, None for all
+                (keyword-only)
+
+        Yields:
+            JiraSprint models of the board
+
+        Raises:
+            TypeError: If the API returns an unexpected response
+            HTTPError: If a page request fails
+        """
+
+        def fetch_page(start: int, limit: int) -> tuple[list[JiraSprint], int | None]:
+            response = self.jira.get_all_sprints_from_board(
+                board_id=board_id, state=state, start=start, limit=limit
+            )
+            if not isinstance(response, dict):
+                msg = f"Unexpected return value type from `jira.get_all_sprints_from_board`: {type(response)}"
+                logger.error(msg)
+                raise TypeError(msg)
+            sprints = [
+                JiraSprint.from_api_response(sprint)
+                for sprint in response.get("values", [])
+            ]
+            return sprints, next_offset(
+                start, len(sprints), None, is_last=response.get("isLast", True)
+            )
+
+        yield from iter_paged(fetch_page, 0, page_size=page_size, max_items=max_items)
+
     def update_sprint(
         self,
         sprint_id: str,
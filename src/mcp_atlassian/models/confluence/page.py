@@ -5,9 +5,16 @@ This module provides Pydantic models for Confluence pages and their versions.
 
 import logging
 import warnings
+from collections.abc import Callable
 from typing import Any
 
-from pydantic import Field
+from pydantic import (
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    SerializerFunctionWrapHandler,
+    model_serializer,
+)
 
 from ..base import ApiModel, TimestampMixin
 from ..constants import (
@@ -77,15 +84,20 @@ class ConfluencePage(ApiModel, TimestampMixin):
     Model representing a Confluence page.
 
     This model includes the content, metadata, and version information
-    for a Confluence page.
+    for a Confluence page. The content can be given as a loader that is only
+    called the first time the content is read, e.g. when the page is
+    serialized, so pages that are listed but never shown are not converted.
     """
 
+    model_config = ConfigDict(populate_by_name=True)
+
     id: str = CONFLUENCE_DEFAULT_ID
     title: str = EMPTY_STRING
     type: str = "page"  # "page", "blogpost", etc.
     status: str = "current"
     space: ConfluenceSpace | None = None
-    content: str = EMPTY_STRING
+    # Read and written through the content property
+    content_value: str = Field(default=EMPTY_STRING, alias="content")
     content_format: str = "view"  # "view", "storage", etc.
     created: str = EMPTY_STRING
     updated: str = EMPTY_STRING
@@ -96,6 +108,45 @@ class ConfluencePage(ApiModel, TimestampMixin):
     attachments: list[ConfluenceAttachment] = Field(default_factory=list)
     url: str | None = None
 
+    _content_loader: Callable[[], str] | None = PrivateAttr(default=None)
+
+    @property
+    def content(self) -> str:
+        """The page content, converted on first access if a loader was given."""
+        if self._content_loader is not None:
+            loader, self._content_loader = self._content_loader, None
+            self.content_value = loader()
+        return self.content_value
+
+    @content.setter
+    def content(self, value: str) -> None:
+        self._content_loader = None
+        self.content_value = value
+
+    @model_serializer(mode="wrap")
+    def _serialize_content(
+        self, handler: SerializerFunctionWrapHandler
+    ) -> dict[str, Any]:
+        """Serialize the resolved content under its public ``content`` name."""
+        # Run a pending loader so the dump holds the converted content
+        self.content  # noqa: B018
+        data = handler(self)
+        if "content_value" in data:
+            data = {
+                ("content" if key == "content_value" else key): value
+                for key, value in data.items()
+            }
+        return data
+
+    def set_content_loader(self, loader: Callable[[], str]) -> None:
+        """
+        Produce the content with a loader the first time it is read.
+
+        Args:
+            loader: Callable returning the content; called at most once
+        """
+        self._content_loader = loader
+
     @property
     def page_content(self) -> str:
         """
@@ -121,6 +172,8 @@ class ConfluencePage(ApiModel, TimestampMixin):
                 base_url: Base URL for constructing page URLs
                 include_body: Whether to include body content
                 content_override: Override the content value
+                content_loader: Callable returning the content, called the
+                    first time the content is read instead of up front
                 content_format: Override the content format
                 is_cloud: Whether this is a cloud instance (affects URL format)
 
@@ -211,7 +264,7 @@ class ConfluencePage(ApiModel, TimestampMixin):
                 # Server format: {base_url}/pages/viewpage.action?pageId={page_id}
                 url = f"{base_url}/pages/viewpage.action?pageId={page_id}"
 
-        return cls(
+        page = cls(
             id=str(data.get("id", CONFLUENCE_DEFAULT_ID)),
             title=data.get("title", EMPTY_STRING),
             type=data.get("type", "page"),
@@ -228,6 +281,9 @@ class ConfluencePage(ApiModel, TimestampMixin):
             attachments=attachments,
             url=url,
         )
+        if content_loader := kwargs.get("content_loader"):
+            page.set_content_loader(content_loader)
+        return page
 
     def to_simplified_dict(self) -> dict[str, Any]:
         """Convert to simplified dictionary for API response."""
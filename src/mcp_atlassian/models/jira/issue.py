@@ -6,7 +6,7 @@ This module provides Pydantic models for Jira issues.
 
 import logging
 import re
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 from pydantic import Field
 
@@ -30,6 +30,9 @@ from .common import (
 from .link import JiraIssueLink
 from .project import JiraProject
 
+if TYPE_CHECKING:
+    from ...jira.field_registry import FieldRegistry
+
 logger = logging.getLogger(__name__)
 
 # Extended epic field name patterns to support more variations
@@ -246,7 +249,9 @@ class JiraIssue(ApiModel, TimestampMixin):
 
         Args:
             data: The issue data from the Jira API
-            **kwargs: Additional arguments to pass to the constructor
+            **kwargs: Additional arguments: requested_fields (fields to include
+                in the simplified output) and field_registry (a FieldRegistry
+                used to find epic fields by ID)
 
         Returns:
             A JiraIssue instance
@@ -409,15 +414,34 @@ class JiraIssue(ApiModel, TimestampMixin):
         epic_key = None
         epic_name = None
 
+        # The field registry knows the epic field IDs of the instance;
+        # otherwise search the response by field name patterns
+        field_registry: FieldRegistry | None = kwargs.get("field_registry")
+        if field_registry is not None:
+            # Roles found by epic discovery cover instances whose epic fields
+            # have non-standard names or types
+            discovered = field_registry.discovered_epic_field_ids or {}
+            epic_link_id = field_registry.role("epic_link") or discovered.get(
+                "epic_link"
+            )
+            epic_name_id = field_registry.role("epic_name") or discovered.get(
+                "epic_name"
+            )
+            epic_link = fields.get(epic_link_id) if epic_link_id else None
+            epic_name_value = fields.get(epic_name_id) if epic_name_id else None
+        else:
+            epic_link = cls._find_custom_field_in_api_response(
+                fields, ["epic link", "parent epic"]
+            )
+            epic_name_value = cls._find_custom_field_in_api_response(
+                fields, ["epic name"]
+            )
+
         # Check for "Epic Link" field
-        epic_link = cls._find_custom_field_in_api_response(
-            fields, ["epic link", "parent epic"]
-        )
         if isinstance(epic_link, str):
             epic_key = epic_link
 
         # Check for "Epic Name" field
-        epic_name_value = cls._find_custom_field_in_api_response(fields, ["epic name"])
         if isinstance(epic_name_value, str):
             epic_name = epic_name_value
 
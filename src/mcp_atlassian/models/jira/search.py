@@ -54,7 +54,9 @@ class JiraSearchResult(ApiModel):
                     requested_fields = kwargs.get("requested_fields")
                     issues.append(
                         JiraIssue.from_api_response(
-                            issue_data, requested_fields=requested_fields
+                            issue_data,
+                            requested_fields=requested_fields,
+                            field_registry=kwargs.get("field_registry"),
                         )
                     )
 
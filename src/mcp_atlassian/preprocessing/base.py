@@ -3,13 +3,42 @@
 import logging
 import re
 import warnings
-from typing import Any, Protocol
+from collections.abc import Iterable
+from threading import Lock
+from typing import Any, Literal, Protocol
 
 from bs4 import BeautifulSoup, Tag
+from cachetools import TTLCache
 from markdownify import markdownify as md
 
+from .storage_markdown import (
+    StorageMarkdownConverter,
+    collect_user_refs,
+    parse_storage,
+)
+
 logger = logging.getLogger("mcp-atlassian")
 
+# Display names of mentioned users, cached per preprocessor instance
+USER_CACHE_SIZE = 2048
+USER_CACHE_TTL_SECONDS = 600
+
+# Maximum account IDs per Confluence Cloud bulk user request
+BULK_USER_LOOKUP_LIMIT = 100
+
+_ACCOUNT_ID_RE = re.compile(r'ri:account-id="([^"]+)"')
+
+# Cache keys are (kind, identifier) where kind is "accountid" or "username"
+UserKey = tuple[str, str]
+
+# Engines for storage format to Markdown: markdownify over BeautifulSoup, or
+# the single-pass lxml converter in storage_markdown
+ContentConverter = Literal["markdownify", "lxml"]
+CONTENT_CONVERTERS: tuple[str, ...] = ("markdownify", "lxml")
+
+# Which representations process_html_content should produce
+ContentOutput = Literal["both", "html", "markdown"]
+
 
 class ConfluenceClient(Protocol):
     """Protocol for Confluence client."""
@@ -26,20 +55,31 @@ class ConfluenceClient(Protocol):
 class BasePreprocessor:
     """Base class for text preprocessing operations."""
 
-    def __init__(self, base_url: str = "") -> None:
+    def __init__(
+        self, base_url: str = "", content_converter: ContentConverter = "markdownify"
+    ) -> None:
         """
         Initialize the base text preprocessor.
 
         Args:
             base_url: Base URL for API server
+            content_converter: Engine used by process_html_content,
+                "markdownify" (default) or "lxml"
         """
         self.base_url = base_url.rstrip("/") if base_url else ""
+        self.content_converter = content_converter
+        self._user_cache: TTLCache[UserKey, str] = TTLCache(
+            maxsize=USER_CACHE_SIZE, ttl=USER_CACHE_TTL_SECONDS
+        )
+        self._user_cache_lock = Lock()
 
     def process_html_content(
         self,
         html_content: str,
         space_key: str = "",
         confluence_client: ConfluenceClient | None = None,
+        *,
+        output: ContentOutput = "both",
     ) -> tuple[str, str]:
         """
         Process HTML content to replace user refs and page links.
@@ -48,21 +88,32 @@ class BasePreprocessor:
             html_content: The HTML content to process
             space_key: Optional space key for context
             confluence_client: Optional Confluence client for user lookups
+            output: Representations to produce, "both" (default), "html" or
+                "markdown". The one not requested is returned as "".
 
         Returns:
             Tuple of (processed_html, processed_markdown)
         """
+        if self.content_converter == "lxml":
+            return self._process_with_lxml(html_content, confluence_client, output)
         try:
             # Parse the HTML content
             soup = BeautifulSoup(html_content, "html.parser")
 
-            # Process user mentions
-            self._process_user_mentions_in_soup(soup, confluence_client)
-            self._process_user_profile_macros_in_soup(soup, confluence_client)
+            # Resolve every mentioned user at once, then replace the mentions
+            display_names = self._resolve_users_in_soup(soup, confluence_client)
+            self._process_user_mentions_in_soup(soup, display_names)
+            self._process_user_profile_macros_in_soup(
+                soup, confluence_client, display_names
+            )
 
             # Convert to string and markdown
             processed_html = str(soup)
+            if output == "html":
+                return processed_html, ""
             processed_markdown = md(processed_html)
+            if output == "markdown":
+                return "", processed_markdown
 
             return processed_html, processed_markdown
 
@@ -70,43 +121,281 @@ class BasePreprocessor:
             logger.error(f"Error in process_html_content: {str(e)}")
             raise
 
-    def _process_user_mentions_in_soup(
+    def _process_with_lxml(
+        self,
+        html_content: str,
+        confluence_client: ConfluenceClient | None,
+        output: ContentOutput,
+    ) -> tuple[str, str]:
+        """
+        Process HTML content with the single-pass lxml converter.
+
+        Args:
+            html_content: The HTML content to process
+            confluence_client: Optional Confluence client for user lookups
+            output: Representations to produce
+
+        Returns:
+            Tuple of (processed_html, processed_markdown)
+        """
+        if not html_content:
+            return "", ""
+        try:
+            root = parse_storage(html_content)
+            account_ids, usernames = collect_user_refs(root)
+            display_names = (
+                self.resolve_user_display_names(
+                    account_ids, usernames, confluence_client
+                )
+                if account_ids or usernames
+                else {}
+            )
+            converter = StorageMarkdownConverter(display_names)
+
+            # Markdown is rendered first, since serializing the HTML
+            # replaces the user references in the tree
+            processed_markdown = converter.to_markdown(root) if output != "html" else ""
+            processed_html = converter.to_html(root) if output != "markdown" else ""
+            return processed_html, processed_markdown
+
+        except Exception as e:
+            logger.error(f"Error in process_html_content: {str(e)}")
+            raise
+
+    def prefetch_user_display_names(
+        self,
+        html_contents: Iterable[str],
+        confluence_client: ConfluenceClient | None = None,
+    ) -> None:
+        """
+        Resolve the users mentioned in several documents ahead of processing.
+
+        Looking up every account ID at once lets a list of comments or search
+        results share one bulk request instead of one request per document.
+
+        Args:
+            html_contents: HTML or storage format documents
+            confluence_client: Optional Confluence client for user lookups
+        """
+        if confluence_client is None:
+            return
+        account_ids = [
+            account_id
+            for html in html_contents
+            if html
+            for account_id in _ACCOUNT_ID_RE.findall(html)
+        ]
+        if account_ids:
+            self.resolve_user_display_names(
+                account_ids, confluence_client=confluence_client
+            )
+
+    def resolve_user_display_names(
+        self,
+        account_ids: Iterable[str] = (),
+        usernames: Iterable[str] = (),
+        confluence_client: ConfluenceClient | None = None,
+    ) -> dict[UserKey, str]:
+        """
+        Get the display names of users, using the cache where possible.
+
+        Account IDs are looked up with the bulk user API on Confluence Cloud
+        and users that still need a lookup are fetched one at a time.
+
+        Args:
+            account_ids: Account IDs to resolve
+            usernames: Usernames or user keys to resolve (Server/DC)
+            confluence_client: Optional Confluence client for user lookups
+
+        Returns:
+            Display names by ("accountid", id) or ("username", name) key.
+            Users that could not be resolved are omitted.
+        """
+        wanted = list(
+            dict.fromkeys(
+                [("accountid", a) for a in account_ids if a]
+                + [("username", u) for u in usernames if u]
+            )
+        )
+        names: dict[UserKey, str] = {}
+        with self._user_cache_lock:
+            for key in wanted:
+                name = self._user_cache.get(key)
+                if name:
+                    names[key] = name
+
+        missing = [key for key in wanted if key not in names]
+        if not missing or confluence_client is None:
+            return names
+
+        fetched = self._fetch_display_names(missing, confluence_client)
+        with self._user_cache_lock:
+            for key, name in fetched.items():
+                self._user_cache[key] = name
+        names.update(fetched)
+        return names
+
+    def _fetch_display_names(
+        self, keys: list[UserKey], confluence_client: ConfluenceClient
+    ) -> dict[UserKey, str]:
+        """
+        Fetch display names from the API.
+
+        Args:
+            keys: Users to look up
+            confluence_client: Confluence client for user lookups
+
+        Returns:
+            Display names of the users that were found
+        """
+        fetched: dict[UserKey, str] = {}
+        answered: set[UserKey] = set()
+        account_ids = [identifier for kind, identifier in keys if kind == "accountid"]
+        if account_ids and _supports_bulk_user_lookup(confluence_client):
+            for start in range(0, len(account_ids), BULK_USER_LOOKUP_LIMIT):
+                chunk = account_ids[start : start + BULK_USER_LOOKUP_LIMIT]
+                users = self._fetch_users_in_bulk(chunk, confluence_client)
+                if users is not None:
+                    fetched.update(users)
+                    answered.update(("accountid", a) for a in chunk)
+
+        remaining = [key for key in keys if key not in answered]
+        if not remaining:
+            return fetched
+
+        # Server/DC has no bulk endpoint. The lookups run one after another
+        # because this already runs in a worker of the shared Confluence pool;
+        # the shared cache keeps repeat lookups to one per user.
+        for key in remaining:
+            name = self._fetch_user(key, confluence_client)
+            if name:
+                fetched[key] = name
+        return fetched
+
+    def _fetch_users_in_bulk(
+        self, account_ids: list[str], confluence_client: Any
+    ) -> dict[UserKey, str] | None:
+        """
+        Look up users with the Confluence Cloud bulk user API.
+
+        Args:
+            account_ids: Up to BULK_USER_LOOKUP_LIMIT account IDs
+            confluence_client: Confluence Cloud client
+
+        Returns:
+            Display names of the users found, or None if the request failed
+        """
+        try:
+            response = confluence_client.get(
+                "rest/api/user/bulk",
+                params={"accountId": ",".join(account_ids), "limit": len(account_ids)},
+            )
+        except Exception as e:
+            logger.warning(f"Bulk user lookup failed, looking users up one by one: {e}")
+            return None
+        if not isinstance(response, dict) or not isinstance(
+            response.get("results"), list
+        ):
+            return None
+        return {
+            ("accountid", user["accountId"]): user["displayName"]
+            for user in response["results"]
+            if isinstance(user, dict)
+            and user.get("accountId")
+            and isinstance(user.get("displayName"), str)
+            and user["displayName"]
+        }
+
+    def _fetch_user(
+        self, key: UserKey, confluence_client: ConfluenceClient
+    ) -> str | None:
+        """
+        Look up the display name of one user.
+
+        Args:
+            key: ("accountid", id) or ("username", name)
+            confluence_client: Confluence client for user lookups
+
+        Returns:
+            Display name, or None if the lookup failed
+        """
+        kind, identifier = key
+        try:
+            if kind == "accountid":
+                user_details = confluence_client.get_user_details_by_accountid(
+                    identifier
+                )
+            else:
+                # For Confluence Server/DC, userkey might be the username
+                user_details = confluence_client.get_user_details_by_username(
+                    identifier
+                )
+            display_name = user_details.get("displayName")
+        except Exception as e:
+            logger.warning(f"Error fetching user details for {identifier}: {e}")
+            return None
+        return display_name if isinstance(display_name, str) and display_name else None
+
+    def _resolve_users_in_soup(
         self, soup: BeautifulSoup, confluence_client: ConfluenceClient | None = None
+    ) -> dict[UserKey, str]:
+        """
+        Resolve every user mentioned in a document in one pass.
+
+        Args:
+            soup: BeautifulSoup object containing HTML
+            confluence_client: Optional Confluence client for user lookups
+
+        Returns:
+            Display names as returned by resolve_user_display_names
+        """
+        account_ids: list[str] = []
+        usernames: list[str] = []
+        for user_element in soup.find_all("ac:link"):
+            user_ref = user_element.find("ri:user")
+            account_id = user_ref.get("ri:account-id") if user_ref else None
+            if account_id and isinstance(account_id, str):
+                account_ids.append(account_id)
+        for macro_element in soup.find_all(
+            "ac:structured-macro", attrs={"ac:name": "profile"}
+        ):
+            user_ref = macro_element.find("ri:user")
+            if not user_ref:
+                continue
+            account_id = user_ref.get("ri:account-id")
+            userkey = user_ref.get("ri:userkey")
+            if account_id and isinstance(account_id, str):
+                account_ids.append(account_id)
+            elif userkey and isinstance(userkey, str):
+                usernames.append(userkey)
+        if not account_ids and not usernames:
+            return {}
+        return self.resolve_user_display_names(
+            account_ids, usernames, confluence_client
+        )
+
+    def _process_user_mentions_in_soup(
+        self, soup: BeautifulSoup, display_names: dict[UserKey, str]
     ) -> None:
         """
         Process user mentions in BeautifulSoup object.
 
         Args:
             soup: BeautifulSoup object containing HTML
-            confluence_client: Optional Confluence client for user lookups
+            display_names: Resolved display names from _resolve_users_in_soup
         """
         # Find all ac:link elements that might contain user mentions
-        user_mentions = soup.find_all("ac:link")
-
-        for user_element in user_mentions:
+        for user_element in soup.find_all("ac:link"):
             user_ref = user_element.find("ri:user")
-            if user_ref and user_ref.get("ri:account-id"):
-                # Case 1: Direct user reference without link-body
-                account_id = user_ref.get("ri:account-id")
-                if isinstance(account_id, str):
-                    self._replace_user_mention(
-                        user_element, account_id, confluence_client
-                    )
-                    continue
-
-            # Case 2: User reference with link-body containing @
-            link_body = user_element.find("ac:link-body")
-            if link_body and "@" in link_body.get_text(strip=True):
-                user_ref = user_element.find("ri:user")
-                if user_ref and user_ref.get("ri:account-id"):
-                    account_id = user_ref.get("ri:account-id")
-                    if isinstance(account_id, str):
-                        self._replace_user_mention(
-                            user_element, account_id, confluence_client
-                        )
+            account_id = user_ref.get("ri:account-id") if user_ref else None
+            if account_id and isinstance(account_id, str):
+                self._replace_user_mention(user_element, account_id, display_names)
 
     def _process_user_profile_macros_in_soup(
-        self, soup: BeautifulSoup, confluence_client: ConfluenceClient | None = None
+        self,
+        soup: BeautifulSoup,
+        confluence_client: ConfluenceClient | None,
+        display_names: dict[UserKey, str],
     ) -> None:
         """
         Process Confluence User Profile macros in BeautifulSoup object.
@@ -116,6 +405,7 @@ class BasePreprocessor:
         Args:
             soup: BeautifulSoup object containing HTML
             confluence_client: Optional Confluence client for user lookups
+            display_names: Resolved display names from _resolve_users_in_soup
         """
         profile_macros = soup.find_all(
             "ac:structured-macro", attrs={"ac:name": "profile"}
@@ -145,22 +435,10 @@ class BasePreprocessor:
             display_name = None
 
             if confluence_client and user_identifier_for_log:
-                try:
-                    if account_id and isinstance(account_id, str):
-                        user_details = confluence_client.get_user_details_by_accountid(
-                            account_id
-                        )
-                        display_name = user_details.get("displayName")
-                    elif userkey and isinstance(userkey, str):
-                        # For Confluence Server/DC, userkey might be the username
-                        user_details = confluence_client.get_user_details_by_username(
-                            userkey
-                        )
-                        display_name = user_details.get("displayName")
-                except Exception as e:
-                    logger.warning(
-                        f"Error fetching user details for profile macro (user: {user_identifier_for_log}): {e}"
-                    )
+                if account_id and isinstance(account_id, str):
+                    display_name = display_names.get(("accountid", account_id))
+                elif userkey and isinstance(userkey, str):
+                    display_name = display_names.get(("username", userkey))
             elif not confluence_client:
                 logger.warning(
                     "Confluence client not available for User Profile Macro processing."
@@ -183,7 +461,7 @@ class BasePreprocessor:
         self,
         user_element: Tag,
         account_id: str,
-        confluence_client: ConfluenceClient | None = None,
+        display_names: dict[UserKey, str],
     ) -> None:
         """
         Replace a user mention with the user's display name.
@@ -191,25 +469,15 @@ class BasePreprocessor:
         Args:
             user_element: The HTML element containing the user mention
             account_id: The user's account ID
-            confluence_client: Optional Confluence client for user lookups
+            display_names: Resolved display names from _resolve_users_in_soup
         """
-        try:
-            # Only attempt to get user details if we have a valid confluence client
-            if confluence_client is not None:
-                user_details = confluence_client.get_user_details_by_accountid(
-                    account_id
-                )
-                display_name = user_details.get("displayName", "")
-                if display_name:
-                    new_text = f"@{display_name}"
-                    user_element.replace_with(new_text)
-                    return
-            # If we don't have a confluence client or couldn't get user details,
-            # use fallback
-            self._use_fallback_user_mention(user_element, account_id)
-        except Exception as e:
-            logger.warning(f"Error processing user mention: {str(e)}")
-            self._use_fallback_user_mention(user_element, account_id)
+        display_name = display_names.get(("accountid", account_id))
+        if display_name:
+            user_element.replace_with(f"@{display_name}")
+            return
+        # If we don't have a confluence client or couldn't get user details,
+        # use fallback
+        self._use_fallback_user_mention(user_element, account_id)
 
     def _use_fallback_user_mention(self, user_element: Tag, account_id: str) -> None:
         """
@@ -235,3 +503,10 @@ class BasePreprocessor:
             except Exception as e:
                 logger.warning(f"Error converting HTML to markdown: {str(e)}")
         return text
+
+
+def _supports_bulk_user_lookup(confluence_client: Any) -> bool:
+    """Check whether a client talks to Confluence Cloud and can make raw requests."""
+    return getattr(confluence_client, "cloud", False) is True and callable(
+        getattr(confluence_client, "get", None)
+    )
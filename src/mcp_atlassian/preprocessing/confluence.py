@@ -13,7 +13,7 @@ from md2conf.converter import (
     markdown_to_html,
 )
 
-from .base import BasePreprocessor
+from .base import BasePreprocessor, ContentConverter
 
 logger = logging.getLogger("mcp-atlassian")
 
@@ -21,14 +21,18 @@ logger = logging.getLogger("mcp-atlassian")
 class ConfluencePreprocessor(BasePreprocessor):
     """Handles text preprocessing for Confluence content."""
 
-    def __init__(self, base_url: str) -> None:
+    def __init__(
+        self, base_url: str, content_converter: ContentConverter = "markdownify"
+    ) -> None:
         """
         Initialize the Confluence text preprocessor.
 
         Args:
             base_url: Base URL for Confluence API
+            content_converter: Storage format to Markdown engine,
+                "markdownify" (default) or "lxml"
         """
-        super().__init__(base_url=base_url)
+        super().__init__(base_url=base_url, content_converter=content_converter)
 
     def markdown_to_confluence_storage(
         self, markdown_content: str, *, enable_heading_anchors: bool = False
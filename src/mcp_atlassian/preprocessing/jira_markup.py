@@ -0,0 +1,391 @@
+"""Conversion between Jira wiki markup and Markdown.
+
+All patterns are compiled once at import time. A conversion runs in a fixed
+number of passes regardless of how much markup the text contains:
+
+1. Code blocks ({code}/{noformat}, or fenced and inline Markdown code) are
+   tokenized out of the text once and replaced by sentinels, so markup inside
+   them is never converted.
+2. Line structure (headers, lists, block quotes) is converted in one pass.
+3. Inline markup (emphasis, links, images, colors, ...) is converted in one
+   left-to-right scan over a single alternation; the contents of a matched
+   element are converted recursively.
+4. Tables and quote blocks, when present, are converted and the code blocks
+   are put back.
+"""
+
+import re
+from collections.abc import Callable
+
+# Sentinels wrapping the index of a protected code block. Quoted blocks use a
+# different opening character so that their lines are quoted on restore.
+_BLOCK_OPEN = "\ue000"
+_QUOTED_BLOCK_OPEN = "\ue002"
+_BLOCK_CLOSE = "\ue001"
+_BLOCK_SENTINEL_RE = re.compile("([\ue000\ue002])(\\d+)\ue001")
+
+# --- Jira wiki markup to Markdown -------------------------------------------
+
+_JIRA_CODE_RE = re.compile(
+    r"\{\{(?P<inline>[^}]+)\}\}"
+    r"|\{code(?::(?P<language>[a-z]+))?\}(?P<code>[\s\S]*?)\{code\}"
+    r"|\{noformat\}(?P<noformat>[\s\S]*?)\{noformat\}"
+)
+
+_JIRA_LINE_RE = re.compile(
+    r"^(?:bq\.(?P<bq>.*)"
+    r"|(?P<bullets>[#\-+*]+) (?P<item>.*)"
+    r"|h(?P<level>[0-6])\.(?P<heading>.*))$",
+    re.MULTILINE,
+)
+
+# Inline elements other than emphasis. The text inside emphasis is converted
+# with these only, since emphasis is never nested.
+_JIRA_ELEMENTS = (
+    r"\?\?(?P<cite>[^?\n]+)\?\?"
+    r"|\+(?P<ins>[^+]*)\+"
+    r"|\^(?P<sup>[^^]*)\^"
+    r"|~(?P<sub>[^~]*)~"
+    r"|!(?P<image>[^|\n\s!]+)\|(?P<image_options>[^\n!]*)!"
+    r"|!(?P<plain_image>[^\n\s!]+)!"
+    r"|\[(?P<link_text>[^|\]]+)\|(?P<link_url>.+?)\]"
+    r"|\[(?P<bare_link>.+?)\](?!\()"
+    r"|\{color:(?P<color>[^}]+)\}(?P<color_text>[\s\S]*?)\{color\}"
+)
+_JIRA_ELEMENT_RE = re.compile(_JIRA_ELEMENTS)
+_JIRA_INLINE_RE = re.compile(r"(?P<em>[*_])(?P<em_text>.*?)(?P=em)|" + _JIRA_ELEMENTS)
+
+# Characters that can start an inline element, to skip the scan entirely
+_JIRA_INLINE_TRIGGER_RE = re.compile(r"[*_{?+^~!\[]")
+
+_JIRA_IMAGE_ALT_RE = re.compile(r".*alt=([^\n!,]+)")
+_JIRA_QUOTE_RE = re.compile(r"\{quote\}([\s\S]*)\{quote\}")
+
+# --- Markdown to Jira wiki markup -------------------------------------------
+
+_MARKDOWN_CODE_RE = re.compile(
+    r"```(?P<language>\w*)\n(?P<code>[\s\S]+?)```|`(?P<inline>[^`]+)`"
+)
+
+_MARKDOWN_SETEXT_RE = re.compile(r"^(.*?)\n([=-])+$", re.MULTILINE)
+
+_MARKDOWN_LINE_RE = re.compile(
+    r"^(?:(?P<hashes>#+)(?P<heading>.*?)"
+    r"|(?P<bullet_indent>[ \t]*)- (?P<bullet>.*)"
+    r"|(?P<number_indent>[ \t]+)1\. (?P<number>.*))$",
+    re.MULTILINE,
+)
+
+_MARKDOWN_ELEMENTS = (
+    r"<(?P<tag>cite|del|ins|sup|sub)>(?P<tag_text>.*?)</(?P=tag)>"
+    r'|<span style="color:(?P<color>#[^"]+)">(?P<color_text>[\s\S]*?)</span>'
+    r"|~~(?P<strike>.*?)~~"
+    r"|!\[\]\((?P<image>[^)\n\s]+)\)"
+    r"|!\[(?P<image_alt>[^\]\n]+)\]\((?P<alt_image>[^)\n\s]+)\)"
+    r"|\[(?P<link_text>[^\]]+)\]\((?P<link_url>[^)]+)\)"
+    r"|<(?P<angle_link>[^>]+)>"
+)
+_MARKDOWN_ELEMENT_RE = re.compile(_MARKDOWN_ELEMENTS)
+_MARKDOWN_INLINE_RE = re.compile(
+    r"(?P<em>[*_]+)(?P<em_text>.*?)(?P=em)|" + _MARKDOWN_ELEMENTS
+)
+
+_MARKDOWN_INLINE_TRIGGER_RE = re.compile(r"[*_<~\[]")
+
+_MARKDOWN_TABLE_SEPARATOR_RE = re.compile(r"\|[-\s|]+\|")
+
+_HTML_TAG_TO_JIRA = {"cite": "??", "del": "-", "ins": "+", "sup": "^", "sub": "~"}
+
+
+def _protect_blocks(
+    text: str, pattern: re.Pattern, render: Callable[[re.Match], str]
+) -> tuple[str, list[str]]:
+    """Replace code blocks with sentinels.
+
+    Args:
+        text: Text to protect
+        pattern: Pattern matching code blocks
+        render: Converts a matched code block to the target format
+
+    Returns:
+        Text with sentinels, and the rendered code blocks they refer to
+    """
+    pieces: list[str] = []
+    blocks: list[str] = []
+    position = 0
+    for match in pattern.finditer(text):
+        pieces.append(text[position : match.start()])
+        pieces.append(f"{_BLOCK_OPEN}{len(blocks)}{_BLOCK_CLOSE}")
+        blocks.append(render(match))
+        position = match.end()
+    if not blocks:
+        return text, blocks
+    pieces.append(text[position:])
+    return "".join(pieces), blocks
+
+
+def _restore_blocks(text: str, blocks: list[str]) -> str:
+    """Put protected code blocks back in place of their sentinels.
+
+    Args:
+        text: Text containing sentinels
+        blocks: Rendered code blocks, indexed by sentinel number
+
+    Returns:
+        Text with the code blocks restored. Blocks inside a quote have every
+        line quoted.
+    """
+    if not blocks:
+        return text
+
+    def restore(match: re.Match) -> str:
+        index = int(match.group(2))
+        if index >= len(blocks):
+            return match.group(0)
+        block = blocks[index]
+        if match.group(1) == _QUOTED_BLOCK_OPEN:
+            return block.replace("\n", "\n> ")
+        return block
+
+    return _BLOCK_SENTINEL_RE.sub(restore, text)
+
+
+def _render_jira_code(match: re.Match) -> str:
+    """Convert a Jira code block or inline code matched by _JIRA_CODE_RE."""
+    if match.group("inline") is not None:
+        return f"`{match.group('inline')}`"
+    if match.group("noformat") is not None:
+        return f"```\n{match.group('noformat')}\n```"
+    return f"```{match.group('language') or ''}\n{match.group('code')}\n```"
+
+
+def _jira_list_item(bullets: str, content: str) -> str:
+    """Convert a Jira list item to Markdown.
+
+    Args:
+        bullets: Jira list markers, e.g. "*", "##" or "*#"
+        content: Item text
+
+    Returns:
+        Markdown list item indented by nesting level
+    """
+    indent = " " * ((len(bullets) - 1) * 2)
+    prefix = "1." if bullets[-1] == "#" else "-"
+    return f"{indent}{prefix} {content}"
+
+
+def _jira_line(match: re.Match) -> str:
+    """Convert a Jira block quote, list item or header line."""
+    if match.group("bullets") is not None:
+        return _jira_list_item(match.group("bullets"), match.group("item"))
+    if match.group("level") is not None:
+        return "#" * int(match.group("level")) + match.group("heading")
+    return f"> {match.group('bq')}\n"
+
+
+def _jira_inline(text: str, *, emphasis: bool = True) -> str:
+    """Convert inline Jira markup to Markdown in one scan.
+
+    Args:
+        text: Jira markup without code blocks
+        emphasis: Whether to convert bold and italic text
+
+    Returns:
+        Markdown text
+    """
+    if not _JIRA_INLINE_TRIGGER_RE.search(text):
+        return text
+    pattern = _JIRA_INLINE_RE if emphasis else _JIRA_ELEMENT_RE
+    return pattern.sub(_jira_inline_element, text)
+
+
+def _jira_inline_element(match: re.Match) -> str:
+    """Convert one inline Jira element matched by _JIRA_INLINE_RE."""
+    kind = match.lastgroup
+    if kind == "em_text":
+        marker = "**" if match.group("em") == "*" else "*"
+        text = _jira_inline(match.group("em_text"), emphasis=False)
+        return f"{marker}{text}{marker}"
+    if kind == "cite":
+        return f"<cite>{_jira_inline(match.group('cite'))}</cite>"
+    if kind in ("ins", "sup", "sub"):
+        return f"<{kind}>{_jira_inline(match.group(kind))}</{kind}>"
+    if kind == "image_options":
+        alt = _JIRA_IMAGE_ALT_RE.match(match.group("image_options"))
+        return f"![{alt.group(1) if alt else ''}]({match.group('image')})"
+    if kind == "plain_image":
+        return f"![]({match.group('plain_image')})"
+    if kind == "link_url":
+        text = _jira_inline(match.group("link_text"))
+        return f"[{text}]({match.group('link_url')})"
+    if kind == "bare_link":
+        return f"<{match.group('bare_link')}>"
+    if kind == "color_text":
+        text = _jira_inline(match.group("color_text"))
+        return f'<span style="color:{match.group("color")}">{text}</span>'
+    return match.group(0)
+
+
+def _quote_jira_block(match: re.Match) -> str:
+    """Convert a {quote} block, marking protected code blocks as quoted."""
+    lines = match.group(1).replace(_BLOCK_OPEN, _QUOTED_BLOCK_OPEN).split("\n")
+    return "\n".join(f"> {line}" for line in lines)
+
+
+def _jira_tables(text: str) -> str:
+    """Convert Jira table header rows (||) to Markdown tables.
+
+    Args:
+        text: Text that may contain Jira tables
+
+    Returns:
+        Text with a Markdown separator row after each header row
+    """
+    lines = []
+    for line in text.split("\n"):
+        if "||" not in line:
+            lines.append(line)
+            continue
+        line = line.replace("||", "|")
+        lines.append(line)
+        header_cells = line.count("|") - 1
+        if header_cells > 0:
+            lines.append("|" + "---|" * header_cells)
+    return "\n".join(lines)
+
+
+def jira_to_markdown(text: str) -> str:
+    """Convert Jira wiki markup to Markdown.
+
+    Args:
+        text: Text in Jira markup format
+
+    Returns:
+        Text in Markdown format
+    """
+    if not text:
+        return ""
+
+    blocks: list[str] = []
+    if "{" in text:
+        text, blocks = _protect_blocks(text, _JIRA_CODE_RE, _render_jira_code)
+
+    text = _JIRA_LINE_RE.sub(_jira_line, text)
+    text = _jira_inline(text)
+    if "{quote}" in text:
+        text = _JIRA_QUOTE_RE.sub(_quote_jira_block, text)
+    if "||" in text:
+        text = _jira_tables(text)
+    return _restore_blocks(text, blocks)
+
+
+def _render_markdown_code(match: re.Match) -> str:
+    """Convert a fenced code block or inline code matched by _MARKDOWN_CODE_RE."""
+    if match.group("inline") is not None:
+        return f"{{{{{match.group('inline')}}}}}"
+    syntax = f":{match.group('language')}" if match.group("language") else ""
+    return f"{{code{syntax}}}{match.group('code')}{{code}}"
+
+
+def _markdown_setext_header(match: re.Match) -> str:
+    """Convert a header underlined with = or - to Jira markup."""
+    level = 1 if match.group(2) == "=" else 2
+    return f"h{level}. {match.group(1)}"
+
+
+def _markdown_line(match: re.Match) -> str:
+    """Convert a Markdown header or list item line."""
+    if match.group("hashes") is not None:
+        return f"h{len(match.group('hashes'))}.{match.group('heading')}"
+    if match.group("bullet") is not None:
+        indent = match.group("bullet_indent")
+        return "  " * (len(indent) // 2) + "* " + match.group("bullet")
+    depth = len(match.group("number_indent")) // 4 + 2
+    return "#" * depth + " " + match.group("number")
+
+
+def _markdown_inline(text: str, *, emphasis: bool = True) -> str:
+    """Convert inline Markdown to Jira markup in one scan.
+
+    Args:
+        text: Markdown without code
+        emphasis: Whether to convert bold and italic text
+
+    Returns:
+        Jira markup
+    """
+    if not _MARKDOWN_INLINE_TRIGGER_RE.search(text):
+        return text
+    pattern = _MARKDOWN_INLINE_RE if emphasis else _MARKDOWN_ELEMENT_RE
+    return pattern.sub(_markdown_inline_element, text)
+
+
+def _markdown_inline_element(match: re.Match) -> str:
+    """Convert one inline Markdown element matched by _MARKDOWN_INLINE_RE."""
+    kind = match.lastgroup
+    if kind == "em_text":
+        marker = "_" if len(match.group("em")) == 1 else "*"
+        text = _markdown_inline(match.group("em_text"), emphasis=False)
+        return f"{marker}{text}{marker}"
+    if kind == "tag_text":
+        marker = _HTML_TAG_TO_JIRA[match.group("tag")]
+        return f"{marker}{_markdown_inline(match.group('tag_text'))}{marker}"
+    if kind == "color_text":
+        text = _markdown_inline(match.group("color_text"))
+        return f"{{color:{match.group('color')}}}{text}{{color}}"
+    if kind == "strike":
+        return f"-{_markdown_inline(match.group('strike'))}-"
+    if kind == "image":
+        return f"!{match.group('image')}!"
+    if kind == "alt_image":
+        return f"!{match.group('alt_image')}|alt={match.group('image_alt')}!"
+    if kind == "link_url":
+        text = _markdown_inline(match.group("link_text"))
+        return f"[{text}|{match.group('link_url')}]"
+    if kind == "angle_link":
+        return f"[{match.group('angle_link')}]"
+    return match.group(0)
+
+
+def _markdown_tables(text: str) -> str:
+    """Convert Markdown table header rows to Jira format.
+
+    Args:
+        text: Text that may contain Markdown tables
+
+    Returns:
+        Text with header rows using || and separator rows removed
+    """
+    lines = text.split("\n")
+    i = 0
+    while i < len(lines) - 1:
+        if _MARKDOWN_TABLE_SEPARATOR_RE.match(lines[i + 1]):
+            lines[i] = lines[i].replace("|", "||")
+            lines.pop(i + 1)
+        i += 1
+    return "\n".join(lines)
+
+
+def markdown_to_jira(text: str) -> str:
+    """Convert Markdown to Jira wiki markup.
+
+    Args:
+        text: Text in Markdown format
+
+    Returns:
+        Text in Jira markup format
+    """
+    if not text:
+        return ""
+
+    blocks: list[str] = []
+    if "`" in text:
+        text, blocks = _protect_blocks(text, _MARKDOWN_CODE_RE, _render_markdown_code)
+
+    text = _markdown_inline(text)
+    if "\n=" in text or "\n-" in text:
+        text = _MARKDOWN_SETEXT_RE.sub(_markdown_setext_header, text)
+    text = _MARKDOWN_LINE_RE.sub(_markdown_line, text)
+    if "|" in text:
+        text = _markdown_tables(text)
+    return _restore_blocks(text, blocks)
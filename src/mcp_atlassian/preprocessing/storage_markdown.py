@@ -0,0 +1,764 @@
+"""Conversion of Confluence storage format to Markdown with lxml.
+
+A document is parsed once with lxml's HTML parser. User mentions and profile
+macros are replaced while the tree is walked, so the same walk that rewrites
+them also emits the Markdown:
+
+1. CDATA sections (code macro bodies, plain-text link bodies) are turned into
+   escaped text, since the HTML parser would otherwise treat them as comments.
+2. The users referenced by mentions and profile macros are collected from the
+   parsed tree, so they can be resolved in one batch before the walk.
+3. The tree is walked depth first. Standard HTML is rendered the way
+   markdownify renders it with its default options; Confluence elements
+   (macros, links, images, tasks, emoticons) are rendered from their
+   parameters and bodies instead of their raw text.
+
+The HTML representation is only serialized when it is asked for.
+"""
+
+import html
+import logging
+import re
+from collections.abc import Callable
+
+from lxml import etree
+from lxml.html import HtmlElement, fragment_fromstring
+
+logger = logging.getLogger("mcp-atlassian")
+
+# Cache keys are (kind, identifier) where kind is "accountid" or "username"
+UserKey = tuple[str, str]
+
+_CDATA_RE = re.compile(r"<!\[CDATA\[(.*?)\]\]>", re.DOTALL)
+
+# Whitespace normalization, as in markdownify
+_WHITESPACE_RE = re.compile(r"[\t ]+")
+_ALL_WHITESPACE_RE = re.compile(r"[\t \r\n]+")
+_NEWLINE_WHITESPACE_RE = re.compile(r"[\t \r\n]*[\r\n][\t \r\n]*")
+_EXTRACT_NEWLINES_RE = re.compile(r"^(\n*)((?:.*[^\n])?)(\n*)$", re.DOTALL)
+_LINE_WITH_CONTENT_RE = re.compile(r"^(.*)", re.MULTILINE)
+_PRE_LSTRIP_RE = re.compile(r"^[ \n]*\n")
+_PRE_RSTRIP_RE = re.compile(r"[ \n]*$")
+_BACKTICK_RUNS_RE = re.compile(r"`+")
+_HEADING_RE = re.compile(r"h(\d+)$")
+
+# Elements whose inner and outer whitespace is dropped
+_BLOCK_TAGS = frozenset(
+    {
+        "p",
+        "blockquote",
+        "article",
+        "div",
+        "section",
+        "ol",
+        "ul",
+        "li",
+        "dl",
+        "dt",
+        "dd",
+        "table",
+        "thead",
+        "tbody",
+        "tfoot",
+        "tr",
+        "td",
+        "th",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "ac:layout",
+        "ac:layout-section",
+        "ac:layout-cell",
+        "ac:rich-text-body",
+        "ac:task-list",
+        "ac:task",
+    }
+)
+_BLOCK_OUTSIDE_TAGS = _BLOCK_TAGS | {"pre"}
+
+# Macros rendered as a block quote of their body
+_PANEL_MACROS = frozenset({"info", "note", "tip", "warning", "panel", "expand"})
+_CODE_MACROS = frozenset({"code", "noformat"})
+# Macros that sit inside a line of text, rendered from one of their parameters
+_INLINE_MACROS = {"status": "title", "jira": "key", "anchor": ""}
+
+# Parent context flags passed down the walk
+_PRE = 1
+_NOFORMAT = 2
+_INLINE = 4
+_LIST_ITEM = 8
+
+_BULLETS = "*+-"
+
+# A child of an element: text, a rendered user reference, or an element
+Node = str | HtmlElement
+
+
+def parse_storage(content: str) -> HtmlElement:
+    """
+    Parse Confluence storage format (or plain HTML) into an element tree.
+
+    Args:
+        content: Storage format document
+
+    Returns:
+        A <div> element wrapping the document
+    """
+    if "<![CDATA[" in content:
+        content = _CDATA_RE.sub(lambda m: html.escape(m.group(1), quote=False), content)
+    return fragment_fromstring(content, create_parent="div")
+
+
+def collect_user_refs(root: HtmlElement) -> tuple[list[str], list[str]]:
+    """
+    Find the users referenced by mentions and profile macros.
+
+    Args:
+        root: Parsed document
+
+    Returns:
+        Tuple of (account_ids, usernames) to resolve
+    """
+    account_ids: list[str] = []
+    usernames: list[str] = []
+    for user_ref in root.iter("ri:user"):
+        parent = user_ref.getparent()
+        account_id = user_ref.get("ri:account-id")
+        if parent is not None and parent.tag == "ac:link":
+            if account_id:
+                account_ids.append(account_id)
+        elif _profile_macro(user_ref) is not None:
+            userkey = user_ref.get("ri:userkey")
+            if account_id:
+                account_ids.append(account_id)
+            elif userkey:
+                usernames.append(userkey)
+    return account_ids, usernames
+
+
+def _profile_macro(user_ref: HtmlElement) -> HtmlElement | None:
+    """Return the profile macro a ri:user element belongs to, if any."""
+    for ancestor in user_ref.iterancestors("ac:structured-macro"):
+        return ancestor if ancestor.get("ac:name") == "profile" else None
+    return None
+
+
+def _escape(text: str) -> str:
+    """Escape the Markdown emphasis characters markdownify escapes."""
+    return text.replace("*", r"\*").replace("_", r"\_")
+
+
+def _chomp(text: str) -> tuple[str, str, str]:
+    """Move leading and trailing spaces of inline content outside its markup."""
+    prefix = " " if text and text[0] == " " else ""
+    suffix = " " if text and text[-1] == " " else ""
+    return prefix, suffix, text.strip()
+
+
+def _indent(text: str, indent: str) -> str:
+    """Indent every non-empty line of text."""
+    return _LINE_WITH_CONTENT_RE.sub(
+        lambda m: indent + m.group(1) if m.group(1) else "", text
+    )
+
+
+def _is_block(node: Node | None) -> bool:
+    """Check whether a sibling is a block, so the whitespace next to it is dropped."""
+    if node is None or isinstance(node, str):
+        return False
+    tag = node.tag
+    if tag == "ac:structured-macro":
+        return node.get("ac:name") not in _INLINE_MACROS
+    return tag in _BLOCK_OUTSIDE_TAGS
+
+
+class StorageMarkdownConverter:
+    """Renders a parsed storage format document as Markdown or HTML."""
+
+    def __init__(self, display_names: dict[UserKey, str]) -> None:
+        """
+        Initialize the converter.
+
+        Args:
+            display_names: Resolved display names of the referenced users
+        """
+        self.display_names = display_names
+        self._converters: dict[str, Callable[[HtmlElement, str, int], str]] = {
+            "a": self._convert_a,
+            "b": self._convert_strong,
+            "strong": self._convert_strong,
+            "em": self._convert_em,
+            "i": self._convert_em,
+            "del": self._convert_del,
+            "s": self._convert_del,
+            "code": self._convert_code,
+            "kbd": self._convert_code,
+            "samp": self._convert_code,
+            "br": self._convert_br,
+            "hr": self._convert_hr,
+            "p": self._convert_p,
+            "div": self._convert_div,
+            "article": self._convert_div,
+            "section": self._convert_div,
+            "dl": self._convert_div,
+            "ac:layout": self._convert_div,
+            "ac:layout-section": self._convert_div,
+            "ac:layout-cell": self._convert_div,
+            "ac:rich-text-body": self._convert_div,
+            "dt": self._convert_dt,
+            "dd": self._convert_dd,
+            "blockquote": self._convert_blockquote,
+            "pre": self._convert_pre,
+            "ul": self._convert_list,
+            "ol": self._convert_list,
+            "ac:task-list": self._convert_list,
+            "li": self._convert_li,
+            "ac:task": self._convert_task,
+            "img": self._convert_img,
+            "ac:image": self._convert_image,
+            "table": self._convert_table,
+            "tr": self._convert_tr,
+            "td": self._convert_cell,
+            "th": self._convert_cell,
+            "caption": self._convert_caption,
+            "q": self._convert_q,
+            "script": self._drop,
+            "style": self._drop,
+            "ac:parameter": self._drop,
+            "ac:task-id": self._drop,
+            "ac:task-status": self._drop,
+            "ac:structured-macro": self._convert_macro,
+            "ac:link": self._convert_link,
+            "ac:emoticon": self._convert_emoticon,
+        }
+
+    # --- User references ----------------------------------------------------
+
+    def user_text(self, element: HtmlElement) -> str | None:
+        """
+        Get the text that replaces a user mention or profile macro.
+
+        Args:
+            element: An ac:link or ac:structured-macro element
+
+        Returns:
+            "@DisplayName" or a fallback, or None if the element does not
+            reference a user
+        """
+        if element.tag == "ac:link":
+            user_ref = next(element.iter("ri:user"), None)
+            account_id = user_ref.get("ri:account-id") if user_ref is not None else None
+            if not account_id:
+                return None
+            display_name = self.display_names.get(("accountid", account_id))
+            return f"@{display_name}" if display_name else f"@user_{account_id}"
+
+        if element.get("ac:name") != "profile":
+            return None
+        user_param = next(
+            (
+                param
+                for param in element.iter("ac:parameter")
+                if param.get("ac:name") == "user"
+            ),
+            None,
+        )
+        user_ref = (
+            next(user_param.iter("ri:user"), None) if user_param is not None else None
+        )
+        if user_ref is None:
+            logger.debug(
+                "User profile macro found without a 'user' parameter or 'ri:user' tag. "
+                "Replacing with placeholder."
+            )
+            return "[User Profile Macro (Malformed)]"
+        account_id = user_ref.get("ri:account-id")
+        userkey = user_ref.get("ri:userkey")
+        if account_id:
+            display_name = self.display_names.get(("accountid", account_id))
+        elif userkey:
+            display_name = self.display_names.get(("username", userkey))
+        else:
+            display_name = None
+        if display_name:
+            return f"@{display_name}"
+        fallback_text = f"[User Profile: {account_id or userkey or 'unknown_user'}]"
+        logger.debug(f"Using fallback for user profile macro: {fallback_text}")
+        return fallback_text
+
+    def _children(self, element: HtmlElement) -> list[Node]:
+        """List the children of an element with user references as text."""
+        nodes: list[Node] = []
+        if element.text:
+            nodes.append(element.text)
+        for child in element:
+            tag = child.tag
+            replacement = (
+                self.user_text(child)
+                if tag == "ac:link" or tag == "ac:structured-macro"
+                else None
+            )
+            nodes.append(child if replacement is None else replacement)
+            if child.tail:
+                nodes.append(child.tail)
+        return nodes
+
+    # --- HTML ---------------------------------------------------------------
+
+    def to_html(self, root: HtmlElement) -> str:
+        """
+        Replace the user references in place and serialize the document.
+
+        Args:
+            root: Parsed document from parse_storage
+
+        Returns:
+            The processed HTML, without the wrapping <div>
+        """
+        references = [
+            element
+            for element in root.iter("ac:link", "ac:structured-macro")
+            if element.tag == "ac:link" or element.get("ac:name") == "profile"
+        ]
+        for element in references:
+            # Elements inside an already replaced reference are detached
+            parent = element.getparent()
+            if parent is None or not _attached(element, root):
+                continue
+            replacement = self.user_text(element)
+            if replacement is not None:
+                _replace_with_text(element, replacement)
+
+        parts = [html.escape(root.text, quote=False)] if root.text else []
+        parts.extend(
+            etree.tostring(child, method="html", encoding="unicode") for child in root
+        )
+        return "".join(parts)
+
+    # --- Markdown -----------------------------------------------------------
+
+    def to_markdown(self, root: HtmlElement) -> str:
+        """
+        Render a document as Markdown.
+
+        Args:
+            root: Parsed document from parse_storage
+
+        Returns:
+            Markdown text
+        """
+        return self._convert_children(root, None, 0).strip("\n")
+
+    def _convert_children(
+        self, element: HtmlElement, tag: str | None, flags: int
+    ) -> str:
+        """Render the children of an element and join them."""
+        nodes = self._children(element)
+        remove_inside = tag in _BLOCK_TAGS
+        last = len(nodes) - 1
+        strings: list[str] = []
+        for index, node in enumerate(nodes):
+            previous = nodes[index - 1] if index > 0 else None
+            following = nodes[index + 1] if index < last else None
+            if isinstance(node, str):
+                block_before = _is_block(previous)
+                block_after = _is_block(following)
+                if not node.strip() and (
+                    (remove_inside and (previous is None or following is None))
+                    or block_before
+                    or block_after
+                ):
+                    continue
+                text = self._convert_text(node, flags)
+                if block_before or (remove_inside and previous is None):
+                    text = text.lstrip(" \t\r\n")
+                if block_after or (remove_inside and following is None):
+                    text = text.rstrip()
+            elif isinstance(node.tag, str):
+                text = self._convert_element(node, flags)
+            else:
+                continue
+            if text:
+                strings.append(text)
+
+        if flags & _PRE:
+            return "".join(strings)
+
+        # Collapse the newlines between children to at most one blank line
+        joined = [""]
+        for string in strings:
+            leading, content, trailing = _EXTRACT_NEWLINES_RE.match(string).groups()
+            if joined[-1] and leading:
+                previous_trailing = joined.pop()
+                leading = "\n" * min(2, max(len(previous_trailing), len(leading)))
+            joined.extend((leading, content, trailing))
+        return "".join(joined)
+
+    def _convert_text(self, text: str, flags: int) -> str:
+        """Normalize the whitespace of a text node and escape it."""
+        if not flags & _PRE:
+            text = _NEWLINE_WHITESPACE_RE.sub("\n", text)
+            text = _WHITESPACE_RE.sub(" ", text)
+        if not flags & _NOFORMAT:
+            text = _escape(text)
+        return text
+
+    def _convert_element(self, element: HtmlElement, flags: int) -> str:
+        """Render one element and its children."""
+        tag = element.tag
+        converter = self._converters.get(tag)
+        if converter is self._drop:
+            return ""
+        if converter is self._convert_macro:
+            return self._convert_macro(element, "", flags)
+
+        child_flags = flags
+        heading = _HEADING_RE.match(tag)
+        if heading or tag in ("td", "th"):
+            child_flags |= _INLINE
+        elif tag in ("pre", "code", "kbd", "samp"):
+            child_flags |= _NOFORMAT
+            if tag == "pre":
+                child_flags |= _PRE
+        elif tag == "li" or tag == "ac:task":
+            child_flags |= _LIST_ITEM
+
+        text = self._convert_children(element, tag, child_flags)
+        if heading:
+            return self._convert_heading(int(heading.group(1)), text, flags)
+        if converter is None:
+            return text
+        return converter(element, text, flags)
+
+    def _drop(self, element: HtmlElement, text: str, flags: int) -> str:
+        return ""
+
+    # --- Standard HTML, rendered as markdownify does ------------------------
+
+    def _inline(self, markup: str, text: str, flags: int) -> str:
+        if flags & _NOFORMAT:
+            return text
+        prefix, suffix, text = _chomp(text)
+        return f"{prefix}{markup}{text}{markup}{suffix}" if text else ""
+
+    def _convert_strong(self, element: HtmlElement, text: str, flags: int) -> str:
+        return self._inline("**", text, flags)
+
+    def _convert_em(self, element: HtmlElement, text: str, flags: int) -> str:
+        return self._inline("*", text, flags)
+
+    def _convert_del(self, element: HtmlElement, text: str, flags: int) -> str:
+        return self._inline("~~", text, flags)
+
+    def _convert_a(self, element: HtmlElement, text: str, flags: int) -> str:
+        if flags & _NOFORMAT:
+            return text
+        prefix, suffix, text = _chomp(text)
+        if not text:
+            return ""
+        href = element.get("href")
+        title = element.get("title")
+        if text.replace(r"\_", "_") == href and not title:
+            return f"<{href}>"
+        title_part = ' "{}"'.format(title.replace('"', r"\"")) if title else ""
+        return f"{prefix}[{text}]({href}{title_part}){suffix}" if href else text
+
+    def _convert_code(self, element: HtmlElement, text: str, flags: int) -> str:
+        if flags & _NOFORMAT:
+            return text
+        prefix, suffix, text = _chomp(text)
+        if not text:
+            return ""
+        backticks = max(
+            (len(run) for run in _BACKTICK_RUNS_RE.findall(text)), default=0
+        )
+        delimiter = "`" * (backticks + 1)
+        if backticks:
+            text = f" {text} "
+        return f"{prefix}{delimiter}{text}{delimiter}{suffix}"
+
+    def _convert_br(self, element: HtmlElement, text: str, flags: int) -> str:
+        if flags & _INLINE:
+            return text + " " if text else " "
+        return "  \n" + text
+
+    def _convert_hr(self, element: HtmlElement, text: str, flags: int) -> str:
+        return "\n\n---\n\n"
+
+    def _convert_heading(self, level: int, text: str, flags: int) -> str:
+        if flags & _INLINE:
+            return text
+        level = max(1, min(6, level))
+        text = text.strip()
+        if level <= 2:
+            text = text.rstrip()
+            line = ("=" if level == 1 else "-") * len(text)
+            return f"\n\n{text}\n{line}\n\n" if text else ""
+        text = _ALL_WHITESPACE_RE.sub(" ", text)
+        return f"\n\n{'#' * level} {text}\n\n"
+
+    def _convert_p(self, element: HtmlElement, text: str, flags: int) -> str:
+        text = text.strip(" \t\r\n")
+        if flags & _INLINE:
+            return f" {text} "
+        return f"\n\n{text}\n\n" if text else ""
+
+    def _convert_div(self, element: HtmlElement, text: str, flags: int) -> str:
+        text = text.strip()
+        if flags & _INLINE:
+            return f" {text} "
+        return f"\n\n{text}\n\n" if text else ""
+
+    def _convert_dt(self, element: HtmlElement, text: str, flags: int) -> str:
+        text = _ALL_WHITESPACE_RE.sub(" ", text.strip())
+        if flags & _INLINE:
+            return f" {text} "
+        return f"\n\n{text}\n" if text else "\n"
+
+    def _convert_dd(self, element: HtmlElement, text: str, flags: int) -> str:
+        text = text.strip()
+        if flags & _INLINE:
+            return f" {text} "
+        if not text:
+            return "\n"
+        text = _indent(text, "    ")
+        return ":" + text[1:] + "\n"
+
+    def _convert_blockquote(self, element: HtmlElement, text: str, flags: int) -> str:
+        text = text.strip(" \t\r\n")
+        if flags & _INLINE:
+            return f" {text} "
+        if not text:
+            return "\n"
+        quoted = _LINE_WITH_CONTENT_RE.sub(
+            lambda m: "> " + m.group(1) if m.group(1) else ">", text
+        )
+        return "\n" + quoted + "\n\n"
+
+    def _convert_pre(self, element: HtmlElement, text: str, flags: int) -> str:
+        if not text:
+            return ""
+        return self._fence(text, "")
+
+    def _fence(self, code: str, language: str) -> str:
+        code = _PRE_RSTRIP_RE.sub("", _PRE_LSTRIP_RE.sub("", code))
+        return f"\n\n```{language}\n{code}\n```\n\n"
+
+    def _convert_list(self, element: HtmlElement, text: str, flags: int) -> str:
+        if flags & _LIST_ITEM:
+            return "\n" + text.rstrip()
+        before_paragraph = False
+        if element.tail and element.tail.strip():
+            before_paragraph = True
+        else:
+            following = next(
+                (
+                    sibling
+                    for sibling in element.itersiblings()
+                    if isinstance(sibling.tag, str)
+                    or (sibling.tail and sibling.tail.strip())
+                ),
+                None,
+            )
+            if following is not None:
+                before_paragraph = following.tag not in ("ul", "ol")
+        return "\n\n" + text + ("\n" if before_paragraph else "")
+
+    def _list_item(self, bullet: str, text: str) -> str:
+        width = len(bullet) + 1
+        text = _indent(text, " " * width)
+        return f"{bullet} {text[width:]}\n"
+
+    def _convert_li(self, element: HtmlElement, text: str, flags: int) -> str:
+        text = text.strip()
+        if not text:
+            return "\n"
+        parent = element.getparent()
+        if parent is not None and parent.tag == "ol":
+            start = parent.get("start", "")
+            number = int(start) if start.isnumeric() else 1
+            number += sum(1 for _ in element.itersiblings("li", preceding=True))
+            bullet = f"{number}."
+        else:
+            depth = sum(1 for _ in element.iterancestors("ul"))
+            bullet = _BULLETS[(depth - 1) % len(_BULLETS)]
+        return self._list_item(bullet, text)
+
+    def _convert_task(self, element: HtmlElement, text: str, flags: int) -> str:
+        text = text.strip()
+        status = next(element.iter("ac:task-status"), None)
+        done = status is not None and (status.text or "").strip() == "complete"
+        return self._list_item("*", f"[{'x' if done else ' '}] {text}".rstrip())
+
+    def _convert_img(self, element: HtmlElement, text: str, flags: int) -> str:
+        alt = element.get("alt") or ""
+        src = element.get("src") or ""
+        title = element.get("title") or ""
+        if flags & _INLINE:
+            return alt
+        title_part = ' "{}"'.format(title.replace('"', r"\"")) if title else ""
+        return f"![{alt}]({src}{title_part})"
+
+    def _convert_table(self, element: HtmlElement, text: str, flags: int) -> str:
+        return "\n\n" + text.strip() + "\n\n"
+
+    def _convert_caption(self, element: HtmlElement, text: str, flags: int) -> str:
+        return text.strip() + "\n\n"
+
+    def _convert_q(self, element: HtmlElement, text: str, flags: int) -> str:
+        return f'"{text}"'
+
+    def _convert_cell(self, element: HtmlElement, text: str, flags: int) -> str:
+        return " " + text.strip().replace("\n", " ") + " |" * _colspan(element)
+
+    def _convert_tr(self, element: HtmlElement, text: str, flags: int) -> str:
+        cells = list(element.iter("td", "th"))
+        parent = element.getparent()
+        parent_tag = parent.tag if parent is not None else None
+        is_first_row = element.getprevious() is None
+        is_head_row = all(cell.tag == "th" for cell in cells) or (
+            parent_tag == "thead" and sum(1 for _ in parent.iter("tr")) == 1
+        )
+        is_head_row_missing = is_first_row and (
+            parent_tag != "tbody"
+            or sum(1 for _ in parent.getparent().iter("thead")) < 1
+        )
+        columns = sum(_colspan(cell) for cell in cells)
+        overline = underline = ""
+        if is_head_row and is_first_row:
+            underline = "| " + " | ".join(["---"] * columns) + " |\n"
+        elif is_head_row_missing or (
+            is_first_row
+            and (
+                parent_tag == "table"
+                or (parent_tag == "tbody" and parent.getprevious() is None)
+            )
+        ):
+            overline = "| " + " | ".join([""] * columns) + " |\n"
+            overline += "| " + " | ".join(["---"] * columns) + " |\n"
+        return overline + "|" + text + "\n" + underline
+
+    # --- Confluence elements ------------------------------------------------
+
+    def _macro_parameter(self, element: HtmlElement, name: str) -> str:
+        return next(
+            (
+                (param.text or "").strip()
+                for param in element.iter("ac:parameter")
+                if param.get("ac:name") == name
+            ),
+            "",
+        )
+
+    def _convert_macro(self, element: HtmlElement, text: str, flags: int) -> str:
+        name = element.get("ac:name", "")
+        if name in _INLINE_MACROS:
+            value = self._macro_parameter(element, _INLINE_MACROS[name])
+            return self._convert_text(value, flags) if value else ""
+        if name in _CODE_MACROS:
+            body = next(element.iter("ac:plain-text-body"), None)
+            code = body.text if body is not None and body.text else ""
+            if not code.strip():
+                return ""
+            return self._fence(code, self._macro_parameter(element, "language"))
+
+        body = next(
+            (
+                child
+                for child in element
+                if child.tag in ("ac:rich-text-body", "ac:plain-text-body")
+            ),
+            None,
+        )
+        if body is None:
+            return ""
+        if body.tag == "ac:plain-text-body":
+            content = self._convert_text(body.text or "", flags).strip()
+        else:
+            content = self._convert_children(body, body.tag, flags).strip()
+        if name not in _PANEL_MACROS or flags & _INLINE:
+            return f"\n\n{content}\n\n" if content else ""
+        title = self._macro_parameter(element, "title")
+        if title:
+            content = f"**{_escape(title)}**\n\n{content}" if content else title
+        return self._convert_blockquote(element, content, flags)
+
+    def _convert_link(self, element: HtmlElement, text: str, flags: int) -> str:
+        text = text.strip()
+        if text:
+            return text
+        target = next(element.iter("ri:page", "ri:attachment", "ri:space"), None)
+        if target is None:
+            return ""
+        label = (
+            target.get("ri:content-title")
+            or target.get("ri:filename")
+            or target.get("ri:space-key")
+            or ""
+        )
+        return label if flags & _NOFORMAT else _escape(label)
+
+    def _convert_image(self, element: HtmlElement, text: str, flags: int) -> str:
+        source = next(element.iter("ri:attachment", "ri:url"), None)
+        if source is None:
+            return ""
+        src = source.get("ri:filename") or source.get("ri:value") or ""
+        alt = element.get("ac:alt") or element.get("ac:title") or ""
+        if flags & _INLINE:
+            return alt
+        return f"![{alt}]({src})"
+
+    def _convert_emoticon(self, element: HtmlElement, text: str, flags: int) -> str:
+        fallback = element.get("ac:emoji-fallback")
+        if fallback:
+            return fallback
+        name = element.get("ac:name")
+        return f":{name}:" if name else ""
+
+
+def _colspan(cell: HtmlElement) -> int:
+    """Return the number of columns a table cell spans."""
+    colspan = cell.get("colspan", "")
+    return max(1, min(1000, int(colspan))) if colspan.isdigit() else 1
+
+
+def _attached(element: HtmlElement, root: HtmlElement) -> bool:
+    """Check whether an element is still part of the document."""
+    for ancestor in element.iterancestors():
+        if ancestor is root:
+            return True
+    return False
+
+
+def _replace_with_text(element: HtmlElement, text: str) -> None:
+    """Replace an element with text, keeping the text that follows it."""
+    parent = element.getparent()
+    text += element.tail or ""
+    previous = element.getprevious()
+    if previous is not None:
+        previous.tail = (previous.tail or "") + text
+    else:
+        parent.text = (parent.text or "") + text
+    parent.remove(element)
+
+
+def storage_to_markdown(
+    content: str, display_names: dict[UserKey, str] | None = None
+) -> str:
+    """
+    Convert a storage format document to Markdown.
+
+    Args:
+        content: Storage format document
+        display_names: Resolved display names of the mentioned users
+
+    Returns:
+        Markdown text
+    """
+    if not content:
+        return ""
+    converter = StorageMarkdownConverter(display_names or {})
+    return converter.to_markdown(parse_storage(content))
@@ -7,8 +7,12 @@ from typing import Annotated
 from fastmcp import Context, FastMCP
 from pydantic import Field
 
+from mcp_atlassian.bitbucket.client import DEFAULT_PAGE_SIZE
+from mcp_atlassian.bitbucket.diff import DEFAULT_DIFF_MAX_BYTES
 from mcp_atlassian.servers.dependencies import get_bitbucket_fetcher
 from mcp_atlassian.utils.decorators import check_write_access
+from mcp_atlassian.utils.executor import run_blocking
+from mcp_atlassian.utils.paging import collect_results
 
 logger = logging.getLogger(__name__)
 
@@ -42,12 +46,10 @@ async def list_projects(
     """
     bitbucket = await get_bitbucket_fetcher(ctx)
     try:
-        projects = bitbucket.get_projects(limit=limit)
-        result = {
-            "success": True,
-            "count": len(projects),
-            "projects": [p.to_simplified_dict() for p in projects],
-        }
+        projects = await collect_results(
+            "bitbucket", bitbucket.iter_projects(max_items=limit), DEFAULT_PAGE_SIZE
+        )
+        result = {"success": True, "count": len(projects), "projects": projects}
     except Exception as e:
         logger.error(f"Error listing projects: {e}")
         result = {"success": False, "error": str(e)}
@@ -70,7 +72,7 @@ async def get_project(
     """
     bitbucket = await get_bitbucket_fetcher(ctx)
     try:
-        project = bitbucket.get_project(project_key)
+        project = await run_blocking("bitbucket", bitbucket.get_project, project_key)
         result = {"success": True, "project": project.to_simplified_dict()}
     except Exception as e:
         logger.error(f"Error getting project {project_key}: {e}")
@@ -87,6 +89,13 @@ async def get_project(
 async def list_repositories(
     ctx: Context,
     project_key: Annotated[str, Field(description="The project key (e.g., 'PROJ')")],
+    filter_text: Annotated[
+        str | None,
+        Field(
+            description="Optional text to filter repositories by name",
+            default=None,
+        ),
+    ] = None,
     limit: Annotated[
         int | None,
         Field(description="Maximum number of repositories to return", default=None),
@@ -97,6 +106,7 @@ async def list_repositories(
     Args:
         ctx: The FastMCP context.
         project_key: The project key.
+        filter_text: Optional text to filter repositories by name.
         limit: Maximum number of repositories to return.
 
     Returns:
@@ -104,12 +114,16 @@ async def list_repositories(
     """
     bitbucket = await get_bitbucket_fetcher(ctx)
     try:
-        repos = bitbucket.get_repositories(project_key, limit=limit)
+        repos = await collect_results(
+            "bitbucket",
+            bitbucket.iter_repositories(project_key, name=filter_text, max_items=limit),
+            DEFAULT_PAGE_SIZE,
+        )
         result = {
             "success": True,
             "project_key": project_key,
             "count": len(repos),
-            "repositories": [r.to_simplified_dict() for r in repos],
+            "repositories": repos,
         }
     except Exception as e:
         logger.error(f"Error listing repositories for {project_key}: {e}")
@@ -137,7 +151,9 @@ async def get_repository(
     """
     bitbucket = await get_bitbucket_fetcher(ctx)
     try:
-        repo = bitbucket.get_repository(project_key, repository_slug)
+        repo = await run_blocking(
+            "bitbucket", bitbucket.get_repository, project_key, repository_slug
+        )
         result = {"success": True, "repository": repo.to_simplified_dict()}
     except Exception as e:
         logger.error(f"Error getting repository {project_key}/{repository_slug}: {e}")
@@ -186,8 +202,13 @@ async def get_file_content(
     """
     bitbucket = await get_bitbucket_fetcher(ctx)
     try:
-        content = bitbucket.get_file_content(
-            project_key, repository_slug, file_path, at=at
+        content = await run_blocking(
+            "bitbucket",
+            bitbucket.get_file_content,
+            project_key,
+            repository_slug,
+            file_path,
+            at=at,
         )
         result = {
             "success": True,
@@ -237,15 +258,19 @@ async def list_branches(
     """
     bitbucket = await get_bitbucket_fetcher(ctx)
     try:
-        branches = bitbucket.get_branches(
-            project_key, repository_slug, filter_text=filter_text, limit=limit
+        branches = await collect_results(
+            "bitbucket",
+            bitbucket.iter_branches(
+                project_key, repository_slug, filter_text=filter_text, max_items=limit
+            ),
+            DEFAULT_PAGE_SIZE,
         )
         result = {
             "success": True,
             "project_key": project_key,
             "repository_slug": repository_slug,
             "count": len(branches),
-            "branches": [b.to_simplified_dict() for b in branches],
+            "branches": branches,
         }
     except Exception as e:
         logger.error(f"Error listing branches for {project_key}/{repository_slug}: {e}")
@@ -277,6 +302,15 @@ async def list_pull_requests(
             default="OPEN",
         ),
     ] = "OPEN",
+    filter_text: Annotated[
+        str | None,
+        Field(
+            description=(
+                "Optional text to filter pull requests by title or description"
+            ),
+            default=None,
+        ),
+    ] = None,
     limit: Annotated[
         int | None,
         Field(description="Maximum number of pull requests to return", default=None),
@@ -289,6 +323,7 @@ async def list_pull_requests(
         project_key: The project key.
         repository_slug: The repository slug.
         state: Filter by PR state.
+        filter_text: Optional text to filter PRs by title or description.
         limit: Maximum number of PRs to return.
 
     Returns:
@@ -296,8 +331,16 @@ async def list_pull_requests(
     """
     bitbucket = await get_bitbucket_fetcher(ctx)
     try:
-        prs = bitbucket.get_pull_requests(
-            project_key, repository_slug, state=state, limit=limit
+        prs = await collect_results(
+            "bitbucket",
+            bitbucket.iter_pull_requests(
+                project_key,
+                repository_slug,
+                state=state,
+                filter_text=filter_text,
+                max_items=limit,
+            ),
+            DEFAULT_PAGE_SIZE,
         )
         result = {
             "success": True,
@@ -305,7 +348,7 @@ async def list_pull_requests(
             "repository_slug": repository_slug,
             "state": state,
             "count": len(prs),
-            "pull_requests": [pr.to_simplified_dict() for pr in prs],
+            "pull_requests": prs,
         }
     except Exception as e:
         logger.error(
@@ -342,7 +385,13 @@ async def get_pull_request(
     """
     bitbucket = await get_bitbucket_fetcher(ctx)
     try:
-        pr = bitbucket.get_pull_request(project_key, repository_slug, pull_request_id)
+        pr = await run_blocking(
+            "bitbucket",
+            bitbucket.get_pull_request,
+            project_key,
+            repository_slug,
+            pull_request_id,
+        )
         result = {"success": True, "pull_request": pr.to_simplified_dict()}
     except Exception as e:
         repo = f"{project_key}/{repository_slug}"
@@ -363,30 +412,96 @@ async def get_pull_request_diff(
         str, Field(description="The repository slug (e.g., 'my-repo')")
     ],
     pull_request_id: Annotated[int, Field(description="The pull request ID")],
+    paths: Annotated[
+        str | None,
+        Field(
+            description=(
+                "Optional comma-separated file paths to include. Directories "
+                "(ending in '/') and glob patterns (e.g., 'src/*.py') are supported."
+            ),
+            default=None,
+        ),
+    ] = None,
+    context_lines: Annotated[
+        int | None,
+        Field(
+            description=(
+                "Number of context lines around each change (server default if not set)"
+            ),
+            default=None,
+            ge=0,
+        ),
+    ] = None,
+    ignore_whitespace: Annotated[
+        bool,
+        Field(description="Whether to ignore whitespace changes", default=False),
+    ] = False,
+    max_bytes: Annotated[
+        int,
+        Field(
+            description=(
+                "Maximum size of the returned diff in bytes. The diff is cut "
+                "at a line boundary and ends with a truncation marker."
+            ),
+            default=DEFAULT_DIFF_MAX_BYTES,
+            ge=1024,
+        ),
+    ] = DEFAULT_DIFF_MAX_BYTES,
+    max_hunks: Annotated[
+        int | None,
+        Field(
+            description="Optional maximum number of hunks to return",
+            default=None,
+            ge=1,
+        ),
+    ] = None,
 ) -> str:
-    """Get the diff/changes for a pull request.
+    """Get the unified diff of a pull request.
+
+    Large diffs are cut to the byte or hunk budget; select files with
+    `paths` to review a pull request piece by piece. The list of all
+    changed files is always included.
 
     Args:
         ctx: The FastMCP context.
         project_key: The project key.
         repository_slug: The repository slug.
         pull_request_id: The PR ID.
+        paths: Optional comma-separated files, directories or glob patterns.
+        context_lines: Number of context lines around each change.
+        ignore_whitespace: Whether to ignore whitespace changes.
+        max_bytes: Maximum size of the returned diff in bytes.
+        max_hunks: Optional maximum number of hunks to return.
 
     Returns:
-        JSON string with the diff summary and changed files.
+        JSON string with the diff, the files it covers and the changed files.
     """
     bitbucket = await get_bitbucket_fetcher(ctx)
+    selected = [p.strip() for p in paths.split(",") if p.strip()] if paths else None
     try:
-        diff = bitbucket.get_pull_request_diff(
-            project_key, repository_slug, pull_request_id
+        diff = await run_blocking(
+            "bitbucket",
+            bitbucket.get_pull_request_diff,
+            project_key,
+            repository_slug,
+            pull_request_id,
+            paths=selected,
+            context_lines=context_lines,
+            ignore_whitespace=ignore_whitespace,
+            max_bytes=max_bytes,
+            max_hunks=max_hunks,
         )
-        changes = bitbucket.get_pull_request_changes(
-            project_key, repository_slug, pull_request_id
+        changes = await run_blocking(
+            "bitbucket",
+            bitbucket.get_pull_request_changes,
+            project_key,
+            repository_slug,
+            pull_request_id,
         )
         result = {
             "success": True,
             "pull_request_id": pull_request_id,
-            "diff_summary": diff,
+            **diff,
             "changes": changes,
         }
     except Exception as e:
@@ -427,14 +542,18 @@ async def get_pull_request_comments(
     """
     bitbucket = await get_bitbucket_fetcher(ctx)
     try:
-        comments = bitbucket.get_pull_request_comments(
-            project_key, repository_slug, pull_request_id, limit=limit
+        comments = await collect_results(
+            "bitbucket",
+            bitbucket.iter_pull_request_comments(
+                project_key, repository_slug, pull_request_id, max_items=limit
+            ),
+            DEFAULT_PAGE_SIZE,
         )
         result = {
             "success": True,
             "pull_request_id": pull_request_id,
             "count": len(comments),
-            "comments": [c.to_simplified_dict() for c in comments],
+            "comments": comments,
         }
     except Exception as e:
         repo = f"{project_key}/{repository_slug}"
@@ -480,8 +599,14 @@ async def add_pull_request_comment(
     """
     bitbucket = await get_bitbucket_fetcher(ctx)
     try:
-        comment = bitbucket.add_pull_request_comment(
-            project_key, repository_slug, pull_request_id, text, parent_id=parent_id
+        comment = await run_blocking(
+            "bitbucket",
+            bitbucket.add_pull_request_comment,
+            project_key,
+            repository_slug,
+            pull_request_id,
+            text,
+            parent_id=parent_id,
         )
         result = {"success": True, "comment": comment.to_simplified_dict()}
     except Exception as e:
@@ -557,7 +682,9 @@ async def create_repository(
     """
     bitbucket = await get_bitbucket_fetcher(ctx)
     try:
-        repo = bitbucket.create_repository(
+        repo = await run_blocking(
+            "bitbucket",
+            bitbucket.create_repository,
             project_key,
             repository_slug,
             description=description,
@@ -574,3 +701,48 @@ async def create_repository(
             "repository_slug": repository_slug,
         }
     return json.dumps(result, indent=2, ensure_ascii=False)
+
+
+# ============================================================================
+# Jira Key Index Tools
+# ============================================================================
+
+
+@bitbucket_mcp.tool(tags={"bitbucket", "read"})
+async def reindex_jira_keys(
+    ctx: Context,
+    project_key: Annotated[str, Field(description="The project key (e.g., 'PROJ')")],
+    full: Annotated[
+        bool,
+        Field(
+            description=(
+                "Re-index all pull requests instead of only those updated since "
+                "the last refresh"
+            ),
+            default=False,
+        ),
+    ] = False,
+) -> str:
+    """Refresh the local index of Jira keys referenced by a project's pull requests.
+
+    The index lets composite tools find the pull requests, branches and
+    commits of a Jira issue without scanning every repository. It is
+    refreshed in the background; use this tool to pick up changes at once
+    or to rebuild it.
+
+    Args:
+        ctx: The FastMCP context.
+        project_key: The project key.
+        full: Whether to re-index all pull requests.
+
+    Returns:
+        JSON string with the refresh statistics of each repository.
+    """
+    bitbucket = await get_bitbucket_fetcher(ctx)
+    try:
+        stats = await bitbucket.refresh_key_index_async(project_key, full=full)
+        result = {"success": True, **stats}
+    except Exception as e:
+        logger.error(f"Error re-indexing Jira keys of project {project_key}: {e}")
+        result = {"success": False, "error": str(e), "project_key": project_key}
+    return json.dumps(result, indent=2, ensure_ascii=False)
@@ -2,12 +2,16 @@
 
 import json
 import logging
+from functools import partial
 from typing import Annotated, Any
 
 from fastmcp import Context, FastMCP
 from pydantic import Field
 
+from mcp_atlassian.bitbucket.key_index import get_key_index_config
 from mcp_atlassian.servers.dependencies import get_bitbucket_fetcher, get_jira_fetcher
+from mcp_atlassian.utils.executor import run_blocking, run_blocking_cancellable
+from mcp_atlassian.utils.fan_out import BranchResult, fan_out
 from mcp_atlassian.utils.jira_keys import (
     extract_jira_keys,
     parse_development_identifier,
@@ -20,6 +24,119 @@ composite_mcp = FastMCP(
     instructions="Provides composite tools that combine data from multiple Atlassian services (Jira, Bitbucket).",
 )
 
+# Fields of linked Jira issues resolved for a pull request
+LINKED_ISSUE_FIELDS = [
+    "summary",
+    "status",
+    "issuetype",
+    "priority",
+    "assignee",
+    "reporter",
+]
+
+
+def _record_incomplete(
+    result: dict[str, Any], branches: list[BranchResult[Any]]
+) -> None:
+    """Mark a tool result as partial for each failed or timed out branch."""
+    incomplete = [branch.to_dict() for branch in branches if not branch.ok]
+    if incomplete:
+        result.setdefault("incomplete", []).extend(incomplete)
+
+
+async def _find_linked_prs(
+    bitbucket: Any, project_key: str, repo_slug: str, issue_key: str
+) -> list[dict[str, Any]]:
+    """Find the pull requests of a repository that mention a Jira issue.
+
+    Args:
+        bitbucket: The Bitbucket fetcher
+        project_key: Bitbucket project key
+        repo_slug: Repository slug
+        issue_key: Jira issue key to look for
+
+    Returns:
+        The matching pull requests, summarized.
+    """
+    prs = await run_blocking_cancellable(
+        "bitbucket",
+        bitbucket.get_pull_requests,
+        project_key,
+        repo_slug,
+        state="ALL",
+        limit=50,
+    )
+
+    linked = []
+    for pr in prs:
+        pr_dict = pr.to_simplified_dict()
+        title = pr_dict.get("title", "")
+        description = pr_dict.get("description", "")
+        source_branch = pr_dict.get("source_branch", "")
+
+        # Check if this PR mentions the issue
+        extracted_keys = extract_jira_keys(
+            title=title,
+            description=description,
+            branch_name=source_branch,
+        )
+
+        if any(m.key == issue_key.upper() for m in extracted_keys):
+            linked.append(
+                {
+                    "project_key": project_key,
+                    "repository_slug": repo_slug,
+                    "id": pr_dict.get("id"),
+                    "title": title,
+                    "state": pr_dict.get("state"),
+                    "author": pr_dict.get("author"),
+                    "source_branch": source_branch,
+                    "target_branch": pr_dict.get("target_branch"),
+                    "url": pr_dict.get("url"),
+                }
+            )
+    return linked
+
+
+async def _find_indexed_prs(
+    bitbucket: Any,
+    result: dict[str, Any],
+    issue_key: str,
+    project_key: str | None,
+    max_age: float,
+) -> list[dict[str, Any]]:
+    """Find the pull requests that mention a Jira issue in the Jira key index.
+
+    If a project is given, its repositories whose index is older than
+    ``max_age`` are refreshed first. The indexed branches and commits that
+    mention the issue are added to the result.
+
+    Args:
+        bitbucket: The Bitbucket fetcher
+        result: Tool result to record the branches, commits and any
+            incomplete refresh in
+        issue_key: Jira issue key to look for
+        project_key: Bitbucket project to refresh and restrict the lookup
+            to, or None to look in all indexed projects
+        max_age: Age in seconds after which a repository is refreshed
+
+    Returns:
+        The matching pull requests, summarized.
+    """
+    if project_key:
+        refresh = await bitbucket.refresh_key_index_async(project_key, max_age=max_age)
+        if refresh["incomplete"]:
+            result.setdefault("incomplete", []).extend(refresh["incomplete"])
+
+    references = await run_blocking(
+        "bitbucket", bitbucket.find_jira_key_references, issue_key, project_key
+    )
+    result["bitbucket_index"] = {
+        "branches": references["branches"],
+        "commits": references["commits"],
+    }
+    return references["pull_requests"]
+
 
 @composite_mcp.tool(tags={"composite", "jira", "bitbucket", "read"})
 async def get_issue_with_development_context(
@@ -77,24 +194,40 @@ async def get_issue_with_development_context(
         result["errors"].append(f"Jira not available: {str(e)}")
         return json.dumps(result, indent=2, ensure_ascii=False)
 
-    # Fetch the Jira issue
-    try:
-        issue = jira.get_issue(
-            issue_key=issue_key,
-            fields=None,  # Get all fields
-            expand="names,renderedFields",
-        )
-        result["issue"] = issue.to_simplified_dict()
-    except Exception as e:
-        logger.error(f"Failed to fetch Jira issue {issue_key}: {e}")
-        result["errors"].append(f"Failed to fetch issue: {str(e)}")
+    # Fetch the Jira issue and its development info concurrently
+    issue_branch, dev_info_branch = await fan_out(
+        [
+            (
+                "issue",
+                partial(
+                    run_blocking_cancellable,
+                    "jira",
+                    jira.get_issue,
+                    issue_key=issue_key,
+                    fields=None,  # Get all fields
+                    expand="names,renderedFields",
+                ),
+            ),
+            (
+                "development_info",
+                partial(
+                    run_blocking_cancellable,
+                    "jira",
+                    jira.get_development_information,
+                    issue_key=issue_key,
+                ),
+            ),
+        ]
+    )
+    if not issue_branch.ok:
+        logger.error(f"Failed to fetch Jira issue {issue_key}: {issue_branch.error}")
+        result["errors"].append(f"Failed to fetch issue: {issue_branch.error}")
         return json.dumps(result, indent=2, ensure_ascii=False)
+    result["issue"] = issue_branch.value.to_simplified_dict()
 
-    # Try to get development info from Jira
     dev_info_available = False
-    try:
-        dev_info = jira.get_development_information(issue_key=issue_key)
-        dev_info_dict = dev_info.to_dict()
+    if dev_info_branch.ok:
+        dev_info_dict = dev_info_branch.value.to_dict()
         result["development_info"] = dev_info_dict
 
         # Check if we have actual development data
@@ -104,73 +237,82 @@ async def get_issue_with_development_context(
             # Extract PR info from development data
             if dev_info_dict.get("pull_requests"):
                 result["pull_requests"] = dev_info_dict["pull_requests"]
+    else:
+        logger.warning(
+            f"Failed to get development info for {issue_key}: {dev_info_branch.error}"
+        )
+        result["errors"].append(
+            f"Development info unavailable: {dev_info_branch.error}"
+        )
 
-    except Exception as e:
-        logger.warning(f"Failed to get development info for {issue_key}: {e}")
-        result["errors"].append(f"Development info unavailable: {str(e)}")
-
-    # If no development info from Jira and Bitbucket project provided, try Bitbucket search
-    if not dev_info_available and bitbucket_project_key and include_pr_details:
+    # If no development info from Jira, look for PRs in Bitbucket: in the Jira
+    # key index when it is enabled, otherwise by scanning the given project
+    index_config = get_key_index_config()
+    if (
+        not dev_info_available
+        and include_pr_details
+        and (bitbucket_project_key or index_config.enabled)
+    ):
         try:
             bitbucket = await get_bitbucket_fetcher(ctx)
-            # Search for PRs mentioning this issue key
-            repos = bitbucket.get_repositories(bitbucket_project_key)
-
-            for repo in repos:
-                repo_slug = repo.slug
-                try:
-                    # Get open PRs and check for issue key in title/description
-                    prs = bitbucket.get_pull_requests(
-                        bitbucket_project_key,
-                        repo_slug,
-                        state="ALL",
-                        limit=50,
-                    )
+            if index_config.enabled:
+                linked_prs = await _find_indexed_prs(
+                    bitbucket,
+                    result,
+                    issue_key,
+                    bitbucket_project_key,
+                    index_config.refresh_interval,
+                )
+            else:
+                # Search for PRs mentioning this issue key
+                repos = await run_blocking(
+                    "bitbucket", bitbucket.get_repositories, bitbucket_project_key
+                )
 
-                    for pr in prs:
-                        pr_dict = pr.to_simplified_dict()
-                        title = pr_dict.get("title", "")
-                        description = pr_dict.get("description", "")
-                        source_branch = pr_dict.get("source_branch", "")
-
-                        # Check if this PR mentions the issue
-                        extracted_keys = extract_jira_keys(
-                            title=title,
-                            description=description,
-                            branch_name=source_branch,
+                # Scan the repositories concurrently
+                scans = await fan_out(
+                    [
+                        (
+                            f"{bitbucket_project_key}/{repo.slug}",
+                            partial(
+                                _find_linked_prs,
+                                bitbucket,
+                                bitbucket_project_key,
+                                repo.slug,
+                                issue_key,
+                            ),
+                        )
+                        for repo in repos
+                    ]
+                )
+                _record_incomplete(result, scans)
+                linked_prs = [pr for scan in scans if scan.ok for pr in scan.value]
+
+            # Optionally include diff summaries, also fetched concurrently
+            if include_pr_diff_summary and linked_prs:
+                diffs = await fan_out(
+                    [
+                        (
+                            f"{pr['repository_slug']}#{pr['id']}",
+                            partial(
+                                run_blocking_cancellable,
+                                "bitbucket",
+                                bitbucket.get_pull_request_changes,
+                                pr["project_key"],
+                                pr["repository_slug"],
+                                pr["id"],
+                            ),
                         )
+                        for pr in linked_prs
+                    ]
+                )
+                for pr_info, diff in zip(linked_prs, diffs, strict=True):
+                    if diff.ok:
+                        pr_info["changes_summary"] = diff.value
+                    else:
+                        pr_info["changes_error"] = diff.error
 
-                        if any(m.key == issue_key.upper() for m in extracted_keys):
-                            pr_info = {
-                                "project_key": bitbucket_project_key,
-                                "repository_slug": repo_slug,
-                                "id": pr_dict.get("id"),
-                                "title": title,
-                                "state": pr_dict.get("state"),
-                                "author": pr_dict.get("author"),
-                                "source_branch": source_branch,
-                                "target_branch": pr_dict.get("target_branch"),
-                                "url": pr_dict.get("url"),
-                            }
-
-                            # Optionally include diff summary
-                            if include_pr_diff_summary:
-                                try:
-                                    changes = bitbucket.get_pull_request_changes(
-                                        bitbucket_project_key,
-                                        repo_slug,
-                                        pr_dict.get("id"),
-                                    )
-                                    pr_info["changes_summary"] = changes
-                                except Exception as diff_err:
-                                    pr_info["changes_error"] = str(diff_err)
-
-                            result["pull_requests"].append(pr_info)
-
-                except Exception as repo_err:
-                    logger.debug(
-                        f"Failed to search PRs in {bitbucket_project_key}/{repo_slug}: {repo_err}"
-                    )
+            result["pull_requests"].extend(linked_prs)
 
         except ValueError as e:
             result["errors"].append(f"Bitbucket search failed: {str(e)}")
@@ -184,6 +326,7 @@ async def get_issue_with_development_context(
         "has_development_info": dev_info_available,
         "pr_count": len(result["pull_requests"]),
         "error_count": len(result["errors"]),
+        "partial": bool(result.get("incomplete")),
     }
 
     return json.dumps(result, indent=2, ensure_ascii=False)
@@ -235,7 +378,13 @@ async def get_pr_with_jira_context(
 
     # Fetch the PR
     try:
-        pr = bitbucket.get_pull_request(project_key, repository_slug, pull_request_id)
+        pr = await run_blocking(
+            "bitbucket",
+            bitbucket.get_pull_request,
+            project_key,
+            repository_slug,
+            pull_request_id,
+        )
         pr_dict = pr.to_simplified_dict()
         result["pull_request"] = pr_dict
     except Exception as e:
@@ -266,38 +415,39 @@ async def get_pr_with_jira_context(
         try:
             jira = await get_jira_fetcher(ctx)
 
-            for match in jira_matches:
-                try:
-                    issue = jira.get_issue(
-                        issue_key=match.key,
-                        fields=[
-                            "summary",
-                            "status",
-                            "issuetype",
-                            "priority",
-                            "assignee",
-                            "reporter",
-                        ],
-                    )
-                    issue_dict = issue.to_simplified_dict()
-                    result["linked_jira_issues"].append(
-                        {
-                            "key": match.key,
-                            "source": match.source,
-                            "confidence": match.confidence,
-                            "issue": issue_dict,
-                        }
+            # Resolve the linked issues concurrently
+            lookups = await fan_out(
+                [
+                    (
+                        match.key,
+                        partial(
+                            run_blocking_cancellable,
+                            "jira",
+                            jira.get_issue,
+                            issue_key=match.key,
+                            fields=LINKED_ISSUE_FIELDS,
+                        ),
                     )
-                except Exception as issue_err:
-                    logger.warning(f"Failed to fetch Jira issue {match.key}: {issue_err}")
-                    result["linked_jira_issues"].append(
-                        {
-                            "key": match.key,
-                            "source": match.source,
-                            "confidence": match.confidence,
-                            "error": str(issue_err),
-                        }
+                    for match in jira_matches
+                ]
+            )
+            for match, lookup in zip(jira_matches, lookups, strict=True):
+                linked: dict[str, Any] = {
+                    "key": match.key,
+                    "source": match.source,
+                    "confidence": match.confidence,
+                }
+                if lookup.ok:
+                    linked["issue"] = lookup.value.to_simplified_dict()
+                else:
+                    logger.warning(
+                        f"Failed to fetch Jira issue {match.key}: {lookup.error}"
                     )
+                    linked["error"] = lookup.error
+                    if lookup.timed_out:
+                        linked["timed_out"] = True
+                result["linked_jira_issues"].append(linked)
+            _record_incomplete(result, lookups)
 
         except ValueError as e:
             result["errors"].append(f"Jira not available: {str(e)}")
@@ -310,6 +460,7 @@ async def get_pr_with_jira_context(
             [i for i in result["linked_jira_issues"] if "issue" in i]
         ),
         "error_count": len(result["errors"]),
+        "partial": bool(result.get("incomplete")),
     }
 
     return json.dumps(result, indent=2, ensure_ascii=False)
@@ -337,7 +488,9 @@ async def resolve_development_links(
     """Resolve development links from any identifier.
 
     Accepts either Jira issue keys or Bitbucket PR references and resolves
-    all linked development information.
+    all linked development information. When the Jira key index is enabled,
+    the pull requests of Jira issues without development information are
+    looked up in the index.
 
     Args:
         ctx: The FastMCP context.
@@ -389,29 +542,42 @@ async def resolve_development_links(
             if resolve_depth > 1:
                 pr_data = result["data"]
                 linked_issues = pr_data.get("linked_jira_issues", [])
-                enhanced_issues = []
-
-                for linked in linked_issues:
-                    if "issue" in linked and "error" not in linked:
-                        try:
-                            issue_dev_result = await get_issue_with_development_context(
+                resolvable = [
+                    linked
+                    for linked in linked_issues
+                    if "issue" in linked and "error" not in linked
+                ]
+
+                # Resolve the development context of each issue concurrently
+                contexts = await fan_out(
+                    [
+                        (
+                            linked["key"],
+                            partial(
+                                get_issue_with_development_context,
                                 ctx=ctx,
                                 issue_key=linked["key"],
                                 include_pr_details=True,
                                 include_pr_diff_summary=False,
-                            )
-                            linked["development_context"] = json.loads(issue_dev_result)
-                        except Exception as e:
-                            linked["development_context_error"] = str(e)
-                    enhanced_issues.append(linked)
-
-                result["data"]["linked_jira_issues"] = enhanced_issues
+                            ),
+                        )
+                        for linked in resolvable
+                    ]
+                )
+                for linked, context in zip(resolvable, contexts, strict=True):
+                    if context.ok:
+                        linked["development_context"] = json.loads(context.value)
+                    else:
+                        linked["development_context_error"] = context.error
+                _record_incomplete(result, contexts)
 
         else:
             # Just a repo reference, list open PRs
             try:
                 bitbucket = await get_bitbucket_fetcher(ctx)
-                prs = bitbucket.get_pull_requests(
+                prs = await run_blocking(
+                    "bitbucket",
+                    bitbucket.get_pull_requests,
                     parsed.project_key,
                     parsed.repo_slug,
                     state="OPEN",
@@ -2,16 +2,20 @@
 
 import json
 import logging
-from typing import Annotated
+from collections.abc import Callable
+from typing import Annotated, Any
 
 from fastmcp import Context, FastMCP
 from pydantic import BeforeValidator, Field
 
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
+from mcp_atlassian.models.confluence import ConfluencePage
 from mcp_atlassian.servers.dependencies import get_confluence_fetcher
 from mcp_atlassian.utils.decorators import (
     check_write_access,
 )
+from mcp_atlassian.utils.executor import run_blocking
+from mcp_atlassian.utils.paging import stream_results
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +25,24 @@ confluence_mcp = FastMCP(
 )
 
 
+def _simplified_pages(
+    fetch: Callable[..., list[ConfluencePage]], *args: Any, **kwargs: Any
+) -> list[dict[str, Any]]:
+    """Fetch pages and serialize them in the same worker thread.
+
+    Page content is converted when it is first read, so serializing here
+    keeps the conversion off the event loop.
+    """
+    return [page.to_simplified_dict() for page in fetch(*args, **kwargs)]
+
+
+def _is_simple_query(query: str) -> bool:
+    """Check whether a search query is simple text rather than CQL."""
+    return bool(query) and not any(
+        x in query for x in ["=", "~", ">", "<", " AND ", " OR ", "currentUser()"]
+    )
+
+
 @confluence_mcp.tool(tags={"confluence", "read"})
 async def search(
     ctx: Context,
@@ -69,6 +91,16 @@ async def search(
             default=None,
         ),
     ] = None,
+    include_content: Annotated[
+        bool,
+        Field(
+            description=(
+                "Whether to include the matching excerpt of each result. "
+                "Set to false to list titles and IDs only."
+            ),
+            default=True,
+        ),
+    ] = True,
 ) -> str:
     """Search Confluence content using simple terms or CQL.
 
@@ -77,39 +109,152 @@ async def search(
         query: Search query - can be simple text or a CQL query string.
         limit: Maximum number of results (1-50).
         spaces_filter: Comma-separated list of space keys to filter by.
+        include_content: Whether to include result excerpts.
 
     Returns:
         JSON string representing a list of simplified Confluence page objects.
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
     # Check if the query is a simple search term or already a CQL query
-    if query and not any(
-        x in query for x in ["=", "~", ">", "<", " AND ", " OR ", "currentUser()"]
-    ):
+    if _is_simple_query(query):
         original_query = query
         try:
             query = f'siteSearch ~ "{original_query}"'
             logger.info(
                 f"Converting simple search term to CQL using siteSearch: {query}"
             )
-            pages = confluence_fetcher.search(
-                query, limit=limit, spaces_filter=spaces_filter
+            search_results = await run_blocking(
+                "confluence",
+                _simplified_pages,
+                confluence_fetcher.search,
+                query,
+                limit=limit,
+                spaces_filter=spaces_filter,
+                include_content=include_content,
             )
         except Exception as e:
             logger.warning(f"siteSearch failed ('{e}'), falling back to text search.")
             query = f'text ~ "{original_query}"'
             logger.info(f"Falling back to text search with CQL: {query}")
-            pages = confluence_fetcher.search(
-                query, limit=limit, spaces_filter=spaces_filter
+            search_results = await run_blocking(
+                "confluence",
+                _simplified_pages,
+                confluence_fetcher.search,
+                query,
+                limit=limit,
+                spaces_filter=spaces_filter,
+                include_content=include_content,
             )
     else:
-        pages = confluence_fetcher.search(
-            query, limit=limit, spaces_filter=spaces_filter
+        search_results = await run_blocking(
+            "confluence",
+            _simplified_pages,
+            confluence_fetcher.search,
+            query,
+            limit=limit,
+            spaces_filter=spaces_filter,
+            include_content=include_content,
         )
-    search_results = [page.to_simplified_dict() for page in pages]
     return json.dumps(search_results, indent=2, ensure_ascii=False)
 
 
+@confluence_mcp.tool(tags={"confluence", "read"})
+async def search_all(
+    ctx: Context,
+    query: Annotated[
+        str,
+        Field(
+            description=(
+                "Search query - either simple text (e.g. 'project documentation'), "
+                "searched with 'siteSearch' and a fallback to 'text', or a CQL query "
+                "string (e.g. 'type=page AND space=DEV'). See confluence_search "
+                "for more CQL examples."
+            )
+        ),
+    ],
+    max_items: Annotated[
+        int,
+        Field(
+            description="Maximum number of results to return across all pages (1-1000)",
+            default=200,
+            ge=1,
+            le=1000,
+        ),
+    ] = 200,
+    page_size: Annotated[
+        int,
+        Field(
+            description="Number of results to request per page (1-100)",
+            default=25,
+            ge=1,
+            le=100,
+        ),
+    ] = 25,
+    spaces_filter: Annotated[
+        str | None,
+        Field(
+            description=(
+                "(Optional) Comma-separated list of space keys to filter results by. "
+                "Overrides the environment variable CONFLUENCE_SPACES_FILTER if provided. "
+                "Use empty string to disable filtering."
+            ),
+            default=None,
+        ),
+    ] = None,
+    include_content: Annotated[
+        bool,
+        Field(
+            description=(
+                "Whether to include the matching excerpt of each result. "
+                "Set to false to list titles and IDs only."
+            ),
+            default=True,
+        ),
+    ] = True,
+) -> str:
+    """Search Confluence content, following pagination across all result pages.
+
+    When the client requests progress notifications, each page is streamed as a
+    notification whose message is a JSON list of results, and the result only
+    summarizes what was sent. Otherwise all results are returned in the result.
+
+    Args:
+        ctx: The FastMCP context.
+        query: Search query - can be simple text or a CQL query string.
+        max_items: Maximum number of results to return.
+        page_size: Number of results to request per page.
+        spaces_filter: Comma-separated list of space keys to filter by.
+        include_content: Whether to include result excerpts.
+
+    Returns:
+        JSON string with the result count, whether the results were streamed and
+        whether max_items was reached, plus the results if they were not streamed.
+    """
+    confluence_fetcher = await get_confluence_fetcher(ctx)
+
+    async def _stream(cql: str) -> str:
+        pages = confluence_fetcher.iter_search(
+            cql,
+            spaces_filter=spaces_filter,
+            include_content=include_content,
+            page_size=page_size,
+            max_items=max_items,
+        )
+        result = await stream_results(ctx, "confluence", pages, page_size, max_items)
+        return json.dumps(result, indent=2, ensure_ascii=False)
+
+    if _is_simple_query(query):
+        try:
+            return await _stream(f'siteSearch ~ "{query}"')
+        except Exception as e:
+            # An unsupported siteSearch fails on the first page, before
+            # anything was streamed
+            logger.warning(f"siteSearch failed ('{e}'), falling back to text search.")
+            query = f'text ~ "{query}"'
+            logger.info(f"Falling back to text search with CQL: {query}")
+    return await _stream(query)
+
+
 @confluence_mcp.tool(tags={"confluence", "read"})
 async def get_page(
     ctx: Context,
@@ -184,8 +329,11 @@ async def get_page(
                 "page_id was provided; title and space_key parameters will be ignored."
             )
         try:
-            page_object = confluence_fetcher.get_page_content(
-                page_id, convert_to_markdown=convert_to_markdown
+            page_object = await run_blocking(
+                "confluence",
+                confluence_fetcher.get_page_content,
+                page_id,
+                convert_to_markdown=convert_to_markdown,
             )
         except Exception as e:
             logger.error(f"Error fetching page by ID '{page_id}': {e}")
@@ -195,8 +343,12 @@ async def get_page(
                 ensure_ascii=False,
             )
     elif title and space_key:
-        page_object = confluence_fetcher.get_page_by_title(
-            space_key, title, convert_to_markdown=convert_to_markdown
+        page_object = await run_blocking(
+            "confluence",
+            confluence_fetcher.get_page_by_title,
+            space_key,
+            title,
+            convert_to_markdown=convert_to_markdown,
         )
         if not page_object:
             return json.dumps(
@@ -289,14 +441,17 @@ async def get_page_children(
         expand = f"{expand},body.storage" if expand else "body.storage"
 
     try:
-        pages = confluence_fetcher.get_page_children(
+        child_pages = await run_blocking(
+            "confluence",
+            _simplified_pages,
+            confluence_fetcher.get_page_children,
             page_id=parent_id,
             start=start,
             limit=limit,
             expand=expand,
             convert_to_markdown=convert_to_markdown,
+            include_content=include_content,
         )
-        child_pages = [page.to_simplified_dict() for page in pages]
         result = {
             "parent_id": parent_id,
             "count": len(child_pages),
@@ -338,7 +493,9 @@ async def get_comments(
         JSON string representing a list of comment objects.
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
-    comments = confluence_fetcher.get_page_comments(page_id)
+    comments = await run_blocking(
+        "confluence", confluence_fetcher.get_page_comments, page_id
+    )
     formatted_comments = [comment.to_simplified_dict() for comment in comments]
     return json.dumps(formatted_comments, indent=2, ensure_ascii=False)
 
@@ -367,7 +524,9 @@ async def get_labels(
         JSON string representing a list of label objects.
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
-    labels = confluence_fetcher.get_page_labels(page_id)
+    labels = await run_blocking(
+        "confluence", confluence_fetcher.get_page_labels, page_id
+    )
     formatted_labels = [label.to_simplified_dict() for label in labels]
     return json.dumps(formatted_labels, indent=2, ensure_ascii=False)
 
@@ -393,7 +552,9 @@ async def add_label(
         ValueError: If in read-only mode or Confluence client is unavailable.
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
-    labels = confluence_fetcher.add_page_label(page_id, name)
+    labels = await run_blocking(
+        "confluence", confluence_fetcher.add_page_label, page_id, name
+    )
     formatted_labels = [label.to_simplified_dict() for label in labels]
     return json.dumps(formatted_labels, indent=2, ensure_ascii=False)
 
@@ -471,7 +632,9 @@ async def create_page(
         is_markdown = False
         content_representation = content_format  # Pass 'wiki' or 'storage' directly
 
-    page = confluence_fetcher.create_page(
+    page = await run_blocking(
+        "confluence",
+        confluence_fetcher.create_page,
         space_key=space_key,
         title=title,
         body=content,
@@ -563,7 +726,9 @@ async def update_page(
         is_markdown = False
         content_representation = content_format  # Pass 'wiki' or 'storage' directly
 
-    updated_page = confluence_fetcher.update_page(
+    updated_page = await run_blocking(
+        "confluence",
+        confluence_fetcher.update_page,
         page_id=page_id,
         title=title,
         body=content,
@@ -604,7 +769,9 @@ async def delete_page(
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
     try:
-        result = confluence_fetcher.delete_page(page_id=page_id)
+        result = await run_blocking(
+            "confluence", confluence_fetcher.delete_page, page_id=page_id
+        )
         if result:
             response = {
                 "success": True,
@@ -652,7 +819,12 @@ async def add_comment(
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
     try:
-        comment = confluence_fetcher.add_comment(page_id=page_id, content=content)
+        comment = await run_blocking(
+            "confluence",
+            confluence_fetcher.add_comment,
+            page_id=page_id,
+            content=content,
+        )
         if comment:
             comment_data = comment.to_simplified_dict()
             response = {
@@ -722,7 +894,9 @@ async def search_user(
         logger.info(f"Converting simple search term to user CQL: {query}")
 
     try:
-        user_results = confluence_fetcher.search_user(query, limit=limit)
+        user_results = await run_blocking(
+            "confluence", confluence_fetcher.search_user, query, limit=limit
+        )
         search_results = [user.to_simplified_dict() for user in user_results]
         return json.dumps(search_results, indent=2, ensure_ascii=False)
     except MCPAtlassianAuthenticationError as e:
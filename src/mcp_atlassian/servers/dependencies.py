@@ -1,14 +1,19 @@
 """Dependency providers for JiraFetcher and ConfluenceFetcher with context awareness.
 
 Provides get_jira_fetcher and get_confluence_fetcher for use in tool functions.
+Fetchers are cached per credential scope so connections and field caches are
+reused across tool calls.
 """
 
 from __future__ import annotations
 
 import dataclasses
+import hashlib
 import logging
+import time
 from typing import TYPE_CHECKING, Any
 
+from cachetools import TTLCache
 from fastmcp import Context
 from fastmcp.server.dependencies import get_http_request
 from starlette.requests import Request
@@ -16,7 +21,10 @@ from starlette.requests import Request
 from mcp_atlassian.bitbucket import BitbucketConfig, BitbucketFetcher
 from mcp_atlassian.confluence import ConfluenceConfig, ConfluenceFetcher
 from mcp_atlassian.jira import JiraConfig, JiraFetcher
+from mcp_atlassian.jira.client import JiraClient
 from mcp_atlassian.servers.context import MainAppContext
+from mcp_atlassian.utils.env import get_env_float, get_env_int
+from mcp_atlassian.utils.executor import run_blocking
 from mcp_atlassian.utils.oauth import OAuthConfig
 
 if TYPE_CHECKING:
@@ -27,6 +35,175 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("mcp-atlassian.servers.dependencies")
 
+FetcherCacheKey = tuple[str, str, str | None, str | None]
+
+
+@dataclasses.dataclass
+class _CachedFetcher:
+    """A fetcher kept alive across tool calls, with the config it was built from."""
+
+    base_config: Any
+    fetcher: Any
+    user_email: str | None = None
+
+
+# Seconds a fetcher dropped from the cache is kept before its async HTTP
+# client is closed, so tool calls still holding it can finish their requests
+RETIRED_FETCHER_GRACE_PERIOD = 60.0
+
+
+class _FetcherCache(TTLCache):
+    """TTLCache that remembers the fetchers it drops.
+
+    Fetchers leave the cache when they expire, are evicted for space, are
+    replaced or are discarded explicitly. Their async HTTP clients hold
+    connection pools that can only be closed from async code, so dropped
+    fetchers are collected in ``retired`` and closed by
+    ``close_retired_fetchers``.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.retired: list[tuple[float, Any]] = []
+
+    def _retire(self, entry: _CachedFetcher) -> None:
+        self.retired.append((time.monotonic(), entry.fetcher))
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        previous = super().get(key)
+        super().__setitem__(key, value)
+        if previous is not None and previous is not value:
+            self._retire(previous)
+
+    def __delitem__(self, key: Any) -> None:
+        entry = super().get(key)
+        super().__delitem__(key)
+        if entry is not None:
+            self._retire(entry)
+
+    def expire(self, time: float | None = None) -> Any:
+        expired = super().expire(time)
+        for _, entry in expired:
+            self._retire(entry)
+        return expired
+
+
+# Fetchers are reused across calls so their requests sessions (warm
+# connections) and per-instance field caches survive between tool calls.
+# Entries expire a fixed time after they were created, not after the last
+# use, so rotated or revoked credentials are picked up within the TTL.
+fetcher_cache: _FetcherCache = _FetcherCache(
+    maxsize=get_env_int("ATLASSIAN_FETCHER_CACHE_SIZE", 100, minimum=1),
+    ttl=get_env_float("ATLASSIAN_FETCHER_CACHE_TTL", 300.0, minimum=1.0),
+)
+
+
+def _fetcher_cache_key(
+    service: str,
+    auth_type: str,
+    token: str | None = None,
+    cloud_id: str | None = None,
+) -> FetcherCacheKey:
+    """Build the fetcher cache key for a service and credential scope.
+
+    The token is hashed so raw credentials are never held in cache keys.
+
+    Args:
+        service: Service name ('jira', 'confluence' or 'bitbucket').
+        auth_type: The user auth type, or 'global' for the server credentials.
+        token: The user token, if any.
+        cloud_id: The cloud ID override, if any.
+
+    Returns:
+        Tuple key for fetcher_cache.
+    """
+    token_hash = hashlib.sha256(token.encode()).hexdigest() if token else None
+    return (service, auth_type, token_hash, cloud_id)
+
+
+def _get_cached_fetcher(
+    key: FetcherCacheKey, base_config: Any
+) -> _CachedFetcher | None:
+    """Return the cached fetcher entry for a key if it is still valid.
+
+    Entries built from a different global configuration object are discarded,
+    so a reloaded server configuration never serves stale fetchers.
+
+    Args:
+        key: Cache key from _fetcher_cache_key.
+        base_config: The global configuration the fetcher must derive from.
+
+    Returns:
+        The cache entry, or None on a miss.
+    """
+    entry = fetcher_cache.get(key)
+    if entry is None:
+        return None
+    if entry.base_config is not base_config:
+        fetcher_cache.pop(key, None)
+        return None
+    logger.debug(f"Reusing cached {key[0]} fetcher (auth type: {key[1]})")
+    return entry
+
+
+def _cache_fetcher(
+    key: FetcherCacheKey,
+    base_config: Any,
+    fetcher: Any,
+    user_email: str | None = None,
+) -> None:
+    """Store a fetcher in the cache.
+
+    Args:
+        key: Cache key from _fetcher_cache_key.
+        base_config: The global configuration the fetcher was derived from.
+        fetcher: The fetcher instance to reuse.
+        user_email: Email derived while validating the user's token, if any.
+    """
+    fetcher_cache[key] = _CachedFetcher(
+        base_config=base_config, fetcher=fetcher, user_email=user_email
+    )
+
+
+def clear_fetcher_cache() -> None:
+    """Drop all cached fetchers (e.g. after configuration changes or in tests)."""
+    fetcher_cache.clear()
+
+
+async def close_retired_fetchers(*, force: bool = False) -> None:
+    """Close the async HTTP clients of fetchers dropped from the cache.
+
+    Args:
+        force: Close every dropped fetcher, without waiting for the grace
+            period (e.g. at shutdown)
+    """
+    now = time.monotonic()
+    due = [
+        fetcher
+        for retired_at, fetcher in fetcher_cache.retired
+        if force or now - retired_at >= RETIRED_FETCHER_GRACE_PERIOD
+    ]
+    if not due:
+        return
+    fetcher_cache.retired = [
+        (retired_at, fetcher)
+        for retired_at, fetcher in fetcher_cache.retired
+        if fetcher not in due
+    ]
+    for fetcher in due:
+        # Only Jira fetchers own an async HTTP client
+        if isinstance(fetcher, JiraClient):
+            try:
+                await fetcher.close_async_client()
+            except Exception as e:  # noqa: BLE001 - closing is best effort
+                logger.warning(f"Failed to close the async client of a fetcher: {e}")
+
+
+async def close_fetcher_cache() -> None:
+    """Drop all cached fetchers and close their async HTTP clients."""
+    fetcher_cache.clear()
+    await close_retired_fetchers(force=True)
+
 
 def _create_user_config_for_fetcher(
     base_config: JiraConfig | ConfluenceConfig,
@@ -168,6 +345,7 @@ async def get_jira_fetcher(ctx: Context) -> JiraFetcher:
         ValueError: If configuration or credentials are invalid.
     """
     logger.debug(f"get_jira_fetcher: ENTERED. Context ID: {id(ctx)}")
+    await close_retired_fetchers()
     try:
         request: Request = get_http_request()
         logger.debug(
@@ -210,6 +388,14 @@ async def get_jira_fetcher(ctx: Context) -> JiraFetcher:
                     "Jira global configuration (URL, SSL) is not available from lifespan context."
                 )
 
+            cache_key = _fetcher_cache_key(
+                "jira", user_auth_type, user_token, user_cloud_id
+            )
+            cached = _get_cached_fetcher(cache_key, app_lifespan_ctx.full_jira_config)
+            if cached:
+                request.state.jira_fetcher = cached.fetcher
+                return cached.fetcher
+
             cloud_id_info = f" with cloudId {user_cloud_id}" if user_cloud_id else ""
             logger.info(
                 f"Creating user-specific JiraFetcher (type: {user_auth_type}) for user {user_email or 'unknown'} (token ...{str(user_token)[-8:]}){cloud_id_info}"
@@ -222,10 +408,15 @@ async def get_jira_fetcher(ctx: Context) -> JiraFetcher:
             )
             try:
                 user_jira_fetcher = JiraFetcher(config=user_specific_config)
-                current_user_id = user_jira_fetcher.get_current_user_account_id()
+                current_user_id = await run_blocking(
+                    "jira", user_jira_fetcher.get_current_user_account_id
+                )
                 logger.debug(
                     f"get_jira_fetcher: Validated Jira token for user ID: {current_user_id}"
                 )
+                _cache_fetcher(
+                    cache_key, app_lifespan_ctx.full_jira_config, user_jira_fetcher
+                )
                 request.state.jira_fetcher = user_jira_fetcher
                 return user_jira_fetcher
             except Exception as e:
@@ -254,7 +445,14 @@ async def get_jira_fetcher(ctx: Context) -> JiraFetcher:
             "get_jira_fetcher: Using global JiraFetcher from lifespan_context. "
             f"Global config auth_type: {app_lifespan_ctx_global.full_jira_config.auth_type}"
         )
-        return JiraFetcher(config=app_lifespan_ctx_global.full_jira_config)
+        global_config = app_lifespan_ctx_global.full_jira_config
+        cache_key = _fetcher_cache_key("jira", "global")
+        cached = _get_cached_fetcher(cache_key, global_config)
+        if cached:
+            return cached.fetcher
+        jira_fetcher = JiraFetcher(config=global_config)
+        _cache_fetcher(cache_key, global_config, jira_fetcher)
+        return jira_fetcher
     logger.error("Jira configuration could not be resolved.")
     raise ValueError(
         "Jira client (fetcher) not available. Ensure server is configured correctly."
@@ -317,6 +515,18 @@ async def get_confluence_fetcher(ctx: Context) -> ConfluenceFetcher:
                     "Confluence global configuration (URL, SSL) is not available from lifespan context."
                 )
 
+            cache_key = _fetcher_cache_key(
+                "confluence", user_auth_type, user_token, user_cloud_id
+            )
+            cached = _get_cached_fetcher(
+                cache_key, app_lifespan_ctx.full_confluence_config
+            )
+            if cached:
+                request.state.confluence_fetcher = cached.fetcher
+                if not user_email and cached.user_email:
+                    request.state.user_atlassian_email = cached.user_email
+                return cached.fetcher
+
             cloud_id_info = f" with cloudId {user_cloud_id}" if user_cloud_id else ""
             logger.info(
                 f"Creating user-specific ConfluenceFetcher (type: {user_auth_type}) for user {user_email or 'unknown'} (token ...{str(user_token)[-8:]}){cloud_id_info}"
@@ -329,7 +539,9 @@ async def get_confluence_fetcher(ctx: Context) -> ConfluenceFetcher:
             )
             try:
                 user_confluence_fetcher = ConfluenceFetcher(config=user_specific_config)
-                current_user_data = user_confluence_fetcher.get_current_user_info()
+                current_user_data = await run_blocking(
+                    "confluence", user_confluence_fetcher.get_current_user_info
+                )
                 # Try to get email from Confluence if not provided (can happen with PAT)
                 derived_email = (
                     current_user_data.get("email")
@@ -344,6 +556,12 @@ async def get_confluence_fetcher(ctx: Context) -> ConfluenceFetcher:
                 logger.debug(
                     f"get_confluence_fetcher: Validated Confluence token. User context: Email='{user_email or derived_email}', DisplayName='{display_name}'"
                 )
+                _cache_fetcher(
+                    cache_key,
+                    app_lifespan_ctx.full_confluence_config,
+                    user_confluence_fetcher,
+                    user_email=derived_email,
+                )
                 request.state.confluence_fetcher = user_confluence_fetcher
                 if (
                     not user_email
@@ -378,7 +596,14 @@ async def get_confluence_fetcher(ctx: Context) -> ConfluenceFetcher:
             "get_confluence_fetcher: Using global ConfluenceFetcher from lifespan_context. "
             f"Global config auth_type: {app_lifespan_ctx_global.full_confluence_config.auth_type}"
         )
-        return ConfluenceFetcher(config=app_lifespan_ctx_global.full_confluence_config)
+        global_config = app_lifespan_ctx_global.full_confluence_config
+        cache_key = _fetcher_cache_key("confluence", "global")
+        cached = _get_cached_fetcher(cache_key, global_config)
+        if cached:
+            return cached.fetcher
+        confluence_fetcher = ConfluenceFetcher(config=global_config)
+        _cache_fetcher(cache_key, global_config, confluence_fetcher)
+        return confluence_fetcher
     logger.error("Confluence configuration could not be resolved.")
     raise ValueError(
         "Confluence client (fetcher) not available. Ensure server is configured correctly."
@@ -425,9 +650,12 @@ async def get_bitbucket_fetcher(ctx: Context) -> BitbucketFetcher:
                     else None
                 )
                 if app_lifespan_ctx and app_lifespan_ctx.full_bitbucket_config:
-                    import dataclasses
-
                     base_config = app_lifespan_ctx.full_bitbucket_config
+                    cache_key = _fetcher_cache_key("bitbucket", "pat", user_token)
+                    cached = _get_cached_fetcher(cache_key, base_config)
+                    if cached:
+                        request.state.bitbucket_fetcher = cached.fetcher
+                        return cached.fetcher
                     # Create user-specific config with the provided PAT
                     user_config = dataclasses.replace(
                         base_config,
@@ -441,6 +669,7 @@ async def get_bitbucket_fetcher(ctx: Context) -> BitbucketFetcher:
                     )
                     try:
                         user_bitbucket_fetcher = BitbucketFetcher(config=user_config)
+                        _cache_fetcher(cache_key, base_config, user_bitbucket_fetcher)
                         request.state.bitbucket_fetcher = user_bitbucket_fetcher
                         return user_bitbucket_fetcher
                     except Exception as e:
@@ -469,7 +698,14 @@ async def get_bitbucket_fetcher(ctx: Context) -> BitbucketFetcher:
             "get_bitbucket_fetcher: Using global BitbucketFetcher from lifespan_context. "
             f"Global config auth_type: {app_lifespan_ctx_global.full_bitbucket_config.auth_type}"
         )
-        return BitbucketFetcher(config=app_lifespan_ctx_global.full_bitbucket_config)
+        global_config = app_lifespan_ctx_global.full_bitbucket_config
+        cache_key = _fetcher_cache_key("bitbucket", "global")
+        cached = _get_cached_fetcher(cache_key, global_config)
+        if cached:
+            return cached.fetcher
+        bitbucket_fetcher = BitbucketFetcher(config=global_config)
+        _cache_fetcher(cache_key, global_config, bitbucket_fetcher)
+        return bitbucket_fetcher
     logger.error("Bitbucket configuration could not be resolved.")
     raise ValueError(
         "Bitbucket client (fetcher) not available. Ensure server is configured correctly."
@@ -0,0 +1,286 @@
+"""BM25 ranking engine for tool discovery.
+
+Tools are indexed as a sparse term-document matrix stored column-wise: each
+term maps to the documents containing it and the precomputed BM25 weight of
+the term in each document. A query is scored against every tool in one pass
+over the postings of its terms, so search cost grows with the number of
+matching postings rather than with the number of tools times the cost of
+fuzzy string comparisons.
+
+Words are matched after light plural stemming. Synonyms are matched through
+concept terms: every word (or two-word phrase) that is a known action or
+entity synonym also contributes an ``action:<canonical>`` or
+``entity:<canonical>`` term, on both the document and the query side.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+from array import array
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING
+
+from .scoring import _ACTION_REVERSE, _ENTITY_REVERSE
+
+if TYPE_CHECKING:
+    from .types import ToolIndexEntry
+
+# Weight of each tool field in the term frequency of a document
+DEFAULT_FIELD_WEIGHTS: dict[str, float] = {
+    "name": 3.0,
+    "keywords": 2.0,
+    "description": 1.0,
+    "use_cases": 1.0,
+    "examples": 1.0,
+}
+
+# Minimum normalized score for a tool to be recommended
+MIN_BM25_SCORE = 0.05
+
+# Function words that carry no meaning in a task description
+QUERY_STOP_WORDS = frozenset(
+    {
+        "a",
+        "an",
+        "and",
+        "are",
+        "can",
+        "do",
+        "for",
+        "from",
+        "how",
+        "i",
+        "in",
+        "is",
+        "it",
+        "me",
+        "my",
+        "of",
+        "on",
+        "or",
+        "please",
+        "the",
+        "this",
+        "to",
+        "want",
+        "what",
+        "with",
+    }
+)
+
+_WORD_RE = re.compile(r"[a-z]+")
+_CAMEL_RE = re.compile(r"([a-z])([A-Z])")
+
+
+def _stem(word: str) -> str:
+    """Strip a plural "s" so "issues" and "issue" share a term."""
+    if len(word) > 3 and word[-1] == "s" and word[-2] != "s":
+        return word[:-1]
+    return word
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase words, handling underscores and camelCase.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        Words in order of appearance
+    """
+    text = _CAMEL_RE.sub(r"\1 \2", text.replace("_", " "))
+    return _WORD_RE.findall(text.lower())
+
+
+def expand_terms(words: Sequence[str]) -> list[str]:
+    """Convert words to index terms, adding synonym concept terms.
+
+    Args:
+        words: Words in order of appearance
+
+    Returns:
+        Stemmed words followed by ``action:``/``entity:`` concept terms
+    """
+    terms = [_stem(word) for word in words]
+    phrases = [f"{a} {b}" for a, b in zip(words, words[1:], strict=False)]
+    for word in (*words, *phrases):
+        for candidate in (word, _stem(word)):
+            action = _ACTION_REVERSE.get(candidate)
+            entity = _ENTITY_REVERSE.get(candidate)
+            if action or entity:
+                if action:
+                    terms.append(f"action:{action}")
+                if entity:
+                    terms.append(f"entity:{entity}")
+                break
+    return terms
+
+
+class BM25Ranker:
+    """Okapi BM25 ranking over a fixed set of tools.
+
+    Field weights scale how much a term occurrence in each tool field
+    counts towards the term frequency (a simplified BM25F).
+    """
+
+    def __init__(
+        self,
+        tools: Iterable[ToolIndexEntry],
+        *,
+        k1: float = 1.2,
+        b: float = 0.75,
+        field_weights: dict[str, float] | None = None,
+    ) -> None:
+        """Build the term-document matrix.
+
+        Args:
+            tools: Tools to index
+            k1: Term frequency saturation
+            b: Document length normalization
+            field_weights: Per-field term frequency weights
+        """
+        self.k1 = k1
+        self.b = b
+        self.field_weights = field_weights or DEFAULT_FIELD_WEIGHTS
+        self.names: list[str] = []
+        self._doc_terms: list[dict[str, float]] = []
+
+        for tool in tools:
+            self.names.append(tool.name)
+            self._doc_terms.append(self._document_terms(tool))
+
+        self._positions = {name: i for i, name in enumerate(self.names)}
+        self._build_postings()
+
+    def _document_terms(self, tool: ToolIndexEntry) -> dict[str, float]:
+        """Get the weighted term frequencies of a tool."""
+        fields = {
+            "name": [tool.name],
+            "keywords": sorted(tool.keywords),
+            "description": [tool.description],
+            "use_cases": tool.use_cases,
+            "examples": tool.examples,
+        }
+        frequencies: dict[str, float] = {}
+        for field, texts in fields.items():
+            weight = self.field_weights.get(field, 1.0)
+            for text in texts:
+                for term in expand_terms(tokenize(text)):
+                    frequencies[term] = frequencies.get(term, 0.0) + weight
+        return frequencies
+
+    def _build_postings(self) -> None:
+        """Precompute BM25 weights as sparse columns per term."""
+        lengths = [sum(terms.values()) for terms in self._doc_terms]
+        average_length = sum(lengths) / len(lengths) if lengths else 0.0
+        document_frequency: Counter[str] = Counter()
+        for terms in self._doc_terms:
+            document_frequency.update(terms.keys())
+
+        count = len(self._doc_terms)
+        self._idf = {
+            term: math.log(1.0 + (count - df + 0.5) / (df + 0.5))
+            for term, df in document_frequency.items()
+        }
+        self._postings: dict[str, tuple[array, array]] = {}
+        for position, terms in enumerate(self._doc_terms):
+            norm = self.k1 * (
+                1.0 - self.b + self.b * lengths[position] / (average_length or 1.0)
+            )
+            for term, tf in terms.items():
+                docs, weights = self._postings.setdefault(
+                    term, (array("I"), array("d"))
+                )
+                docs.append(position)
+                weights.append(self._idf[term] * tf * (self.k1 + 1.0) / (tf + norm))
+
+    @staticmethod
+    def query_terms(query: str) -> Counter[str]:
+        """Get the weighted terms of a query.
+
+        Args:
+            query: Natural language task description
+
+        Returns:
+            Counter of query terms
+        """
+        words = [w for w in tokenize(query) if w not in QUERY_STOP_WORDS]
+        return Counter(expand_terms(words))
+
+    def score(self, query: str) -> list[float]:
+        """Score every tool against a query.
+
+        Args:
+            query: Natural language task description
+
+        Returns:
+            Scores between 0.0 and 1.0, aligned with ``names``. A score is
+            the BM25 score divided by the best score any document could get.
+        """
+        terms = self.query_terms(query)
+        scores = [0.0] * len(self.names)
+        best_possible = 0.0
+        for term, weight in terms.items():
+            idf = self._idf.get(term)
+            if idf is None:
+                continue
+            best_possible += weight * idf * (self.k1 + 1.0)
+            docs, weights = self._postings[term]
+            for position, term_weight in zip(docs, weights, strict=True):
+                scores[position] += weight * term_weight
+        if best_possible:
+            scores = [min(1.0, s / best_possible) for s in scores]
+        return scores
+
+    def match_reasons(self, query: str, name: str) -> list[str]:
+        """Explain which query terms matched a tool.
+
+        Args:
+            query: Natural language task description
+            name: Tool name
+
+        Returns:
+            List of match reasons
+        """
+        doc_terms = self._doc_terms[self._positions[name]]
+        matched = [term for term in self.query_terms(query) if term in doc_terms]
+        reasons = []
+        words = [t for t in matched if ":" not in t]
+        if words:
+            reasons.append(f"keyword match: {', '.join(sorted(words)[:3])}")
+        for kind in ("action", "entity"):
+            concepts = sorted(
+                t.split(":", 1)[1] for t in matched if t.startswith(f"{kind}:")
+            )
+            if concepts:
+                reasons.append(f"{kind} match: {', '.join(concepts)}")
+        return reasons
+
+    def rank(
+        self, query: str, names: Iterable[str], limit: int
+    ) -> list[tuple[str, float]]:
+        """Rank a subset of the indexed tools for a query.
+
+        Args:
+            query: Natural language task description
+            names: Names of the tools eligible for ranking
+            limit: Maximum results to return
+
+        Returns:
+            (name, score) pairs sorted by descending score. Ties keep the
+            order of ``names``.
+        """
+        scores = self.score(query)
+        ranked = (
+            (name, scores[self._positions[name]])
+            for name in names
+            if name in self._positions
+        )
+        return heapq.nlargest(
+            limit,
+            (item for item in ranked if item[1] > MIN_BM25_SCORE),
+            key=lambda item: item[1],
+        )
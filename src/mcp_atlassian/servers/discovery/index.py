@@ -3,11 +3,20 @@
 from __future__ import annotations
 
 import logging
+import os
 import re
-from typing import TYPE_CHECKING
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Literal
 
+from .bm25 import BM25Ranker
 from .metadata import TOOL_ENHANCEMENTS
-from .scoring import score_tool_relevance
+from .scoring import (
+    QueryFeatures,
+    ToolFeatures,
+    extract_query_features,
+    extract_tool_features,
+    score_features,
+)
 from .types import ToolIndexEntry, ToolRecommendation
 
 if TYPE_CHECKING:
@@ -16,18 +25,66 @@ if TYPE_CHECKING:
 logger = logging.getLogger("mcp-atlassian.discovery")
 
 
+# Number of recent search results kept in the query cache
+QUERY_CACHE_SIZE = 256
+
+QueryCacheKey = tuple[str, str | None, bool, int]
+
+DiscoveryRanker = Literal["heuristic", "bm25"]
+
+DISCOVERY_RANKERS: tuple[DiscoveryRanker, ...] = ("heuristic", "bm25")
+
+
+def get_ranker_from_env() -> DiscoveryRanker:
+    """Get the tool discovery ranking engine selected by the environment.
+
+    Returns:
+        "heuristic" (weighted keyword and fuzzy matching, the default) or
+        "bm25" (BM25 over a term-document matrix).
+
+    Environment Variables:
+        TOOL_DISCOVERY_RANKER: Ranking engine to use
+    """
+    ranker = os.getenv("TOOL_DISCOVERY_RANKER", "heuristic").strip().lower()
+    if ranker not in DISCOVERY_RANKERS:
+        logger.warning(
+            f"Unknown TOOL_DISCOVERY_RANKER '{ranker}', using heuristic ranking"
+        )
+        return "heuristic"
+    return ranker  # type: ignore[return-value]
+
+
 class ToolDiscoveryIndex:
-    """Singleton index of all available tools."""
+    """Singleton index of all available tools.
+
+    Scoring features of each tool are computed once in ``build_index`` and
+    an inverted index maps words, canonical actions and canonical entities
+    to the tools containing them. A search scores only the tools sharing a
+    term with the query, and recent results are memoized.
+
+    With the "bm25" ranker, tools are instead ranked by a ``BM25Ranker``
+    built on first use after the tools change.
+    """
 
     _instance: ToolDiscoveryIndex | None = None
     _tools: dict[str, ToolIndexEntry]
+    _features: dict[str, ToolFeatures]
+    _inverted: dict[str, set[str]]
+    _query_cache: OrderedDict[QueryCacheKey, list[ToolRecommendation]]
+    _bm25: BM25Ranker | None
     _built: bool
+    ranker: DiscoveryRanker
 
     def __new__(cls) -> ToolDiscoveryIndex:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._tools = {}
+            cls._instance._features = {}
+            cls._instance._inverted = {}
+            cls._instance._query_cache = OrderedDict()
+            cls._instance._bm25 = None
             cls._instance._built = False
+            cls._instance.ranker = get_ranker_from_env()
         return cls._instance
 
     @classmethod
@@ -240,49 +297,107 @@ class ToolDiscoveryIndex:
                 keywords=keywords,
             )
 
-            self._tools[registered_name] = entry
+            self._add_to_index(entry)
 
+        self._query_cache.clear()
         self._built = True
         logger.info(f"Tool discovery index built with {len(self._tools)} tools")
 
-    def search(
+    @staticmethod
+    def _tool_terms(features: ToolFeatures) -> set[str]:
+        """Get the inverted index terms of a tool."""
+        terms = set(features.all_words)
+        terms.update(f"action:{action}" for action in features.actions)
+        terms.update(f"entity:{entity}" for entity in features.entities)
+        return terms
+
+    @staticmethod
+    def _query_terms(features: QueryFeatures) -> set[str]:
+        """Get the inverted index terms to look up for a query."""
+        terms = set(features.words)
+        # Let plurals ("issues") shortlist tools mentioning the singular
+        terms.update(w[:-1] for w in features.words if len(w) > 3 and w[-1] == "s")
+        terms.update(f"action:{action}" for action in features.actions)
+        terms.update(f"entity:{entity}" for entity in features.entities)
+        return terms
+
+    def _add_to_index(self, entry: ToolIndexEntry) -> None:
+        """Add a tool entry, its features and its index terms."""
+        features = extract_tool_features(entry)
+        self._tools[entry.name] = entry
+        self._features[entry.name] = features
+        for term in self._tool_terms(features):
+            self._inverted.setdefault(term, set()).add(entry.name)
+        self._bm25 = None
+
+    def _ensure_indexed(self) -> None:
+        """Rebuild features and the inverted index if the tools changed."""
+        if self._features.keys() == self._tools.keys():
+            return
+        tools = list(self._tools.values())
+        self._tools = {}
+        self._features = {}
+        self._inverted = {}
+        self._bm25 = None
+        self._query_cache.clear()
+        for entry in tools:
+            self._add_to_index(entry)
+
+    def _eligible(
         self,
-        query: str,
-        service_filter: str | None = None,
-        include_write: bool = True,
-        limit: int = 7,
-    ) -> list[ToolRecommendation]:
-        """Search for tools matching a query.
+        service_filter: str | None,
+        *,
+        include_write: bool,
+    ) -> list[str]:
+        """Get the names of the tools passing the search filters."""
+        return [
+            name
+            for name, tool in self._tools.items()
+            # Skip the discover_tools itself to avoid recursion
+            if name != "discover_tools"
+            and (not service_filter or tool.service == service_filter.lower())
+            and (include_write or not tool.is_write)
+        ]
+
+    def set_ranker(self, ranker: DiscoveryRanker) -> None:
+        """Select the ranking engine used by ``search``.
 
         Args:
-            query: Natural language description of task
-            service_filter: Filter by service ("jira", "confluence", "bitbucket")
-            include_write: Include tools that modify data
-            limit: Maximum results to return
+            ranker: "heuristic" or "bm25"
 
-        Returns:
-            List of tool recommendations sorted by relevance
+        Raises:
+            ValueError: If the ranker is unknown
         """
-        if not self._built:
-            logger.warning("Index not built, returning empty results")
-            return []
-
+        if ranker not in DISCOVERY_RANKERS:
+            error_msg = f"Unknown tool discovery ranker: {ranker}"
+            raise ValueError(error_msg)
+        if ranker != self.ranker:
+            self.ranker = ranker
+            self._query_cache.clear()
+
+    def _search_heuristic(
+        self,
+        query: str,
+        service_filter: str | None,
+        *,
+        include_write: bool,
+        limit: int,
+    ) -> list[ToolRecommendation]:
+        """Rank the shortlisted tools with the weighted heuristic scorer."""
+        query_features = extract_query_features(query)
         results: list[tuple[float, ToolRecommendation]] = []
 
-        for name, tool in self._tools.items():
-            # Apply filters
-            if service_filter and tool.service != service_filter.lower():
-                continue
-
-            if not include_write and tool.is_write:
-                continue
-
-            # Skip the discover_tools itself to avoid recursion
-            if name == "discover_tools":
-                continue
+        candidates = self._candidates(
+            query_features,
+            service_filter=service_filter,
+            include_write=include_write,
+            limit=limit,
+        )
+        for name in candidates:
+            tool = self._tools[name]
 
             # Score the tool
-            score, reasons = score_tool_relevance(query, tool)
+            score, reasons = score_features(query_features, self._features[name])
 
             # Only include tools with some relevance
             if score > 0.1:
@@ -302,6 +417,102 @@ class ToolDiscoveryIndex:
         # Return top N recommendations
         return [rec for _, rec in results[:limit]]
 
+    def _search_bm25(
+        self,
+        query: str,
+        service_filter: str | None,
+        *,
+        include_write: bool,
+        limit: int,
+    ) -> list[ToolRecommendation]:
+        """Rank the eligible tools with BM25."""
+        if self._bm25 is None:
+            self._bm25 = BM25Ranker(self._tools.values())
+        eligible = self._eligible(service_filter, include_write=include_write)
+        recommendations = []
+        for name, score in self._bm25.rank(query, eligible, limit):
+            tool = self._tools[name]
+            recommendations.append(
+                ToolRecommendation(
+                    name=name,
+                    description=tool.description,
+                    relevance_score=score,
+                    match_reasons=self._bm25.match_reasons(query, name),
+                    service=tool.service,
+                    is_write=tool.is_write,
+                )
+            )
+        return recommendations
+
+    def _candidates(
+        self,
+        query: QueryFeatures,
+        *,
+        service_filter: str | None,
+        include_write: bool,
+        limit: int,
+    ) -> list[str]:
+        """Shortlist the tools to score for a query.
+
+        Tools sharing no term with the query can still score through fuzzy
+        matching, so every eligible tool is scored when the shortlist is too
+        short to fill the requested number of results.
+        """
+        eligible = self._eligible(service_filter, include_write=include_write)
+        names: set[str] = set()
+        for term in self._query_terms(query):
+            names |= self._inverted.get(term, set())
+        shortlist = [name for name in eligible if name in names]
+        # Keep registration order so ties rank the same as a full scan
+        return shortlist if len(shortlist) >= limit else eligible
+
+    def search(
+        self,
+        query: str,
+        service_filter: str | None = None,
+        include_write: bool = True,
+        limit: int = 7,
+    ) -> list[ToolRecommendation]:
+        """Search for tools matching a query.
+
+        Args:
+            query: Natural language description of task
+            service_filter: Filter by service ("jira", "confluence", "bitbucket")
+            include_write: Include tools that modify data
+            limit: Maximum results to return
+
+        Returns:
+            List of tool recommendations sorted by relevance
+        """
+        if not self._built:
+            logger.warning("Index not built, returning empty results")
+            return []
+
+        self._ensure_indexed()
+        cache_key: QueryCacheKey = (
+            query.strip().lower(),
+            service_filter.lower() if service_filter else None,
+            include_write,
+            limit,
+        )
+        cached = self._query_cache.get(cache_key)
+        if cached is not None:
+            self._query_cache.move_to_end(cache_key)
+            return list(cached)
+
+        if self.ranker == "bm25":
+            recommendations = self._search_bm25(
+                query, service_filter, include_write=include_write, limit=limit
+            )
+        else:
+            recommendations = self._search_heuristic(
+                query, service_filter, include_write=include_write, limit=limit
+            )
+        self._query_cache[cache_key] = recommendations
+        if len(self._query_cache) > QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
+        return list(recommendations)
+
     def get_tool(self, name: str) -> ToolIndexEntry | None:
         """Get a specific tool by name.
 
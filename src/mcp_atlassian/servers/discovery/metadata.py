@@ -65,6 +65,18 @@ TOOL_ENHANCEMENTS: dict[str, dict[str, list[str] | set[str]]] = {
         ],
         "keywords": {"find", "search", "query", "jql", "filter", "list", "issues"},
     },
+    "jira_search_all": {
+        "use_cases": [
+            "Get every issue matching a query",
+            "Export all issues of a project",
+            "Collect more than one page of search results",
+        ],
+        "examples": [
+            "List all open bugs in PROJ, not just the first page",
+            "Get every issue updated this quarter",
+        ],
+        "keywords": {"all", "every", "export", "paginate", "jql", "issues", "bulk"},
+    },
     "jira_search_fields": {
         "use_cases": [
             "Find custom field names",
@@ -231,6 +243,18 @@ TOOL_ENHANCEMENTS: dict[str, dict[str, list[str] | set[str]]] = {
         ],
         "keywords": {"batch", "bulk", "multiple", "create"},
     },
+    "jira_batch_get_issues": {
+        "use_cases": [
+            "Get details of several issues at once",
+            "Look up a list of tickets",
+            "Check the status of multiple issues",
+        ],
+        "examples": [
+            "Get PROJ-1, PROJ-2 and PROJ-3",
+            "What's the status of these tickets?",
+        ],
+        "keywords": {"batch", "bulk", "multiple", "issues", "tickets", "details"},
+    },
     "jira_batch_get_changelogs": {
         "use_cases": [
             "Get history for multiple issues",
@@ -453,6 +477,18 @@ TOOL_ENHANCEMENTS: dict[str, dict[str, list[str] | set[str]]] = {
         ],
         "keywords": {"documentation", "docs", "wiki", "page", "article", "search"},
     },
+    "confluence_search_all": {
+        "use_cases": [
+            "Get every page matching a search",
+            "Collect more than one page of search results",
+            "Inventory documentation on a topic",
+        ],
+        "examples": [
+            "Find all pages labelled runbook",
+            "List every page mentioning the billing service",
+        ],
+        "keywords": {"all", "every", "export", "paginate", "cql", "pages", "bulk"},
+    },
     "confluence_get_page": {
         "use_cases": [
             "Read a specific page",
@@ -607,6 +643,7 @@ TOOL_ENHANCEMENTS: dict[str, dict[str, list[str] | set[str]]] = {
         "examples": [
             "What repos are in PROJ?",
             "List repositories",
+            "Which repos in PROJ have 'service' in their name?",
         ],
         "keywords": {"repository", "repo", "list"},
     },
@@ -653,6 +690,7 @@ TOOL_ENHANCEMENTS: dict[str, dict[str, list[str] | set[str]]] = {
         "examples": [
             "What PRs are open?",
             "List pull requests",
+            "Find merged PRs mentioning the login page",
         ],
         "keywords": {"pr", "pull request", "list", "merge"},
     },
@@ -677,8 +715,9 @@ TOOL_ENHANCEMENTS: dict[str, dict[str, list[str] | set[str]]] = {
         "examples": [
             "Show the diff for PR #123",
             "What changed in this PR?",
+            "Show the diff of src/app.py in PR #123",
         ],
-        "keywords": {"diff", "changes", "pr", "pull request"},
+        "keywords": {"diff", "changes", "pr", "pull request", "patch", "hunk"},
     },
     "bitbucket_get_pull_request_comments": {
         "use_cases": [
@@ -713,4 +752,16 @@ TOOL_ENHANCEMENTS: dict[str, dict[str, list[str] | set[str]]] = {
         ],
         "keywords": {"create", "repository", "repo", "new"},
     },
+    "bitbucket_reindex_jira_keys": {
+        "use_cases": [
+            "Refresh the Jira key index of a project",
+            "Find newly linked PRs of an issue",
+            "Rebuild the PR to Jira issue index",
+        ],
+        "examples": [
+            "Reindex Jira keys in PROJ",
+            "Pick up new pull requests for PROJ-123",
+        ],
+        "keywords": {"index", "reindex", "jira", "pr", "pull request", "link"},
+    },
 }
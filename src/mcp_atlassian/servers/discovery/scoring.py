@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from thefuzz import fuzz
@@ -10,6 +11,14 @@ from thefuzz import fuzz
 if TYPE_CHECKING:
     from .types import ToolIndexEntry
 
+DEFAULT_WEIGHTS: dict[str, float] = {
+    "keyword": 0.25,
+    "action": 0.20,
+    "entity": 0.25,
+    "fuzzy": 0.20,
+    "use_case": 0.10,
+}
+
 # Action verb synonyms - maps canonical verbs to their synonyms
 ACTION_SYNONYMS: dict[str, list[str]] = {
     "get": ["fetch", "retrieve", "read", "find", "lookup", "show", "display", "view"],
@@ -93,6 +102,86 @@ def _get_canonical_entity(word: str) -> str | None:
     return _ENTITY_REVERSE.get(word.lower())
 
 
+@dataclass(frozen=True)
+class QueryFeatures:
+    """Query text features used by the scorer, computed once per query."""
+
+    normalized: str
+    words: frozenset[str]
+    actions: frozenset[str]
+    entities: frozenset[str]
+
+
+@dataclass(frozen=True)
+class ToolFeatures:
+    """Tool text features used by the scorer, precomputed per tool."""
+
+    name_words: frozenset[str]
+    all_words: frozenset[str]
+    keywords: frozenset[str]
+    actions: frozenset[str]
+    entities: frozenset[str]
+    description: str
+    name_text: str
+    use_cases: tuple[tuple[str, str], ...]
+    examples: tuple[tuple[str, str], ...]
+
+
+def extract_query_features(query: str) -> QueryFeatures:
+    """Compute the scorer features of a query.
+
+    Args:
+        query: Natural language task description
+
+    Returns:
+        QueryFeatures for the query
+    """
+    words = _extract_words(query)
+    return QueryFeatures(
+        normalized=_normalize_text(query),
+        words=frozenset(words),
+        actions=frozenset(
+            action for w in words if (action := _get_canonical_action(w))
+        ),
+        entities=frozenset(
+            entity for w in words if (entity := _get_canonical_entity(w))
+        ),
+    )
+
+
+def extract_tool_features(tool: ToolIndexEntry) -> ToolFeatures:
+    """Compute the scorer features of a tool.
+
+    Args:
+        tool: Tool to analyze
+
+    Returns:
+        ToolFeatures for the tool
+    """
+    name_words = _extract_words(tool.name)
+    desc_words = _extract_words(tool.description)
+    entities = {
+        entity
+        for w in (name_words | desc_words)
+        if (entity := _get_canonical_entity(w))
+    }
+    # Also include service as an entity
+    entities.add(tool.service)
+    return ToolFeatures(
+        name_words=frozenset(name_words),
+        all_words=frozenset(name_words | desc_words | tool.keywords),
+        keywords=frozenset(tool.keywords),
+        actions=frozenset(
+            action for w in name_words if (action := _get_canonical_action(w))
+        ),
+        entities=frozenset(entities),
+        description=tool.description.lower(),
+        name_text=tool.name.lower().replace("_", " "),
+        use_cases=tuple((u, u.lower()) for u in tool.use_cases),
+        examples=tuple((e, e.lower()) for e in tool.examples),
+    )
+
+
 def score_tool_relevance(
     query: str,
     tool: ToolIndexEntry,
@@ -108,33 +197,40 @@ def score_tool_relevance(
     Returns:
         Tuple of (score 0.0-1.0, list of match reasons)
     """
-    default_weights = {
-        "keyword": 0.25,
-        "action": 0.20,
-        "entity": 0.25,
-        "fuzzy": 0.20,
-        "use_case": 0.10,
-    }
-    weights = weights or default_weights
+    return score_features(
+        extract_query_features(query), extract_tool_features(tool), weights
+    )
+
+
+def score_features(
+    query: QueryFeatures,
+    tool: ToolFeatures,
+    weights: dict[str, float] | None = None,
+) -> tuple[float, list[str]]:
+    """Score precomputed query features against precomputed tool features.
+
+    Args:
+        query: Features of the natural language task description
+        tool: Features of the tool to score
+        weights: Optional custom weights for scoring factors
+
+    Returns:
+        Tuple of (score 0.0-1.0, list of match reasons)
+    """
+    weights = weights or DEFAULT_WEIGHTS
 
     score = 0.0
     reasons: list[str] = []
 
-    query_normalized = _normalize_text(query)
-    query_words = _extract_words(query)
-
-    # Extract words from tool name and description
-    tool_name_words = _extract_words(tool.name)
-    tool_desc_words = _extract_words(tool.description)
-    all_tool_words = tool_name_words | tool_desc_words | tool.keywords
+    query_normalized = query.normalized
+    query_words = query.words
 
     # 1. Keyword matching (direct keyword hits)
-    keyword_hits = query_words & all_tool_words
+    keyword_hits = query_words & tool.all_words
     if keyword_hits:
         keyword_score = min(1.0, len(keyword_hits) / max(1, len(query_words) / 2))
         score += weights["keyword"] * keyword_score
-        if keyword_hits:
-            reasons.append(f"keyword match: {', '.join(sorted(keyword_hits)[:3])}")
+        reasons.append(f"keyword match: {', '.join(sorted(keyword_hits)[:3])}")
 
     # Also check for keyword matches with tool's explicit keywords
     explicit_keyword_hits = query_words & tool.keywords
@@ -143,32 +239,14 @@ def score_tool_relevance(
         score += bonus
 
     # 2. Action verb matching (with synonyms)
-    query_actions = {
-        _get_canonical_action(w) for w in query_words if _get_canonical_action(w)
-    }
-    tool_actions = {
-        _get_canonical_action(w) for w in tool_name_words if _get_canonical_action(w)
-    }
-
-    action_matches = query_actions & tool_actions
+    action_matches = query.actions & tool.actions
     if action_matches:
         action_score = min(1.0, len(action_matches))
         score += weights["action"] * action_score
         reasons.append(f"action match: {', '.join(sorted(action_matches))}")
 
     # 3. Entity matching (with synonyms)
-    query_entities = {
-        _get_canonical_entity(w) for w in query_words if _get_canonical_entity(w)
-    }
-    tool_entities = {
-        _get_canonical_entity(w)
-        for w in (tool_name_words | tool_desc_words)
-        if _get_canonical_entity(w)
-    }
-    # Also include service as an entity
-    tool_entities.add(tool.service)
-
-    entity_matches = query_entities & tool_entities
+    entity_matches = query.entities & tool.entities
     if entity_matches:
         entity_score = min(1.0, len(entity_matches))
         score += weights["entity"] * entity_score
@@ -176,7 +254,7 @@ def score_tool_relevance(
 
     # 4. Fuzzy description matching using thefuzz
     # Compare query to tool description
-    fuzzy_ratio = fuzz.partial_ratio(query_normalized, tool.description.lower())
+    fuzzy_ratio = fuzz.partial_ratio(query_normalized, tool.description)
     if fuzzy_ratio > 60:  # Only count significant fuzzy matches
         fuzzy_score = (fuzzy_ratio - 60) / 40.0  # Normalize 60-100 to 0-1
         score += weights["fuzzy"] * fuzzy_score
@@ -184,7 +262,7 @@ def score_tool_relevance(
             reasons.append(f"description similarity: {fuzzy_ratio}%")
 
     # Also check tool name fuzzy match
-    name_fuzzy = fuzz.ratio(query_normalized, tool.name.lower().replace("_", " "))
+    name_fuzzy = fuzz.ratio(query_normalized, tool.name_text)
     if name_fuzzy > 50:
         name_bonus = (name_fuzzy - 50) / 100.0  # Small bonus for name match
         score += name_bonus * 0.1
@@ -193,8 +271,8 @@ def score_tool_relevance(
     if tool.use_cases:
         best_use_case_score = 0.0
         best_use_case = ""
-        for use_case in tool.use_cases:
-            use_case_ratio = fuzz.partial_ratio(query_normalized, use_case.lower())
+        for use_case, use_case_lower in tool.use_cases:
+            use_case_ratio = fuzz.partial_ratio(query_normalized, use_case_lower)
             if use_case_ratio > best_use_case_score:
                 best_use_case_score = use_case_ratio
                 best_use_case = use_case
@@ -206,12 +284,11 @@ def score_tool_relevance(
                 reasons.append(f"use case: '{best_use_case}'")
 
     # 6. Example matching (bonus)
-    if tool.examples:
-        for example in tool.examples:
-            example_ratio = fuzz.partial_ratio(query_normalized, example.lower())
-            if example_ratio > 80:
-                score += 0.05  # Small bonus for example match
-                reasons.append(f"similar to example: '{example[:40]}...'")
-                break
+    for example, example_lower in tool.examples:
+        example_ratio = fuzz.partial_ratio(query_normalized, example_lower)
+        if example_ratio > 80:
+            score += 0.05  # Small bonus for example match
+            reasons.append(f"similar to example: '{example[:40]}...'")
+            break
 
     return min(1.0, score), reasons
@@ -2,17 +2,25 @@
 
 import json
 import logging
-from typing import Annotated, Any
+from typing import Annotated, Any, Literal
 
+import anyio
 from fastmcp import Context, FastMCP
 from pydantic import Field
 from requests.exceptions import HTTPError
 
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
-from mcp_atlassian.jira.constants import DEFAULT_READ_JIRA_FIELDS
+from mcp_atlassian.jira import JiraFetcher
+from mcp_atlassian.jira.constants import (
+    BATCH_GET_ISSUES_CHUNK_SIZE,
+    DEFAULT_READ_JIRA_FIELDS,
+)
+from mcp_atlassian.models.jira import JiraIssue
 from mcp_atlassian.models.jira.common import JiraUser
 from mcp_atlassian.servers.dependencies import get_jira_fetcher
 from mcp_atlassian.utils.decorators import check_write_access
+from mcp_atlassian.utils.executor import run_blocking
+from mcp_atlassian.utils.paging import stream_results
 
 logger = logging.getLogger(__name__)
 
@@ -47,7 +55,9 @@ async def get_user_profile(
     """
     jira = await get_jira_fetcher(ctx)
     try:
-        user: JiraUser = jira.get_user_profile_by_identifier(user_identifier)
+        user: JiraUser = await run_blocking(
+            "jira", jira.get_user_profile_by_identifier, user_identifier
+        )
         result = user.to_simplified_dict()
         response_data = {"success": True, "user": result}
     except Exception as e:
@@ -151,7 +161,9 @@ async def get_issue(
     if fields and fields != "*all":
         fields_list = [f.strip() for f in fields.split(",")]
 
-    issue = jira.get_issue(
+    issue = await run_blocking(
+        "jira",
+        jira.get_issue,
         issue_key=issue_key,
         fields=fields_list,
         expand=expand,
@@ -218,6 +230,17 @@ async def search(
             default=None,
         ),
     ] = None,
+    total_mode: Annotated[
+        Literal["approximate", "exact", "none"],
+        Field(
+            description=(
+                "(Optional, Cloud only) How to count the total matches: 'approximate' "
+                "(default) uses the fast approximate count, 'exact' the legacy count, "
+                "and 'none' skips counting (total is -1) to save a request."
+            ),
+            default="approximate",
+        ),
+    ] = "approximate",
 ) -> str:
     """Search Jira issues using JQL (Jira Query Language).
 
@@ -229,6 +252,7 @@ async def search(
         start_at: Starting index for pagination.
         projects_filter: Comma-separated list of project keys to filter by.
         expand: Optional fields to expand.
+        total_mode: How to count the total matches on Cloud.
 
     Returns:
         JSON string representing the search results including pagination info.
@@ -238,18 +262,117 @@ async def search(
     if fields and fields != "*all":
         fields_list = [f.strip() for f in fields.split(",")]
 
-    search_result = jira.search_issues(
+    search_result = await run_blocking(
+        "jira",
+        jira.search_issues,
         jql=jql,
         fields=fields_list,
         limit=limit,
         start=start_at,
         expand=expand,
         projects_filter=projects_filter,
+        total_mode=total_mode,
     )
     result = search_result.to_simplified_dict()
     return json.dumps(result, indent=2, ensure_ascii=False)
 
 
+@jira_mcp.tool(tags={"jira", "read"})
+async def search_all(
+    ctx: Context,
+    jql: Annotated[
+        str,
+        Field(
+            description=(
+                "JQL query string (Jira Query Language), e.g. "
+                "'project = PROJ AND status = \"In Progress\" ORDER BY created'"
+            )
+        ),
+    ],
+    fields: Annotated[
+        str,
+        Field(
+            description=(
+                "(Optional) Comma-separated fields to return in the results. "
+                "Use '*all' for all fields, or specify individual fields like 'summary,status,assignee,priority'"
+            ),
+            default=",".join(DEFAULT_READ_JIRA_FIELDS),
+        ),
+    ] = ",".join(DEFAULT_READ_JIRA_FIELDS),
+    max_items: Annotated[
+        int,
+        Field(
+            description="Maximum number of issues to return across all pages (1-1000)",
+            default=200,
+            ge=1,
+            le=1000,
+        ),
+    ] = 200,
+    page_size: Annotated[
+        int,
+        Field(
+            description="Number of issues to request per page (1-100)",
+            default=50,
+            ge=1,
+            le=100,
+        ),
+    ] = 50,
+    projects_filter: Annotated[
+        str | None,
+        Field(
+            description=(
+                "(Optional) Comma-separated list of project keys to filter results by. "
+                "Overrides the environment variable JIRA_PROJECTS_FILTER if provided."
+            ),
+            default=None,
+        ),
+    ] = None,
+    expand: Annotated[
+        str | None,
+        Field(
+            description=(
+                "(Optional) fields to expand. Examples: 'renderedFields', 'transitions', 'changelog'"
+            ),
+            default=None,
+        ),
+    ] = None,
+) -> str:
+    """Search Jira issues using JQL, following pagination across all result pages.
+
+    When the client requests progress notifications, each page is streamed as a
+    notification whose message is a JSON list of issues, and the result only
+    summarizes what was sent. Otherwise all issues are returned in the result.
+
+    Args:
+        ctx: The FastMCP context.
+        jql: JQL query string.
+        fields: Comma-separated fields to return.
+        max_items: Maximum number of issues to return.
+        page_size: Number of issues to request per page.
+        projects_filter: Comma-separated list of project keys to filter by.
+        expand: Optional fields to expand.
+
+    Returns:
+        JSON string with the issue count, whether the issues were streamed and
+        whether max_items was reached, plus the issues if they were not streamed.
+    """
+    jira = await get_jira_fetcher(ctx)
+    fields_list: str | list[str] | None = fields
+    if fields and fields != "*all":
+        fields_list = [f.strip() for f in fields.split(",")]
+
+    issues = jira.iter_issues(
+        jql,
+        fields=fields_list,
+        expand=expand,
+        projects_filter=projects_filter,
+        page_size=page_size,
+        max_items=max_items,
+    )
+    result = await stream_results(ctx, "jira", issues, page_size, max_items)
+    return json.dumps(result, indent=2, ensure_ascii=False)
+
+
 @jira_mcp.tool(tags={"jira", "read"})
 async def search_fields(
     ctx: Context,
@@ -280,7 +403,9 @@ async def search_fields(
         JSON string representing a list of matching field definitions.
     """
     jira = await get_jira_fetcher(ctx)
-    result = jira.search_fields(keyword, limit=limit, refresh=refresh)
+    result = await run_blocking(
+        "jira", jira.search_fields, keyword, limit=limit, refresh=refresh
+    )
     return json.dumps(result, indent=2, ensure_ascii=False)
 
 
@@ -309,8 +434,12 @@ async def get_project_issues(
         JSON string representing the search results including pagination info.
     """
     jira = await get_jira_fetcher(ctx)
-    search_result = jira.get_project_issues(
-        project_key=project_key, start=start_at, limit=limit
+    search_result = await run_blocking(
+        "jira",
+        jira.get_project_issues,
+        project_key=project_key,
+        start=start_at,
+        limit=limit,
     )
     result = search_result.to_simplified_dict()
     return json.dumps(result, indent=2, ensure_ascii=False)
@@ -332,7 +461,7 @@ async def get_transitions(
     """
     jira = await get_jira_fetcher(ctx)
     # Underlying method returns list[dict] in the desired format
-    transitions = jira.get_available_transitions(issue_key)
+    transitions = await run_blocking("jira", jira.get_available_transitions, issue_key)
     return json.dumps(transitions, indent=2, ensure_ascii=False)
 
 
@@ -361,7 +490,9 @@ async def get_comments(
         JSON string representing the comments with author, creation date, and content.
     """
     jira = await get_jira_fetcher(ctx)
-    comments = jira.get_issue_comments(issue_key=issue_key, limit=limit)
+    comments = await run_blocking(
+        "jira", jira.get_issue_comments, issue_key=issue_key, limit=limit
+    )
     result = {
         "issue_key": issue_key,
         "total_comments": len(comments),
@@ -385,7 +516,7 @@ async def get_worklog(
         JSON string representing the worklog entries.
     """
     jira = await get_jira_fetcher(ctx)
-    worklogs = jira.get_worklogs(issue_key)
+    worklogs = await run_blocking("jira", jira.get_worklogs, issue_key)
     result = {"worklogs": worklogs}
     return json.dumps(result, indent=2, ensure_ascii=False)
 
@@ -397,19 +528,36 @@ async def download_attachments(
     target_dir: Annotated[
         str, Field(description="Directory where attachments should be saved")
     ],
+    as_zip: Annotated[
+        bool,
+        Field(
+            description=(
+                "(Optional) Also return the attachments as a base64 encoded zip "
+                "archive in the response (limited to 50 MB uncompressed)"
+            ),
+            default=False,
+        ),
+    ] = False,
 ) -> str:
     """Download attachments from a Jira issue.
 
+    Attachments are downloaded concurrently. Files already in the target
+    directory with an unchanged size and creation time are skipped, and
+    interrupted downloads are resumed.
+
     Args:
         ctx: The FastMCP context.
         issue_key: Jira issue key.
         target_dir: Directory to save attachments.
+        as_zip: Whether to include a zip archive of the attachments.
 
     Returns:
         JSON string indicating the result of the download operation.
     """
     jira = await get_jira_fetcher(ctx)
-    result = jira.download_issue_attachments(issue_key=issue_key, target_dir=target_dir)
+    result = await jira.download_issue_attachments_async(
+        issue_key=issue_key, target_dir=target_dir, as_zip=as_zip
+    )
     return json.dumps(result, indent=2, ensure_ascii=False)
 
 
@@ -452,7 +600,9 @@ async def get_agile_boards(
         JSON string representing a list of board objects.
     """
     jira = await get_jira_fetcher(ctx)
-    boards = jira.get_all_agile_boards_model(
+    boards = await run_blocking(
+        "jira",
+        jira.get_all_agile_boards_model,
         board_name=board_name,
         project_key=project_key,
         board_type=board_type,
@@ -528,7 +678,9 @@ async def get_board_issues(
     if fields and fields != "*all":
         fields_list = [f.strip() for f in fields.split(",")]
 
-    search_result = jira.get_board_issues(
+    search_result = await run_blocking(
+        "jira",
+        jira.get_board_issues,
         board_id=board_id,
         jql=jql,
         fields=fields_list,
@@ -570,8 +722,13 @@ async def get_sprints_from_board(
         JSON string representing a list of sprint objects.
     """
     jira = await get_jira_fetcher(ctx)
-    sprints = jira.get_all_sprints_from_board_model(
-        board_id=board_id, state=state, start=start_at, limit=limit
+    sprints = await run_blocking(
+        "jira",
+        jira.get_all_sprints_from_board_model,
+        board_id=board_id,
+        state=state,
+        start=start_at,
+        limit=limit,
     )
     result = [sprint.to_simplified_dict() for sprint in sprints]
     return json.dumps(result, indent=2, ensure_ascii=False)
@@ -618,8 +775,13 @@ async def get_sprint_issues(
     if fields and fields != "*all":
         fields_list = [f.strip() for f in fields.split(",")]
 
-    search_result = jira.get_sprint_issues(
-        sprint_id=sprint_id, fields=fields_list, start=start_at, limit=limit
+    search_result = await run_blocking(
+        "jira",
+        jira.get_sprint_issues,
+        sprint_id=sprint_id,
+        fields=fields_list,
+        start=start_at,
+        limit=limit,
     )
     result = search_result.to_simplified_dict()
     return json.dumps(result, indent=2, ensure_ascii=False)
@@ -636,7 +798,7 @@ async def get_link_types(ctx: Context) -> str:
         JSON string representing a list of issue link type objects.
     """
     jira = await get_jira_fetcher(ctx)
-    link_types = jira.get_issue_link_types()
+    link_types = await run_blocking("jira", jira.get_issue_link_types)
     formatted_link_types = [link_type.to_simplified_dict() for link_type in link_types]
     return json.dumps(formatted_link_types, indent=2, ensure_ascii=False)
 
@@ -729,7 +891,9 @@ async def create_issue(
     if not isinstance(extra_fields, dict):
         raise ValueError("additional_fields must be a dictionary.")
 
-    issue = jira.create_issue(
+    issue = await run_blocking(
+        "jira",
+        jira.create_issue,
         project_key=project_key,
         summary=summary,
         issue_type=issue_type,
@@ -801,7 +965,9 @@ async def batch_create_issues(
         raise ValueError(f"Invalid input for issues: {e}") from e
 
     # Create issues in batch
-    created_issues = jira.batch_create_issues(issues_list, validate_only=validate_only)
+    created_issues = await run_blocking(
+        "jira", jira.batch_create_issues, issues_list, validate_only=validate_only
+    )
 
     message = (
         "Issues validated successfully"
@@ -867,8 +1033,11 @@ async def batch_get_changelogs(
         )
 
     # Call the underlying method
-    issues_with_changelogs = jira.batch_get_changelogs(
-        issue_ids_or_keys=issue_ids_or_keys, fields=fields
+    issues_with_changelogs = await run_blocking(
+        "jira",
+        jira.batch_get_changelogs,
+        issue_ids_or_keys=issue_ids_or_keys,
+        fields=fields,
     )
 
     # Format the response
@@ -887,6 +1056,116 @@ async def batch_get_changelogs(
     return json.dumps(results, indent=2, ensure_ascii=False)
 
 
+async def _get_issues_by_key_chunked(
+    jira: JiraFetcher,
+    keys: list[str],
+    fields: str | list[str],
+    expand: str | None,
+) -> dict[str, JiraIssue]:
+    """Fetch issues by key, one chunk per Jira worker, concurrently.
+
+    Each chunk is a separate ``get_issues_by_key`` call in the Jira worker
+    pool, so the pool size and the Jira rate limiter bound the requests in
+    flight. The first failing chunk cancels the others and its error is
+    raised as is.
+
+    Args:
+        jira: The Jira fetcher.
+        keys: Deduplicated issue keys, in the requested order.
+        fields: Fields to return.
+        expand: Optional fields to expand.
+
+    Returns:
+        Mapping of requested key to JiraIssue, in the order of keys.
+    """
+    step = BATCH_GET_ISSUES_CHUNK_SIZE
+    chunks = [keys[i : i + step] for i in range(0, len(keys), step)]
+    results: list[dict[str, JiraIssue]] = [{} for _ in chunks]
+    errors: list[Exception] = []
+
+    async def fetch(index: int, chunk: list[str], scope: anyio.CancelScope) -> None:
+        try:
+            results[index] = await run_blocking(
+                "jira", jira.get_issues_by_key, chunk, fields=fields, expand=expand
+            )
+        except Exception as e:  # noqa: BLE001 - re-raised below
+            errors.append(e)
+            scope.cancel()
+
+    async with anyio.create_task_group() as tg:
+        for index, chunk in enumerate(chunks):
+            tg.start_soon(fetch, index, chunk, tg.cancel_scope)
+    if errors:
+        raise errors[0]
+    return {
+        key: issue for chunk_issues in results for key, issue in chunk_issues.items()
+    }
+
+
+@jira_mcp.tool(tags={"jira", "read"})
+async def batch_get_issues(
+    ctx: Context,
+    issue_keys: Annotated[
+        list[str],
+        Field(description="List of Jira issue keys, e.g. ['PROJ-123', 'PROJ-124']"),
+    ],
+    fields: Annotated[
+        str,
+        Field(
+            description=(
+                "(Optional) Comma-separated list of fields to return for every issue "
+                "(e.g., 'summary,status,customfield_10010'). "
+                "Use '*all' for all fields, or omit for essential fields only."
+            ),
+            default=",".join(DEFAULT_READ_JIRA_FIELDS),
+        ),
+    ] = ",".join(DEFAULT_READ_JIRA_FIELDS),
+    expand: Annotated[
+        str | None,
+        Field(
+            description=(
+                "(Optional) Fields to expand for every issue, e.g. 'renderedFields'"
+            ),
+            default=None,
+        ),
+    ] = None,
+) -> str:
+    """Get details of multiple Jira issues in a few batched requests.
+
+    Args:
+        ctx: The FastMCP context.
+        issue_keys: List of issue keys.
+        fields: Comma-separated list of fields to return, '*all' for all fields, or omitted for essentials.
+        expand: Optional fields to expand.
+
+    Returns:
+        JSON string with the issues in the requested order and the keys that were not found.
+
+    Raises:
+        ValueError: If the Jira client is not configured or available.
+    """
+    jira = await get_jira_fetcher(ctx)
+    fields_list: str | list[str] = fields
+    if fields and fields != "*all":
+        fields_list = [f.strip() for f in fields.split(",")]
+
+    requested = list(dict.fromkeys(k.strip() for k in issue_keys if k and k.strip()))
+    if jira.uses_async_backend:
+        issues_by_key = await jira.get_issues_by_key_async(
+            issue_keys, fields=fields_list, expand=expand
+        )
+    else:
+        issues_by_key = await _get_issues_by_key_chunked(
+            jira, requested, fields_list, expand
+        )
+    result = {
+        "total": len(issues_by_key),
+        "issues": [issue.to_simplified_dict() for issue in issues_by_key.values()],
+        "not_found": [key for key in requested if key not in issues_by_key],
+    }
+    return json.dumps(result, indent=2, ensure_ascii=False)
+
+
 @jira_mcp.tool(tags={"jira", "write"})
 @check_write_access
 async def update_issue(
@@ -967,17 +1246,25 @@ async def update_issue(
 
     # Combine fields and additional_fields
     all_updates = {**update_fields, **extra_fields}
-    if attachment_paths:
-        all_updates["attachments"] = attachment_paths
 
     try:
-        issue = jira.update_issue(issue_key=issue_key, **all_updates)
+        issue = await run_blocking(
+            "jira", jira.update_issue, issue_key=issue_key, **all_updates
+        )
+        # Upload the files concurrently, only once the update succeeded
+        attachment_results = None
+        if attachment_paths:
+            try:
+                attachment_results = await jira.upload_attachments_async(
+                    issue_key, attachment_paths
+                )
+            except Exception as e:
+                logger.error(f"Error uploading attachments to {issue_key}: {str(e)}")
+                # Continue with the update even if attachments fail
+                attachment_results = {"success": False, "error": str(e)}
         result = issue.to_simplified_dict()
-        if (
-            hasattr(issue, "custom_fields")
-            and "attachment_results" in issue.custom_fields
-        ):
-            result["attachment_results"] = issue.custom_fields["attachment_results"]
+        if attachment_results:
+            result["attachment_results"] = attachment_results
         return json.dumps(
             {"message": "Issue updated successfully", "issue": result},
             indent=2,
@@ -1007,7 +1294,7 @@ async def delete_issue(
         ValueError: If in read-only mode or Jira client unavailable.
     """
     jira = await get_jira_fetcher(ctx)
-    deleted = jira.delete_issue(issue_key)
+    deleted = await run_blocking("jira", jira.delete_issue, issue_key)
     result = {"message": f"Issue {issue_key} has been deleted successfully."}
     # The underlying method raises on failure, so if we reach here, it's success.
     return json.dumps(result, indent=2, ensure_ascii=False)
@@ -1035,7 +1322,7 @@ async def add_comment(
     """
     jira = await get_jira_fetcher(ctx)
     # add_comment returns dict
-    result = jira.add_comment(issue_key, comment)
+    result = await run_blocking("jira", jira.add_comment, issue_key, comment)
     return json.dumps(result, indent=2, ensure_ascii=False)
 
 
@@ -1094,7 +1381,9 @@ async def add_worklog(
     """
     jira = await get_jira_fetcher(ctx)
     # add_worklog returns dict
-    worklog_result = jira.add_worklog(
+    worklog_result = await run_blocking(
+        "jira",
+        jira.add_worklog,
         issue_key=issue_key,
         time_spent=time_spent,
         comment=comment,
@@ -1131,7 +1420,7 @@ async def link_to_epic(
         ValueError: If in read-only mode or Jira client unavailable.
     """
     jira = await get_jira_fetcher(ctx)
-    issue = jira.link_issue_to_epic(issue_key, epic_key)
+    issue = await run_blocking("jira", jira.link_issue_to_epic, issue_key, epic_key)
     result = {
         "message": f"Issue {issue_key} has been linked to epic {epic_key}.",
         "issue": issue.to_simplified_dict(),
@@ -1203,7 +1492,7 @@ async def create_issue_link(
                 logger.warning("Invalid comment_visibility dictionary structure.")
         link_data["comment"] = comment_obj
 
-    result = jira.create_issue_link(link_data)
+    result = await run_blocking("jira", jira.create_issue_link, link_data)
     return json.dumps(result, indent=2, ensure_ascii=False)
 
 
@@ -1285,7 +1574,9 @@ async def create_remote_issue_link(
     if relationship:
         link_data["relationship"] = relationship
 
-    result = jira.create_remote_issue_link(issue_key, link_data)
+    result = await run_blocking(
+        "jira", jira.create_remote_issue_link, issue_key, link_data
+    )
     return json.dumps(result, indent=2, ensure_ascii=False)
 
 
@@ -1311,7 +1602,9 @@ async def remove_issue_link(
     if not link_id:
         raise ValueError("link_id is required")
 
-    result = jira.remove_issue_link(link_id)  # Returns dict on success
+    result = await run_blocking(
+        "jira", jira.remove_issue_link, link_id
+    )  # Returns dict on success
     return json.dumps(result, indent=2, ensure_ascii=False)
 
 
@@ -1374,7 +1667,9 @@ async def transition_issue(
     if not isinstance(update_fields, dict):
         raise ValueError("fields must be a dictionary.")
 
-    issue = jira.transition_issue(
+    issue = await run_blocking(
+        "jira",
+        jira.transition_issue,
         issue_key=issue_key,
         transition_id=transition_id,
         fields=update_fields,
@@ -1423,7 +1718,9 @@ async def create_sprint(
         ValueError: If in read-only mode or Jira client unavailable.
     """
     jira = await get_jira_fetcher(ctx)
-    sprint = jira.create_sprint(
+    sprint = await run_blocking(
+        "jira",
+        jira.create_sprint,
         board_id=board_id,
         sprint_name=sprint_name,
         start_date=start_date,
@@ -1473,7 +1770,9 @@ async def update_sprint(
         ValueError: If in read-only mode or Jira client unavailable.
     """
     jira = await get_jira_fetcher(ctx)
-    sprint = jira.update_sprint(
+    sprint = await run_blocking(
+        "jira",
+        jira.update_sprint,
         sprint_id=sprint_id,
         sprint_name=sprint_name,
         state=state,
@@ -1498,7 +1797,7 @@ async def get_project_versions(
 ) -> str:
     """Get all fix versions for a specific Jira project."""
     jira = await get_jira_fetcher(ctx)
-    versions = jira.get_project_versions(project_key)
+    versions = await run_blocking("jira", jira.get_project_versions, project_key)
     return json.dumps(versions, indent=2, ensure_ascii=False)
 
 
@@ -1536,7 +1835,9 @@ async def get_development_information(
     jira = await get_jira_fetcher(ctx)
     
     try:
-        dev_info = jira.get_development_information(
+        dev_info = await run_blocking(
+            "jira",
+            jira.get_development_information,
             issue_key=issue_key,
             application_type=application_type
         )
@@ -1588,7 +1889,9 @@ async def get_all_projects(
     """
     try:
         jira = await get_jira_fetcher(ctx)
-        projects = jira.get_all_projects(include_archived=include_archived)
+        projects = await run_blocking(
+            "jira", jira.get_all_projects, include_archived=include_archived
+        )
     except (MCPAtlassianAuthenticationError, HTTPError, OSError, ValueError) as e:
         error_message = ""
         log_level = logging.ERROR
@@ -1657,7 +1960,9 @@ async def create_version(
     """
     jira = await get_jira_fetcher(ctx)
     try:
-        version = jira.create_project_version(
+        version = await run_blocking(
+            "jira",
+            jira.create_project_version,
             project_key=project_key,
             name=name,
             start_date=start_date,
@@ -1731,7 +2036,9 @@ async def batch_create_versions(
             )
             continue
         try:
-            version = jira.create_project_version(
+            version = await run_blocking(
+                "jira",
+                jira.create_project_version,
                 project_key=project_key,
                 name=v["name"],
                 start_date=v.get("startDate"),
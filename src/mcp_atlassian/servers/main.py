@@ -4,8 +4,10 @@ import json
 import logging
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from functools import partial
 from typing import Annotated, Any, Literal, Optional
 
+import anyio
 from cachetools import TTLCache
 from fastmcp import Context, FastMCP
 from fastmcp.tools import Tool as FastMCPTool
@@ -17,12 +19,18 @@ from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoin
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
+from mcp_atlassian.bitbucket import BitbucketFetcher
 from mcp_atlassian.bitbucket.config import BitbucketConfig
+from mcp_atlassian.bitbucket.key_index import (
+    get_key_index_config,
+    run_key_index_refresher,
+)
 from mcp_atlassian.confluence import ConfluenceFetcher
 from mcp_atlassian.confluence.config import ConfluenceConfig
 from mcp_atlassian.jira import JiraFetcher
 from mcp_atlassian.jira.config import JiraConfig
 from mcp_atlassian.utils.environment import get_available_services
+from mcp_atlassian.utils.executor import get_executor_registry
 from mcp_atlassian.utils.io import is_read_only_mode
 from mcp_atlassian.utils.logging import mask_sensitive
 from mcp_atlassian.utils.tools import get_enabled_tools, should_include_tool
@@ -31,6 +39,7 @@ from .bitbucket import bitbucket_mcp
 from .composite import composite_mcp
 from .confluence import confluence_mcp
 from .context import MainAppContext
+from .dependencies import close_fetcher_cache
 from .jira import jira_mcp
 
 logger = logging.getLogger("mcp-atlassian.server.main")
@@ -106,30 +115,74 @@ async def main_lifespan(app: FastMCP[MainAppContext]) -> AsyncIterator[dict]:
     logger.info(f"Read-only mode: {'ENABLED' if read_only else 'DISABLED'}")
     logger.info(f"Enabled tools filter: {enabled_tools or 'All tools enabled'}")
 
-    try:
-        yield {"app_lifespan_context": app_context}
-    except Exception as e:
-        logger.error(f"Error during lifespan: {e}", exc_info=True)
-        raise
-    finally:
-        logger.info("Main Atlassian MCP server lifespan shutting down...")
-        # Perform any necessary cleanup here
+    key_index_config = get_key_index_config()
+    async with anyio.create_task_group() as background:
+        if (
+            loaded_bitbucket_config
+            and key_index_config.enabled
+            and key_index_config.refresh_interval
+        ):
+            logger.info(
+                f"Refreshing the Bitbucket Jira key index every "
+                f"{key_index_config.refresh_interval:g}s"
+            )
+            background.start_soon(
+                run_key_index_refresher,
+                partial(BitbucketFetcher, loaded_bitbucket_config),
+                key_index_config,
+            )
+
         try:
-            # Close any open connections if needed
-            if loaded_jira_config:
-                logger.debug("Cleaning up Jira resources...")
-            if loaded_confluence_config:
-                logger.debug("Cleaning up Confluence resources...")
-            if loaded_bitbucket_config:
-                logger.debug("Cleaning up Bitbucket resources...")
+            yield {"app_lifespan_context": app_context}
         except Exception as e:
-            logger.error(f"Error during cleanup: {e}", exc_info=True)
-        logger.info("Main Atlassian MCP server lifespan shutdown complete.")
+            logger.error(f"Error during lifespan: {e}", exc_info=True)
+            raise
+        finally:
+            background.cancel_scope.cancel()
+            logger.info("Main Atlassian MCP server lifespan shutting down...")
+            # Perform any necessary cleanup here
+            try:
+                # Close any open connections if needed
+                if loaded_jira_config:
+                    logger.debug("Cleaning up Jira resources...")
+                await close_fetcher_cache()
+                if loaded_confluence_config:
+                    logger.debug("Cleaning up Confluence resources...")
+                if loaded_bitbucket_config:
+                    logger.debug("Cleaning up Bitbucket resources...")
+                for service, stats in get_executor_registry().get_stats().items():
+                    logger.debug(f"Worker pool stats for {service}: {stats.to_dict()}")
+            except Exception as e:
+                logger.error(f"Error during cleanup: {e}", exc_info=True)
+            logger.info("Main Atlassian MCP server lifespan shutdown complete.")
+
+
+def _tool_registry_state(server: FastMCP) -> tuple:
+    """Identify the tools registered on a server and its mounted servers.
+
+    The state changes whenever a tool, tool transformation or mounted server
+    is added, replaced or removed, and is computed without building any tool.
+    """
+    tool_manager = server._tool_manager
+    return (
+        tuple((key, id(tool)) for key, tool in tool_manager._tools.items()),
+        tuple((key, id(t)) for key, t in tool_manager.transformations.items()),
+        tuple(
+            (mounted.prefix, id(mounted.server), _tool_registry_state(mounted.server))
+            for mounted in server._mounted_servers
+        ),
+    )
 
 
 class AtlassianMCP(FastMCP[MainAppContext]):
     """Custom FastMCP server class for Atlassian integration with tool filtering."""
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Filtered tool lists by filter settings, valid for one registry state
+        self._tool_list_cache: dict[tuple, list[MCPTool]] = {}
+        self._tool_list_registry_state: tuple | None = None
+
     async def _list_tools_mcp(self) -> list[MCPTool]:
         # Filter tools based on enabled_tools, read_only mode, and service configuration from the lifespan context.
         req_context = self._mcp_server.request_context
@@ -155,6 +208,38 @@ class AtlassianMCP(FastMCP[MainAppContext]):
             if app_lifespan_state
             else None
         )
+
+        # The filtered list only depends on these settings and on the
+        # registered tools, so it is built once and reused until either changes
+        registry_state = _tool_registry_state(self)
+        if registry_state != self._tool_list_registry_state:
+            self._tool_list_cache.clear()
+            self._tool_list_registry_state = registry_state
+        cache_key = (
+            read_only,
+            tuple(enabled_tools_filter) if enabled_tools_filter is not None else None,
+            app_lifespan_state is not None,
+            bool(app_lifespan_state and app_lifespan_state.full_jira_config),
+            bool(app_lifespan_state and app_lifespan_state.full_confluence_config),
+            bool(app_lifespan_state and app_lifespan_state.full_bitbucket_config),
+        )
+        cached_tools = self._tool_list_cache.get(cache_key)
+        if cached_tools is None:
+            cached_tools = await self._filter_tools_mcp(
+                app_lifespan_state,
+                read_only=read_only,
+                enabled_tools_filter=enabled_tools_filter,
+            )
+            self._tool_list_cache[cache_key] = cached_tools
+        return list(cached_tools)
+
+    async def _filter_tools_mcp(
+        self,
+        app_lifespan_state: MainAppContext | None,
+        *,
+        read_only: bool,
+        enabled_tools_filter: list[str] | None,
+    ) -> list[MCPTool]:
         logger.debug(
             f"_main_mcp_list_tools: read_only={read_only}, enabled_tools_filter={enabled_tools_filter}"
         )
@@ -0,0 +1,558 @@
+"""Native async HTTP backend for Atlassian REST APIs.
+
+The fetchers are built on the synchronous ``atlassian-python-api`` client.
+This module provides an optional httpx-based client that speaks the same REST
+endpoints with connection pooling (and HTTP/2 when ``h2`` is installed), so
+bulk operations and composite tools can fan out many requests concurrently
+without tying up worker threads. It applies the same authentication, proxy,
+SSL and custom header settings as the synchronous clients.
+"""
+
+import importlib.util
+import logging
+import os
+from collections.abc import Generator
+from dataclasses import dataclass
+from typing import Any, Literal, Protocol
+from urllib.parse import urlparse
+
+import anyio
+import anyio.to_thread
+import httpx
+
+from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
+
+from .env import get_env_float, get_env_int, is_env_truthy
+from .logging import mask_sensitive
+from .oauth import BYOAccessTokenOAuthConfig, OAuthConfig
+from .rate_limit import (
+    RateLimitConfig,
+    TokenBucket,
+    get_backoff_delay,
+    get_rate_limiter_registry,
+    get_retry_after,
+)
+from .response_cache import invalidate_cached_responses
+
+logger = logging.getLogger("mcp-atlassian.async_http")
+
+HttpBackend = Literal["sync", "async"]
+
+HTTP_BACKENDS: tuple[str, ...] = ("sync", "async")
+
+# Path segment used by the OAuth gateway (api.atlassian.com/ex/{product}/...)
+OAUTH_GATEWAY_PRODUCTS = {"jira": "jira", "confluence": "confluence"}
+
+
+class AsyncClientConfig(Protocol):
+    """Subset of the service configuration used to build an async client."""
+
+    url: str
+    auth_type: str
+    username: str | None
+    api_token: str | None
+    personal_token: str | None
+    ssl_verify: bool
+    http_proxy: str | None
+    https_proxy: str | None
+    no_proxy: str | None
+    socks_proxy: str | None
+    custom_headers: dict[str, str] | None
+
+
+@dataclass
+class AsyncHTTPSettings:
+    """Connection settings for the async HTTP backend.
+
+    Attributes:
+        http2: Whether to negotiate HTTP/2 (requires the ``h2`` package)
+        max_connections: Maximum number of pooled connections (default 100)
+        max_keepalive_connections: Maximum idle keep-alive connections
+            (default 20)
+        keepalive_expiry: Seconds an idle connection is kept open (default 30.0)
+        timeout: Request timeout in seconds (default 30.0)
+    """
+
+    http2: bool = False
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    timeout: float = 30.0
+
+    def limits(self) -> httpx.Limits:
+        """Get the connection pool limits for a transport."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+def get_http_backend(service_name: str) -> HttpBackend:
+    """Read the HTTP backend selection for a service from the environment.
+
+    Args:
+        service_name: Service name (e.g., "JIRA", "CONFLUENCE", "BITBUCKET")
+
+    Returns:
+        "async" if the native async backend is selected, otherwise "sync".
+
+    Environment Variables:
+        ATLASSIAN_HTTP_BACKEND: Global backend, "sync" (default) or "async"
+        {SERVICE}_HTTP_BACKEND: Service-specific backend
+    """
+    backend = "sync"
+    for key in ("ATLASSIAN_HTTP_BACKEND", f"{service_name.upper()}_HTTP_BACKEND"):
+        value = os.getenv(key, "").strip().lower()
+        if not value:
+            continue
+        if value not in HTTP_BACKENDS:
+            logger.warning(
+                f"Invalid value for {key}: {value}, "
+                f"expected one of {', '.join(HTTP_BACKENDS)}"
+            )
+            continue
+        backend = value
+    return backend  # type: ignore[return-value]
+
+
+def get_settings_from_env() -> AsyncHTTPSettings:
+    """Load async HTTP connection settings from environment variables.
+
+    Returns:
+        AsyncHTTPSettings with values from environment or defaults.
+
+    Environment Variables:
+        ATLASSIAN_HTTP2: Enable HTTP/2 when ``h2`` is installed (default false)
+        ATLASSIAN_HTTP_MAX_CONNECTIONS: Connection pool size (default 100)
+        ATLASSIAN_HTTP_MAX_KEEPALIVE: Idle keep-alive connections (default 20)
+        ATLASSIAN_HTTP_TIMEOUT: Request timeout in seconds (default 30)
+    """
+    http2 = is_env_truthy("ATLASSIAN_HTTP2")
+    if http2 and importlib.util.find_spec("h2") is None:
+        logger.warning(
+            "ATLASSIAN_HTTP2 is enabled but the 'h2' package is not installed, "
+            "falling back to HTTP/1.1"
+        )
+        http2 = False
+
+    return AsyncHTTPSettings(
+        http2=http2,
+        max_connections=get_env_int("ATLASSIAN_HTTP_MAX_CONNECTIONS", 100, minimum=1),
+        max_keepalive_connections=get_env_int(
+            "ATLASSIAN_HTTP_MAX_KEEPALIVE", 20, minimum=0
+        ),
+        timeout=get_env_float("ATLASSIAN_HTTP_TIMEOUT", 30.0, minimum=0.0),
+    )
+
+
+class OAuthBearerAuth(httpx.Auth):
+    """httpx auth flow that sends an OAuth access token as a Bearer token.
+
+    Tokens that can be refreshed are checked before each request and
+    refreshed in a worker thread when expired, mirroring
+    ``configure_oauth_session`` for the synchronous clients.
+    """
+
+    def __init__(self, oauth_config: OAuthConfig | BYOAccessTokenOAuthConfig) -> None:
+        """Initialize the auth flow.
+
+        Args:
+            oauth_config: OAuth configuration holding the access token
+        """
+        self.oauth_config = oauth_config
+
+    def _can_refresh(self) -> bool:
+        """Check whether the token can be refreshed."""
+        return isinstance(self.oauth_config, OAuthConfig) and bool(
+            self.oauth_config.refresh_token
+        )
+
+    def _authorize(self, request: httpx.Request) -> None:
+        """Set the Authorization header on a request."""
+        if not self.oauth_config.access_token:
+            error_msg = "OAuth access token is not available"
+            raise MCPAtlassianAuthenticationError(error_msg)
+        request.headers["Authorization"] = f"Bearer {self.oauth_config.access_token}"
+
+    def sync_auth_flow(
+        self, request: httpx.Request
+    ) -> Generator[httpx.Request, httpx.Response, None]:
+        """Authorize a request made with a synchronous httpx client."""
+        if self._can_refresh() and not self.oauth_config.ensure_valid_token():
+            error_msg = "Failed to refresh OAuth access token"
+            raise MCPAtlassianAuthenticationError(error_msg)
+        self._authorize(request)
+        yield request
+
+    async def async_auth_flow(self, request: httpx.Request) -> Any:
+        """Authorize a request, refreshing the token off the event loop."""
+        if self._can_refresh() and self.oauth_config.is_token_expired:
+            refreshed = await anyio.to_thread.run_sync(
+                self.oauth_config.ensure_valid_token
+            )
+            if not refreshed:
+                error_msg = "Failed to refresh OAuth access token"
+                raise MCPAtlassianAuthenticationError(error_msg)
+        self._authorize(request)
+        yield request
+
+
+class AsyncAtlassianClient:
+    """Async REST client for one Atlassian service.
+
+    Requests go through the service's shared rate limiter and are retried on
+    HTTP 429 using the same policy as ``RateLimitedAdapter``. Paths are
+    resolved against the service base URL; absolute URLs are used as-is.
+
+    Attributes:
+        service_name: Service name used for rate limiting and logging
+        base_url: Base URL requests are resolved against
+    """
+
+    def __init__(
+        self,
+        service_name: str,
+        base_url: str,
+        *,
+        auth: httpx.Auth | tuple[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+        verify: bool = True,
+        mounts: dict[str, httpx.AsyncBaseTransport | None] | None = None,
+        settings: AsyncHTTPSettings | None = None,
+        rate_limit_config: RateLimitConfig | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            service_name: Service name (e.g., "jira", "confluence", "bitbucket")
+            base_url: Base URL of the service REST API
+            auth: Optional httpx auth (basic credentials or a custom flow)
+            headers: Default headers sent with every request
+            verify: Whether to verify SSL certificates
+            mounts: Optional per-URL-pattern transports (used for proxies)
+            settings: Connection settings (loaded from env if not provided)
+            rate_limit_config: Retry policy for 429 responses (uses the
+                service configuration if not provided)
+            transport: Optional transport override (primarily for testing)
+        """
+        self.service_name = service_name.lower()
+        self.base_url = base_url.rstrip("/")
+        self.settings = settings or get_settings_from_env()
+        self._rate_limit_config = rate_limit_config
+
+        request_headers = {"Accept": "application/json"}
+        request_headers.update(headers or {})
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            auth=auth,
+            headers=request_headers,
+            verify=verify,
+            http2=self.settings.http2,
+            limits=self.settings.limits(),
+            timeout=self.settings.timeout,
+            mounts=mounts,
+            transport=transport,
+        )
+
+    @property
+    def rate_limiter(self) -> TokenBucket:
+        """The service limiter, looked up in the registry for each request."""
+        return get_rate_limiter_registry().get_limiter(self.service_name)
+
+    @property
+    def rate_limit_config(self) -> RateLimitConfig:
+        """The retry policy for 429 responses."""
+        return self._rate_limit_config or self.rate_limiter.config
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether the underlying connection pool has been closed."""
+        return self._client.is_closed
+
+    async def send(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json: Any = None,
+        data: Any = None,
+        files: Any = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """Send a request with rate limiting and retry on 429.
+
+        Args:
+            method: HTTP method
+            url: Path relative to the base URL, or an absolute URL
+            params: Optional query parameters
+            json: Optional JSON body
+            data: Optional form body
+            files: Optional multipart files
+            headers: Optional per-request headers
+
+        Returns:
+            The final response (which may still be a 429 once retries run out).
+        """
+        rate_limiter = self.rate_limiter
+        retries = 0
+        while True:
+            await rate_limiter.acquire_async()
+
+            logger.debug(f"Sending async {method} request to {url}")
+            response = await self._client.request(
+                method,
+                url,
+                params=params,
+                json=json,
+                data=data,
+                files=files,
+                headers=headers,
+            )
+
+            await rate_limiter.observe_async(response.status_code, response.headers)
+            if response.status_code != 429:
+                if response.status_code < 400:
+                    invalidate_cached_responses(
+                        self.service_name, method, str(response.request.url)
+                    )
+                return response
+
+            retries += 1
+            if retries > self.rate_limit_config.max_retries:
+                logger.error(
+                    f"Max retries ({self.rate_limit_config.max_retries}) exceeded "
+                    f"for {response.request.url}"
+                )
+                return response
+
+            retry_after = get_retry_after(response.headers)
+            wait_time = get_backoff_delay(self.rate_limit_config, retries, retry_after)
+            logger.warning(
+                f"Rate limited (429), waiting {wait_time}s, "
+                f"attempt {retries}/{self.rate_limit_config.max_retries}"
+            )
+            await response.aclose()
+            await anyio.sleep(wait_time)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json: Any = None,
+        data: Any = None,
+        files: Any = None,
+        headers: dict[str, str] | None = None,
+    ) -> Any:
+        """Send a request and return the decoded response body.
+
+        Args:
+            method: HTTP method
+            url: Path relative to the base URL, or an absolute URL
+            params: Optional query parameters
+            json: Optional JSON body
+            data: Optional form body
+            files: Optional multipart files
+            headers: Optional per-request headers
+
+        Returns:
+            The decoded JSON body, the response text for non-JSON bodies, or
+            None for empty responses.
+
+        Raises:
+            httpx.HTTPStatusError: If the response has an error status code
+        """
+        response = await self.send(
+            method,
+            url,
+            params=params,
+            json=json,
+            data=data,
+            files=files,
+            headers=headers,
+        )
+        response.raise_for_status()
+        if not response.content:
+            return None
+        if "json" in response.headers.get("Content-Type", ""):
+            return response.json()
+        return response.text
+
+    async def get(self, url: str, *, params: dict[str, Any] | None = None) -> Any:
+        """Send a GET request and return the decoded body."""
+        return await self.request("GET", url, params=params)
+
+    async def post(
+        self,
+        url: str,
+        *,
+        json: Any = None,
+        params: dict[str, Any] | None = None,
+    ) -> Any:
+        """Send a POST request and return the decoded body."""
+        return await self.request("POST", url, json=json, params=params)
+
+    async def put(
+        self,
+        url: str,
+        *,
+        json: Any = None,
+        params: dict[str, Any] | None = None,
+    ) -> Any:
+        """Send a PUT request and return the decoded body."""
+        return await self.request("PUT", url, json=json, params=params)
+
+    async def delete(self, url: str, *, params: dict[str, Any] | None = None) -> Any:
+        """Send a DELETE request and return the decoded body."""
+        return await self.request("DELETE", url, params=params)
+
+    async def aclose(self) -> None:
+        """Close the connection pool."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncAtlassianClient":
+        """Enter the async context manager."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close the client on exit."""
+        await self.aclose()
+
+
+def _build_proxy_mounts(
+    service_name: str, config: AsyncClientConfig, settings: AsyncHTTPSettings
+) -> dict[str, httpx.AsyncBaseTransport | None]:
+    """Build httpx transport mounts from the proxy settings of a config.
+
+    Args:
+        service_name: Service name used for logging
+        config: Service configuration
+        settings: Connection settings, applied to the proxy transports as to
+            the client's own transport
+
+    Returns:
+        Mapping of URL patterns to transports. Hosts listed in ``no_proxy``
+        are mounted to None so they bypass the proxy.
+    """
+    mounts: dict[str, httpx.AsyncBaseTransport | None] = {}
+
+    def proxy_transport(proxy: str) -> httpx.AsyncHTTPTransport:
+        return httpx.AsyncHTTPTransport(
+            proxy=proxy,
+            verify=config.ssl_verify,
+            http2=settings.http2,
+            limits=settings.limits(),
+        )
+
+    if config.socks_proxy:
+        if importlib.util.find_spec("socksio") is None:
+            logger.warning(
+                f"{service_name} SOCKS proxy is configured but the 'socksio' "
+                "package is not installed, ignoring it for the async backend"
+            )
+        else:
+            transport = proxy_transport(config.socks_proxy)
+            mounts["http://"] = transport
+            mounts["https://"] = transport
+    if config.http_proxy:
+        mounts["http://"] = proxy_transport(config.http_proxy)
+    if config.https_proxy:
+        mounts["https://"] = proxy_transport(config.https_proxy)
+
+    if mounts and config.no_proxy:
+        for host in config.no_proxy.split(","):
+            host = host.strip()
+            if not host:
+                continue
+            if host == "*":
+                return {}
+            # Accept both "example.com" and ".example.com" forms
+            host = host.lstrip(".")
+            if "://" in host:
+                host = urlparse(host).netloc
+            mounts[f"all://{host}"] = None
+            mounts[f"all://*.{host}"] = None
+
+    return mounts
+
+
+def create_async_client(
+    service_name: str,
+    config: AsyncClientConfig,
+    *,
+    settings: AsyncHTTPSettings | None = None,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> AsyncAtlassianClient:
+    """Create an async client using the settings of a service configuration.
+
+    Applies the same auth, SSL, proxy and custom header settings the
+    synchronous clients configure on their ``requests`` session.
+
+    Args:
+        service_name: Service name (e.g., "jira", "confluence", "bitbucket")
+        config: JiraConfig, ConfluenceConfig or BitbucketConfig
+        settings: Optional connection settings (loaded from env if not provided)
+        transport: Optional transport override (primarily for testing)
+
+    Returns:
+        A configured AsyncAtlassianClient.
+
+    Raises:
+        ValueError: If the configuration is incomplete for its auth type
+    """
+    service_key = service_name.lower()
+    settings = settings or get_settings_from_env()
+    base_url = config.url
+    auth: httpx.Auth | tuple[str, str] | None = None
+    headers: dict[str, str] = {}
+
+    if config.auth_type == "oauth":
+        oauth_config = getattr(config, "oauth_config", None)
+        product = OAUTH_GATEWAY_PRODUCTS.get(service_key)
+        if not oauth_config or not oauth_config.cloud_id or not product:
+            error_msg = "OAuth authentication requires a valid cloud_id"
+            raise ValueError(error_msg)
+        base_url = f"https://api.atlassian.com/ex/{product}/{oauth_config.cloud_id}"
+        auth = OAuthBearerAuth(oauth_config)
+    elif config.auth_type == "pat":
+        if not config.personal_token:
+            error_msg = "PAT authentication requires a personal token"
+            raise ValueError(error_msg)
+        headers["Authorization"] = f"Bearer {config.personal_token.strip()}"
+        logger.debug(
+            f"Async {service_name} client using Bearer auth, token (masked): "
+            f"{mask_sensitive(config.personal_token)}"
+        )
+    else:
+        auth = (config.username or "", config.api_token or "")
+
+    if not base_url:
+        error_msg = f"{service_name} URL is required for the async HTTP backend"
+        raise ValueError(error_msg)
+
+    if config.custom_headers:
+        headers.update(config.custom_headers)
+
+    rate_limit_config = get_rate_limiter_registry().get_config(service_key)
+
+    client = AsyncAtlassianClient(
+        service_key,
+        base_url,
+        auth=auth,
+        headers=headers,
+        verify=config.ssl_verify,
+        mounts=_build_proxy_mounts(service_name, config, settings) or None,
+        settings=settings,
+        rate_limit_config=rate_limit_config,
+        transport=transport,
+    )
+    logger.debug(
+        f"Created async {service_name} client for {base_url} "
+        f"(http2={client.settings.http2}, "
+        f"max_connections={client.settings.max_connections})"
+    )
+    return client
@@ -91,3 +91,55 @@ def get_custom_headers(env_var_name: str) -> dict[str, str]:
             headers[key] = value
 
     return headers
+
+
+def get_env_int(env_var_name: str, default: int, minimum: int | None = None) -> int:
+    """Read an integer environment variable, falling back to a default.
+
+    Invalid values, or values below ``minimum``, are ignored.
+
+    Args:
+        env_var_name: Name of the environment variable to read
+        default: Value returned if the variable is unset or invalid
+        minimum: Optional lowest accepted value
+
+    Returns:
+        The parsed integer, or the default
+    """
+    value = os.getenv(env_var_name)
+    if not value or not value.strip():
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        return default
+    if minimum is not None and parsed < minimum:
+        return default
+    return parsed
+
+
+def get_env_float(
+    env_var_name: str, default: float, minimum: float | None = None
+) -> float:
+    """Read a float environment variable, falling back to a default.
+
+    Invalid values, or values below ``minimum``, are ignored.
+
+    Args:
+        env_var_name: Name of the environment variable to read
+        default: Value returned if the variable is unset or invalid
+        minimum: Optional lowest accepted value
+
+    Returns:
+        The parsed float, or the default
+    """
+    value = os.getenv(env_var_name)
+    if not value or not value.strip():
+        return default
+    try:
+        parsed = float(value)
+    except ValueError:
+        return default
+    if minimum is not None and parsed < minimum:
+        return default
+    return parsed
@@ -0,0 +1,451 @@
+"""Worker pool utilities for running blocking Atlassian calls from async tools.
+
+The Jira, Confluence and Bitbucket fetchers are built on the synchronous
+``requests`` library. This module provides bounded, per-service worker pools
+so async tool functions can offload those calls without blocking the event
+loop, along with queue-depth and wait-time metrics for each pool.
+"""
+
+import logging
+import os
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, TypeVar
+
+import anyio
+import anyio.from_thread
+import anyio.to_thread
+import sniffio
+
+logger = logging.getLogger("mcp-atlassian.executor")
+
+T = TypeVar("T")
+
+
+@dataclass
+class ExecutorConfig:
+    """Configuration for a service worker pool.
+
+    Attributes:
+        max_workers: Maximum number of blocking calls running concurrently
+            for the service (default 8)
+    """
+
+    max_workers: int = 8
+
+
+@dataclass
+class ExecutorStats:
+    """Snapshot of worker pool metrics for a service.
+
+    Attributes:
+        max_workers: Configured pool size
+        active: Number of calls currently running in a worker thread
+        queued: Number of calls waiting for a free worker (queue depth)
+        submitted: Total number of calls submitted
+        completed: Total number of calls that returned successfully
+        failed: Total number of calls that raised an exception
+        total_wait_time: Cumulative time in seconds calls spent queued
+        max_wait_time: Longest time in seconds a single call spent queued
+    """
+
+    max_workers: int
+    active: int = 0
+    queued: int = 0
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    total_wait_time: float = 0.0
+    max_wait_time: float = 0.0
+
+    @property
+    def avg_wait_time(self) -> float:
+        """Average time in seconds calls spent queued before running."""
+        started = self.submitted - self.queued
+        if started <= 0:
+            return 0.0
+        return self.total_wait_time / started
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the stats to a dictionary for logging or API responses."""
+        return {
+            "max_workers": self.max_workers,
+            "active": self.active,
+            "queued": self.queued,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "avg_wait_time": round(self.avg_wait_time, 6),
+            "max_wait_time": round(self.max_wait_time, 6),
+        }
+
+
+def get_config_from_env(service_name: str | None = None) -> ExecutorConfig:
+    """Load worker pool configuration from environment variables.
+
+    Service-specific variables take precedence over global ones.
+
+    Args:
+        service_name: Optional service name (e.g., "JIRA", "CONFLUENCE", "BITBUCKET")
+                     for service-specific configuration.
+
+    Returns:
+        ExecutorConfig with values from environment or defaults.
+
+    Environment Variables:
+        ATLASSIAN_MAX_WORKERS: Global worker pool size (default 8)
+        {SERVICE}_MAX_WORKERS: Service-specific worker pool size
+    """
+    max_workers = ExecutorConfig.max_workers
+    keys = ["ATLASSIAN_MAX_WORKERS"]
+    if service_name:
+        keys.append(f"{service_name.upper()}_MAX_WORKERS")
+
+    for key in keys:
+        value = os.getenv(key)
+        if not value:
+            continue
+        try:
+            parsed = int(value)
+        except ValueError:
+            logger.warning(f"Invalid int value for {key}: {value}, ignoring")
+            continue
+        if parsed < 1:
+            logger.warning(f"{key} must be at least 1, got {parsed}, ignoring")
+            continue
+        max_workers = parsed
+
+    return ExecutorConfig(max_workers=max_workers)
+
+
+class ServiceExecutor:
+    """Bounded worker pool for blocking calls made on behalf of one service.
+
+    Calls are executed in anyio worker threads, so the pool works under both
+    asyncio and trio. Concurrency is capped by a capacity limiter sized from
+    the configuration; callers beyond that limit wait in a queue.
+
+    Attributes:
+        service_name: Name of the service this pool serves
+        config: Worker pool configuration
+    """
+
+    def __init__(self, service_name: str, config: ExecutorConfig) -> None:
+        """Initialize the executor.
+
+        Args:
+            service_name: Service name (e.g., "jira", "confluence", "bitbucket")
+            config: Worker pool configuration
+        """
+        self.service_name = service_name
+        self.config = config
+        self._stats = ExecutorStats(max_workers=config.max_workers)
+        self._stats_lock = Lock()
+        # Capacity limiters are bound to an async library, so keep one per library
+        self._limiters: dict[str, anyio.CapacityLimiter] = {}
+
+    def _get_limiter(self) -> anyio.CapacityLimiter:
+        """Get or create the capacity limiter for the running async library."""
+        library = sniffio.current_async_library()
+        limiter = self._limiters.get(library)
+        if limiter is None:
+            limiter = anyio.CapacityLimiter(self.config.max_workers)
+            self._limiters[library] = limiter
+        return limiter
+
+    def get_stats(self) -> ExecutorStats:
+        """Get a snapshot of the pool metrics.
+
+        Returns:
+            Copy of the current ExecutorStats.
+        """
+        with self._stats_lock:
+            return ExecutorStats(**vars(self._stats))
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking callable in the service worker pool.
+
+        Args:
+            func: The blocking callable to run
+            *args: Positional arguments for the callable
+            **kwargs: Keyword arguments for the callable
+
+        Returns:
+            The value returned by the callable.
+
+        Raises:
+            Exception: Any exception raised by the callable is propagated.
+        """
+        return await self._run(func, args, kwargs, abandon_on_cancel=False)
+
+    async def run_cancellable(
+        self, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """Run a blocking callable in the pool, returning as soon as cancelled.
+
+        Unlike ``run``, a cancelled call (e.g. on a timeout) does not wait for
+        the worker thread: the thread finishes its request in the background
+        and its result is discarded. Only use this for calls that are safe to
+        abandon, i.e. reads.
+
+        An abandoned thread keeps its worker slot until it really finishes,
+        so timed out calls never let more than ``max_workers`` threads run
+        for the service.
+
+        Args:
+            func: The blocking callable to run
+            *args: Positional arguments for the callable
+            **kwargs: Keyword arguments for the callable
+
+        Returns:
+            The value returned by the callable.
+
+        Raises:
+            Exception: Any exception raised by the callable is propagated.
+        """
+        return await self._run(func, args, kwargs, abandon_on_cancel=True)
+
+    async def _run(
+        self,
+        func: Callable[..., T],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        *,
+        abandon_on_cancel: bool,
+    ) -> T:
+        """Run a blocking callable in the pool and record its metrics."""
+        submitted_at = time.monotonic()
+        picked_up = False
+        with self._stats_lock:
+            self._stats.submitted += 1
+            self._stats.queued += 1
+
+        def _worker() -> T:
+            nonlocal picked_up
+            wait_time = time.monotonic() - submitted_at
+            with self._stats_lock:
+                picked_up = True
+                self._stats.queued -= 1
+                self._stats.active += 1
+                self._stats.total_wait_time += wait_time
+                self._stats.max_wait_time = max(self._stats.max_wait_time, wait_time)
+            if wait_time > 1.0:
+                logger.debug(
+                    f"{self.service_name} call {getattr(func, '__name__', func)} "
+                    f"waited {wait_time:.2f}s for a worker"
+                )
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                with self._stats_lock:
+                    self._stats.active -= 1
+                    self._stats.failed += 1
+                raise
+            with self._stats_lock:
+                self._stats.active -= 1
+                self._stats.completed += 1
+            return result
+
+        try:
+            if abandon_on_cancel:
+                return await self._run_abandonable(_worker)
+            return await anyio.to_thread.run_sync(_worker, limiter=self._get_limiter())
+        finally:
+            with self._stats_lock:
+                if not picked_up:
+                    # Cancelled while still waiting for a free worker
+                    self._stats.queued -= 1
+
+    async def _run_abandonable(self, worker: Callable[[], T]) -> T:
+        """Run a worker that may be abandoned, holding its slot until it ends.
+
+        anyio gives back the capacity of an abandoned thread as soon as the
+        call is cancelled, while the thread keeps running. The worker slot is
+        therefore acquired here instead, and released by whichever side
+        finishes last: the caller, or the abandoned thread once its call
+        returns.
+        """
+        limiter = self._get_limiter()
+        borrower = object()
+        await limiter.acquire_on_behalf_of(borrower)
+        state_lock = Lock()
+        # pending -> running -> finished, or abandoned if the caller leaves
+        # while running, or cancelled if it leaves before the thread starts
+        state = "pending"
+
+        def release() -> None:
+            limiter.release_on_behalf_of(borrower)
+
+        def _abandonable_worker() -> T | None:
+            nonlocal state
+            with state_lock:
+                if state == "cancelled":
+                    return None
+                state = "running"
+            try:
+                return worker()
+            finally:
+                with state_lock:
+                    abandoned = state == "abandoned"
+                    state = "finished"
+                if abandoned:
+                    try:
+                        anyio.from_thread.run_sync(release)
+                    except Exception as e:  # noqa: BLE001 - event loop is gone
+                        logger.debug(f"Could not release an abandoned worker: {e}")
+
+        try:
+            return await anyio.to_thread.run_sync(  # type: ignore[return-value]
+                _abandonable_worker,
+                abandon_on_cancel=True,
+                # The worker slot is the real bound, this one never waits
+                limiter=anyio.CapacityLimiter(1),
+            )
+        finally:
+            with state_lock:
+                abandoned = state == "running"
+                if abandoned:
+                    state = "abandoned"
+                elif state == "pending":
+                    state = "cancelled"
+            if not abandoned:
+                release()
+
+
+class ExecutorRegistry:
+    """Singleton registry for per-service worker pools.
+
+    Mirrors RateLimiterRegistry: each service gets one pool shared by all
+    sessions, configured from environment variables unless overridden.
+    """
+
+    _instance: "ExecutorRegistry | None" = None
+    _lock = Lock()
+
+    def __new__(cls) -> "ExecutorRegistry":
+        """Ensure singleton instance."""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
+                    cls._instance._executors: dict[str, ServiceExecutor] = {}
+                    cls._instance._configs: dict[str, ExecutorConfig] = {}
+        return cls._instance
+
+    def get_executor(self, service_name: str) -> ServiceExecutor:
+        """Get or create the worker pool for a service.
+
+        Args:
+            service_name: Service name (e.g., "jira", "confluence", "bitbucket")
+
+        Returns:
+            ServiceExecutor for the service
+        """
+        service_key = service_name.lower()
+        if service_key not in self._executors:
+            with self._lock:
+                if service_key not in self._executors:
+                    config = self._configs.get(
+                        service_key, get_config_from_env(service_key)
+                    )
+                    self._executors[service_key] = ServiceExecutor(service_key, config)
+                    logger.debug(
+                        f"Created worker pool for {service_name}: "
+                        f"{config.max_workers} workers"
+                    )
+        return self._executors[service_key]
+
+    def configure(self, service_name: str, config: ExecutorConfig) -> None:
+        """Configure the worker pool for a service.
+
+        If a pool already exists for the service, it will be replaced. Calls
+        already running in the old pool are unaffected.
+
+        Args:
+            service_name: Service name (e.g., "jira", "confluence", "bitbucket")
+            config: Worker pool configuration for the service
+        """
+        service_key = service_name.lower()
+        with self._lock:
+            self._configs[service_key] = config
+            if service_key in self._executors:
+                self._executors[service_key] = ServiceExecutor(service_key, config)
+                logger.info(
+                    f"Reconfigured worker pool for {service_name}: "
+                    f"{config.max_workers} workers"
+                )
+
+    def get_stats(self) -> dict[str, ExecutorStats]:
+        """Get metrics for every worker pool created so far.
+
+        Returns:
+            Mapping of service name to ExecutorStats snapshot.
+        """
+        return {
+            name: executor.get_stats() for name, executor in self._executors.items()
+        }
+
+    def reset(self) -> None:
+        """Reset the registry (primarily for testing).
+
+        Clears all worker pools and configurations.
+        """
+        with self._lock:
+            self._executors.clear()
+            self._configs.clear()
+
+
+def get_executor_registry() -> ExecutorRegistry:
+    """Get the global worker pool registry.
+
+    Returns:
+        The singleton ExecutorRegistry instance.
+    """
+    return ExecutorRegistry()
+
+
+async def run_blocking(
+    service_name: str, func: Callable[..., T], *args: Any, **kwargs: Any
+) -> T:
+    """Run a blocking fetcher call in the worker pool of a service.
+
+    This is the entry point tool functions use to call synchronous fetcher
+    methods without stalling the event loop, e.g.
+    ``await run_blocking("jira", jira.get_issue, issue_key="PROJ-1")``.
+
+    Args:
+        service_name: Service name (e.g., "jira", "confluence", "bitbucket")
+        func: The blocking callable to run
+        *args: Positional arguments for the callable
+        **kwargs: Keyword arguments for the callable
+
+    Returns:
+        The value returned by the callable.
+    """
+    executor = get_executor_registry().get_executor(service_name)
+    return await executor.run(func, *args, **kwargs)
+
+
+async def run_blocking_cancellable(
+    service_name: str, func: Callable[..., T], *args: Any, **kwargs: Any
+) -> T:
+    """Run a blocking read in the worker pool of a service, abandoning it on cancel.
+
+    Same as ``run_blocking``, but a cancelled call returns immediately instead
+    of waiting for the worker thread, so that a timeout around it takes
+    effect even while the HTTP request is still in flight. See
+    ``ServiceExecutor.run_cancellable``.
+
+    Args:
+        service_name: Service name (e.g., "jira", "confluence", "bitbucket")
+        func: The blocking callable to run
+        *args: Positional arguments for the callable
+        **kwargs: Keyword arguments for the callable
+
+    Returns:
+        The value returned by the callable.
+    """
+    executor = get_executor_registry().get_executor(service_name)
+    return await executor.run_cancellable(func, *args, **kwargs)
@@ -0,0 +1,122 @@
+"""Bounded concurrent fan-out for tools that combine many API calls.
+
+Composite tools gather data from many independent requests, e.g. the pull
+requests of every repository in a Bitbucket project. ``fan_out`` runs such
+branches concurrently, at most ``ATLASSIAN_FANOUT_MAX_CONCURRENCY`` at a
+time, and gives each branch ``ATLASSIAN_FANOUT_BRANCH_TIMEOUT`` seconds. A
+failed or timed out branch does not affect the others, so the tool can
+report partial results.
+
+Branches still make their blocking calls through the per-service worker
+pools (see ``executor``), so the Jira, Confluence and Bitbucket pool sizes
+and rate limiters apply across all branches and all concurrent tool calls.
+Blocking reads made by a branch should use ``run_blocking_cancellable`` so
+that its timeout takes effect while a request is in flight.
+"""
+
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+import anyio
+
+from .env import get_env_float, get_env_int
+
+T = TypeVar("T")
+
+DEFAULT_MAX_CONCURRENCY = 16
+DEFAULT_BRANCH_TIMEOUT = 30.0
+
+
+@dataclass
+class BranchResult(Generic[T]):
+    """Outcome of one fan-out branch.
+
+    Attributes:
+        name: Name of the branch, e.g. the repository it scans
+        value: Value returned by the branch, if it completed
+        error: Error message, if the branch failed or timed out
+        timed_out: Whether the branch was cancelled by its timeout
+    """
+
+    name: str
+    value: T | None = None
+    error: str | None = None
+    timed_out: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """Whether the branch completed without error."""
+        return self.error is None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Describe an incomplete branch for a tool response."""
+        return {"branch": self.name, "error": self.error, "timed_out": self.timed_out}
+
+
+def get_max_concurrency() -> int:
+    """Get the number of branches a fan-out runs at once.
+
+    Returns:
+        The value of ATLASSIAN_FANOUT_MAX_CONCURRENCY, or the default.
+    """
+    return get_env_int(
+        "ATLASSIAN_FANOUT_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY, minimum=1
+    )
+
+
+def get_branch_timeout() -> float | None:
+    """Get the time limit of a fan-out branch in seconds.
+
+    Returns:
+        The value of ATLASSIAN_FANOUT_BRANCH_TIMEOUT or the default, or None
+        if it is set to 0 (no limit).
+    """
+    timeout = get_env_float(
+        "ATLASSIAN_FANOUT_BRANCH_TIMEOUT", DEFAULT_BRANCH_TIMEOUT, minimum=0
+    )
+    return timeout or None
+
+
+async def fan_out(
+    branches: Sequence[tuple[str, Callable[[], Awaitable[T]]]],
+    *,
+    max_concurrency: int | None = None,
+    timeout: float | None = None,
+) -> list[BranchResult[T]]:
+    """Run async branches concurrently with a concurrency bound and timeouts.
+
+    Each fan-out has its own bound, so a branch may itself fan out without
+    waiting for slots held by its parent.
+
+    Args:
+        branches: Pairs of branch name and async callable without arguments
+        max_concurrency: Maximum number of branches running at once
+            (defaults to ``get_max_concurrency()``)
+        timeout: Time limit of each branch in seconds, counted from when it
+            starts running (defaults to ``get_branch_timeout()``)
+
+    Returns:
+        The result of each branch, in the order of ``branches``. Errors
+        raised by a branch are captured in its result rather than raised.
+    """
+    limiter = anyio.CapacityLimiter(max_concurrency or get_max_concurrency())
+    if timeout is None:
+        timeout = get_branch_timeout()
+    results: list[BranchResult[T]] = [BranchResult(name) for name, _ in branches]
+
+    async def _run(result: BranchResult[T], call: Callable[[], Awaitable[T]]) -> None:
+        async with limiter:
+            with anyio.move_on_after(timeout) as scope:
+                try:
+                    result.value = await call()
+                except Exception as e:  # noqa: BLE001 - reported per branch
+                    result.error = str(e)
+        if scope.cancelled_caught:
+            result.timed_out = True
+            result.error = f"Timed out after {timeout:g}s"
+
+    async with anyio.create_task_group() as task_group:
+        for result, (_, call) in zip(results, branches, strict=True):
+            task_group.start_soon(_run, result, call)
+    return results
@@ -0,0 +1,240 @@
+"""Pagination utilities for iterating and streaming paged Atlassian results.
+
+The Jira, Confluence and Bitbucket REST APIs return large collections one
+page at a time, following either an offset (``startAt``/``start``), an
+opaque token (``nextPageToken``) or a link (``_links.next``). ``iter_paged``
+turns any of them into a lazy iterator of items with an optional item
+budget, and ``stream_chunks`` hands the items of such an iterator to an
+async tool in chunks while the next chunk is already being fetched.
+``stream_results`` builds on it to send each chunk to the MCP client as a
+progress notification, and ``collect_results`` to return the serialized
+items of all chunks at once.
+"""
+
+import json
+from collections.abc import Awaitable, Callable, Iterator
+from itertools import islice
+from typing import Any, Protocol, TypeVar
+
+import anyio
+from fastmcp import Context
+
+from .executor import run_blocking
+
+T = TypeVar("T")
+C = TypeVar("C")
+
+
+class SimplifiedModel(Protocol):
+    """A model that can be serialized for tool responses."""
+
+    def to_simplified_dict(self) -> dict[str, Any]: ...
+
+
+def iter_paged(
+    fetch_page: Callable[[C, int], tuple[list[T], C | None]],
+    cursor: C,
+    *,
+    page_size: int,
+    max_items: int | None = None,
+) -> Iterator[T]:
+    """Lazily yield the items of a paged collection.
+
+    Pages are requested one at a time, only once the items of the previous
+    page have been consumed. The last page is never requested for more items
+    than the remaining budget.
+
+    Args:
+        fetch_page: Callable taking the cursor of a page and the number of
+            items to request, and returning the items of the page and the
+            cursor of the next page (None on the last page)
+        cursor: Cursor of the first page, e.g. a start index or token
+        page_size: Maximum number of items to request per page
+        max_items: Optional maximum number of items to yield in total
+
+    Yields:
+        The items of each page, in order.
+    """
+    remaining = max_items
+    next_cursor: C | None = cursor
+    while next_cursor is not None and (remaining is None or remaining > 0):
+        limit = page_size if remaining is None else min(page_size, remaining)
+        items, next_cursor = fetch_page(next_cursor, limit)
+        if remaining is not None:
+            items = items[:remaining]
+            remaining -= len(items)
+        if not items:
+            return
+        yield from items
+
+
+def next_offset(
+    start: int, count: int, total: int | None, *, is_last: bool
+) -> int | None:
+    """Get the start index of the next page of an offset-paged collection.
+
+    Args:
+        start: Start index of the current page
+        count: Number of items on the current page
+        total: Total number of items, if the API reports it
+        is_last: Whether the API flagged the current page as the last one
+
+    Returns:
+        The start index of the next page, or None if there are no more pages.
+    """
+    next_start = start + count
+    if is_last or count == 0 or (total is not None and next_start >= total):
+        return None
+    return next_start
+
+
+async def stream_chunks(
+    service: str,
+    items: Iterator[T],
+    chunk_size: int,
+    handle_chunk: Callable[[list[T]], Awaitable[None]],
+) -> int:
+    """Hand the items of a blocking iterator to an async callback in chunks.
+
+    Each chunk is pulled from the iterator in the service worker pool. While
+    a chunk is being handled, the next one is already being pulled, so page
+    requests overlap with serializing and sending the previous page. At most
+    one chunk is fetched ahead.
+
+    Args:
+        service: Service whose worker pool runs the iterator
+        items: Blocking iterator, e.g. from one of the ``iter_*`` methods
+        chunk_size: Number of items per chunk, ideally the page size
+        handle_chunk: Async callable invoked with each chunk, in order
+
+    Returns:
+        The total number of items handled.
+
+    Raises:
+        Exception: The first error raised by the iterator or the callback,
+            unwrapped from the task group.
+    """
+    send, receive = anyio.create_memory_object_stream[list[T]](0)
+    errors: list[Exception] = []
+    handled = 0
+
+    async def _produce() -> None:
+        async with send:
+            try:
+                while chunk := await run_blocking(
+                    service, lambda: list(islice(items, chunk_size))
+                ):
+                    await send.send(chunk)
+            except Exception as e:  # noqa: BLE001 - re-raised below
+                errors.append(e)
+
+    async with anyio.create_task_group() as task_group:
+        task_group.start_soon(_produce)
+        try:
+            async with receive:
+                async for chunk in receive:
+                    await handle_chunk(chunk)
+                    handled += len(chunk)
+        except Exception as e:  # noqa: BLE001 - re-raised below
+            errors.append(e)
+            task_group.cancel_scope.cancel()
+
+    if errors:
+        raise errors[0]
+    return handled
+
+
+async def _simplify_chunk(
+    service: str, chunk: list[SimplifiedModel]
+) -> list[dict[str, Any]]:
+    """Serialize a chunk of models in the service worker pool."""
+    # Serializing may convert content, so keep it off the event loop
+    return await run_blocking(
+        service, lambda: [item.to_simplified_dict() for item in chunk]
+    )
+
+
+async def collect_results(
+    service: str,
+    items: Iterator[SimplifiedModel],
+    chunk_size: int,
+) -> list[dict[str, Any]]:
+    """Serialize the items of a paged iterator, fetching pages ahead.
+
+    Each chunk is serialized while the next one is being fetched, so a tool
+    listing a long collection waits for one page request at a time instead
+    of one page request plus the serialization of the previous page.
+
+    Args:
+        service: Service whose worker pool runs the iterator
+        items: Iterator of models, e.g. from one of the ``iter_*`` methods
+        chunk_size: Number of items per chunk, ideally the page size
+
+    Returns:
+        The simplified items, in order.
+    """
+    collected: list[dict[str, Any]] = []
+
+    async def _handle(chunk: list[SimplifiedModel]) -> None:
+        collected.extend(await _simplify_chunk(service, chunk))
+
+    await stream_chunks(service, items, chunk_size, _handle)
+    return collected
+
+
+async def stream_results(
+    ctx: Context,
+    service: str,
+    items: Iterator[SimplifiedModel],
+    chunk_size: int,
+    max_items: int,
+) -> dict[str, Any]:
+    """Serialize the items of a paged iterator and stream them to the client.
+
+    When the client asked for progress notifications, each chunk is sent as a
+    notification whose message is the JSON list of simplified items, and the
+    result only summarizes what was sent. Otherwise the items are collected
+    and returned in the result.
+
+    Args:
+        ctx: The FastMCP context of the tool call
+        service: Service whose worker pool runs the iterator
+        items: Iterator of models, e.g. from one of the ``iter_*`` methods
+        chunk_size: Number of items per chunk, ideally the page size
+        max_items: The item budget of the iterator, to report whether it was
+            reached
+
+    Returns:
+        Dictionary with the number of items and chunks, whether they were
+        streamed and whether the budget was reached, plus the items
+        themselves when they were not streamed.
+    """
+    meta = ctx.request_context.meta if ctx.request_context else None
+    streamed = meta is not None and meta.progressToken is not None
+    collected: list[dict[str, Any]] = []
+    chunks = 0
+    sent = 0
+
+    async def _handle(chunk: list[SimplifiedModel]) -> None:
+        nonlocal chunks, sent
+        simplified = await _simplify_chunk(service, chunk)
+        chunks += 1
+        if streamed:
+            sent += len(simplified)
+            # The progress is the number of items sent so far
+            await ctx.report_progress(
+                sent, message=json.dumps(simplified, ensure_ascii=False)
+            )
+        else:
+            collected.extend(simplified)
+
+    count = await stream_chunks(service, items, chunk_size, _handle)
+    result: dict[str, Any] = {
+        "count": count,
+        "chunks": chunks,
+        "streamed": streamed,
+        "max_items_reached": count >= max_items,
+    }
+    if not streamed:
+        result["items"] = collected
+    return result
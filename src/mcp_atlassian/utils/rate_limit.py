@@ -4,19 +4,27 @@ This module provides token bucket rate limiting with exponential backoff
 for handling HTTP 429 responses from Atlassian APIs.
 """
 
-import asyncio
 import logging
 import os
 import time
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from threading import Lock
-from typing import Any
+from typing import Any, TypeVar
 
+import anyio
+import anyio.to_thread
 from requests import PreparedRequest, Response, Session
 from requests.adapters import HTTPAdapter
 
+from .rate_limit_backends import BucketOp, RateLimitBackend, get_backend_from_env
+
 logger = logging.getLogger("mcp-atlassian.rate_limit")
 
+_T = TypeVar("_T")
+
 
 @dataclass
 class RateLimitConfig:
@@ -27,12 +35,26 @@ class RateLimitConfig:
         burst_capacity: Maximum number of tokens in the bucket (default 20)
         backoff_base: Base delay in seconds for exponential backoff (default 1.0)
         max_retries: Maximum number of retry attempts for 429 responses (default 5)
+        adaptive: Tune the refill rate from rate limit response headers
+            (default False)
+        min_requests_per_second: Lowest refill rate in adaptive mode (default 1.0)
+        max_requests_per_second: Highest refill rate in adaptive mode
+            (default 100.0)
+        additive_increase: Rate added per successful response in adaptive mode
+            (default 0.1)
+        multiplicative_decrease: Factor applied to the rate on throttling
+            signals in adaptive mode (default 0.5)
     """
 
     requests_per_second: float = 10.0
     burst_capacity: int = 20
     backoff_base: float = 1.0
     max_retries: int = 5
+    adaptive: bool = False
+    min_requests_per_second: float = 1.0
+    max_requests_per_second: float = 100.0
+    additive_increase: float = 0.1
+    multiplicative_decrease: float = 0.5
 
 
 def get_config_from_env(service_name: str | None = None) -> RateLimitConfig:
@@ -57,6 +79,12 @@ def get_config_from_env(service_name: str | None = None) -> RateLimitConfig:
         {SERVICE}_RATE_LIMIT_BURST: Service-specific burst capacity
         {SERVICE}_RATE_LIMIT_BACKOFF_BASE: Service-specific backoff base
         {SERVICE}_RATE_LIMIT_MAX_RETRIES: Service-specific max retries
+        ATLASSIAN_RATE_LIMIT_ADAPTIVE: Enable adaptive rate limiting (default false)
+        ATLASSIAN_RATE_LIMIT_MIN_RPS: Global adaptive rate floor (default 1.0)
+        ATLASSIAN_RATE_LIMIT_MAX_RPS: Global adaptive rate ceiling (default 100.0)
+        {SERVICE}_RATE_LIMIT_ADAPTIVE: Service-specific adaptive mode
+        {SERVICE}_RATE_LIMIT_MIN_RPS: Service-specific adaptive rate floor
+        {SERVICE}_RATE_LIMIT_MAX_RPS: Service-specific adaptive rate ceiling
     """
 
     def get_float(
@@ -107,6 +135,15 @@ def get_config_from_env(service_name: str | None = None) -> RateLimitConfig:
                     )
         return value
 
+    def get_bool(global_key: str, service_key: str | None) -> bool:
+        """Get bool value (default False) from environment with service override."""
+        value = False
+        for key in (global_key, service_key):
+            raw = os.getenv(key) if key else None
+            if raw:
+                value = raw.strip().lower() in ("true", "1", "yes", "y", "on")
+        return value
+
     # Build service-specific env var names if service name provided
     service_prefix = f"{service_name.upper()}_" if service_name else None
 
@@ -131,23 +168,136 @@ def get_config_from_env(service_name: str | None = None) -> RateLimitConfig:
         5,
     )
 
+    adaptive = get_bool(
+        "ATLASSIAN_RATE_LIMIT_ADAPTIVE",
+        f"{service_prefix}RATE_LIMIT_ADAPTIVE" if service_prefix else None,
+    )
+    min_rps = get_float(
+        "ATLASSIAN_RATE_LIMIT_MIN_RPS",
+        f"{service_prefix}RATE_LIMIT_MIN_RPS" if service_prefix else None,
+        1.0,
+    )
+    max_rps = get_float(
+        "ATLASSIAN_RATE_LIMIT_MAX_RPS",
+        f"{service_prefix}RATE_LIMIT_MAX_RPS" if service_prefix else None,
+        100.0,
+    )
+
     return RateLimitConfig(
         requests_per_second=rps,
         burst_capacity=burst,
         backoff_base=backoff,
         max_retries=max_retries,
+        adaptive=adaptive,
+        min_requests_per_second=min_rps,
+        max_requests_per_second=max_rps,
     )
 
 
+def parse_retry_after(retry_after: str | None) -> float | None:
+    """Parse a Retry-After header value.
+
+    Both forms allowed by RFC 9110 are supported: a number of seconds and an
+    HTTP-date (e.g. ``Wed, 21 Oct 2015 07:28:00 GMT``).
+
+    Args:
+        retry_after: Raw header value, or None if the header is absent
+
+    Returns:
+        Retry-After value in seconds (never negative), or None if not
+        present/parseable.
+    """
+    if retry_after is None:
+        return None
+
+    try:
+        # Try parsing as seconds (integer)
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError, IndexError):
+        logger.debug(f"Could not parse Retry-After header: {retry_after}")
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def get_retry_after(headers: Mapping[str, str]) -> float | None:
+    """Get the server-requested retry delay from response headers.
+
+    Jira Cloud sends ``Beta-Retry-After`` instead of ``Retry-After`` when a
+    request is throttled by a beta rate limit.
+
+    Args:
+        headers: Response headers (case-insensitive mapping)
+
+    Returns:
+        Retry delay in seconds, or None if neither header is usable.
+    """
+    retry_after = parse_retry_after(headers.get("Retry-After"))
+    if retry_after is None:
+        retry_after = parse_retry_after(headers.get("Beta-Retry-After"))
+    return retry_after
+
+
+def parse_rate_limit_reset(reset: str | None) -> float | None:
+    """Parse an X-RateLimit-Reset header into seconds from now.
+
+    Jira Cloud sends an ISO 8601 timestamp; epoch seconds are also accepted.
+
+    Args:
+        reset: Raw header value, or None if the header is absent
+
+    Returns:
+        Seconds until the quota resets (never negative), or None if not
+        present/parseable.
+    """
+    if not reset:
+        return None
+
+    now = datetime.now(timezone.utc)
+    try:
+        return max(0.0, float(reset) - now.timestamp())
+    except ValueError:
+        pass
+
+    try:
+        reset_at = datetime.fromisoformat(reset.strip())
+    except ValueError:
+        logger.debug(f"Could not parse X-RateLimit-Reset header: {reset}")
+        return None
+    if reset_at.tzinfo is None:
+        reset_at = reset_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (reset_at - now).total_seconds())
+
+
 class TokenBucket:
     """Token bucket rate limiter with async and sync support.
 
     Implements the token bucket algorithm for rate limiting. Tokens are
     consumed when requests are made and refilled at a constant rate.
 
+    Waiters are scheduled by reservation: each caller takes its token up
+    front, letting the balance go negative, and is told how long to wait
+    for its slot. The lock is only held for that bookkeeping, never while
+    sleeping, so threads and async tasks are served in arrival order
+    without queueing behind one another.
+
+    In adaptive mode the refill rate is tuned from the rate limit headers of
+    each response (see ``observe``): additive increase while requests
+    succeed, multiplicative decrease on 429s and near-limit signals, and a
+    rate derived from ``X-RateLimit-Remaining``/``X-RateLimit-Reset`` when
+    the server reports its remaining quota.
+
     Attributes:
         config: Rate limit configuration
-        tokens: Current number of available tokens
+        rate: Current refill rate in tokens per second
+        tokens: Current number of available tokens (negative while there
+            are outstanding reservations)
         last_refill: Timestamp of last token refill
     """
 
@@ -158,22 +308,16 @@ class TokenBucket:
             config: Rate limit configuration
         """
         self.config = config
+        self.rate: float = config.requests_per_second
         self.tokens: float = float(config.burst_capacity)
         self.last_refill: float = time.monotonic()
         self._lock = Lock()
-        self._async_lock: asyncio.Lock | None = None
-
-    def _get_async_lock(self) -> asyncio.Lock:
-        """Get or create the async lock (lazy initialization)."""
-        if self._async_lock is None:
-            self._async_lock = asyncio.Lock()
-        return self._async_lock
 
     def _refill(self) -> None:
         """Refill tokens based on elapsed time since last refill."""
         now = time.monotonic()
         elapsed = now - self.last_refill
-        tokens_to_add = elapsed * self.config.requests_per_second
+        tokens_to_add = elapsed * self.rate
         self.tokens = min(self.config.burst_capacity, self.tokens + tokens_to_add)
         self.last_refill = now
 
@@ -189,7 +333,7 @@ class TokenBucket:
                 return 0.0
             # Calculate time needed to refill to 1 token
             tokens_needed = 1.0 - self.tokens
-            return tokens_needed / self.config.requests_per_second
+            return tokens_needed / self.rate
 
     def try_acquire(self) -> bool:
         """Attempt to acquire a token without waiting.
@@ -204,32 +348,268 @@ class TokenBucket:
                 return True
             return False
 
+    def reserve(self) -> float:
+        """Reserve the next token slot.
+
+        The token is taken immediately; the caller must wait the returned
+        delay before sending its request, or hand the slot back with
+        ``cancel_reservation`` if it gives up.
+
+        Returns:
+            Time in seconds until the reserved slot, or 0.0 if a token was
+            available.
+        """
+        with self._lock:
+            self._refill()
+            self.tokens -= 1.0
+            if self.tokens >= 0.0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def cancel_reservation(self) -> None:
+        """Return a reserved token that will not be used."""
+        with self._lock:
+            self._refill()
+            self.tokens = min(self.config.burst_capacity, self.tokens + 1.0)
+
+    def set_rate(self, requests_per_second: float) -> None:
+        """Change the refill rate.
+
+        Tokens accrued so far are credited at the old rate first.
+
+        Args:
+            requests_per_second: New refill rate in tokens per second
+        """
+        with self._lock:
+            self._refill()
+            self.rate = requests_per_second
+
+    def defer(self, delay: float) -> None:
+        """Hold back new reservations until ``delay`` seconds from now.
+
+        Reservations already handed out keep their slots.
+
+        Args:
+            delay: Seconds before the next reservation may proceed
+        """
+        with self._lock:
+            self._refill()
+            self.tokens = min(self.tokens, 1.0 - delay * self.rate)
+
+    def observe(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """Tune the refill rate from a response (adaptive mode only).
+
+        Args:
+            status_code: HTTP status code of the response
+            headers: Response headers (case-insensitive mapping)
+        """
+        config = self.config
+        if not config.adaptive:
+            return
+
+        defer_for: float | None = None
+        with self._lock:
+            self._refill()
+            old_rate = self.rate
+            remaining = _parse_header_float(headers.get("X-RateLimit-Remaining"))
+            reset_in = parse_rate_limit_reset(headers.get("X-RateLimit-Reset"))
+
+            if status_code == 429:
+                rate = old_rate * config.multiplicative_decrease
+                defer_for = get_retry_after(headers) or reset_in
+                logger.info(
+                    f"Rate limited (429, reason: "
+                    f"{headers.get('RateLimit-Reason', 'unknown')}), "
+                    f"reducing rate to {max(rate, config.min_requests_per_second):.2f}"
+                    " RPS"
+                )
+            elif remaining is not None and reset_in:
+                # Spread the remaining quota over the time left in the window
+                rate = min(old_rate + config.additive_increase, remaining / reset_in)
+                if remaining < 1:
+                    defer_for = reset_in
+            elif headers.get("X-RateLimit-NearLimit", "").lower() == "true":
+                rate = old_rate * config.multiplicative_decrease
+            elif status_code < 400:
+                rate = old_rate + config.additive_increase
+            else:
+                return
+
+            self.rate = min(
+                config.max_requests_per_second,
+                max(config.min_requests_per_second, rate),
+            )
+
+        if defer_for:
+            self.defer(defer_for)
+        if self.rate < old_rate:
+            logger.debug(f"Adaptive rate lowered: {old_rate:.2f} -> {self.rate:.2f}")
+
     def acquire(self) -> None:
         """Acquire a token, blocking if necessary.
 
         This method will block until a token is available.
         """
-        while True:
-            wait_time = self.get_wait_time()
-            if wait_time <= 0:
-                if self.try_acquire():
-                    return
-            else:
-                time.sleep(wait_time)
+        wait_time = self.reserve()
+        if wait_time > 0:
+            time.sleep(wait_time)
 
     async def acquire_async(self) -> None:
         """Acquire a token asynchronously, waiting if necessary.
 
-        This method will await until a token is available.
+        This method will await until a token is available. If the waiting
+        task is cancelled, its reservation is released.
+        """
+        wait_time = await self._run_async(self.reserve)
+        if wait_time <= 0:
+            return
+        try:
+            await anyio.sleep(wait_time)
+        except BaseException:
+            with anyio.CancelScope(shield=True):
+                await self._run_async(self.cancel_reservation)
+            raise
+
+    async def observe_async(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """Tune the refill rate from a response without blocking the event loop.
+
+        Args:
+            status_code: HTTP status code of the response
+            headers: Response headers (case-insensitive mapping)
+        """
+        if self.config.adaptive:
+            await self._run_async(self.observe, status_code, headers)
+
+    async def _run_async(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Run a bucket operation from async code.
+
+        Local bookkeeping only takes a lock for a few microseconds, so it
+        runs inline.
         """
-        async with self._get_async_lock():
-            while True:
-                wait_time = self.get_wait_time()
-                if wait_time <= 0:
-                    if self.try_acquire():
-                        return
-                else:
-                    await asyncio.sleep(wait_time)
+        return func(*args)
+
+
+class DistributedTokenBucket(TokenBucket):
+    """Token bucket whose state lives in a shared backend.
+
+    Behaves like TokenBucket, but the token balance is kept in a
+    RateLimitBackend so several processes or replicas draw from one budget
+    per service. The refill rate is still decided locally, which lets
+    adaptive mode keep working. If the backend is unreachable, the bucket
+    falls back to its local state until the backend recovers.
+
+    Attributes:
+        backend: Backend holding the shared state
+        key: Bucket key in the backend (the service name)
+    """
+
+    _FALLBACK_LOG_INTERVAL = 60.0
+
+    def __init__(
+        self, config: RateLimitConfig, backend: RateLimitBackend, key: str
+    ) -> None:
+        """Initialize the token bucket.
+
+        Args:
+            config: Rate limit configuration
+            backend: Backend holding the shared bucket state
+            key: Bucket key in the backend (the service name)
+        """
+        super().__init__(config)
+        self.backend = backend
+        self.key = key
+        self._last_fallback_log = 0.0
+
+    def _execute(self, op: BucketOp, amount: float = 1.0) -> tuple[float, float] | None:
+        """Run a bucket operation on the backend.
+
+        Returns:
+            The balances before and after the operation, or None if the
+            backend failed and the caller should use local state.
+        """
+        try:
+            return self.backend.execute(
+                self.key, self.rate, float(self.config.burst_capacity), op, amount
+            )
+        except Exception as e:  # noqa: BLE001 - any backend failure falls back
+            now = time.monotonic()
+            if now - self._last_fallback_log > self._FALLBACK_LOG_INTERVAL:
+                self._last_fallback_log = now
+                logger.warning(
+                    f"Rate limit backend '{self.backend.name}' failed for "
+                    f"{self.key}, using local limits: {e}"
+                )
+            return None
+
+    async def _run_async(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Run a bucket operation from async code.
+
+        Backend operations do blocking network or file I/O, so they run in
+        a worker thread instead of on the event loop.
+        """
+        return await anyio.to_thread.run_sync(func, *args)
+
+    def get_wait_time(self) -> float:
+        """Calculate time to wait for next available token."""
+        result = self._execute("peek")
+        if result is None:
+            return super().get_wait_time()
+        tokens = result[0]
+        return 0.0 if tokens >= 1.0 else (1.0 - tokens) / self.rate
+
+    def try_acquire(self) -> bool:
+        """Attempt to acquire a token without waiting."""
+        result = self._execute("try")
+        if result is None:
+            return super().try_acquire()
+        return result[1] < result[0]
+
+    def reserve(self) -> float:
+        """Reserve the next token slot."""
+        result = self._execute("reserve")
+        if result is None:
+            return super().reserve()
+        tokens = result[1]
+        return 0.0 if tokens >= 0.0 else -tokens / self.rate
+
+    def cancel_reservation(self) -> None:
+        """Return a reserved token that will not be used."""
+        if self._execute("refund") is None:
+            super().cancel_reservation()
+
+    def defer(self, delay: float) -> None:
+        """Hold back new reservations until ``delay`` seconds from now."""
+        if self._execute("cap", 1.0 - delay * self.rate) is None:
+            super().defer(delay)
+
+
+def _parse_header_float(value: str | None) -> float | None:
+    """Parse a numeric header value, returning None if absent or invalid."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def get_backoff_delay(
+    config: RateLimitConfig, attempt: int, retry_after: float | None = None
+) -> float:
+    """Compute the delay before retrying a rate limited (429) request.
+
+    Args:
+        config: Rate limit configuration
+        attempt: Retry attempt number, starting at 1
+        retry_after: Server-provided Retry-After value in seconds, if any
+
+    Returns:
+        Delay in seconds: Retry-After when provided, otherwise exponential
+        backoff from ``backoff_base``.
+    """
+    if retry_after is not None:
+        return retry_after
+    return config.backoff_base * (2 ** (attempt - 1))
 
 
 class RateLimitedAdapter(HTTPAdapter):
@@ -238,6 +618,11 @@ class RateLimitedAdapter(HTTPAdapter):
     This adapter wraps requests to enforce rate limiting using a token bucket
     and handles HTTP 429 (Too Many Requests) responses with exponential backoff.
 
+    An adapter created for a service name looks its limiter up in the
+    RateLimiterRegistry on every request, so limiters replaced later by
+    ``configure`` or ``set_backend`` take effect on sessions that are
+    already mounted.
+
     Attributes:
         rate_limiter: TokenBucket instance for rate limiting
         config: Rate limit configuration
@@ -245,23 +630,55 @@ class RateLimitedAdapter(HTTPAdapter):
 
     def __init__(
         self,
-        rate_limiter: TokenBucket,
+        rate_limiter: TokenBucket | None = None,
         config: RateLimitConfig | None = None,
         *args: Any,
+        service_name: str | None = None,
         **kwargs: Any,
     ) -> None:
         """Initialize the rate limited adapter.
 
         Args:
-            rate_limiter: TokenBucket instance for rate limiting
+            rate_limiter: TokenBucket instance for rate limiting (required
+                unless service_name is given)
             config: Optional rate limit configuration (uses rate_limiter's config
                    if None)
             *args: Additional positional arguments for HTTPAdapter
+            service_name: Service whose registry limiter is used for each
+                request, instead of a fixed rate_limiter
             **kwargs: Additional keyword arguments for HTTPAdapter
+
+        Raises:
+            ValueError: If neither rate_limiter nor service_name is given
         """
+        if rate_limiter is None and service_name is None:
+            error_msg = "RateLimitedAdapter needs a rate_limiter or a service_name"
+            raise ValueError(error_msg)
         super().__init__(*args, **kwargs)
-        self.rate_limiter = rate_limiter
-        self.config = config or rate_limiter.config
+        self._rate_limiter = rate_limiter
+        self._config = config
+        self.service_name = service_name
+
+    @property
+    def rate_limiter(self) -> TokenBucket:
+        """The limiter requests currently draw from."""
+        if self.service_name is not None:
+            return get_rate_limiter_registry().get_limiter(self.service_name)
+        return self._rate_limiter  # type: ignore[return-value]
+
+    @rate_limiter.setter
+    def rate_limiter(self, rate_limiter: TokenBucket) -> None:
+        self._rate_limiter = rate_limiter
+        self.service_name = None
+
+    @property
+    def config(self) -> RateLimitConfig:
+        """The retry policy for 429 responses."""
+        return self._config or self.rate_limiter.config
+
+    @config.setter
+    def config(self, config: RateLimitConfig) -> None:
+        self._config = config
 
     def send(
         self,
@@ -288,10 +705,12 @@ class RateLimitedAdapter(HTTPAdapter):
         Raises:
             Exception: If max retries exceeded on 429 responses
         """
+        rate_limiter = self.rate_limiter
+        config = self._config or rate_limiter.config
         retries = 0
         while True:
             # Acquire rate limit token before sending
-            self.rate_limiter.acquire()
+            rate_limiter.acquire()
 
             logger.debug(f"Sending request to {request.url}")
             response = super().send(
@@ -303,32 +722,31 @@ class RateLimitedAdapter(HTTPAdapter):
                 proxies=proxies,
             )
 
+            if rate_limiter.config.adaptive:
+                rate_limiter.observe(response.status_code, response.headers)
             if response.status_code != 429:
                 return response
 
             # Handle rate limit response
             retries += 1
-            if retries > self.config.max_retries:
+            if retries > config.max_retries:
                 logger.error(
-                    f"Max retries ({self.config.max_retries}) exceeded for "
-                    f"{request.url}"
+                    f"Max retries ({config.max_retries}) exceeded for {request.url}"
                 )
                 return response
 
             # Calculate backoff time
             retry_after = self._parse_retry_after(response)
+            wait_time = get_backoff_delay(config, retries, retry_after)
             if retry_after is not None:
-                wait_time = retry_after
                 logger.warning(
                     f"Rate limited (429), Retry-After: {wait_time}s, "
-                    f"attempt {retries}/{self.config.max_retries}"
+                    f"attempt {retries}/{config.max_retries}"
                 )
             else:
-                # Exponential backoff
-                wait_time = self.config.backoff_base * (2 ** (retries - 1))
                 logger.warning(
                     f"Rate limited (429), exponential backoff: {wait_time}s, "
-                    f"attempt {retries}/{self.config.max_retries}"
+                    f"attempt {retries}/{config.max_retries}"
                 )
 
             time.sleep(wait_time)
@@ -342,19 +760,7 @@ class RateLimitedAdapter(HTTPAdapter):
         Returns:
             Retry-After value in seconds, or None if not present/parseable.
         """
-        retry_after = response.headers.get("Retry-After")
-        if retry_after is None:
-            return None
-
-        try:
-            # Try parsing as seconds (integer)
-            return float(retry_after)
-        except ValueError:
-            pass
-
-        # Could also try parsing as HTTP-date, but Atlassian typically uses seconds
-        logger.debug(f"Could not parse Retry-After header: {retry_after}")
-        return None
+        return get_retry_after(response.headers)
 
 
 class RateLimiterRegistry:
@@ -363,6 +769,10 @@ class RateLimiterRegistry:
     This class manages rate limiters for different Atlassian services,
     allowing service-specific rate limit configurations while sharing
     rate limiters across multiple sessions for the same service.
+
+    When a RateLimitBackend is configured (see ``set_backend`` and
+    ATLASSIAN_RATE_LIMIT_BACKEND), limiters keep their state in it so the
+    budget is shared across processes and replicas as well.
     """
 
     _instance: "RateLimiterRegistry | None" = None
@@ -376,8 +786,63 @@ class RateLimiterRegistry:
                     cls._instance = super().__new__(cls)
                     cls._instance._limiters: dict[str, TokenBucket] = {}
                     cls._instance._configs: dict[str, RateLimitConfig] = {}
+                    cls._instance._backend: RateLimitBackend | None = None
+                    cls._instance._backend_loaded = False
         return cls._instance
 
+    def _create_limiter(self, service_key: str, config: RateLimitConfig) -> TokenBucket:
+        """Create a limiter for a service using the configured backend."""
+        backend = self.get_backend()
+        if backend is None:
+            return TokenBucket(config)
+        return DistributedTokenBucket(config, backend, service_key)
+
+    def get_backend(self) -> RateLimitBackend | None:
+        """Get the shared state backend, loading it from env on first use.
+
+        Returns:
+            The configured backend, or None for per-process limiters.
+        """
+        if not self._backend_loaded:
+            with self._lock:
+                if not self._backend_loaded:
+                    self._backend = get_backend_from_env()
+                    self._backend_loaded = True
+                    if self._backend is not None:
+                        logger.info(f"Using '{self._backend.name}' rate limit backend")
+        return self._backend
+
+    def set_backend(self, backend: RateLimitBackend | None) -> None:
+        """Select the shared state backend for all services.
+
+        Existing limiters are replaced so they use the new backend. Sessions
+        configured with configure_rate_limiting pick up the replacements on
+        their next request.
+
+        Args:
+            backend: Backend to use, or None for per-process limiters
+        """
+        with self._lock:
+            self._backend = backend
+            self._backend_loaded = True
+        for service_key, limiter in list(self._limiters.items()):
+            self._limiters[service_key] = self._create_limiter(
+                service_key, limiter.config
+            )
+
+    def get_config(self, service_name: str) -> RateLimitConfig:
+        """Get the rate limit configuration of a service.
+
+        Args:
+            service_name: Service name (e.g., "jira", "confluence", "bitbucket")
+
+        Returns:
+            The configuration set with ``configure``, or the one from the
+            environment.
+        """
+        service_key = service_name.lower()
+        return self._configs.get(service_key) or get_config_from_env(service_key)
+
     def get_limiter(self, service_name: str) -> TokenBucket:
         """Get or create a rate limiter for a service.
 
@@ -389,8 +854,8 @@ class RateLimiterRegistry:
         """
         service_key = service_name.lower()
         if service_key not in self._limiters:
-            config = self._configs.get(service_key, get_config_from_env(service_key))
-            self._limiters[service_key] = TokenBucket(config)
+            config = self.get_config(service_key)
+            self._limiters[service_key] = self._create_limiter(service_key, config)
             logger.debug(
                 f"Created rate limiter for {service_name}: "
                 f"{config.requests_per_second} RPS, burst {config.burst_capacity}"
@@ -410,7 +875,7 @@ class RateLimiterRegistry:
         self._configs[service_key] = config
         # If limiter already exists, replace it with new config
         if service_key in self._limiters:
-            self._limiters[service_key] = TokenBucket(config)
+            self._limiters[service_key] = self._create_limiter(service_key, config)
             logger.info(
                 f"Reconfigured rate limiter for {service_name}: "
                 f"{config.requests_per_second} RPS, burst {config.burst_capacity}"
@@ -419,10 +884,13 @@ class RateLimiterRegistry:
     def reset(self) -> None:
         """Reset the registry (primarily for testing).
 
-        Clears all configured limiters and configurations.
+        Clears all configured limiters and configurations, and the backend
+        selection (the backend itself is not closed).
         """
         self._limiters.clear()
         self._configs.clear()
+        self._backend = None
+        self._backend_loaded = False
 
 
 def get_rate_limiter_registry() -> RateLimiterRegistry:
@@ -434,7 +902,11 @@ def get_rate_limiter_registry() -> RateLimiterRegistry:
     return RateLimiterRegistry()
 
 
-def configure_rate_limiting(session: Session, service_name: str) -> None:
+def configure_rate_limiting(
+    session: Session,
+    service_name: str,
+    backend: RateLimitBackend | None = None,
+) -> None:
     """Configure rate limiting for a requests session.
 
     This is the main integration function that mounts a RateLimitedAdapter
@@ -443,14 +915,15 @@ def configure_rate_limiting(session: Session, service_name: str) -> None:
     Args:
         session: The requests Session to configure
         service_name: Service name (e.g., "jira", "confluence", "bitbucket")
+        backend: Optional shared state backend to select for all services
+            (defaults to the one chosen by ATLASSIAN_RATE_LIMIT_BACKEND)
     """
     registry = get_rate_limiter_registry()
-    rate_limiter = registry.get_limiter(service_name)
-    config = registry._configs.get(
-        service_name.lower(), get_config_from_env(service_name)
-    )
-
-    adapter = RateLimitedAdapter(rate_limiter, config)
+    if backend is not None and registry.get_backend() is not backend:
+        registry.set_backend(backend)
+    # The adapter resolves the limiter per request, so later calls to
+    # configure() or set_backend() apply to this session as well
+    adapter = RateLimitedAdapter(service_name=service_name.lower())
 
     # Mount for all URLs (rate limiting is per-service, not per-domain)
     session.mount("https://", adapter)
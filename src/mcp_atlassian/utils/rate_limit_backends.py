@@ -0,0 +1,368 @@
+"""Shared state backends for the rate limiter.
+
+By default every process keeps its own token buckets, so N server replicas
+together get N times the configured budget. The backends in this module keep
+the bucket state outside the process so replicas draw from one budget per
+service:
+
+- ``SharedMemoryBackend``: memory-mapped files guarded by ``flock``, for
+  several processes on one host.
+- ``RedisBackend``: a Redis (or Redis-protocol compatible) server, for
+  replicas on different hosts. Updates run as a Lua script so each one is a
+  single atomic round trip.
+
+All backends implement the same atomic bucket operation, so token bucket
+semantics are identical whichever one is selected.
+"""
+
+import logging
+import mmap
+import os
+import re
+import struct
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from threading import Lock
+from typing import Any, Literal
+
+logger = logging.getLogger("mcp-atlassian.rate_limit")
+
+BucketOp = Literal["reserve", "try", "peek", "refund", "cap"]
+
+DEFAULT_KEY_PREFIX = "mcp-atlassian:ratelimit"
+
+
+def apply_bucket_op(
+    tokens: float,
+    last_refill: float,
+    now: float,
+    rate: float,
+    capacity: float,
+    op: BucketOp,
+    amount: float,
+) -> tuple[float, float]:
+    """Refill a bucket and apply one operation to it.
+
+    This is the reference implementation of the operation every backend
+    performs atomically.
+
+    Args:
+        tokens: Stored token balance
+        last_refill: Time the balance was last updated
+        now: Current time on the same clock as ``last_refill``
+        rate: Refill rate in tokens per second
+        capacity: Maximum token balance
+        op: ``reserve`` (always take ``amount``), ``try`` (take ``amount``
+            only if available), ``peek`` (no change), ``refund`` (give
+            ``amount`` back) or ``cap`` (limit the balance to ``amount``)
+        amount: Operation argument
+
+    Returns:
+        Tuple of the balance after refilling and the balance after the
+        operation.
+    """
+    elapsed = max(0.0, now - last_refill)
+    before = min(capacity, tokens + elapsed * rate)
+    after = before
+    if op == "reserve":
+        after = before - amount
+    elif op == "try":
+        if before >= amount:
+            after = before - amount
+    elif op == "refund":
+        after = min(capacity, before + amount)
+    elif op == "cap":
+        after = min(before, amount)
+    return before, after
+
+
+class RateLimitBackend(ABC):
+    """Storage for token bucket state shared between processes."""
+
+    name: str = "backend"
+
+    @abstractmethod
+    def execute(
+        self,
+        key: str,
+        rate: float,
+        capacity: float,
+        op: BucketOp,
+        amount: float = 1.0,
+    ) -> tuple[float, float]:
+        """Atomically refill a bucket and apply an operation.
+
+        Buckets that do not exist yet start full.
+
+        Args:
+            key: Bucket key (the service name)
+            rate: Refill rate in tokens per second
+            capacity: Maximum token balance
+            op: Operation, see ``apply_bucket_op``
+            amount: Operation argument
+
+        Returns:
+            Tuple of the balance after refilling and after the operation.
+        """
+
+    def reset(self, key: str) -> None:  # noqa: B027
+        """Delete the state of a bucket (primarily for testing).
+
+        Args:
+            key: Bucket key
+        """
+
+    def close(self) -> None:  # noqa: B027
+        """Release resources held by the backend."""
+
+
+class SharedMemoryBackend(RateLimitBackend):
+    """Bucket state in memory-mapped files shared by processes on one host.
+
+    Each bucket is a small file holding the balance and the last refill
+    time, mapped into every process and locked with ``flock`` while it is
+    updated. Wall-clock time is used because it is shared across processes.
+    """
+
+    name = "shared"
+    _RECORD = struct.Struct("dd")
+
+    def __init__(self, directory: str | os.PathLike[str] | None = None) -> None:
+        """Initialize the backend.
+
+        Args:
+            directory: Directory holding the bucket files (defaults to
+                ``mcp-atlassian-ratelimit`` in the system temp directory)
+
+        Raises:
+            ValueError: If the platform does not support ``flock``
+        """
+        try:
+            import fcntl
+        except ImportError as e:
+            error_msg = "The shared-memory rate limit backend requires a POSIX platform"
+            raise ValueError(error_msg) from e
+
+        self._fcntl = fcntl
+        self.directory = Path(
+            directory or Path(tempfile.gettempdir()) / "mcp-atlassian-ratelimit"
+        )
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._maps: dict[str, tuple[Any, mmap.mmap]] = {}
+        # flock does not exclude threads of the same process sharing a file
+        self._lock = Lock()
+
+    def _path(self, key: str) -> Path:
+        """Get the bucket file path for a key."""
+        safe_key = re.sub(r"[^A-Za-z0-9_.-]", "_", key)
+        return self.directory / f"{safe_key}.bucket"
+
+    def _open(self, key: str) -> tuple[Any, mmap.mmap]:
+        """Open and map the bucket file for a key, creating it if needed."""
+        entry = self._maps.get(key)
+        if entry is None:
+            fd = os.open(self._path(key), os.O_RDWR | os.O_CREAT, 0o600)
+            file = os.fdopen(fd, "r+b")
+            self._fcntl.flock(file.fileno(), self._fcntl.LOCK_EX)
+            try:
+                if os.fstat(file.fileno()).st_size < self._RECORD.size:
+                    # NaN marks a bucket that has not been used yet
+                    file.write(self._RECORD.pack(float("nan"), 0.0))
+                    file.flush()
+            finally:
+                self._fcntl.flock(file.fileno(), self._fcntl.LOCK_UN)
+            entry = (file, mmap.mmap(file.fileno(), self._RECORD.size))
+            self._maps[key] = entry
+        return entry
+
+    def execute(
+        self,
+        key: str,
+        rate: float,
+        capacity: float,
+        op: BucketOp,
+        amount: float = 1.0,
+    ) -> tuple[float, float]:
+        """Atomically refill a bucket and apply an operation."""
+        with self._lock:
+            file, buffer = self._open(key)
+            self._fcntl.flock(file.fileno(), self._fcntl.LOCK_EX)
+            try:
+                tokens, last_refill = self._RECORD.unpack(buffer[:])
+                now = time.time()
+                if tokens != tokens:  # NaN: new bucket starts full
+                    tokens, last_refill = capacity, now
+                before, after = apply_bucket_op(
+                    tokens, last_refill, now, rate, capacity, op, amount
+                )
+                buffer[:] = self._RECORD.pack(after, now)
+            finally:
+                self._fcntl.flock(file.fileno(), self._fcntl.LOCK_UN)
+        return before, after
+
+    def reset(self, key: str) -> None:
+        """Mark a bucket as unused so it starts full again."""
+        with self._lock:
+            file, buffer = self._open(key)
+            self._fcntl.flock(file.fileno(), self._fcntl.LOCK_EX)
+            try:
+                buffer[:] = self._RECORD.pack(float("nan"), 0.0)
+            finally:
+                self._fcntl.flock(file.fileno(), self._fcntl.LOCK_UN)
+
+    def close(self) -> None:
+        """Unmap and close all bucket files."""
+        with self._lock:
+            for file, buffer in self._maps.values():
+                buffer.close()
+                file.close()
+            self._maps.clear()
+
+
+# KEYS[1]: bucket hash; ARGV: rate, capacity, op, amount, ttl (ms).
+# Numbers are returned as strings because Redis truncates Lua numbers.
+_REDIS_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local op = ARGV[3]
+local amount = tonumber(ARGV[4])
+local ttl = tonumber(ARGV[5])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil or ts == nil then
+  tokens = capacity
+  ts = now
+end
+local before = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local after = before
+if op == 'reserve' then
+  after = before - amount
+elseif op == 'try' then
+  if before >= amount then after = before - amount end
+elseif op == 'refund' then
+  after = math.min(capacity, before + amount)
+elseif op == 'cap' then
+  after = math.min(before, amount)
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(after), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], ttl)
+return {tostring(before), tostring(after)}
+"""
+
+
+class RedisBackend(RateLimitBackend):
+    """Bucket state in a Redis (or Redis-protocol compatible) server.
+
+    Each update is one Lua script call, which refills and updates the bucket
+    atomically using the server clock, so replicas on different hosts share
+    one consistent budget. Idle buckets expire once they would be full again.
+    """
+
+    name = "redis"
+
+    def __init__(
+        self,
+        url: str | None = None,
+        *,
+        client: Any = None,
+        key_prefix: str = DEFAULT_KEY_PREFIX,
+    ) -> None:
+        """Initialize the backend.
+
+        Args:
+            url: Redis URL (e.g. ``redis://localhost:6379/0``)
+            client: Optional pre-built Redis client, used instead of ``url``
+            key_prefix: Prefix for bucket keys, so several deployments can
+                share one server
+
+        Raises:
+            ValueError: If neither a URL nor a client is given, or the
+                ``redis`` package is not installed
+        """
+        if client is None:
+            if not url:
+                error_msg = "The Redis rate limit backend requires a URL"
+                raise ValueError(error_msg)
+            try:
+                import redis
+            except ImportError as e:
+                error_msg = (
+                    "The Redis rate limit backend requires the 'redis' package "
+                    "(pip install 'mcp-atlassian[redis]')"
+                )
+                raise ValueError(error_msg) from e
+            client = redis.Redis.from_url(url, socket_timeout=5.0)
+        self.client = client
+        self.key_prefix = key_prefix
+        self._script = client.register_script(_REDIS_BUCKET_SCRIPT)
+
+    def _key(self, key: str) -> str:
+        """Get the Redis key for a bucket."""
+        return f"{self.key_prefix}:{key}"
+
+    def execute(
+        self,
+        key: str,
+        rate: float,
+        capacity: float,
+        op: BucketOp,
+        amount: float = 1.0,
+    ) -> tuple[float, float]:
+        """Atomically refill a bucket and apply an operation."""
+        # Keep state while there is debt to pay back, then let it expire
+        ttl_ms = int(1000 * (capacity + 1.0) / rate) + 60_000
+        before, after = self._script(
+            keys=[self._key(key)],
+            args=[repr(rate), repr(capacity), op, repr(amount), ttl_ms],
+        )
+        return float(before), float(after)
+
+    def reset(self, key: str) -> None:
+        """Delete a bucket."""
+        self.client.delete(self._key(key))
+
+    def close(self) -> None:
+        """Close the Redis connection pool."""
+        self.client.close()
+
+
+def get_backend_from_env() -> RateLimitBackend | None:
+    """Create the rate limit backend selected by environment variables.
+
+    Returns:
+        The configured backend, or None for per-process (in-memory) buckets.
+
+    Environment Variables:
+        ATLASSIAN_RATE_LIMIT_BACKEND: "memory" (default), "shared" or "redis"
+        ATLASSIAN_RATE_LIMIT_SHM_DIR: Directory for the shared-memory backend
+        ATLASSIAN_RATE_LIMIT_REDIS_URL: Redis URL for the Redis backend
+        ATLASSIAN_RATE_LIMIT_KEY_PREFIX: Key prefix for the Redis backend
+    """
+    backend = os.getenv("ATLASSIAN_RATE_LIMIT_BACKEND", "memory").strip().lower()
+    if backend in ("", "memory"):
+        return None
+
+    try:
+        if backend == "shared":
+            return SharedMemoryBackend(os.getenv("ATLASSIAN_RATE_LIMIT_SHM_DIR"))
+        if backend == "redis":
+            return RedisBackend(
+                os.getenv("ATLASSIAN_RATE_LIMIT_REDIS_URL"),
+                key_prefix=os.getenv(
+                    "ATLASSIAN_RATE_LIMIT_KEY_PREFIX", DEFAULT_KEY_PREFIX
+                ),
+            )
+    except ValueError as e:
+        logger.error(f"{e}; falling back to in-memory rate limiting")
+        return None
+
+    logger.warning(
+        f"Unknown ATLASSIAN_RATE_LIMIT_BACKEND '{backend}', "
+        "using in-memory rate limiting"
+    )
+    return None
@@ -0,0 +1,1002 @@
+"""Read-through response cache for Atlassian API requests.
+
+Agents often fetch the same issue, page or pull request several times within
+a few minutes. ``CachingAdapter`` wraps the transport adapters of a requests
+session and answers repeated GET requests for cacheable resources from a
+``ResponseCache``:
+
+- Entries are keyed by service, credential scope (a hash of the credentials
+  sent with the request), URL and Accept header, so users never see each
+  other's responses.
+- Each cacheable resource has a rule with its own TTL.
+- Stale entries are revalidated instead of refetched: with ``If-None-Match``
+  or ``If-Modified-Since`` when the server sent an ``ETag`` or
+  ``Last-Modified`` header, or with a cheap probe of the resource's update
+  marker (e.g. the ``updated`` field of a Jira issue).
+- Successful writes (PUT/POST/DELETE) through the same session invalidate
+  the entries of the resource they touch, so our own write tools never
+  leave stale reads behind. Writes whose resource cannot be identified
+  invalidate all entries of the service. POST requests to known read-only
+  endpoints (e.g. JQL searches and bulk fetches) invalidate nothing.
+
+Responses are held in an in-memory LRU and, if a path is configured, in a
+SQLite database shared by processes on the host. Invalidations made by one
+process reach the memory tier of the others through a generation counter in
+the database.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from threading import Lock
+from typing import Any
+from urllib.parse import urlencode, urlsplit, urlunsplit
+
+from requests import PreparedRequest, Response, Session
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from .env import get_env_int, is_env_extended_truthy
+
+logger = logging.getLogger("mcp-atlassian.response_cache")
+
+# Response header telling callers how a response was served
+CACHE_STATUS_HEADER = "X-MCP-Atlassian-Cache"
+
+# Headers that are never stored with a cached response
+_UNCACHED_HEADERS = frozenset({"set-cookie", "content-encoding", "transfer-encoding"})
+
+_WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+# Optional context path before the REST API path (e.g. /wiki, /jira)
+_PREFIX = r"(?:/.*)?"
+
+
+@dataclass(frozen=True)
+class CacheRule:
+    """A cacheable resource.
+
+    Attributes:
+        resource: Resource name, used for TTL overrides
+        pattern: Regular expression matching the full URL path
+        ttl: Seconds a response is served without revalidation
+        version_path: JSON path to the resource's update marker
+        probe_params: Query parameters of a cheap request returning the
+            update marker, used to revalidate entries without an ETag
+        id_fields: Response fields identifying the resource, used to tag
+            entries for invalidation (e.g. both ``id`` and ``key``)
+    """
+
+    resource: str
+    pattern: re.Pattern[str]
+    ttl: float
+    version_path: tuple[str, ...] = ()
+    probe_params: dict[str, str] = field(default_factory=dict)
+    id_fields: tuple[str, ...] = ()
+
+
+def _rule(resource: str, pattern: str, ttl: float, **kwargs: Any) -> CacheRule:
+    """Create a cache rule, compiling its path pattern."""
+    return CacheRule(resource, re.compile(_PREFIX + pattern), ttl, **kwargs)
+
+
+_JIRA_API = r"/rest/api/(?:2|3|latest)"
+_CONFLUENCE_API = r"/rest/api"
+_BITBUCKET_REPO = r"/rest/api/(?:1\.0|latest)/projects/[^/]+/repos/[^/]+"
+_BITBUCKET_CLOUD_REPO = r"/2\.0/repositories/[^/]+/[^/]+"
+
+CACHE_RULES: dict[str, tuple[CacheRule, ...]] = {
+    "jira": (
+        _rule(
+            "issue",
+            rf"{_JIRA_API}/issue/[^/]+",
+            60,
+            version_path=("fields", "updated"),
+            probe_params={"fields": "updated"},
+            id_fields=("id", "key"),
+        ),
+        _rule(
+            "issue_detail",
+            rf"{_JIRA_API}/issue/[^/]+/(?:comment|worklog|transitions|remotelink)",
+            30,
+        ),
+        _rule("field", rf"{_JIRA_API}/field", 3600),
+        _rule("link_type", rf"{_JIRA_API}/issueLinkType", 3600),
+        _rule("project", rf"{_JIRA_API}/project(?:/[^/]+(?:/versions)?)?", 300),
+        _rule("user", rf"{_JIRA_API}/(?:myself|user)", 600),
+    ),
+    "confluence": (
+        _rule(
+            "page",
+            rf"{_CONFLUENCE_API}/content/\d+",
+            120,
+            version_path=("version", "number"),
+            probe_params={"expand": "version"},
+            id_fields=("id",),
+        ),
+        _rule(
+            "page_detail",
+            rf"{_CONFLUENCE_API}/content/\d+/(?:child|descendant)/\w+",
+            60,
+        ),
+        _rule("page_detail", rf"{_CONFLUENCE_API}/content/\d+/label", 60),
+        _rule(
+            "page",
+            r"/api/v2/(?:pages|blogposts)/\d+",
+            120,
+            version_path=("version", "number"),
+            id_fields=("id",),
+        ),
+        _rule("space", rf"{_CONFLUENCE_API}/space(?:/[^/]+)?", 600),
+        _rule("user", rf"{_CONFLUENCE_API}/user(?:/current)?", 600),
+    ),
+    "bitbucket": (
+        _rule("pull_request", rf"{_BITBUCKET_REPO}/pull-requests/\d+", 60),
+        _rule(
+            "pull_request_detail",
+            rf"{_BITBUCKET_REPO}/pull-requests/\d+/(?:activities|changes|commits|diff)",
+            60,
+        ),
+        _rule("pull_request", rf"{_BITBUCKET_CLOUD_REPO}/pullrequests/\d+", 60),
+        _rule(
+            "pull_request_detail",
+            rf"{_BITBUCKET_CLOUD_REPO}/pullrequests/\d+/(?:activity|comments|commits|diff)",
+            60,
+        ),
+        _rule(
+            "repository",
+            r"/rest/api/(?:1\.0|latest)/projects(?:/[^/]+(?:/repos(?:/[^/]+)?)?)?",
+            300,
+        ),
+        _rule("repository", r"/2\.0/repositories/[^/]+(?:/[^/]+)?", 300),
+    ),
+}
+
+# Patterns identifying the resource a request is about. Cached entries are
+# tagged with these identities, and writes invalidate entries sharing one.
+IDENTITY_PATTERNS: dict[str, tuple[tuple[str, re.Pattern[str]], ...]] = {
+    "jira": (("issue", re.compile(rf"{_JIRA_API}/issue/(?P<id>[^/?]+)")),),
+    "confluence": (
+        ("page", re.compile(rf"{_CONFLUENCE_API}/content/(?P<id>\d+)")),
+        ("page", re.compile(r"/api/v2/(?:pages|blogposts)/(?P<id>\d+)")),
+    ),
+    "bitbucket": (
+        (
+            "pull_request",
+            re.compile(
+                r"/rest/api/(?:1\.0|latest)/projects/(?P<project>[^/]+)"
+                r"/repos/(?P<repo>[^/]+)/pull-requests/(?P<id>\d+)"
+            ),
+        ),
+        (
+            "pull_request",
+            re.compile(
+                r"/2\.0/repositories/(?P<project>[^/]+)/(?P<repo>[^/]+)"
+                r"/pullrequests/(?P<id>\d+)"
+            ),
+        ),
+    ),
+}
+
+# POST endpoints that only read, e.g. searches taking their query as a body.
+# Successful requests to them never invalidate cached responses.
+READ_ONLY_POSTS: dict[str, re.Pattern[str]] = {
+    "jira": re.compile(
+        _PREFIX
+        + rf"{_JIRA_API}/(?:search(?:/jql|/approximate-count)?"
+        + r"|issue/bulkfetch|changelog/bulkfetch|expression/eval)"
+    ),
+}
+
+
+@dataclass
+class ResponseCacheConfig:
+    """Configuration of the response cache.
+
+    Attributes:
+        enabled: Whether responses are cached (default False)
+        max_entries: Responses kept in memory (default 512)
+        path: SQLite database for the shared on-disk tier (default None,
+            memory only)
+        ttl_overrides: TTL in seconds per resource name, replacing the
+            rule defaults
+        max_entry_bytes: Largest response body that is cached (default 2 MiB)
+        max_stale: Seconds an expired entry is kept for revalidation
+            (default 1 day)
+    """
+
+    enabled: bool = False
+    max_entries: int = 512
+    path: str | None = None
+    ttl_overrides: dict[str, float] = field(default_factory=dict)
+    max_entry_bytes: int = 2 * 1024 * 1024
+    max_stale: float = 86400.0
+
+
+def _parse_ttls(value: str) -> dict[str, float]:
+    """Parse TTL overrides in the form ``issue=120,page=300``."""
+    ttls: dict[str, float] = {}
+    for item in value.split(","):
+        name, sep, seconds = item.partition("=")
+        if not sep:
+            continue
+        try:
+            ttls[name.strip().lower()] = float(seconds)
+        except ValueError:
+            logger.warning(f"Invalid response cache TTL '{item.strip()}', ignoring")
+    return ttls
+
+
+def get_config_from_env(service_name: str | None = None) -> ResponseCacheConfig:
+    """Load response cache configuration from environment variables.
+
+    Args:
+        service_name: Optional service name (e.g., "JIRA") for the
+            service-specific enable switch
+
+    Returns:
+        ResponseCacheConfig with values from environment or defaults.
+
+    Environment Variables:
+        ATLASSIAN_RESPONSE_CACHE: Enable the response cache (default false)
+        {SERVICE}_RESPONSE_CACHE: Service-specific enable switch
+        ATLASSIAN_RESPONSE_CACHE_SIZE: Responses kept in memory (default 512)
+        ATLASSIAN_RESPONSE_CACHE_PATH: SQLite file for the on-disk tier
+        ATLASSIAN_RESPONSE_CACHE_TTLS: TTL overrides, e.g. "issue=120,page=300"
+    """
+    enabled = is_env_extended_truthy("ATLASSIAN_RESPONSE_CACHE")
+    service_key = f"{service_name.upper()}_RESPONSE_CACHE" if service_name else None
+    if service_key and os.getenv(service_key):
+        enabled = is_env_extended_truthy(service_key)
+    return ResponseCacheConfig(
+        enabled=enabled,
+        max_entries=get_env_int("ATLASSIAN_RESPONSE_CACHE_SIZE", 512, minimum=1),
+        path=os.getenv("ATLASSIAN_RESPONSE_CACHE_PATH") or None,
+        ttl_overrides=_parse_ttls(os.getenv("ATLASSIAN_RESPONSE_CACHE_TTLS", "")),
+    )
+
+
+@dataclass
+class CachedResponse:
+    """A stored response and its freshness metadata."""
+
+    status: int
+    headers: dict[str, str]
+    content: bytes
+    encoding: str | None
+    expires_at: float
+    stored_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+    version: str | None = None
+    tags: frozenset[str] = frozenset()
+
+
+class SQLiteResponseStore:
+    """On-disk tier of the response cache, shared by local processes."""
+
+    def __init__(self, path: str | os.PathLike[str], max_stale: float) -> None:
+        """Open (and create if needed) the cache database.
+
+        Args:
+            path: SQLite database file
+            max_stale: Seconds expired entries are kept before being purged
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_stale = max_stale
+        self._lock = Lock()
+        self._writes = 0
+        self._conn = sqlite3.connect(
+            self.path, timeout=5.0, check_same_thread=False, isolation_level=None
+        )
+        os.chmod(self.path, 0o600)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                content BLOB NOT NULL,
+                encoding TEXT,
+                expires_at REAL NOT NULL,
+                stored_at REAL NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                version TEXT
+            );
+            CREATE TABLE IF NOT EXISTS tags (
+                tag TEXT NOT NULL,
+                key TEXT NOT NULL REFERENCES responses(key) ON DELETE CASCADE
+            );
+            CREATE INDEX IF NOT EXISTS tags_tag ON tags(tag);
+            CREATE INDEX IF NOT EXISTS tags_key ON tags(key);
+            CREATE TABLE IF NOT EXISTS generation (
+                id INTEGER PRIMARY KEY CHECK (id = 0),
+                value INTEGER NOT NULL
+            );
+            INSERT OR IGNORE INTO generation VALUES (0, 0);
+            """
+        )
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self.purge()
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Load an entry."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, headers, content, encoding, expires_at, stored_at, "
+                "etag, last_modified, version FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            tags = self._conn.execute(
+                "SELECT tag FROM tags WHERE key = ?", (key,)
+            ).fetchall()
+        status, headers, content, encoding, expires, stored, etag, modified, ver = row
+        return CachedResponse(
+            status=status,
+            headers=json.loads(headers),
+            content=bytes(content),
+            encoding=encoding,
+            expires_at=expires,
+            stored_at=stored,
+            etag=etag,
+            last_modified=modified,
+            version=ver,
+            tags=frozenset(tag for (tag,) in tags),
+        )
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        """Store an entry, replacing any previous one."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.execute(
+                    "INSERT INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        entry.status,
+                        json.dumps(entry.headers),
+                        entry.content,
+                        entry.encoding,
+                        entry.expires_at,
+                        entry.stored_at,
+                        entry.etag,
+                        entry.last_modified,
+                        entry.version,
+                    ),
+                )
+                self._conn.executemany(
+                    "INSERT INTO tags VALUES (?, ?)", [(t, key) for t in entry.tags]
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._writes += 1
+        if self._writes % 100 == 0:
+            self.purge()
+
+    def touch(self, key: str, expires_at: float) -> None:
+        """Extend the freshness of an entry after revalidation."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET expires_at = ? WHERE key = ?", (expires_at, key)
+            )
+
+    def generation(self) -> int:
+        """Get the invalidation counter, bumped by every delete."""
+        with self._lock:
+            (value,) = self._conn.execute(
+                "SELECT value FROM generation WHERE id = 0"
+            ).fetchone()
+        return value
+
+    def _delete(self, query: str, params: Iterable[Any]) -> int:
+        """Run a delete and bump the generation in one transaction.
+
+        Returns:
+            The generation after the delete
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(query, tuple(params))
+                self._conn.execute(
+                    "UPDATE generation SET value = value + 1 WHERE id = 0"
+                )
+                (value,) = self._conn.execute(
+                    "SELECT value FROM generation WHERE id = 0"
+                ).fetchone()
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return value
+
+    def delete_tags(self, tags: Iterable[str]) -> int | None:
+        """Delete entries carrying any of the tags.
+
+        Returns:
+            The generation after the delete, or None if there was nothing to do
+        """
+        tags = list(tags)
+        if not tags:
+            return None
+        placeholders = ", ".join("?" * len(tags))
+        # Only "?" placeholders are interpolated; tags are bound parameters
+        query = (
+            "DELETE FROM responses WHERE key IN "  # noqa: S608
+            f"(SELECT key FROM tags WHERE tag IN ({placeholders}))"
+        )
+        return self._delete(query, tags)
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Delete entries whose key starts with a prefix.
+
+        Returns:
+            The generation after the delete
+        """
+        return self._delete(
+            "DELETE FROM responses WHERE substr(key, 1, ?) = ?", (len(prefix), prefix)
+        )
+
+    def purge(self) -> None:
+        """Delete entries that expired longer than ``max_stale`` ago."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM responses WHERE expires_at < ?",
+                (time.time() - self.max_stale,),
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class ResponseCache:
+    """Two-tier store of cached responses.
+
+    The memory tier is an LRU of at most ``max_entries`` responses. When a
+    path is configured, entries are also written to a SQLite database, which
+    survives restarts and is shared by processes on the host.
+
+    Invalidations bump a generation counter in the database. Before serving
+    from memory, the cache compares it with the generation its memory tier
+    was filled under and drops the memory tier if another process has
+    invalidated entries since, so writes made through any process are seen
+    by all of them.
+    """
+
+    def __init__(self, config: ResponseCacheConfig | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            config: Cache configuration (defaults to the environment)
+        """
+        self.config = config or get_config_from_env()
+        self._memory: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = Lock()
+        self._generation = 0
+        self.store: SQLiteResponseStore | None = None
+        if self.config.path:
+            try:
+                self.store = SQLiteResponseStore(
+                    self.config.path, self.config.max_stale
+                )
+                self._generation = self.store.generation()
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(
+                    f"Cannot open response cache at {self.config.path}: {e}; "
+                    "using memory only"
+                )
+
+    def ttl_for(self, rule: CacheRule) -> float:
+        """Get the TTL of a rule, applying configured overrides."""
+        return self.config.ttl_overrides.get(rule.resource, rule.ttl)
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Look up an entry, including expired ones kept for revalidation.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The entry, or None if it is not cached
+        """
+        if self.store is not None:
+            self._sync_generation()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry
+        if self.store is None:
+            return None
+        try:
+            entry = self.store.get(key)
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache read failed: {e}")
+            return None
+        if entry is not None:
+            self._remember(key, entry)
+        return entry
+
+    def _sync_generation(self, generation: int | None = None) -> None:
+        """Drop the memory tier if another process invalidated entries.
+
+        Args:
+            generation: Generation returned by an invalidation of this
+                process, which only accounts for that one bump
+        """
+        store = self.store
+        if store is None:
+            return
+        try:
+            current = store.generation() if generation is None else generation
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache read failed: {e}")
+            current = None
+        with self._lock:
+            expected = self._generation + (0 if generation is None else 1)
+            if current != expected:
+                # Unknown or foreign invalidations: the memory tier may hold
+                # entries that were deleted from the shared tier
+                self._memory.clear()
+            if current is not None:
+                self._generation = current
+
+    def _remember(self, key: str, entry: CachedResponse) -> None:
+        """Put an entry in the memory tier, evicting the oldest ones."""
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.config.max_entries:
+                self._memory.popitem(last=False)
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        """Store an entry in both tiers.
+
+        Args:
+            key: Cache key
+            entry: Response to store
+        """
+        self._remember(key, entry)
+        if self.store is not None:
+            try:
+                self.store.set(key, entry)
+            except sqlite3.Error as e:
+                logger.warning(f"Response cache write failed: {e}")
+
+    def touch(self, key: str, entry: CachedResponse, ttl: float) -> CachedResponse:
+        """Mark an entry fresh again after successful revalidation.
+
+        Args:
+            key: Cache key
+            entry: Revalidated entry
+            ttl: Seconds the entry is fresh for
+
+        Returns:
+            The updated entry
+        """
+        entry = replace(entry, expires_at=time.time() + ttl)
+        self._remember(key, entry)
+        if self.store is not None:
+            try:
+                self.store.touch(key, entry.expires_at)
+            except sqlite3.Error as e:
+                logger.warning(f"Response cache write failed: {e}")
+        return entry
+
+    def invalidate(self, service_name: str, tags: Iterable[str] | None = None) -> None:
+        """Drop cached responses of a service.
+
+        Args:
+            service_name: Service name (e.g., "jira")
+            tags: Resource identities to drop, across all credential scopes,
+                or None to drop every entry of the service
+        """
+        prefix = f"{service_name.lower()}|"
+        tag_set = set(tags) if tags is not None else None
+        with self._lock:
+            stale = [
+                key
+                for key, entry in self._memory.items()
+                if key.startswith(prefix) and (tag_set is None or entry.tags & tag_set)
+            ]
+            for key in stale:
+                del self._memory[key]
+        if self.store is not None:
+            try:
+                if tag_set is None:
+                    generation = self.store.delete_prefix(prefix)
+                else:
+                    generation = self.store.delete_tags(tag_set)
+            except sqlite3.Error as e:
+                logger.warning(f"Response cache invalidation failed: {e}")
+            else:
+                if generation is not None:
+                    self._sync_generation(generation)
+        logger.debug(
+            f"Invalidated {len(stale)} cached {service_name} responses"
+            + (f" for {', '.join(sorted(tag_set))}" if tag_set else "")
+        )
+
+    def invalidate_request(self, service_name: str, method: str, url: str) -> None:
+        """Invalidate the entries affected by a successful write request.
+
+        Args:
+            service_name: Service name (e.g., "jira")
+            method: HTTP method of the request
+            url: URL of the request
+        """
+        method = method.upper()
+        if method not in _WRITE_METHODS:
+            return
+        path = urlsplit(url).path
+        if method == "POST" and is_read_only_post(service_name, path):
+            return
+        tags = resource_tags(service_name, path)
+        self.invalidate(service_name, tags or None)
+
+    def clear(self) -> None:
+        """Drop all entries from the memory tier."""
+        with self._lock:
+            self._memory.clear()
+
+    def close(self) -> None:
+        """Clear the memory tier and close the on-disk tier."""
+        self.clear()
+        if self.store is not None:
+            self.store.close()
+            self.store = None
+
+
+def find_rule(service_name: str, path: str) -> CacheRule | None:
+    """Find the cache rule matching a URL path.
+
+    Args:
+        service_name: Service name (e.g., "jira")
+        path: URL path
+
+    Returns:
+        The matching rule, or None if the resource is not cacheable
+    """
+    for rule in CACHE_RULES.get(service_name.lower(), ()):
+        if rule.pattern.fullmatch(path):
+            return rule
+    return None
+
+
+def is_read_only_post(service_name: str, path: str) -> bool:
+    """Check whether a POST request to a URL path only reads data.
+
+    Args:
+        service_name: Service name (e.g., "jira")
+        path: URL path
+
+    Returns:
+        True if the path is a known read-only POST endpoint
+    """
+    pattern = READ_ONLY_POSTS.get(service_name.lower())
+    return pattern is not None and pattern.fullmatch(path) is not None
+
+
+def resource_tags(service_name: str, path: str) -> set[str]:
+    """Get the identities of the resources a URL path refers to.
+
+    Args:
+        service_name: Service name (e.g., "jira")
+        path: URL path
+
+    Returns:
+        Tags of the form ``<service>:<resource>:<id>``
+    """
+    service = service_name.lower()
+    tags = set()
+    for resource, pattern in IDENTITY_PATTERNS.get(service, ()):
+        match = pattern.search(path)
+        if match:
+            tags.add(f"{service}:{resource}:{'/'.join(match.groups())}")
+    return tags
+
+
+def _json_path(data: Any, path: Iterable[str]) -> Any:
+    """Follow a path of keys into decoded JSON, returning None if missing."""
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def _credential_scope(request: PreparedRequest) -> str:
+    """Hash the credentials sent with a request."""
+    credentials = "\n".join(
+        request.headers.get(name, "") for name in ("Authorization", "Cookie")
+    )
+    return hashlib.sha256(credentials.encode()).hexdigest()[:16]
+
+
+class CachingAdapter(BaseAdapter):
+    """Transport adapter answering cacheable GET requests from a cache.
+
+    Requests the cache cannot answer are sent through the wrapped adapter,
+    so rate limiting and SSL settings of the session still apply.
+    """
+
+    def __init__(
+        self, inner: BaseAdapter, cache: ResponseCache, service_name: str
+    ) -> None:
+        """Initialize the adapter.
+
+        Args:
+            inner: Adapter sending requests to the server
+            cache: Response cache to use
+            service_name: Service name (e.g., "jira")
+        """
+        super().__init__()
+        self.inner = inner
+        self.cache = cache
+        self.service_name = service_name.lower()
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose attributes of the wrapped adapter (e.g. rate_limiter)
+        if name == "inner":
+            raise AttributeError(name)
+        return getattr(self.inner, name)
+
+    def _cache_key(self, request: PreparedRequest) -> str:
+        """Build the cache key of a request."""
+        return "|".join(
+            (
+                self.service_name,
+                _credential_scope(request),
+                request.url or "",
+                request.headers.get("Accept", ""),
+            )
+        )
+
+    def _cached_response(
+        self, request: PreparedRequest, entry: CachedResponse, status: str
+    ) -> Response:
+        """Build a response from a cache entry."""
+        response = Response()
+        response.status_code = entry.status
+        response.headers = CaseInsensitiveDict(entry.headers)
+        response.headers[CACHE_STATUS_HEADER] = status
+        response._content = entry.content
+        response._content_consumed = True
+        response.encoding = entry.encoding
+        response.reason = "OK"
+        response.url = request.url or ""
+        response.request = request
+        response.connection = self
+        return response
+
+    def _store(self, key: str, rule: CacheRule, path: str, response: Response) -> None:
+        """Store a successful response if it is cacheable."""
+        if response.status_code != 200:
+            return
+        if "no-store" in response.headers.get("Cache-Control", ""):
+            return
+        content = response.content
+        if len(content) > self.cache.config.max_entry_bytes:
+            return
+
+        tags = resource_tags(self.service_name, path)
+        version = None
+        if rule.version_path or rule.id_fields:
+            try:
+                data = json.loads(content)
+            except ValueError:
+                data = None
+            if rule.version_path:
+                marker = _json_path(data, rule.version_path)
+                version = None if marker is None else str(marker)
+            for id_field in rule.id_fields:
+                value = _json_path(data, (id_field,))
+                if value is not None:
+                    tags.add(f"{self.service_name}:{rule.resource}:{value}")
+
+        now = time.time()
+        self.cache.set(
+            key,
+            CachedResponse(
+                status=response.status_code,
+                headers={
+                    k: v
+                    for k, v in response.headers.items()
+                    if k.lower() not in _UNCACHED_HEADERS
+                },
+                content=content,
+                encoding=response.encoding,
+                expires_at=now + self.cache.ttl_for(rule),
+                stored_at=now,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                version=version,
+                tags=frozenset(tags),
+            ),
+        )
+
+    def _probe_unchanged(
+        self,
+        request: PreparedRequest,
+        rule: CacheRule,
+        entry: CachedResponse,
+        **kw: Any,
+    ) -> bool:
+        """Check with a cheap request whether a resource is unchanged."""
+        scheme, netloc, path, _query, _fragment = urlsplit(request.url or "")
+        probe = request.copy()
+        probe.url = urlunsplit((scheme, netloc, path, urlencode(rule.probe_params), ""))
+        response = self.inner.send(probe, **kw)
+        try:
+            if response.status_code != 200:
+                return False
+            marker = _json_path(response.json(), rule.version_path)
+        except ValueError:
+            return False
+        finally:
+            response.close()
+        return marker is not None and str(marker) == entry.version
+
+    def send(
+        self,
+        request: PreparedRequest,
+        stream: bool = False,  # noqa: FBT001, FBT002
+        timeout: float | tuple[float, float] | None = None,
+        verify: bool | str = True,  # noqa: FBT001, FBT002
+        cert: str | tuple[str, str] | None = None,
+        proxies: dict[str, str] | None = None,
+    ) -> Response:
+        """Send a request, answering it from the cache when possible.
+
+        Args:
+            request: The prepared request to send
+            stream: Whether to stream the response
+            timeout: Request timeout
+            verify: SSL verification setting
+            cert: Client certificate
+            proxies: Proxy settings
+
+        Returns:
+            Response from the cache or the server
+        """
+        kw: dict[str, Any] = {
+            "stream": stream,
+            "timeout": timeout,
+            "verify": verify,
+            "cert": cert,
+            "proxies": proxies,
+        }
+        method = (request.method or "GET").upper()
+        if method != "GET":
+            response = self.inner.send(request, **kw)
+            if response.status_code < 400:
+                self.cache.invalidate_request(
+                    self.service_name, method, request.url or ""
+                )
+            return response
+
+        path = urlsplit(request.url or "").path
+        rule = find_rule(self.service_name, path)
+        if rule is None or "no-cache" in request.headers.get("Cache-Control", ""):
+            return self.inner.send(request, **kw)
+
+        key = self._cache_key(request)
+        entry = self.cache.get(key)
+        if entry is not None:
+            if entry.expires_at > time.time():
+                logger.debug(f"Response cache hit for {request.url}")
+                return self._cached_response(request, entry, "hit")
+
+            if entry.etag or entry.last_modified:
+                conditional = request.copy()
+                if entry.etag:
+                    conditional.headers["If-None-Match"] = entry.etag
+                if entry.last_modified:
+                    conditional.headers["If-Modified-Since"] = entry.last_modified
+                response = self.inner.send(conditional, **kw)
+                if response.status_code == 304:
+                    response.close()
+                    entry = self.cache.touch(key, entry, self.cache.ttl_for(rule))
+                    return self._cached_response(request, entry, "revalidated")
+                self._store(key, rule, path, response)
+                return response
+
+            if entry.version is not None and rule.probe_params:
+                if self._probe_unchanged(request, rule, entry, **kw):
+                    entry = self.cache.touch(key, entry, self.cache.ttl_for(rule))
+                    return self._cached_response(request, entry, "revalidated")
+
+        response = self.inner.send(request, **kw)
+        self._store(key, rule, path, response)
+        return response
+
+    def close(self) -> None:
+        """Close the wrapped adapter."""
+        self.inner.close()
+
+
+_response_cache: ResponseCache | None = None
+_response_cache_lock = Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the process-wide response cache, creating it on first use.
+
+    Returns:
+        The shared ResponseCache instance.
+    """
+    global _response_cache
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                _response_cache = ResponseCache()
+    return _response_cache
+
+
+def reset_response_cache() -> None:
+    """Close and forget the process-wide response cache (primarily for testing)."""
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is not None:
+            _response_cache.close()
+        _response_cache = None
+
+
+def invalidate_cached_responses(service_name: str, method: str, url: str) -> None:
+    """Invalidate cached responses affected by a write sent outside a session.
+
+    Used by clients that do not go through a CachingAdapter (such as the
+    async HTTP backend). Does nothing if no response cache is in use.
+
+    Args:
+        service_name: Service name (e.g., "jira")
+        method: HTTP method of the successful request
+        url: URL of the request
+    """
+    if _response_cache is not None:
+        _response_cache.invalidate_request(service_name, method, url)
+
+
+def configure_response_cache(
+    session: Session,
+    service_name: str,
+    cache: ResponseCache | None = None,
+) -> None:
+    """Wrap the adapters of a session with a CachingAdapter.
+
+    Does nothing unless the cache is enabled for the service. Call this
+    after all other adapters are mounted.
+
+    Args:
+        session: The requests Session to configure
+        service_name: Service name (e.g., "jira", "confluence", "bitbucket")
+        cache: Response cache to use (defaults to the process-wide cache)
+    """
+    if cache is None:
+        if not get_config_from_env(service_name).enabled:
+            return
+        cache = get_response_cache()
+
+    for prefix, adapter in list(session.adapters.items()):
+        if not isinstance(adapter, CachingAdapter):
+            session.mount(prefix, CachingAdapter(adapter, cache, service_name))
+
+    logger.debug(f"Configured response cache for {service_name} session")
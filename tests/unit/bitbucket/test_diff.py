@@ -0,0 +1,214 @@
+"""Tests for streaming and slicing pull request diffs."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from mcp_atlassian.bitbucket import BitbucketConfig, BitbucketFetcher
+from mcp_atlassian.bitbucket.diff import (
+    iter_structured_diff_lines,
+    iter_text_lines,
+    path_selected,
+    slice_diff,
+)
+
+RAW_DIFF = """diff --git a/src/app.py b/src/app.py
+index 1111111..2222222 100644
+--- a/src/app.py
++++ b/src/app.py
+@@ -1,3 +1,3 @@
+ import os
+-print("old")
++print("new")
+@@ -10,2 +10,3 @@
+ def main():
++    run()
+diff --git a/docs/readme.md b/docs/readme.md
+--- a/docs/readme.md
++++ b/docs/readme.md
+@@ -1 +1 @@
+-Old title
++New title
+diff --git a/logo.png b/logo.png
+Binary files a/logo.png and b/logo.png differ
+"""
+
+
+def diff_lines():
+    return RAW_DIFF.splitlines()
+
+
+class TestSliceDiff:
+    """Test the slice_diff function."""
+
+    def test_returns_whole_diff_within_budget(self):
+        """Test that a small diff is returned unchanged."""
+        result = slice_diff(diff_lines())
+
+        assert result["diff"] == RAW_DIFF.rstrip("\n")
+        assert result["files"] == [
+            {"path": "src/app.py", "hunks": 2},
+            {"path": "docs/readme.md", "hunks": 1},
+            {"path": "logo.png", "hunks": 0},
+        ]
+        assert result["truncated"] is False
+        assert result["bytes"] == len(RAW_DIFF.rstrip("\n").encode())
+
+    @pytest.mark.parametrize(
+        ("paths", "expected"),
+        [
+            (["docs/readme.md"], ["docs/readme.md"]),
+            (["src/"], ["src/app.py"]),
+            (["*.png", "*.md"], ["docs/readme.md", "logo.png"]),
+            (["missing.txt"], []),
+        ],
+    )
+    def test_selects_files(self, paths, expected):
+        """Test selecting files by path, directory and glob pattern."""
+        result = slice_diff(diff_lines(), paths=paths)
+
+        assert [f["path"] for f in result["files"]] == expected
+        for path in expected:
+            assert f"diff --git a/{path} b/{path}" in result["diff"]
+
+    def test_byte_budget_cuts_at_line_and_marks_truncation(self):
+        """Test that the diff is cut before the line exceeding the budget."""
+        result = slice_diff(diff_lines(), max_bytes=150)
+
+        lines = result["diff"].splitlines()
+        assert lines[-1] == "[... diff truncated: limit of 150 bytes reached ...]"
+        assert result["bytes"] <= 150
+        assert "\n".join(lines[:-1]) == RAW_DIFF[: result["bytes"]]
+        assert result["truncated"] is True
+        assert result["truncation"] == "max_bytes"
+        assert result["files"] == [
+            {"path": "src/app.py", "hunks": 1, "truncated": True}
+        ]
+
+    def test_hunk_budget(self):
+        """Test that no more than max_hunks hunks are returned."""
+        result = slice_diff(diff_lines(), max_hunks=1)
+
+        assert result["diff"].count("\n@@") == 1
+        assert result["truncation"] == "max_hunks"
+        assert result["diff"].endswith("limit of 1 hunks reached ...]")
+
+    def test_stops_reading_when_budget_is_reached(self):
+        """Test that lines after the budget are never pulled from the stream."""
+        pulled = []
+
+        def lines():
+            for line in diff_lines():
+                pulled.append(line)
+                yield line
+
+        slice_diff(lines(), max_hunks=1)
+
+        assert len(pulled) == 9
+
+
+def test_iter_text_lines_keeps_carriage_returns():
+    """Test that lines are split on line feeds only, across chunk boundaries."""
+    chunks = [b"+a\r\n+b", b"c\n", b"+\xe2\x82", b"\xac"]
+
+    assert list(iter_text_lines(chunks)) == ["+a\r", "+bc", "+€"]
+
+
+def test_path_selected_without_selection():
+    """Test that every file is selected when no paths are given."""
+    assert path_selected("any/file.txt", None) is True
+
+
+def test_iter_structured_diff_lines():
+    """Test rendering the structured diff API response as a unified diff."""
+    diff_data = {
+        "diffs": [
+            {
+                "source": None,
+                "destination": {"toString": "new.txt"},
+                "hunks": [
+                    {
+                        "sourceLine": 0,
+                        "sourceSpan": 0,
+                        "destinationLine": 1,
+                        "destinationSpan": 1,
+                        "segments": [{"type": "ADDED", "lines": [{"line": "hi"}]}],
+                    }
+                ],
+            }
+        ]
+    }
+
+    assert list(iter_structured_diff_lines(diff_data)) == [
+        "diff --git a/new.txt b/new.txt",
+        "--- /dev/null",
+        "+++ b/new.txt",
+        "@@ -0,0 +1,1 @@",
+        "+hi",
+    ]
+
+
+class TestGetPullRequestDiff:
+    """Test PullRequestsMixin.get_pull_request_diff."""
+
+    @pytest.fixture
+    def fetcher(self):
+        fetcher = BitbucketFetcher.__new__(BitbucketFetcher)
+        fetcher.config = BitbucketConfig(
+            url="https://bitbucket.example.com", auth_type="pat", personal_token="t"
+        )
+        fetcher.bitbucket = MagicMock()
+        fetcher.bitbucket.url = "https://bitbucket.example.com"
+        fetcher.bitbucket.timeout = 75
+        fetcher.bitbucket._url_pull_request.return_value = (
+            "rest/api/1.0/projects/PROJ/repos/app/pull-requests/5"
+        )
+        fetcher.bitbucket.url_joiner.side_effect = lambda url, path: f"{url}/{path}"
+        return fetcher
+
+    def test_streams_raw_diff(self, fetcher):
+        """Test that the raw diff is streamed with the requested options."""
+        response = MagicMock(status_code=200)
+        response.iter_content.return_value = iter([RAW_DIFF.encode()])
+        fetcher.bitbucket._session.get.return_value = response
+
+        result = fetcher.get_pull_request_diff(
+            "PROJ",
+            "app",
+            5,
+            paths=["docs/"],
+            context_lines=5,
+            ignore_whitespace=True,
+        )
+
+        assert [f["path"] for f in result["files"]] == ["docs/readme.md"]
+        fetcher.bitbucket._session.get.assert_called_once_with(
+            "https://bitbucket.example.com/rest/api/1.0/projects/PROJ/repos/app/pull-requests/5.diff",
+            params={"contextLines": 5, "whitespace": "ignore-all"},
+            headers={"Accept": "text/plain"},
+            stream=True,
+            timeout=75,
+        )
+        response.close.assert_called_once()
+        fetcher.bitbucket.get.assert_not_called()
+
+    def test_falls_back_to_structured_diff(self, fetcher):
+        """Test that servers without the raw diff endpoint use the diff API."""
+        fetcher.bitbucket._session.get.return_value = MagicMock(status_code=404)
+        fetcher.bitbucket.get.return_value = {
+            "diffs": [
+                {
+                    "source": {"toString": "a.txt"},
+                    "destination": {"toString": "a.txt"},
+                    "hunks": [],
+                }
+            ]
+        }
+
+        result = fetcher.get_pull_request_diff("PROJ", "app", 5)
+
+        assert result["files"] == [{"path": "a.txt", "hunks": 0}]
+        fetcher.bitbucket.get.assert_called_once_with(
+            "rest/api/1.0/projects/PROJ/repos/app/pull-requests/5/diff",
+            params={"withComments": "false"},
+        )
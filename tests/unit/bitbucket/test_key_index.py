@@ -0,0 +1,318 @@
+"""Tests for the Bitbucket Jira key index."""
+
+import os
+import sqlite3
+import stat
+from unittest.mock import MagicMock, patch
+
+import anyio
+import pytest
+
+from mcp_atlassian.bitbucket import BitbucketConfig, BitbucketFetcher
+from mcp_atlassian.bitbucket.key_index import (
+    JiraKeyIndex,
+    credential_scope,
+    get_key_index,
+    get_key_index_config,
+    reset_key_index,
+    run_key_index_refresher,
+)
+from mcp_atlassian.utils.executor import get_executor_registry
+
+BASE_TIME = 1_700_000_000_000
+
+
+@pytest.fixture(autouse=True)
+def key_index_path(tmp_path, monkeypatch):
+    """Enable the key index in a temporary database."""
+    path = tmp_path / "index" / "keys.db"
+    monkeypatch.setenv("BITBUCKET_KEY_INDEX_PATH", str(path))
+    reset_key_index()
+    get_executor_registry().reset()
+    yield path
+    reset_key_index()
+    get_executor_registry().reset()
+
+
+def make_pr(pr_id, title, updated, branch="main-work", description=None):
+    """Build a pull request as returned by the Bitbucket Server API."""
+    return {
+        "id": pr_id,
+        "title": title,
+        "description": description,
+        "state": "OPEN",
+        "updatedDate": BASE_TIME + updated,
+        "fromRef": {"id": f"refs/heads/{branch}", "displayId": branch},
+        "toRef": {"id": "refs/heads/main", "displayId": "main"},
+        "links": {"self": [{"href": f"https://bitbucket.example.com/pr/{pr_id}"}]},
+    }
+
+
+def make_fetcher(prs_by_repo, token="secret"):
+    """Create a fetcher whose client serves the given pull requests."""
+    fetcher = BitbucketFetcher.__new__(BitbucketFetcher)
+    fetcher.config = BitbucketConfig(
+        url="https://bitbucket.example.com", auth_type="pat", personal_token=token
+    )
+    fetcher.bitbucket = MagicMock()
+    fetcher.pulled = []
+
+    def get_pull_requests(project_key, repo_slug, **kwargs):
+        # Newest first, recording how far the listing was consumed
+        for pr in sorted(prs_by_repo[repo_slug], key=lambda p: -p["updatedDate"]):
+            fetcher.pulled.append(pr["id"])
+            yield pr
+
+    fetcher.bitbucket.get_pull_requests.side_effect = get_pull_requests
+    fetcher.get_repositories = MagicMock(
+        return_value=[MagicMock(slug=slug) for slug in prs_by_repo]
+    )
+    return fetcher
+
+
+class TestKeyIndexConfig:
+    """Test loading the key index configuration."""
+
+    def test_disabled_without_path(self, monkeypatch):
+        """Test that the index is disabled unless a path is set."""
+        monkeypatch.delenv("BITBUCKET_KEY_INDEX_PATH")
+
+        assert get_key_index_config().enabled is False
+        assert get_key_index() is None
+
+    def test_from_env(self, monkeypatch):
+        """Test reading the refresh interval, projects and commit switch."""
+        monkeypatch.setenv("BITBUCKET_KEY_INDEX_REFRESH_INTERVAL", "60")
+        monkeypatch.setenv("BITBUCKET_KEY_INDEX_PROJECTS", "PROJ, INFRA,")
+        monkeypatch.setenv("BITBUCKET_KEY_INDEX_COMMITS", "true")
+
+        config = get_key_index_config()
+
+        assert config.enabled is True
+        assert config.refresh_interval == 60
+        assert config.projects == ["PROJ", "INFRA"]
+        assert config.index_commits is True
+
+
+class TestIndexRepositoryKeys:
+    """Test indexing the pull requests of a repository."""
+
+    def test_indexes_pull_requests_and_branches(self, key_index_path):
+        """Test that keys in titles, descriptions and branches are indexed."""
+        fetcher = make_fetcher(
+            {
+                "app": [
+                    make_pr(1, "PROJ-1: Fix login", 10, branch="feature/PROJ-2-x"),
+                    make_pr(2, "Refactor", 20, description="Relates to PROJ-1"),
+                    make_pr(3, "Unrelated", 30),
+                ]
+            }
+        )
+
+        stats = fetcher.index_repository_keys("PROJ", "app")
+
+        assert stats == {
+            "repository_slug": "app",
+            "scanned": 3,
+            "reindexed": 3,
+            "references": 4,
+        }
+        found = fetcher.find_jira_key_references("proj-1")
+        assert [pr["id"] for pr in found["pull_requests"]] == [2, 1]
+        assert found["pull_requests"][1]["match_source"] == "title"
+        assert found["branches"] == []
+        branches = fetcher.find_jira_key_references("PROJ-2")["branches"]
+        assert branches == [
+            {
+                "project_key": "PROJ",
+                "repository_slug": "app",
+                "name": "feature/PROJ-2-x",
+                "pull_request_id": 1,
+            }
+        ]
+        assert stat.S_IMODE(os.stat(key_index_path).st_mode) == 0o600
+
+    def test_incremental_refresh_stops_at_watermark(self):
+        """Test that only pull requests updated since the last run are listed."""
+        prs = [make_pr(n, f"PROJ-{n} change", n) for n in range(1, 61)]
+        fetcher = make_fetcher({"app": prs})
+        fetcher.index_repository_keys("PROJ", "app")
+        fetcher.pulled.clear()
+
+        prs[0] = make_pr(1, "PROJ-100 retitled", 100)
+        stats = fetcher.index_repository_keys("PROJ", "app")
+
+        # The updated PR, then 25 unchanged ones before stopping
+        assert stats["reindexed"] == 1
+        assert len(fetcher.pulled) == 26
+        assert fetcher.find_jira_key_references("PROJ-1")["pull_requests"] == []
+        retitled = fetcher.find_jira_key_references("PROJ-100")["pull_requests"]
+        assert [pr["id"] for pr in retitled] == [1]
+
+    def test_full_reindex_drops_deleted_pull_requests(self):
+        """Test that a full re-index forgets pull requests no longer listed."""
+        prs = {"app": [make_pr(1, "PROJ-1", 1), make_pr(2, "PROJ-2", 2)]}
+        fetcher = make_fetcher(prs)
+        fetcher.index_repository_keys("PROJ", "app")
+
+        prs["app"].pop(0)
+        fetcher.index_repository_keys("PROJ", "app")
+        assert fetcher.find_jira_key_references("PROJ-1")["pull_requests"]
+        fetcher.index_repository_keys("PROJ", "app", full=True)
+
+        assert fetcher.find_jira_key_references("PROJ-1")["pull_requests"] == []
+        assert fetcher.find_jira_key_references("PROJ-2")["pull_requests"]
+
+    def test_references_are_scoped_to_credentials(self):
+        """Test that another user does not see references indexed by a user."""
+        prs = {"app": [make_pr(1, "PROJ-1", 1)]}
+        make_fetcher(prs).index_repository_keys("PROJ", "app")
+
+        other = make_fetcher(prs, token="other-secret")
+
+        assert other.find_jira_key_references("PROJ-1")["pull_requests"] == []
+        assert credential_scope(other.config) != credential_scope(
+            make_fetcher(prs).config
+        )
+
+    def test_indexes_commits_when_enabled(self, monkeypatch):
+        """Test that commit messages of changed pull requests are indexed."""
+        monkeypatch.setenv("BITBUCKET_KEY_INDEX_COMMITS", "true")
+        fetcher = make_fetcher({"app": [make_pr(1, "PROJ-1", 1)]})
+        fetcher.get_pull_request_commits = MagicMock(
+            return_value=[
+                {
+                    "id": "abc123",
+                    "display_id": "abc",
+                    "message": "PROJ-9 fix\n\nDetails",
+                    "author": {"name": "dev"},
+                }
+            ]
+        )
+
+        fetcher.index_repository_keys("PROJ", "app")
+
+        commits = fetcher.find_jira_key_references("PROJ-9")["commits"]
+        assert commits[0]["id"] == "abc123"
+        assert commits[0]["message"] == "PROJ-9 fix"
+        assert commits[0]["pull_request_id"] == 1
+
+    def test_disabled_index_raises(self, monkeypatch):
+        """Test that indexing fails clearly when the index is not enabled."""
+        monkeypatch.delenv("BITBUCKET_KEY_INDEX_PATH")
+        fetcher = make_fetcher({"app": []})
+
+        with pytest.raises(ValueError, match="BITBUCKET_KEY_INDEX_PATH"):
+            fetcher.index_repository_keys("PROJ", "app")
+
+
+class TestRefreshKeyIndex:
+    """Test refreshing the key index of a project."""
+
+    @pytest.mark.anyio
+    async def test_refreshes_repositories_concurrently(self):
+        """Test that every repository is indexed and deleted ones are dropped."""
+        prs = {
+            "app": [make_pr(1, "PROJ-1", 1)],
+            "lib": [make_pr(7, "PROJ-1 in lib", 2)],
+            "old": [make_pr(3, "PROJ-1 in old", 3)],
+        }
+        fetcher = make_fetcher(prs)
+        await fetcher.refresh_key_index_async("PROJ")
+        fetcher.get_repositories.return_value = [
+            MagicMock(slug="app"),
+            MagicMock(slug="lib"),
+        ]
+
+        stats = await fetcher.refresh_key_index_async("PROJ")
+
+        assert stats["repositories"] == 2
+        assert sorted(r["repository_slug"] for r in stats["refreshed"]) == [
+            "app",
+            "lib",
+        ]
+        assert stats["removed"] == ["old"]
+        assert stats["incomplete"] == []
+        found = fetcher.find_jira_key_references("PROJ-1", "PROJ")["pull_requests"]
+        assert [pr["repository_slug"] for pr in found] == ["lib", "app"]
+
+    @pytest.mark.anyio
+    async def test_max_age_skips_fresh_repositories(self):
+        """Test that recently refreshed repositories are not listed again."""
+        fetcher = make_fetcher({"app": [make_pr(1, "PROJ-1", 1)]})
+        await fetcher.refresh_key_index_async("PROJ")
+        fetcher.pulled.clear()
+
+        stats = await fetcher.refresh_key_index_async("PROJ", max_age=600)
+
+        assert stats["fresh"] == 1
+        assert stats["refreshed"] == []
+        assert fetcher.pulled == []
+
+    @pytest.mark.anyio
+    async def test_failed_repository_is_reported(self):
+        """Test that a repository that cannot be listed does not stop the rest."""
+        fetcher = make_fetcher({"app": [make_pr(1, "PROJ-1", 1)], "gone": []})
+        listing = fetcher.bitbucket.get_pull_requests.side_effect
+
+        def get_pull_requests(project_key, repo_slug, **kwargs):
+            if repo_slug == "gone":
+                raise Exception("Repository not found")
+            return listing(project_key, repo_slug, **kwargs)
+
+        fetcher.bitbucket.get_pull_requests.side_effect = get_pull_requests
+
+        stats = await fetcher.refresh_key_index_async("PROJ")
+
+        assert stats["incomplete"] == [
+            {"branch": "PROJ/gone", "error": "Repository not found", "timed_out": False}
+        ]
+        assert fetcher.find_jira_key_references("PROJ-1")["pull_requests"]
+
+    @pytest.mark.anyio
+    async def test_background_refresher(self):
+        """Test that the refresher indexes configured and known projects."""
+        fetcher = make_fetcher({"app": [make_pr(1, "PROJ-1", 1)]})
+        fetcher.index_repository_keys("KNOWN", "app")
+        config = get_key_index_config()
+        config.projects = ["PROJ"]
+        config.refresh_interval = 60
+
+        with anyio.move_on_after(1):
+            await run_key_index_refresher(lambda: fetcher, config)
+
+        found = fetcher.find_jira_key_references("PROJ-1")["pull_requests"]
+        assert sorted(pr["project_key"] for pr in found) == ["KNOWN", "PROJ"]
+
+    @pytest.mark.anyio
+    async def test_background_refresher_survives_database_errors(self):
+        """Test that a locked database does not end the refresher."""
+        fetcher = make_fetcher({"app": [make_pr(1, "PROJ-1", 1)]})
+        config = get_key_index_config()
+        config.projects = ["PROJ"]
+        config.refresh_interval = 60
+        locked = sqlite3.OperationalError("database is locked")
+
+        with (
+            patch.object(JiraKeyIndex, "projects", side_effect=locked),
+            anyio.move_on_after(1) as scope,
+        ):
+            await run_key_index_refresher(lambda: fetcher, config)
+
+        assert scope.cancelled_caught
+        assert fetcher.find_jira_key_references("PROJ-1")["pull_requests"]
+
+
+def test_index_is_shared_across_connections(key_index_path):
+    """Test that a second process-level connection sees stored references."""
+    make_fetcher({"app": [make_pr(1, "PROJ-1", 1)]}).index_repository_keys(
+        "PROJ", "app"
+    )
+    scope = credential_scope(make_fetcher({}).config)
+
+    other = JiraKeyIndex(key_index_path)
+    try:
+        assert [ref.pull_request_id for ref in other.find(scope, "PROJ-1")] == [1]
+        assert other.projects(scope) == ["PROJ"]
+    finally:
+        other.close()
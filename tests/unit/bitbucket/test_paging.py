@@ -0,0 +1,170 @@
+"""Tests for paging through Bitbucket Server resources."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from atlassian import Bitbucket
+
+from mcp_atlassian.bitbucket import BitbucketConfig, BitbucketFetcher
+
+
+def paged_get(resources):
+    """Build a stand-in for ``Bitbucket.get`` serving paged resources.
+
+    Each resource is a list of values, served in pages of the requested
+    limit with ``isLastPage`` and ``nextPageStart`` as Bitbucket Server does.
+    """
+
+    def get(path, params=None):
+        values = resources[path]
+        start, limit = params["start"], params["limit"]
+        page = values[start : start + limit]
+        is_last = start + limit >= len(values)
+        response = {
+            "values": page,
+            "size": len(page),
+            "start": start,
+            "limit": limit,
+            "isLastPage": is_last,
+        }
+        if not is_last:
+            response["nextPageStart"] = start + len(page)
+        return response
+
+    return MagicMock(side_effect=get)
+
+
+@pytest.fixture
+def fetcher():
+    """Create a fetcher whose REST client is replaced by a paged stand-in."""
+    fetcher = BitbucketFetcher.__new__(BitbucketFetcher)
+    fetcher.config = BitbucketConfig(
+        url="https://bitbucket.example.com", auth_type="pat", personal_token="t"
+    )
+    fetcher.bitbucket = Bitbucket(url="https://bitbucket.example.com")
+    return fetcher
+
+
+PRS_PATH = "rest/api/1.0/projects/PROJ/repos/repo/pull-requests"
+
+
+class TestIterPaged:
+    """Test following isLastPage/nextPageStart."""
+
+    def test_follows_next_page_start(self, fetcher):
+        """Test that every page is requested from the reported start."""
+        fetcher.bitbucket.get = paged_get({"items": [{"n": n} for n in range(5)]})
+
+        values = list(fetcher._iter_paged("items", page_size=2))
+
+        assert [value["n"] for value in values] == [0, 1, 2, 3, 4]
+        starts = [
+            call.kwargs["params"]["start"]
+            for call in fetcher.bitbucket.get.call_args_list
+        ]
+        assert starts == [0, 2, 4]
+
+    def test_stops_at_limit_without_extra_requests(self, fetcher):
+        """Test that the last request is capped and no page follows the limit."""
+        fetcher.bitbucket.get = paged_get({"items": [{"n": n} for n in range(50)]})
+
+        values = list(fetcher._iter_paged("items", page_size=10, max_items=15))
+
+        assert len(values) == 15
+        limits = [
+            call.kwargs["params"]["limit"]
+            for call in fetcher.bitbucket.get.call_args_list
+        ]
+        assert limits == [10, 5]
+
+    def test_predicate_stops_once_enough_values_match(self, fetcher):
+        """Test that filtered values do not count towards the limit."""
+        fetcher.bitbucket.get = paged_get({"items": [{"n": n} for n in range(100)]})
+
+        values = list(
+            fetcher._iter_paged(
+                "items",
+                page_size=10,
+                max_items=3,
+                predicate=lambda value: value["n"] % 7 == 0,
+            )
+        )
+
+        assert [value["n"] for value in values] == [0, 7, 14]
+        assert fetcher.bitbucket.get.call_count == 2
+
+    def test_none_params_are_left_out(self, fetcher):
+        """Test that unset server-side filters are not sent."""
+        fetcher.bitbucket.get = paged_get({"items": []})
+
+        list(fetcher._iter_paged("items", {"filterText": None, "state": "OPEN"}))
+
+        params = fetcher.bitbucket.get.call_args.kwargs["params"]
+        assert params == {"state": "OPEN", "start": 0, "limit": 100}
+
+    def test_unexpected_response(self, fetcher):
+        """Test that a response without pages is reported."""
+        fetcher.bitbucket.get = MagicMock(return_value="<html>")
+
+        with pytest.raises(TypeError, match="Unexpected response type"):
+            list(fetcher._iter_paged("items"))
+
+
+class TestIterMethods:
+    """Test the iter_* methods of the mixins."""
+
+    def test_pull_requests_use_server_side_filters(self, fetcher):
+        """Test that state and text filters are passed to the server."""
+        fetcher.bitbucket.get = paged_get(
+            {PRS_PATH: [{"id": n, "title": f"PR {n}"} for n in range(3)]}
+        )
+
+        prs = list(
+            fetcher.iter_pull_requests(
+                "PROJ", "repo", state="merged", filter_text="login", max_items=2
+            )
+        )
+
+        assert [pr.id for pr in prs] == [0, 1]
+        params = fetcher.bitbucket.get.call_args.kwargs["params"]
+        assert params["state"] == "MERGED"
+        assert params["filterText"] == "login"
+
+    def test_repositories_name_filter_uses_repository_search(self, fetcher):
+        """Test that a name filter queries the global repository search."""
+        fetcher.bitbucket.get = paged_get(
+            {"rest/api/1.0/repos": [{"slug": "api-service", "name": "api-service"}]}
+        )
+
+        repos = list(fetcher.iter_repositories("PROJ", name="service"))
+
+        assert [repo.slug for repo in repos] == ["api-service"]
+        params = fetcher.bitbucket.get.call_args.kwargs["params"]
+        assert params["projectkey"] == "PROJ"
+        assert params["name"] == "service"
+
+    def test_projects_filter_does_not_count_towards_limit(self, fetcher):
+        """Test that projects outside the filter are skipped before the limit."""
+        fetcher.config.projects_filter = "b, d"
+        fetcher.bitbucket.get = paged_get(
+            {"rest/api/1.0/projects": [{"key": key} for key in "ABCDE"]}
+        )
+
+        projects = fetcher.get_projects(limit=2)
+
+        assert [project.key for project in projects] == ["B", "D"]
+
+    def test_comments_skip_other_activities(self, fetcher):
+        """Test that only comment activities are returned, up to the limit."""
+        activities = [
+            {"action": "APPROVED"},
+            {"action": "COMMENTED", "comment": {"id": 1, "text": "first"}},
+            {"action": "RESCOPED"},
+            {"action": "COMMENTED", "comment": {"id": 2, "text": "second"}},
+            {"action": "COMMENTED", "comment": {"id": 3, "text": "third"}},
+        ]
+        fetcher.bitbucket.get = paged_get({f"{PRS_PATH}/5/activities": activities})
+
+        comments = fetcher.get_pull_request_comments("PROJ", "repo", 5, limit=2)
+
+        assert [comment.text for comment in comments] == ["first", "second"]
@@ -183,3 +183,25 @@ def test_is_cloud_oauth_with_cloud_id():
         oauth_config=oauth_config,
     )
     assert config.is_cloud is True
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, "markdownify"),
+        ("lxml", "lxml"),
+        (" LXML ", "lxml"),
+        ("bogus", "markdownify"),
+    ],
+)
+def test_from_env_content_converter(value, expected):
+    """Test that CONFLUENCE_CONTENT_CONVERTER selects the Markdown engine."""
+    env = {
+        "CONFLUENCE_URL": "https://test.atlassian.net/wiki",
+        "CONFLUENCE_USERNAME": "test_username",
+        "CONFLUENCE_API_TOKEN": "test_token",
+    }
+    if value is not None:
+        env["CONFLUENCE_CONTENT_CONVERTER"] = value
+    with patch.dict("os.environ", env, clear=True):
+        assert ConfluenceConfig.from_env().content_converter == expected
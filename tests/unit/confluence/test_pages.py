@@ -261,6 +261,55 @@ class TestPagesMixin:
         assert results[1].id == "987654321"  # Second page ID from mock
         assert results[1].title == "Example Meeting Notes"
 
+    def test_get_space_pages_without_content(self, pages_mixin):
+        """Test that include_content=False does not request page bodies."""
+        pages_mixin.confluence.get_all_pages_from_space.return_value = [
+            {"id": "1", "title": "Page"}
+        ]
+
+        results = pages_mixin.get_space_pages("PROJ", include_content=False)
+
+        pages_mixin.confluence.get_all_pages_from_space.assert_called_once_with(
+            space="PROJ", start=0, limit=10, expand=None
+        )
+        assert results[0].title == "Page"
+        assert results[0].content == ""
+        pages_mixin.preprocessor.process_html_content.assert_not_called()
+
+    def test_iter_space_pages(self, pages_mixin):
+        """Test that space pages are paged with start until an empty page."""
+        pages_mixin.confluence.get_all_pages_from_space.side_effect = [
+            [{"id": "1", "title": "One"}, {"id": "2", "title": "Two"}],
+            [{"id": "3", "title": "Three"}],
+            [],
+        ]
+
+        pages = list(
+            pages_mixin.iter_space_pages("PROJ", include_content=False, page_size=2)
+        )
+
+        assert [page.title for page in pages] == ["One", "Two", "Three"]
+        starts = [
+            c.kwargs["start"]
+            for c in pages_mixin.confluence.get_all_pages_from_space.call_args_list
+        ]
+        assert starts == [0, 2, 3]
+        assert pages[0].space.key == "PROJ"
+
+    def test_iter_space_pages_max_items(self, pages_mixin):
+        """Test that max_items stops paging once the budget is spent."""
+        pages_mixin.confluence.get_all_pages_from_space.return_value = [
+            {"id": "1", "title": "One"},
+            {"id": "2", "title": "Two"},
+        ]
+
+        pages = list(pages_mixin.iter_space_pages("PROJ", page_size=2, max_items=2))
+
+        assert len(pages) == 2
+        pages_mixin.confluence.get_all_pages_from_space.assert_called_once_with(
+            space="PROJ", start=0, limit=2, expand="body.storage"
+        )
+
     def test_create_page_success(self, pages_mixin):
         """Test creating a new page."""
         # Arrange
@@ -553,7 +602,62 @@ class TestPagesMixin:
             "<p>This is some content</p>",
             space_key="DEMO",
             confluence_client=pages_mixin.confluence,
+            output="markdown",
+        )
+
+    def test_get_page_children_converts_content_when_read(self, pages_mixin):
+        """Test that child page content is only converted once it is read."""
+        pages_mixin.confluence.get_page_child_by_type.return_value = {
+            "results": [
+                {
+                    "id": str(i),
+                    "title": f"Child {i}",
+                    "space": {"key": "DEMO"},
+                    "body": {"storage": {"value": f"<p>Content {i}</p>"}},
+                }
+                for i in range(3)
+            ]
+        }
+        pages_mixin.preprocessor.process_html_content.return_value = (
+            "",
+            "Processed Markdown",
+        )
+
+        results = pages_mixin.get_page_children(
+            page_id="123456", expand="body.storage", convert_to_markdown=True
+        )
+
+        pages_mixin.preprocessor.process_html_content.assert_not_called()
+        pages_mixin.preprocessor.prefetch_user_display_names.assert_not_called()
+        assert results[1].to_simplified_dict()["content"]["value"] == (
+            "Processed Markdown"
+        )
+        pages_mixin.preprocessor.process_html_content.assert_called_once_with(
+            "<p>Content 1</p>",
+            space_key="DEMO",
+            confluence_client=pages_mixin.confluence,
+            output="markdown",
         )
+        pages_mixin.preprocessor.prefetch_user_display_names.assert_called_once()
+
+    def test_get_page_children_without_content(self, pages_mixin):
+        """Test that include_content=False leaves expanded bodies out."""
+        pages_mixin.confluence.get_page_child_by_type.return_value = {
+            "results": [
+                {
+                    "id": "789012",
+                    "title": "Child",
+                    "body": {"storage": {"value": "<p>Content</p>"}},
+                }
+            ]
+        }
+
+        results = pages_mixin.get_page_children(
+            page_id="123456", expand="body.storage", include_content=False
+        )
+
+        assert "content" not in results[0].to_simplified_dict()
+        pages_mixin.preprocessor.process_html_content.assert_not_called()
 
     def test_get_page_children_empty(self, pages_mixin):
         """Test getting child pages when there are none."""
@@ -1074,6 +1178,7 @@ class TestPagesOAuthMixin:
                 "<p>OAuth page content</p>",
                 space_key="PROJ",
                 confluence_client=oauth_pages_mixin.confluence,
+                output="markdown",
             )
 
             # Verify result is a ConfluencePage with correct data
@@ -66,6 +66,53 @@ class TestSearchMixin:
         assert result[0].title == "Test Page"
         assert result[0].content == "Processed content"
 
+    def test_search_without_content(self, search_mixin):
+        """Test that include_content=False leaves excerpts unprocessed."""
+        search_mixin.confluence.cql.return_value = {
+            "results": [
+                {
+                    "content": {"id": "123456789", "title": "Test Page"},
+                    "excerpt": "Test content excerpt",
+                }
+            ]
+        }
+
+        result = search_mixin.search("test query", include_content=False)
+
+        assert result[0].title == "Test Page"
+        assert "content" not in result[0].to_simplified_dict()
+        search_mixin.preprocessor.process_html_content.assert_not_called()
+
+    def test_search_matches_excerpts_by_id(self, search_mixin):
+        """Test that each page gets its own excerpt and users are fetched once."""
+        search_mixin.confluence.cql.return_value = {
+            "results": [
+                {
+                    "content": {"id": str(i), "title": f"Page {i}"},
+                    "excerpt": f"Excerpt {i}",
+                }
+                for i in range(3)
+            ]
+        }
+        search_mixin.preprocessor.process_html_content.side_effect = (
+            lambda excerpt, **kwargs: ("", excerpt.upper())
+        )
+
+        result = search_mixin.search("test query")
+
+        assert [page.content for page in result] == [
+            "EXCERPT 0",
+            "EXCERPT 1",
+            "EXCERPT 2",
+        ]
+        prefetch = search_mixin.preprocessor.prefetch_user_display_names
+        prefetch.assert_called_once()
+        assert list(prefetch.call_args.args[0]) == [
+            "Excerpt 0",
+            "Excerpt 1",
+            "Excerpt 2",
+        ]
+
     def test_search_with_empty_results(self, search_mixin):
         """Test handling of empty search results."""
         # Mock an empty result set
@@ -564,3 +611,44 @@ class TestSearchMixin:
         assert results[0].user.display_name == "Test User"
         assert results[0].title == "Test User"
         assert results[0].entity_type == "user"
+
+    def test_iter_search_follows_next_links(self, search_mixin):
+        """Test that iteration follows _links.next with the remaining budget."""
+
+        def result(content_id):
+            return {
+                "content": {"id": content_id, "type": "page", "title": content_id},
+                "excerpt": "",
+            }
+
+        search_mixin.confluence.cql.return_value = {
+            "results": [result("1"), result("2")],
+            "_links": {"next": "/rest/api/search?cql=type%3Dpage&limit=2&cursor=c1"},
+        }
+        search_mixin.confluence.get.return_value = {
+            "results": [result("3")],
+            "_links": {"next": "/rest/api/search?cql=type%3Dpage&limit=2&cursor=c2"},
+        }
+
+        pages = list(
+            search_mixin.iter_search(
+                "type=page", include_content=False, page_size=2, max_items=3
+            )
+        )
+
+        assert [page.id for page in pages] == ["1", "2", "3"]
+        search_mixin.confluence.cql.assert_called_once_with(cql="type=page", limit=2)
+        search_mixin.confluence.get.assert_called_once_with(
+            "/rest/api/search?cql=type%3Dpage&cursor=c1&limit=1"
+        )
+
+    def test_iter_search_stops_without_next_link(self, search_mixin):
+        """Test that iteration ends on a page without a next link."""
+        search_mixin.confluence.cql.return_value = {
+            "results": [{"content": {"id": "1", "type": "page", "title": "One"}}]
+        }
+
+        pages = list(search_mixin.iter_search("type=page", include_content=False))
+
+        assert [page.id for page in pages] == ["1"]
+        search_mixin.confluence.get.assert_not_called()
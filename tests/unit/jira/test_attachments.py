@@ -1,11 +1,17 @@
 """Tests for the Jira attachments module."""
 
+import base64
+import io
+import threading
+import zipfile
 from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
 
 from mcp_atlassian.jira import JiraFetcher
 from mcp_atlassian.jira.attachments import AttachmentsMixin
+from mcp_atlassian.jira.constants import ATTACHMENT_MANIFEST_NAME
+from mcp_atlassian.utils.executor import get_executor_registry
 
 # Test scenarios for AttachmentsMixin
 #
@@ -44,6 +50,11 @@ from mcp_atlassian.jira.attachments import AttachmentsMixin
 #    - Error cases:
 #      - Empty list of file paths
 #      - No issue key provided
+#
+# 5. Transfer engine (TestAttachmentTransfers, on a real directory):
+#    - Interrupted downloads resume with a Range request
+#    - Unchanged attachments are skipped using the directory manifest
+#    - Concurrent downloads and uploads, and the in-memory zip archive
 
 
 class TestAttachmentsMixin:
@@ -72,6 +83,7 @@ class TestAttachmentsMixin:
             patch("os.path.exists") as mock_exists,
             patch("os.path.getsize") as mock_getsize,
             patch("os.makedirs") as mock_makedirs,
+            patch("os.replace") as mock_replace,
         ):
             mock_exists.return_value = True
             mock_getsize.return_value = 12  # Length of "test content"
@@ -86,9 +98,12 @@ class TestAttachmentsMixin:
             attachments_mixin.jira._session.get.assert_called_once_with(
                 "https://test.url/attachment", stream=True
             )
-            mock_file.assert_called_once_with("/tmp/test_file.txt", "wb")
+            mock_file.assert_called_once_with("/tmp/test_file.txt.part", "wb")
             mock_file().write.assert_called_once_with(b"test content")
             mock_makedirs.assert_called_once()
+            mock_replace.assert_called_once_with(
+                "/tmp/test_file.txt.part", "/tmp/test_file.txt"
+            )
 
     def test_download_attachment_relative_path(
         self, attachments_mixin: AttachmentsMixin
@@ -108,6 +123,7 @@ class TestAttachmentsMixin:
             patch("os.makedirs") as mock_makedirs,
             patch("os.path.abspath") as mock_abspath,
             patch("os.path.isabs") as mock_isabs,
+            patch("os.replace"),
         ):
             mock_exists.return_value = True
             mock_getsize.return_value = 12
@@ -123,7 +139,7 @@ class TestAttachmentsMixin:
             assert result is True
             mock_isabs.assert_called_once_with("test_file.txt")
             mock_abspath.assert_called_once_with("test_file.txt")
-            mock_file.assert_called_once_with("/absolute/path/test_file.txt", "wb")
+            mock_file.assert_called_once_with("/absolute/path/test_file.txt.part", "wb")
 
     def test_download_attachment_no_url(self, attachments_mixin: AttachmentsMixin):
         """Test attachment download with no URL."""
@@ -744,3 +760,186 @@ class TestAttachmentsMixin:
         # Assertions
         assert result["success"] is False
         assert "No issue key provided" in result["error"]
+
+
+def attachment_data(attachment_id: str, filename: str, content: bytes) -> dict:
+    """Build the API representation of an attachment."""
+    return {
+        "id": attachment_id,
+        "filename": filename,
+        "content": f"https://test.url/attachment/{attachment_id}",
+        "size": len(content),
+        "created": "2024-01-01T10:00:00.000+0000",
+    }
+
+
+class TestAttachmentTransfers:
+    """Tests for resumable, skipping and concurrent attachment transfers."""
+
+    FILES = {"1": ("a.txt", b"first file"), "2": ("b.txt", b"second file!")}
+
+    @pytest.fixture(autouse=True)
+    def reset_registry(self):
+        """Reset the executor registry around each test."""
+        get_executor_registry().reset()
+        yield
+        get_executor_registry().reset()
+
+    @pytest.fixture
+    def attachments_mixin(self, jira_fetcher: JiraFetcher) -> AttachmentsMixin:
+        """Attachments mixin serving FILES from a stand-in session."""
+        jira_fetcher.jira = MagicMock()
+        jira_fetcher.jira.issue.return_value = {
+            "fields": {
+                "attachment": [
+                    attachment_data(attachment_id, filename, content)
+                    for attachment_id, (filename, content) in self.FILES.items()
+                ]
+            }
+        }
+
+        def get(url, stream, headers=None):
+            response = MagicMock(status_code=200)
+            response.iter_content.return_value = [self.FILES[url.rsplit("/", 1)[1]][1]]
+            return response
+
+        jira_fetcher.jira._session.get.side_effect = get
+        return jira_fetcher
+
+    def test_resumes_partial_download(self, attachments_mixin, tmp_path):
+        """Test that a partial file is completed with a Range request."""
+        target = tmp_path / "file.txt"
+        (tmp_path / "file.txt.part").write_bytes(b"hello ")
+        response = MagicMock(status_code=206)
+        response.iter_content.return_value = [b"world"]
+        attachments_mixin.jira._session.get.side_effect = None
+        attachments_mixin.jira._session.get.return_value = response
+
+        assert attachments_mixin.download_attachment(
+            "https://test.url/file", str(target), expected_size=11
+        )
+
+        attachments_mixin.jira._session.get.assert_called_once_with(
+            "https://test.url/file", stream=True, headers={"Range": "bytes=6-"}
+        )
+        assert target.read_bytes() == b"hello world"
+        assert not (tmp_path / "file.txt.part").exists()
+
+    def test_range_ignored_restarts_download(self, attachments_mixin, tmp_path):
+        """Test that a full response replaces the partial file."""
+        target = tmp_path / "file.txt"
+        (tmp_path / "file.txt.part").write_bytes(b"stale")
+        response = MagicMock(status_code=200)
+        response.iter_content.return_value = [b"hello world"]
+        attachments_mixin.jira._session.get.side_effect = None
+        attachments_mixin.jira._session.get.return_value = response
+
+        assert attachments_mixin.download_attachment(
+            "https://test.url/file", str(target), expected_size=11
+        )
+        assert target.read_bytes() == b"hello world"
+
+    def test_incomplete_download_is_kept_for_resume(self, attachments_mixin, tmp_path):
+        """Test that a short download fails but leaves its partial file."""
+        target = tmp_path / "file.txt"
+        response = MagicMock(status_code=200)
+        response.iter_content.return_value = [b"hello"]
+        attachments_mixin.jira._session.get.side_effect = None
+        attachments_mixin.jira._session.get.return_value = response
+
+        assert not attachments_mixin.download_attachment(
+            "https://test.url/file", str(target), expected_size=11
+        )
+        assert not target.exists()
+        assert (tmp_path / "file.txt.part").read_bytes() == b"hello"
+
+    def test_unchanged_attachments_are_skipped(self, attachments_mixin, tmp_path):
+        """Test that a second download only fetches changed attachments."""
+        first = attachments_mixin.download_issue_attachments("TEST-1", str(tmp_path))
+
+        assert [d["filename"] for d in first["downloaded"]] == ["a.txt", "b.txt"]
+        assert (tmp_path / ATTACHMENT_MANIFEST_NAME).exists()
+
+        # b.txt was replaced by a new upload with the same name
+        issue = attachments_mixin.jira.issue.return_value
+        issue["fields"]["attachment"][1]["created"] = "2024-02-01T10:00:00.000+0000"
+        attachments_mixin.jira._session.get.reset_mock()
+
+        second = attachments_mixin.download_issue_attachments("TEST-1", str(tmp_path))
+
+        assert [d["filename"] for d in second["skipped"]] == ["a.txt"]
+        assert [d["filename"] for d in second["downloaded"]] == ["b.txt"]
+        attachments_mixin.jira._session.get.assert_called_once()
+
+    def test_duplicate_filenames_get_distinct_paths(self, attachments_mixin, tmp_path):
+        """Test that attachments sharing a name are saved to different files."""
+        issue = attachments_mixin.jira.issue.return_value
+        issue["fields"]["attachment"][1]["filename"] = "a.txt"
+
+        result = attachments_mixin.download_issue_attachments("TEST-1", str(tmp_path))
+
+        assert [d["path"] for d in result["downloaded"]] == [
+            str(tmp_path / "a.txt"),
+            str(tmp_path / "a-2.txt"),
+        ]
+        assert (tmp_path / "a-2.txt").read_bytes() == b"second file!"
+
+    @pytest.mark.anyio
+    async def test_async_download_is_concurrent(self, attachments_mixin, tmp_path):
+        """Test that attachments are downloaded at the same time and zipped."""
+        barrier = threading.Barrier(2, timeout=5)
+        get = attachments_mixin.jira._session.get.side_effect
+
+        def concurrent_get(url, stream, headers=None):
+            # Both downloads must be in flight for the barrier to pass
+            barrier.wait()
+            return get(url, stream, headers)
+
+        attachments_mixin.jira._session.get.side_effect = concurrent_get
+
+        result = await attachments_mixin.download_issue_attachments_async(
+            "TEST-1", str(tmp_path), as_zip=True
+        )
+
+        assert [d["filename"] for d in result["downloaded"]] == ["a.txt", "b.txt"]
+        assert result["failed"] == []
+        archive = result["zip"]
+        assert archive["filename"] == "TEST-1-attachments.zip"
+        assert archive["files"] == ["a.txt", "b.txt"]
+        with zipfile.ZipFile(
+            io.BytesIO(base64.b64decode(archive["content_base64"]))
+        ) as zf:
+            assert zf.read("b.txt") == b"second file!"
+
+    def test_zip_respects_size_limit(self, attachments_mixin, tmp_path):
+        """Test that files over the archive budget are left out."""
+        result = attachments_mixin.download_issue_attachments("TEST-1", str(tmp_path))
+
+        archive = attachments_mixin.zip_attachments(
+            "out.zip", result["downloaded"], max_bytes=11
+        )
+
+        assert archive["files"] == ["a.txt"]
+        assert archive["omitted"] == ["b.txt"]
+
+    @pytest.mark.anyio
+    async def test_async_upload_keeps_order(self, attachments_mixin):
+        """Test that concurrent uploads report results in path order."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def upload(issue_key, file_path):
+            barrier.wait()
+            if file_path.endswith("missing.txt"):
+                return {"success": False, "error": "File not found"}
+            return {"success": True, "filename": "ok.txt", "size": 1, "id": "10"}
+
+        with patch.object(attachments_mixin, "upload_attachment", side_effect=upload):
+            result = await attachments_mixin.upload_attachments_async(
+                "TEST-1", ["/tmp/ok.txt", "/tmp/missing.txt"]
+            )
+
+        assert result["total"] == 2
+        assert result["uploaded"] == [{"filename": "ok.txt", "size": 1, "id": "10"}]
+        assert result["failed"] == [
+            {"filename": "missing.txt", "error": "File not found"}
+        ]
@@ -0,0 +1,156 @@
+"""Tests for the Jira field registry."""
+
+import json
+import os
+import time
+
+import pytest
+
+from mcp_atlassian.jira.config import JiraConfig
+from mcp_atlassian.jira.field_registry import (
+    FieldRegistry,
+    get_credential_identity,
+    get_field_cache_path,
+    get_field_cache_ttl,
+)
+from mcp_atlassian.utils.oauth import OAuthConfig
+
+FIELDS = [
+    {"id": "summary", "name": "Summary", "clauseNames": ["summary"]},
+    {
+        "id": "customfield_10010",
+        "name": "Epic Link",
+        "clauseNames": ["cf[10010]", "Epic Link"],
+        "schema": {"custom": "com.pyxis.greenhopper.jira:gh-epic-link"},
+    },
+    {
+        "id": "customfield_10011",
+        "name": "Epic Name",
+        "schema": {"custom": "com.pyxis.greenhopper.jira:gh-epic-label"},
+    },
+    {
+        "id": "customfield_10020",
+        "name": "Sprint",
+        "schema": {"custom": "com.pyxis.greenhopper.jira:gh-sprint"},
+    },
+    {
+        "id": "customfield_10016",
+        "name": "Story point estimate",
+        "schema": {"type": "number"},
+    },
+    {"id": "customfield_10099", "name": "Summary"},
+]
+
+
+class TestFieldRegistry:
+    """Tests for indexing and role detection."""
+
+    def test_resolve(self):
+        """Test resolving IDs, case-insensitive names and clause names."""
+        registry = FieldRegistry(FIELDS)
+
+        assert registry.resolve("customfield_10010") == "customfield_10010"
+        assert registry.resolve("epic name") == "customfield_10011"
+        assert registry.resolve("CF[10010]") == "customfield_10010"
+        # The first field wins for duplicate names
+        assert registry.resolve("summary") == "summary"
+        assert registry.resolve("Unknown") is None
+
+    def test_roles(self):
+        """Test detecting field roles by custom type and by name."""
+        registry = FieldRegistry(FIELDS)
+
+        assert registry.role("epic_link") == "customfield_10010"
+        assert registry.role("epic_name") == "customfield_10011"
+        assert registry.role("sprint") == "customfield_10020"
+        assert registry.role("story_points") == "customfield_10016"
+        assert registry.role("epic_color") is None
+
+    def test_epic_field_ids_format(self):
+        """Test the legacy epic field ID mapping."""
+        field_ids = FieldRegistry(FIELDS).epic_field_ids
+
+        assert field_ids["epic_link"] == field_ids["Epic Link"] == "customfield_10010"
+        assert field_ids["epic_name"] == field_ids["Epic Name"] == "customfield_10011"
+        assert field_ids["Sprint"] == "customfield_10020"
+
+    def test_lookups(self):
+        """Test field definition, schema and name map lookups."""
+        registry = FieldRegistry(FIELDS)
+
+        assert registry.get("customfield_10020")["name"] == "Sprint"
+        assert registry.schema("customfield_10016") == {"type": "number"}
+        assert registry.schema("missing") == {}
+        assert registry.name_map["story point estimate"] == "customfield_10016"
+        assert registry.name_map["customfield_10099"] == "customfield_10099"
+
+
+class TestFieldRegistryPersistence:
+    """Tests for saving and loading registries."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that a saved registry loads with the same fields."""
+        path = tmp_path / "fields.json"
+        FieldRegistry(FIELDS, fetched_at=time.time()).save(path)
+
+        loaded = FieldRegistry.load(path, ttl=60)
+
+        assert loaded is not None
+        assert loaded.fields == FIELDS
+        assert loaded.role("sprint") == "customfield_10020"
+        assert os.stat(path).st_mode & 0o777 == 0o600
+
+    def test_expired_file_is_ignored(self, tmp_path):
+        """Test that a field list older than the TTL is not used."""
+        path = tmp_path / "fields.json"
+        FieldRegistry(FIELDS, fetched_at=time.time() - 120).save(path)
+
+        assert FieldRegistry.load(path, ttl=60) is None
+        assert FieldRegistry.load(path, ttl=0) is not None
+
+    @pytest.mark.parametrize("content", ["not json", json.dumps({"fields": []})])
+    def test_invalid_file_is_ignored(self, tmp_path, content):
+        """Test that unreadable cache files are ignored."""
+        path = tmp_path / "fields.json"
+        path.write_text(content)
+
+        assert FieldRegistry.load(path, ttl=60) is None
+
+    def test_cache_path_from_env(self, monkeypatch, tmp_path):
+        """Test the cache file location and TTL settings."""
+        monkeypatch.delenv("JIRA_FIELD_CACHE_DIR", raising=False)
+        assert get_field_cache_path("https://jira.example.com") is None
+
+        monkeypatch.setenv("JIRA_FIELD_CACHE_DIR", str(tmp_path))
+        monkeypatch.setenv("JIRA_FIELD_CACHE_TTL", "120")
+        first = get_field_cache_path("https://jira.example.com", "alice")
+        second = get_field_cache_path("https://jira.example.com", "bob")
+
+        assert first.parent == tmp_path
+        assert first != second
+        assert get_field_cache_ttl() == 120
+
+    def test_credential_identity_without_username(self):
+        """Test PAT and OAuth credentials without a username get distinct identities."""
+        url = "https://jira.example.com"
+        alice = JiraConfig(url=url, auth_type="pat", personal_token="alice-token")
+        bob = JiraConfig(url=url, auth_type="pat", personal_token="bob-token")
+        oauth = JiraConfig(
+            url=url,
+            auth_type="oauth",
+            oauth_config=OAuthConfig(
+                client_id="client",
+                client_secret="secret",
+                redirect_uri="http://localhost",
+                scope="read:jira-work",
+                cloud_id="cloud-1",
+            ),
+        )
+
+        identities = {get_credential_identity(c) for c in (alice, bob, oauth)}
+
+        assert len(identities) == 3
+        assert get_credential_identity(alice) == get_credential_identity(
+            JiraConfig(url=url, auth_type="pat", personal_token="alice-token")
+        )
+        assert all("token" not in identity for identity in identities)
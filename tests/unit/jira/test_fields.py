@@ -353,6 +353,79 @@ class TestFieldsMixin:
         # Verify the result
         assert result == {}
 
+    def test_get_field_ids_to_epic_is_memoized(
+        self, fields_mixin: FieldsMixin, mock_fields
+    ):
+        """Test epic field discovery runs once per field list."""
+        fields_mixin._field_ids_cache = mock_fields[:4]
+        fields_mixin._try_discover_fields_from_existing_epic = MagicMock()
+
+        first = fields_mixin.get_field_ids_to_epic()
+        first["epic_link"] = "changed"
+        second = fields_mixin.get_field_ids_to_epic()
+
+        fields_mixin._try_discover_fields_from_existing_epic.assert_called_once()
+        assert "epic_link" not in second
+
+        # A new field list is discovered again
+        fields_mixin._field_ids_cache = mock_fields
+        assert fields_mixin.get_field_ids_to_epic()["epic_link"] == "customfield_10010"
+
+    def test_get_fields_persisted_to_disk(
+        self, fields_mixin: FieldsMixin, mock_fields, monkeypatch, tmp_path
+    ):
+        """Test a persisted field list is reused by a new fetcher."""
+        monkeypatch.setenv("JIRA_FIELD_CACHE_DIR", str(tmp_path))
+        fields_mixin.jira.get_all_fields.return_value = mock_fields
+        fields_mixin.get_fields()
+        assert len(list(tmp_path.iterdir())) == 1
+
+        # Simulate a new process
+        fields_mixin._field_ids_cache = None
+        fields_mixin._field_registry = None
+        fields_mixin.jira.get_all_fields.reset_mock()
+
+        assert fields_mixin.get_fields() == mock_fields
+        fields_mixin.jira.get_all_fields.assert_not_called()
+        assert fields_mixin.get_field_registry().role("epic_name") == (
+            "customfield_10011"
+        )
+
+    def test_get_fields_expired_keeps_unchanged_registry(
+        self, fields_mixin: FieldsMixin, mock_fields, monkeypatch
+    ):
+        """Test an expired field list is refetched and indexes kept if unchanged."""
+        monkeypatch.setenv("JIRA_FIELD_CACHE_TTL", "60")
+        fields_mixin.jira.get_all_fields.return_value = mock_fields
+        fields_mixin.get_fields()
+        registry = fields_mixin.get_field_registry()
+
+        registry.fetched_at -= 120
+        fields_mixin.get_fields()
+
+        assert fields_mixin.jira.get_all_fields.call_count == 2
+        assert fields_mixin.get_field_registry() is registry
+        assert registry.age() < 60
+
+    def test_get_field_id_unknown_refreshes_stale_list(
+        self, fields_mixin: FieldsMixin, mock_fields
+    ):
+        """Test an unknown field name refreshes a field list once it is stale."""
+        fields_mixin.jira.get_all_fields.return_value = mock_fields
+        fields_mixin.get_fields()
+        fields_mixin.jira.get_all_fields.return_value = [
+            *mock_fields,
+            {"id": "customfield_10100", "name": "Team"},
+        ]
+
+        # Freshly downloaded lists are not refreshed
+        assert fields_mixin.get_field_id("Team") is None
+        assert fields_mixin.jira.get_all_fields.call_count == 1
+
+        fields_mixin.get_field_registry().fetched_at -= 120
+        assert fields_mixin.get_field_id("Team") == "customfield_10100"
+        assert fields_mixin.jira.get_all_fields.call_count == 2
+
     def test_is_custom_field(self, fields_mixin: FieldsMixin):
         """Test is_custom_field correctly identifies custom fields."""
         # Test with custom field
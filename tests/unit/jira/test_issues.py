@@ -3,7 +3,9 @@
 from unittest.mock import ANY, MagicMock, patch
 
 import pytest
+from requests.exceptions import HTTPError
 
+from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.jira import JiraFetcher
 from mcp_atlassian.jira.issues import IssuesMixin, logger
 from mcp_atlassian.models.jira import JiraIssue
@@ -115,7 +117,8 @@ class TestIssuesMixin:
             properties=None,
             update_history=True,
         )
-        issues_mixin.jira.issue_get_comments.assert_called_once_with("TEST-123")
+        # The comments returned with the issue are complete, so none are refetched
+        issues_mixin.jira.issue_get_comments.assert_not_called()
 
         # Verify the comments were added to the issue
         assert hasattr(issue, "comments")
@@ -176,12 +179,13 @@ class TestIssuesMixin:
                 properties=None,
                 update_history=True,
             )
+            # Only the epic's summary and name are requested
             issues_mixin.jira.get_issue.assert_any_call(
                 "EPIC-456",
                 expand=None,
-                fields=None,
+                fields="summary,customfield_10011",
                 properties=None,
-                update_history=True,
+                update_history=False,
             )
 
             # Verify the issue
@@ -197,6 +201,94 @@ class TestIssuesMixin:
         except Exception as e:
             pytest.fail(f"Test failed: {e}")
 
+    def test_get_issue_fetches_truncated_comments(self, issues_mixin: IssuesMixin):
+        """Test that only comment_limit comments are requested when truncated."""
+        comment = {
+            "id": "1",
+            "body": "First",
+            "created": "2023-01-01T00:00:00.000+0000",
+            "author": {"displayName": "Comment User"},
+        }
+        issues_mixin.jira.get_issue.return_value = {
+            "id": "12345",
+            "key": "TEST-123",
+            "fields": {
+                "summary": "Test Issue",
+                "comment": {"comments": [comment], "total": 30, "maxResults": 1},
+            },
+        }
+        issues_mixin.jira.resource_url.side_effect = lambda r: f"rest/api/2/{r}"
+        issues_mixin.jira.get.return_value = {"comments": [comment, comment]}
+
+        issue = issues_mixin.get_issue(
+            "TEST-123", fields="summary,comment", comment_limit=2
+        )
+
+        issues_mixin.jira.get.assert_called_once_with(
+            "rest/api/2/issue/TEST-123/comment",
+            params={"startAt": 0, "maxResults": 2},
+        )
+        issues_mixin.jira.issue_get_comments.assert_not_called()
+        assert len(issue.comments) == 2
+
+    def test_get_issue_epic_details_are_cached(self, issues_mixin: IssuesMixin):
+        """Test that the linked epic is looked up once across calls."""
+        story = {
+            "id": "10001",
+            "key": "TEST-123",
+            "fields": {
+                "summary": "Test Issue",
+                "issuetype": {"name": "Story"},
+                "customfield_10010": "EPIC-456",
+            },
+        }
+        epic = {
+            "id": "10002",
+            "key": "EPIC-456",
+            "fields": {"summary": "Epic", "customfield_10011": "Epic Name"},
+        }
+        issues_mixin.jira.get_issue.side_effect = lambda key, **kwargs: (
+            epic if key == "EPIC-456" else {**story, "fields": dict(story["fields"])}
+        )
+        issues_mixin.get_field_ids_to_epic = MagicMock(
+            return_value={
+                "epic_link": "customfield_10010",
+                "epic_name": "customfield_10011",
+            }
+        )
+
+        for _ in range(2):
+            issue = issues_mixin.get_issue("TEST-123")
+            assert issue.custom_fields["customfield_10011"] == {"value": "Epic Name"}
+
+        epic_calls = [
+            c
+            for c in issues_mixin.jira.get_issue.call_args_list
+            if c.args[0] == "EPIC-456"
+        ]
+        assert len(epic_calls) == 1
+
+    def test_get_issue_skips_epic_lookup_without_epic_name_field(
+        self, issues_mixin: IssuesMixin
+    ):
+        """Test that no epic request is made when there is no Epic Name field."""
+        issues_mixin.jira.get_issue.return_value = {
+            "id": "10001",
+            "key": "TEST-123",
+            "fields": {
+                "summary": "Test Issue",
+                "issuetype": {"name": "Story"},
+                "customfield_10010": "EPIC-456",
+            },
+        }
+        issues_mixin.get_field_ids_to_epic = MagicMock(
+            return_value={"epic_link": "customfield_10010"}
+        )
+
+        issues_mixin.get_issue("TEST-123")
+
+        issues_mixin.jira.get_issue.assert_called_once()
+
     def test_get_issue_error_handling(self, issues_mixin: IssuesMixin):
         """Test error handling in get_issue."""
         # Mock the API to raise an exception
@@ -1460,6 +1552,168 @@ class TestIssuesMixin:
             },
         )
 
+    @staticmethod
+    def _raw_issue(key: str) -> dict:
+        """Build a minimal raw issue as returned by the Jira API."""
+        return {
+            "id": str(10000 + int(key.split("-")[1])),
+            "key": key,
+            "fields": {"summary": f"Issue {key}", "status": {"name": "Open"}},
+        }
+
+    def test_get_issues_cloud_bulk_fetch(self, issues_mixin: IssuesMixin):
+        """Test get_issues uses the bulk fetch endpoint and keeps input order."""
+        issues_mixin.config = MagicMock(
+            is_cloud=True, projects_filter=None, url="https://test.atlassian.net"
+        )
+        issues_mixin.jira.resource_url.side_effect = lambda r: f"rest/api/2/{r}"
+        issues_mixin.jira.post.return_value = {
+            "issues": [self._raw_issue("TEST-2"), self._raw_issue("TEST-1")],
+            "issueErrors": [{"errorMessages": ["Issue TEST-9 not found"]}],
+        }
+
+        result = issues_mixin.get_issues(
+            ["TEST-1", "TEST-9", "TEST-2", "TEST-1"], fields="summary,status"
+        )
+
+        assert [issue.key for issue in result] == ["TEST-1", "TEST-2"]
+        issues_mixin.jira.post.assert_called_once_with(
+            "rest/api/2/issue/bulkfetch",
+            data={
+                "issueIdsOrKeys": ["TEST-1", "TEST-9", "TEST-2"],
+                "fields": ["summary", "status"],
+            },
+        )
+
+    def test_get_issues_server_jql_chunks(self, issues_mixin: IssuesMixin):
+        """Test get_issues splits keys into sequential JQL chunks on Server/DC."""
+        issues_mixin.config = MagicMock(
+            is_cloud=False, projects_filter=None, url="https://jira.example.com"
+        )
+        issues_mixin.jira.resource_url.side_effect = lambda r: f"rest/api/2/{r}"
+
+        def search(path, data):
+            keys = data["jql"][len("key in (") : -1].replace('"', "").split(", ")
+            return {"issues": [self._raw_issue(key) for key in reversed(keys)]}
+
+        issues_mixin.jira.post.side_effect = search
+        keys = [f"TEST-{i}" for i in range(1, 6)]
+
+        result = issues_mixin.get_issues(keys, expand="renderedFields", chunk_size=2)
+
+        assert [issue.key for issue in result] == keys
+        assert issues_mixin.jira.post.call_count == 3
+        payloads = [c.kwargs["data"] for c in issues_mixin.jira.post.call_args_list]
+        assert [p["jql"] for p in payloads] == [
+            'key in ("TEST-1", "TEST-2")',
+            'key in ("TEST-3", "TEST-4")',
+            'key in ("TEST-5")',
+        ]
+        # Every chunk requests the same field list
+        assert all(p["fields"] == payloads[0]["fields"] for p in payloads)
+        assert all(p["validateQuery"] is False for p in payloads)
+        assert all(p["expand"] == ["renderedFields"] for p in payloads)
+
+    def test_get_issues_by_key_moved_issues(self, issues_mixin: IssuesMixin):
+        """Test moved issues are returned under the key they were requested with."""
+        issues_mixin.config = MagicMock(
+            is_cloud=True, projects_filter=None, url="https://test.atlassian.net"
+        )
+        moved = [self._raw_issue("NEW-7"), self._raw_issue("NEW-8")]
+        issues_mixin.jira.post.return_value = {
+            "issues": [self._raw_issue("TEST-1"), *moved]
+        }
+        issues_mixin.jira.get_issue.side_effect = lambda key, fields: {
+            "OLD-7": {"id": moved[0]["id"], "key": "NEW-7"},
+            "OLD-8": {"id": moved[1]["id"], "key": "NEW-8"},
+        }.get(key)
+
+        result = issues_mixin.get_issues_by_key(
+            ["TEST-1", "OLD-8", "OLD-7", "TEST-9"], fields="summary"
+        )
+
+        assert {key: issue.key for key, issue in result.items()} == {
+            "TEST-1": "TEST-1",
+            "OLD-8": "NEW-8",
+            "OLD-7": "NEW-7",
+        }
+        assert list(result) == ["TEST-1", "OLD-8", "OLD-7"]
+
+    def test_get_issues_by_key_single_moved_issue(self, issues_mixin: IssuesMixin):
+        """Test a single leftover issue answers a single unmatched key."""
+        issues_mixin.config = MagicMock(
+            is_cloud=True, projects_filter=None, url="https://test.atlassian.net"
+        )
+        issues_mixin.jira.post.return_value = {
+            "issues": [self._raw_issue("TEST-1"), self._raw_issue("NEW-7")]
+        }
+
+        result = issues_mixin.get_issues_by_key(["TEST-1", "OLD-7"])
+
+        assert result["OLD-7"].key == "NEW-7"
+        issues_mixin.jira.get_issue.assert_not_called()
+
+    def test_get_issues_projects_filter(self, issues_mixin: IssuesMixin):
+        """Test get_issues skips keys restricted by the projects filter."""
+        issues_mixin.config = MagicMock(
+            is_cloud=True, projects_filter="TEST", url="https://test.atlassian.net"
+        )
+        issues_mixin.jira.post.return_value = {"issues": [self._raw_issue("TEST-1")]}
+
+        result = issues_mixin.get_issues(["OTHER-1", "TEST-1"])
+
+        assert [issue.key for issue in result] == ["TEST-1"]
+        payload = issues_mixin.jira.post.call_args.kwargs["data"]
+        assert payload["issueIdsOrKeys"] == ["TEST-1"]
+
+        issues_mixin.jira.post.reset_mock()
+        assert issues_mixin.get_issues(["OTHER-1"]) == []
+        issues_mixin.jira.post.assert_not_called()
+
+    def test_get_issues_batches_epic_lookups(self, issues_mixin: IssuesMixin):
+        """Test get_issues resolves linked epic names in one request."""
+        issues_mixin.config = MagicMock(
+            is_cloud=True, projects_filter=None, url="https://test.atlassian.net"
+        )
+        issues_mixin.get_field_ids_to_epic = MagicMock(
+            return_value={
+                "epic_link": "customfield_10010",
+                "epic_name": "customfield_10011",
+            }
+        )
+        stories = []
+        for i, epic_key in enumerate(["EPIC-1", "EPIC-2", "EPIC-1"], start=1):
+            story = self._raw_issue(f"TEST-{i}")
+            story["fields"]["customfield_10010"] = epic_key
+            stories.append(story)
+        epics = [
+            {"key": key, "fields": {"summary": key, "customfield_10011": f"{key} name"}}
+            for key in ("EPIC-1", "EPIC-2")
+        ]
+        issues_mixin.jira.post.side_effect = [{"issues": stories}, {"issues": epics}]
+
+        result = issues_mixin.get_issues(
+            ["TEST-1", "TEST-2", "TEST-3"], fields="summary,customfield_10010"
+        )
+
+        assert issues_mixin.jira.post.call_count == 2
+        epic_payload = issues_mixin.jira.post.call_args.kwargs["data"]
+        assert epic_payload["issueIdsOrKeys"] == ["EPIC-1", "EPIC-2"]
+        assert epic_payload["fields"] == ["summary", "customfield_10011"]
+        assert [
+            issue.custom_fields["customfield_10011"]["value"] for issue in result
+        ] == ["EPIC-1 name", "EPIC-2 name", "EPIC-1 name"]
+
+    def test_get_issues_authentication_error(self, issues_mixin: IssuesMixin):
+        """Test get_issues converts 401 responses to authentication errors."""
+        issues_mixin.config = MagicMock(is_cloud=True, projects_filter=None)
+        issues_mixin.jira.post.side_effect = HTTPError(
+            response=MagicMock(status_code=401)
+        )
+
+        with pytest.raises(MCPAtlassianAuthenticationError):
+            issues_mixin.get_issues(["TEST-1"])
+
     def test_create_issue_with_labels(self, issues_mixin: IssuesMixin):
         """Test creating an issue with labels in additional_fields."""
         # Mock create_issue response
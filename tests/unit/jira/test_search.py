@@ -6,7 +6,7 @@ import pytest
 import requests
 
 from mcp_atlassian.jira import JiraFetcher
-from mcp_atlassian.jira.search import SearchMixin
+from mcp_atlassian.jira.search import SearchMixin, normalize_jql
 from mcp_atlassian.models.jira import JiraIssue, JiraSearchResult
 
 
@@ -116,6 +116,81 @@ class TestSearchMixin:
         other_method_mock = getattr(search_mixin.jira, other_method_name)
         other_method_mock.assert_not_called()
 
+    @pytest.fixture
+    def cloud_search_mixin(self, search_mixin: SearchMixin, mock_issues_response):
+        """Configure the search mixin for Jira Cloud."""
+        search_mixin.config.is_cloud = True
+        search_mixin.jira.resource_url = MagicMock(
+            side_effect=lambda resource: f"rest/api/3/{resource}"
+        )
+        search_mixin.jira.enhanced_jql_get_list_of_tickets = MagicMock(
+            return_value=mock_issues_response["issues"]
+        )
+        search_mixin.jira.post = MagicMock(return_value={"count": 42})
+        search_mixin.jira.get = MagicMock(return_value={"total": 40})
+        return search_mixin
+
+    def test_search_issues_cloud_approximate_total(
+        self, cloud_search_mixin: SearchMixin
+    ):
+        """Test that Cloud totals come from the approximate count, cached per JQL."""
+        result = cloud_search_mixin.search_issues("project = TEST ORDER BY created")
+        again = cloud_search_mixin.search_issues("project  =  TEST order by key DESC")
+
+        assert result.total == 42
+        assert again.total == 42
+        cloud_search_mixin.jira.post.assert_called_once_with(
+            "rest/api/3/search/approximate-count",
+            json={"jql": "project = TEST ORDER BY created"},
+        )
+        cloud_search_mixin.jira.get.assert_not_called()
+
+    def test_search_issues_cloud_exact_total(self, cloud_search_mixin: SearchMixin):
+        """Test that the exact mode counts with the legacy search endpoint."""
+        result = cloud_search_mixin.search_issues("project = TEST", total_mode="exact")
+
+        assert result.total == 40
+        cloud_search_mixin.jira.get.assert_called_once_with(
+            "rest/api/3/search", params={"jql": "project = TEST", "maxResults": 0}
+        )
+        cloud_search_mixin.jira.post.assert_not_called()
+
+    def test_search_issues_cloud_without_total(self, cloud_search_mixin: SearchMixin):
+        """Test that opting out of totals makes a single request."""
+        result = cloud_search_mixin.search_issues("project = TEST", total_mode="none")
+
+        assert result.total == -1
+        assert len(result.issues) == 1
+        cloud_search_mixin.jira.post.assert_not_called()
+        cloud_search_mixin.jira.get.assert_not_called()
+
+    def test_search_issues_cloud_failed_total_not_cached(
+        self, cloud_search_mixin: SearchMixin
+    ):
+        """Test that a failed count yields -1 and is retried by the next search."""
+        cloud_search_mixin.jira.post.side_effect = [
+            requests.HTTPError("bounded JQL required"),
+            {"count": 7},
+        ]
+
+        assert cloud_search_mixin.search_issues("project = TEST").total == -1
+        assert cloud_search_mixin.search_issues("project = TEST").total == 7
+        assert cloud_search_mixin.jira.post.call_count == 2
+
+    @pytest.mark.parametrize(
+        ("jql", "expected"),
+        [
+            ("project = TEST", "project = TEST"),
+            ("  project =\n TEST  ", "project = TEST"),
+            ("project = TEST ORDER BY created DESC", "project = TEST"),
+            ("ORDER BY created", ""),
+            ('summary ~ "order by x"', 'summary ~ "order by x"'),
+        ],
+    )
+    def test_normalize_jql(self, jql, expected):
+        """Test that formatting and ordering do not change the cache key."""
+        assert normalize_jql(jql) == expected
+
     def test_search_issues_basic(self, search_mixin: SearchMixin):
         """Test basic search functionality."""
         # Setup mock response
@@ -788,3 +863,97 @@ class TestSearchMixin:
         api_method_mock.assert_called_with(
             'project = "PROJ1"   ORDER BY priority DESC  ', **expected_kwargs
         )
+
+    @staticmethod
+    def issues_page(keys: list[str], **extra) -> dict:
+        """Build a page of a search response with the given issue keys."""
+        return {
+            "issues": [
+                {"id": key.split("-")[1], "key": key, "fields": {"summary": key}}
+                for key in keys
+            ],
+            **extra,
+        }
+
+    def test_iter_issues_server_follows_start_at(self, search_mixin: SearchMixin):
+        """Test that Server/DC iteration pages with startAt until the total."""
+        search_mixin.jira.jql.side_effect = [
+            self.issues_page(["T-1", "T-2"], total=5, startAt=0),
+            self.issues_page(["T-3", "T-4"], total=5, startAt=2),
+            self.issues_page(["T-5"], total=5, startAt=4),
+        ]
+
+        issues = list(search_mixin.iter_issues("project = T", page_size=2))
+
+        assert [issue.key for issue in issues] == ["T-1", "T-2", "T-3", "T-4", "T-5"]
+        assert [c.kwargs["start"] for c in search_mixin.jira.jql.call_args_list] == [
+            0,
+            2,
+            4,
+        ]
+
+    def test_iter_issues_cloud_follows_next_page_token(self, search_mixin: SearchMixin):
+        """Test that Cloud iteration follows nextPageToken until the last page."""
+        search_mixin.config.is_cloud = True
+        search_mixin.jira.enhanced_jql.side_effect = [
+            self.issues_page(["T-1", "T-2"], nextPageToken="tok-2"),
+            self.issues_page(["T-3"], isLast=True),
+        ]
+
+        issues = list(
+            search_mixin.iter_issues("project = T", fields="summary", page_size=2)
+        )
+
+        assert [issue.key for issue in issues] == ["T-1", "T-2", "T-3"]
+        tokens = [
+            c.kwargs["nextPageToken"]
+            for c in search_mixin.jira.enhanced_jql.call_args_list
+        ]
+        assert tokens == [None, "tok-2"]
+
+    def test_iter_issues_max_items(self, search_mixin: SearchMixin):
+        """Test that max_items caps the requested page size and stops paging."""
+        search_mixin.config.is_cloud = True
+        search_mixin.jira.enhanced_jql.side_effect = [
+            self.issues_page(["T-1", "T-2", "T-3"], nextPageToken="tok-2"),
+            self.issues_page(["T-4", "T-5"], nextPageToken="tok-3"),
+        ]
+
+        issues = list(search_mixin.iter_issues("project = T", page_size=3, max_items=5))
+
+        assert len(issues) == 5
+        limits = [
+            c.kwargs["limit"] for c in search_mixin.jira.enhanced_jql.call_args_list
+        ]
+        assert limits == [3, 2]
+
+    def test_iter_issues_applies_projects_filter(self, search_mixin: SearchMixin):
+        """Test that iteration applies the projects filter like search_issues."""
+        search_mixin.jira.jql.return_value = self.issues_page([], total=0)
+
+        list(search_mixin.iter_issues("status = Open", projects_filter="P1"))
+
+        assert search_mixin.jira.jql.call_args.args[0] == (
+            '(status = Open) AND project = "P1"'
+        )
+
+    def test_iter_board_issues(self, search_mixin: SearchMixin):
+        """Test that board issues are paged with startAt."""
+        search_mixin.jira.get_issues_for_board.side_effect = [
+            self.issues_page(["T-1", "T-2"], total=3),
+            self.issues_page(["T-3"], total=3),
+        ]
+
+        issues = list(search_mixin.iter_board_issues("1000", "", page_size=2))
+
+        assert [issue.key for issue in issues] == ["T-1", "T-2", "T-3"]
+        search_mixin.jira.get_issues_for_board.assert_called_with(
+            board_id="1000", jql="", fields=ANY, start=2, limit=2, expand=None
+        )
+
+    def test_iter_sprint_issues_type_error(self, search_mixin: SearchMixin):
+        """Test that an unexpected response raises instead of ending silently."""
+        search_mixin.jira.get_sprint_issues.return_value = None
+
+        with pytest.raises(TypeError, match="jira.get_sprint_issues"):
+            list(search_mixin.iter_sprint_issues("10001"))
@@ -332,3 +332,27 @@ def test_update_sprint_exception(sprints_mixin):
 
     assert result is None
     sprints_mixin.jira.update_partially_sprint.assert_called_once()
+
+
+def test_iter_sprints_from_board(sprints_mixin):
+    """Test that sprints are paged until the page flagged as the last one."""
+    sprints_mixin.jira.get_all_sprints_from_board.side_effect = [
+        {"isLast": False, "values": [{"id": 1, "name": "S1"}, {"id": 2, "name": "S2"}]},
+        {"isLast": True, "values": [{"id": 3, "name": "S3"}]},
+    ]
+
+    sprints = list(sprints_mixin.iter_sprints_from_board("1000", page_size=2))
+
+    assert [sprint.name for sprint in sprints] == ["S1", "S2", "S3"]
+    assert all(isinstance(sprint, JiraSprint) for sprint in sprints)
+    sprints_mixin.jira.get_all_sprints_from_board.assert_called_with(
+        board_id="1000", state=None, start=2, limit=2
+    )
+
+
+def test_iter_sprints_from_board_error_is_raised(sprints_mixin):
+    """Test that a failing page is raised rather than ending the iteration."""
+    sprints_mixin.jira.get_all_sprints_from_board.side_effect = requests.HTTPError()
+
+    with pytest.raises(requests.HTTPError):
+        list(sprints_mixin.iter_sprints_from_board("1000", max_items=10))
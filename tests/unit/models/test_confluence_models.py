@@ -5,6 +5,8 @@ These tests validate the conversion of Confluence API responses to structured mo
 and the simplified dictionary conversion for API responses.
 """
 
+from unittest.mock import MagicMock
+
 import pytest
 
 from src.mcp_atlassian.models import (
@@ -460,6 +462,46 @@ class TestConfluencePage:
         # URL should be included
         assert "url" in simplified
 
+    def test_content_loader_runs_once_on_first_read(self, confluence_page_data):
+        """Test that a content loader is deferred until the content is read."""
+        loader = MagicMock(return_value="Converted content")
+        page = ConfluencePage.from_api_response(
+            confluence_page_data, content_loader=loader, content_format="markdown"
+        )
+
+        loader.assert_not_called()
+        assert page.to_simplified_dict()["content"] == {
+            "value": "Converted content",
+            "format": "markdown",
+        }
+        assert page.content == "Converted content"
+        loader.assert_called_once_with()
+
+    def test_content_assignment_replaces_loader(self):
+        """Test that assigning content discards a pending loader."""
+        loader = MagicMock(return_value="Converted content")
+        page = ConfluencePage(id="1", content="original")
+        page.set_content_loader(loader)
+
+        page.content = "assigned"
+
+        assert page.content == "assigned"
+        loader.assert_not_called()
+
+    def test_model_dump_resolves_content_loader(self):
+        """Test that dumps emit the loaded content under the content key."""
+        loader = MagicMock(return_value="Converted content")
+        page = ConfluencePage(id="1")
+        page.set_content_loader(loader)
+
+        dumped = page.model_dump()
+
+        assert dumped["content"] == "Converted content"
+        assert "content_value" not in dumped
+        assert '"content":"Converted content"' in page.model_dump_json()
+        assert ConfluencePage.model_validate(dumped).content == "Converted content"
+        loader.assert_called_once_with()
+
     def test_from_api_response_with_expandable_space(self):
         """Test creating a ConfluencePage from data with space info in _expandable."""
         page_data = {
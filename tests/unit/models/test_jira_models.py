@@ -7,9 +7,11 @@ and the simplified dictionary conversion for API responses.
 
 import os
 import re
+from unittest.mock import patch
 
 import pytest
 
+from src.mcp_atlassian.jira.field_registry import FieldRegistry
 from src.mcp_atlassian.models.constants import (
     EMPTY_STRING,
     JIRA_DEFAULT_ID,
@@ -912,6 +914,58 @@ class TestJiraIssue:
         assert issue.epic_key == "EPIC-456"
         assert issue.epic_name == "Epic Name Value"
 
+    def test_epic_field_extraction_with_field_registry(self):
+        """Test epic fields are read by ID when a field registry is given."""
+        registry = FieldRegistry(
+            [
+                {"id": "customfield_20100", "name": "Epic Link"},
+                {"id": "customfield_20200", "name": "Epic Name"},
+            ]
+        )
+        test_data = {
+            "id": "12345",
+            "key": "PROJ-123",
+            "fields": {
+                "summary": "Test Issue",
+                "customfield_20100": "EPIC-456",
+                "customfield_20200": "My Epic Name",
+            },
+        }
+
+        with patch.object(JiraIssue, "_find_custom_field_in_api_response") as mock_find:
+            issue = JiraIssue.from_api_response(test_data, field_registry=registry)
+
+        mock_find.assert_not_called()
+        assert issue.epic_key == "EPIC-456"
+        assert issue.epic_name == "My Epic Name"
+
+    def test_epic_field_extraction_with_discovered_epic_fields(self):
+        """Test epic field IDs found by discovery are used when no role matches."""
+        registry = FieldRegistry(
+            [
+                {"id": "customfield_30100", "name": "Feature"},
+                {"id": "customfield_30200", "name": "Feature Title"},
+            ]
+        )
+        registry.discovered_epic_field_ids = {
+            "epic_link": "customfield_30100",
+            "epic_name": "customfield_30200",
+        }
+        test_data = {
+            "id": "12345",
+            "key": "PROJ-123",
+            "fields": {
+                "summary": "Test Issue",
+                "customfield_30100": "EPIC-789",
+                "customfield_30200": "Discovered Epic",
+            },
+        }
+
+        issue = JiraIssue.from_api_response(test_data, field_registry=registry)
+
+        assert issue.epic_key == "EPIC-789"
+        assert issue.epic_name == "Discovered Epic"
+
     def test_fields_with_names(self):
         """Test using the names to find fields."""
 
@@ -0,0 +1 @@
+"""Unit tests for the MCP Atlassian preprocessing module."""
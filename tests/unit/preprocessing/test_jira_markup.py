@@ -0,0 +1,86 @@
+"""Tests for the Jira wiki markup <-> Markdown converter."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from mcp_atlassian.preprocessing import jira_markup
+from mcp_atlassian.preprocessing.jira import JiraPreprocessor
+
+# Outputs of the previous converter, except for the cases marked "changed"
+GOLDEN_CASES = json.loads(
+    (Path(__file__).parent / "golden" / "jira_markup.json").read_text()
+)
+
+
+@pytest.mark.parametrize(
+    "case",
+    GOLDEN_CASES,
+    ids=[f"{case['direction']}-{case['name']}" for case in GOLDEN_CASES],
+)
+def test_golden_output(case):
+    """Test that conversions match the recorded output."""
+    convert = getattr(jira_markup, case["direction"])
+    assert convert(case["input"]) == case["expected"]
+
+
+@pytest.mark.parametrize("convert", ["jira_to_markdown", "markdown_to_jira"])
+def test_empty_input(convert):
+    """Test that empty input converts to an empty string."""
+    assert getattr(jira_markup, convert)("") == ""
+
+
+def test_jira_code_block_content_is_verbatim():
+    """Test that markup inside Jira code blocks is not converted."""
+    text = "{code}\nh1. *not* a [header|url]\n||a||b||\n{code}"
+
+    assert jira_markup.jira_to_markdown(text) == (
+        "```\n\nh1. *not* a [header|url]\n||a||b||\n\n```"
+    )
+
+
+def test_markdown_code_content_is_verbatim():
+    """Test that markup inside Markdown code is not converted."""
+    text = "`**kwargs**` and\n```\n- item\n[a](b)\n```"
+
+    assert jira_markup.markdown_to_jira(text) == (
+        "{{**kwargs**}} and\n{code}- item\n[a](b)\n{code}"
+    )
+
+
+def test_jira_code_block_in_quote():
+    """Test that every line of a code block inside a quote is quoted."""
+    text = "{quote}{code}\na\nb\n{code}{quote}"
+
+    assert jira_markup.jira_to_markdown(text) == "> ```\n> \n> a\n> b\n> \n> ```"
+
+
+def test_sentinel_characters_in_input_are_kept():
+    """Test that text resembling a protected block sentinel is left alone."""
+    text = "7 {{code}}"
+
+    assert jira_markup.jira_to_markdown(text) == "7 `code`"
+
+
+def test_preprocessor_delegates_to_converter():
+    """Test that JiraPreprocessor uses the converter in both directions."""
+    preprocessor = JiraPreprocessor()
+
+    assert preprocessor.jira_to_markdown("h1. *Title*") == "# **Title**"
+    assert preprocessor.markdown_to_jira("# **Title**") == "h1. *Title*"
+
+
+def test_clean_jira_text_smart_links_and_mentions():
+    """Test that mentions and smart links are converted before the markup."""
+    preprocessor = JiraPreprocessor(base_url="https://jira.example.com")
+    text = (
+        "[~accountid:abc123] see "
+        "[PROJ-1|https://x.atlassian.net/browse/PROJ-1|smart-link] and "
+        "[page|https://x.atlassian.net/wiki/spaces/S/pages/1/My+Page|smart-link]"
+    )
+
+    assert preprocessor.clean_jira_text(text) == (
+        "User:abc123 see [PROJ-1](https://jira.example.com/browse/PROJ-1) and "
+        "[My Page](https://x.atlassian.net/wiki/spaces/S/pages/1/My+Page)"
+    )
@@ -0,0 +1,185 @@
+"""Tests for the lxml storage format to Markdown converter."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from markdownify import markdownify as md
+
+from mcp_atlassian.preprocessing.confluence import ConfluencePreprocessor
+from mcp_atlassian.preprocessing.storage_markdown import (
+    StorageMarkdownConverter,
+    collect_user_refs,
+    parse_storage,
+    storage_to_markdown,
+)
+
+# Plain HTML is rendered exactly as markdownify renders it
+MARKDOWNIFY_CASES = [
+    "plain text only",
+    "<p>a  b\n c</p><p>x</p>",
+    "<p>a<b> bold </b>c</p>",
+    "<p><strong>a</strong><em>b</em><s>c</s></p>",
+    "<p>x_y*z <em>e</em> <code>c_d</code></p>",
+    "<p>``tick` code</p><code>a`b</code>",
+    "<p>a<br/>b</p><hr/><p>c&nbsp;d</p>",
+    "<p>x<!-- c -->y</p><script>z</script>",
+    "<div>  <p> a </p>  text  <span> s </span> </div>",
+    "<h1>T</h1><h2>Sub</h2><h3>Third</h3><h4>a <b>b</b></h4>",
+    '<a href="http://e.com">http://e.com</a> <a href="x"> sp </a>',
+    '<a href="u" title="t">l</a><img src="x.png" alt="A"/>',
+    "<ul><li><p>one</p></li><li>two</li></ul>",
+    "<ul><li>a<ul><li>b<ul><li>c</li></ul></li></ul></li></ul>",
+    '<ol start="3"><li>a</li></ol><ol><li>x</li><li>y</li></ol><p>after</p>',
+    "<ul><li>a</li></ul>\n<ul><li>b</li></ul>",
+    "<pre>code\n  block\n</pre><blockquote><p>q</p><p>r</p></blockquote>",
+    "<dl><dt>t</dt><dd>d\nmore</dd></dl>",
+    "<table><tr><td>a|b</td><td>c</td></tr><tr><td>1</td><td>2</td></tr></table>",
+    "<table><thead><tr><th>h</th><th>h2</th></tr></thead>"
+    '<tbody><tr><td>1</td><td colspan="2">2</td></tr></tbody></table>',
+]
+
+
+@pytest.mark.parametrize("html", MARKDOWNIFY_CASES)
+def test_matches_markdownify(html):
+    """Test that standard HTML renders the same as with markdownify."""
+    assert storage_to_markdown(html) == md(html)
+
+
+def test_empty_input():
+    """Test that empty input converts to an empty string."""
+    assert storage_to_markdown("") == ""
+
+
+def test_code_macro_is_fenced():
+    """Test that code macros become fenced blocks with their language."""
+    storage = (
+        '<ac:structured-macro ac:name="code">'
+        '<ac:parameter ac:name="language">python</ac:parameter>'
+        "<ac:plain-text-body><![CDATA[if a < b:\n    print('<b>_x_</b>')]]>"
+        "</ac:plain-text-body></ac:structured-macro>"
+    )
+
+    assert storage_to_markdown(storage) == (
+        "```python\nif a < b:\n    print('<b>_x_</b>')\n```"
+    )
+
+
+def test_panel_macro_is_quoted():
+    """Test that panel macros become block quotes without their parameters."""
+    storage = (
+        '<ac:structured-macro ac:name="info">'
+        '<ac:parameter ac:name="title">Heads up</ac:parameter>'
+        "<ac:rich-text-body><p>Read <strong>this</strong>.</p></ac:rich-text-body>"
+        "</ac:structured-macro>"
+    )
+
+    assert storage_to_markdown(storage) == "> **Heads up**\n>\n> Read **this**."
+
+
+def test_inline_confluence_elements():
+    """Test links, images, status macros and emoticons within a line."""
+    storage = (
+        "<p>See <ac:link><ri:page ri:content-title='Runbook'/>"
+        "<ac:plain-text-link-body><![CDATA[the runbook]]></ac:plain-text-link-body>"
+        "</ac:link> or <ac:link><ri:page ri:content-title='Other_page'/></ac:link>, "
+        '<ac:structured-macro ac:name="status">'
+        '<ac:parameter ac:name="title">DONE</ac:parameter></ac:structured-macro> '
+        '<ac:emoticon ac:name="tick"/> '
+        '<ac:image ac:alt="diagram"><ri:attachment ri:filename="d.png"/></ac:image>'
+        "</p>"
+    )
+
+    assert storage_to_markdown(storage) == (
+        r"See the runbook or Other\_page, DONE :tick: ![diagram](d.png)"
+    )
+
+
+def test_task_list():
+    """Test that task lists become Markdown checkboxes."""
+    storage = (
+        "<ac:task-list>"
+        "<ac:task><ac:task-id>1</ac:task-id><ac:task-status>complete</ac:task-status>"
+        "<ac:task-body>ship it</ac:task-body></ac:task>"
+        "<ac:task><ac:task-id>2</ac:task-id><ac:task-status>incomplete</ac:task-status>"
+        "<ac:task-body>tell people</ac:task-body></ac:task>"
+        "</ac:task-list>"
+    )
+
+    assert storage_to_markdown(storage) == "* [x] ship it\n* [ ] tell people"
+
+
+def test_user_references():
+    """Test that mentions and profile macros are collected and replaced."""
+    storage = (
+        '<p>Hi <ac:link><ri:user ri:account-id="a1"/></ac:link> and '
+        '<ac:link><ri:user ri:account-id="a2"/></ac:link>, from '
+        '<ac:structured-macro ac:name="profile"><ac:parameter ac:name="user">'
+        '<ri:user ri:userkey="k1"/></ac:parameter></ac:structured-macro> and '
+        '<ac:structured-macro ac:name="profile"></ac:structured-macro></p>'
+    )
+    root = parse_storage(storage)
+    converter = StorageMarkdownConverter(
+        {("accountid", "a1"): "Ann Lee", ("username", "k1"): "Kim"}
+    )
+
+    assert collect_user_refs(root) == (["a1", "a2"], ["k1"])
+    assert converter.to_markdown(root) == (
+        r"Hi @Ann Lee and @user\_a2, from @Kim and [User Profile Macro (Malformed)]"
+    )
+    assert converter.to_html(root) == (
+        "<p>Hi @Ann Lee and @user_a2, from @Kim and "
+        "[User Profile Macro (Malformed)]</p>"
+    )
+
+
+class TestLxmlPreprocessor:
+    """Tests for process_html_content with the lxml converter."""
+
+    @pytest.fixture
+    def preprocessor(self):
+        return ConfluencePreprocessor(
+            base_url="https://example.atlassian.net", content_converter="lxml"
+        )
+
+    @pytest.fixture
+    def client(self):
+        client = MagicMock(spec=["get_user_details_by_accountid"])
+        client.get_user_details_by_accountid.side_effect = lambda account_id: {
+            "displayName": f"User {account_id}"
+        }
+        return client
+
+    def test_both_representations(self, preprocessor, client):
+        """Test that mentions are resolved in both representations."""
+        storage = '<p>Ask <ac:link><ri:user ri:account-id="a1"/></ac:link></p>'
+
+        processed_html, processed_markdown = preprocessor.process_html_content(
+            storage, confluence_client=client
+        )
+
+        assert processed_html == "<p>Ask @User a1</p>"
+        assert processed_markdown == "Ask @User a1"
+        client.get_user_details_by_accountid.assert_called_once_with("a1")
+
+    @pytest.mark.parametrize(
+        ("output", "expected"),
+        [("html", ("<p><b>x</b></p>", "")), ("markdown", ("", "**x**"))],
+    )
+    def test_only_requested_output(self, preprocessor, output, expected):
+        """Test that only the requested representation is produced."""
+        result = preprocessor.process_html_content("<p><b>x</b></p>", output=output)
+
+        assert result == expected
+
+    def test_markdownify_default_honours_output(self):
+        """Test that the default converter also skips the unused representation."""
+        preprocessor = ConfluencePreprocessor(base_url="https://example.atlassian.net")
+
+        assert preprocessor.process_html_content("<p>x</p>", output="html") == (
+            "<p>x</p>",
+            "",
+        )
+        assert preprocessor.process_html_content("<p>x</p>", output="markdown") == (
+            "",
+            "x",
+        )
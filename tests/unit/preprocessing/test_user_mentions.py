@@ -0,0 +1,157 @@
+"""Tests for batched and cached user mention resolution."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from mcp_atlassian.preprocessing.base import BULK_USER_LOOKUP_LIMIT
+from mcp_atlassian.preprocessing.confluence import ConfluencePreprocessor
+
+
+def _mention(account_id: str) -> str:
+    return f'<ac:link><ri:user ri:account-id="{account_id}" /></ac:link>'
+
+
+def _profile_macro(attribute: str, value: str) -> str:
+    return (
+        '<ac:structured-macro ac:name="profile"><ac:parameter ac:name="user">'
+        f'<ri:user {attribute}="{value}" /></ac:parameter></ac:structured-macro>'
+    )
+
+
+@pytest.fixture
+def preprocessor():
+    return ConfluencePreprocessor(base_url="https://example.atlassian.net")
+
+
+@pytest.fixture
+def server_client():
+    client = MagicMock(
+        spec=["get_user_details_by_accountid", "get_user_details_by_username"]
+    )
+    client.get_user_details_by_accountid.side_effect = lambda account_id: {
+        "displayName": f"User {account_id}"
+    }
+    client.get_user_details_by_username.side_effect = lambda username: {
+        "displayName": f"Server {username}"
+    }
+    return client
+
+
+@pytest.fixture
+def cloud_client():
+    client = MagicMock()
+    client.cloud = True
+
+    def bulk(path, params):
+        ids = params["accountId"].split(",")
+        return {"results": [{"accountId": a, "displayName": f"User {a}"} for a in ids]}
+
+    client.get.side_effect = bulk
+    return client
+
+
+def test_each_user_is_looked_up_once(preprocessor, server_client):
+    """Test that repeated mentions of a user make a single lookup."""
+    html = "".join(_mention(a) for a in ["a1", "a2", "a1", "a1", "a2"])
+
+    _, markdown = preprocessor.process_html_content(
+        html, confluence_client=server_client
+    )
+
+    assert markdown.count("@User a1") == 3
+    assert markdown.count("@User a2") == 2
+    assert server_client.get_user_details_by_accountid.call_count == 2
+
+
+def test_cloud_uses_bulk_lookup(preprocessor, cloud_client):
+    """Test that Cloud resolves mentions with chunked bulk requests."""
+    account_ids = [f"id{i}" for i in range(BULK_USER_LOOKUP_LIMIT + 1)]
+    html = "".join(_mention(a) for a in account_ids)
+
+    _, markdown = preprocessor.process_html_content(
+        html, confluence_client=cloud_client
+    )
+
+    assert "@User id0" in markdown
+    assert f"@User id{BULK_USER_LOOKUP_LIMIT}" in markdown
+    assert cloud_client.get.call_count == 2
+    assert cloud_client.get.call_args.args[0] == "rest/api/user/bulk"
+    cloud_client.get_user_details_by_accountid.assert_not_called()
+
+
+def test_bulk_failure_falls_back_to_single_lookups(preprocessor, cloud_client):
+    """Test that users are looked up one by one if the bulk request fails."""
+    cloud_client.get.side_effect = Exception("not supported")
+    cloud_client.get_user_details_by_accountid.return_value = {"displayName": "Ann"}
+
+    _, markdown = preprocessor.process_html_content(
+        _mention("a1"), confluence_client=cloud_client
+    )
+
+    assert "@Ann" in markdown
+    cloud_client.get_user_details_by_accountid.assert_called_once_with("a1")
+
+
+def test_users_missing_from_bulk_response_use_fallback(preprocessor, cloud_client):
+    """Test that users the bulk API does not return are not fetched again."""
+    cloud_client.get.side_effect = None
+    cloud_client.get.return_value = {"results": []}
+
+    html, _ = preprocessor.process_html_content(
+        _mention("gone"), confluence_client=cloud_client
+    )
+
+    assert html == "@user_gone"
+    cloud_client.get_user_details_by_accountid.assert_not_called()
+
+
+def test_display_names_are_cached_across_documents(preprocessor, server_client):
+    """Test that later documents reuse display names resolved earlier."""
+    preprocessor.process_html_content(_mention("a1"), confluence_client=server_client)
+    _, markdown = preprocessor.process_html_content(
+        _mention("a1") + _profile_macro("ri:account-id", "a1"),
+        confluence_client=server_client,
+    )
+
+    assert markdown.count("@User a1") == 2
+    server_client.get_user_details_by_accountid.assert_called_once()
+
+
+def test_failed_lookups_are_not_cached(preprocessor, server_client):
+    """Test that a failed lookup is retried for the next document."""
+    server_client.get_user_details_by_accountid.side_effect = [
+        Exception("timeout"),
+        {"displayName": "Ann"},
+    ]
+
+    first, _ = preprocessor.process_html_content(
+        _mention("a1"), confluence_client=server_client
+    )
+    second, _ = preprocessor.process_html_content(
+        _mention("a1"), confluence_client=server_client
+    )
+
+    assert first == "@user_a1"
+    assert second == "@Ann"
+
+
+def test_profile_macro_with_userkey(preprocessor, server_client):
+    """Test that Server/DC profile macros resolve user keys by username."""
+    _, markdown = preprocessor.process_html_content(
+        _profile_macro("ri:userkey", "jdoe"), confluence_client=server_client
+    )
+
+    assert "@Server jdoe" in markdown
+    server_client.get_user_details_by_username.assert_called_once_with("jdoe")
+
+
+def test_prefetch_resolves_all_documents_at_once(preprocessor, cloud_client):
+    """Test that prefetching warms the cache for several documents."""
+    documents = [_mention("a1"), _mention("a2") + _mention("a1")]
+
+    preprocessor.prefetch_user_display_names(documents, confluence_client=cloud_client)
+    for document in documents:
+        preprocessor.process_html_content(document, confluence_client=cloud_client)
+
+    cloud_client.get.assert_called_once()
@@ -0,0 +1,129 @@
+"""Unit tests for the tool discovery BM25 ranking engine."""
+
+import pytest
+
+from src.mcp_atlassian.servers.discovery.bm25 import (
+    BM25Ranker,
+    expand_terms,
+    tokenize,
+)
+from src.mcp_atlassian.servers.discovery.types import ToolIndexEntry
+
+
+def make_tool(name: str, description: str, **kwargs) -> ToolIndexEntry:
+    """Create a read-only tool entry for ranking."""
+    return ToolIndexEntry(
+        name=name,
+        description=description,
+        service=name.split("_", 1)[0],
+        is_write=False,
+        tags=set(),
+        parameters=[],
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def ranker() -> BM25Ranker:
+    """Ranker over a small set of tools."""
+    return BM25Ranker(
+        [
+            make_tool(
+                "jira_get_issue",
+                "Get details of a Jira issue.",
+                keywords={"ticket", "status"},
+            ),
+            make_tool("jira_add_comment", "Add a comment to a Jira issue."),
+            make_tool(
+                "confluence_get_page",
+                "Get content of a Confluence page.",
+                use_cases=["Read documentation"],
+            ),
+            make_tool(
+                "bitbucket_list_pull_requests", "List pull requests in a repository."
+            ),
+        ]
+    )
+
+
+class TestTerms:
+    """Tests for tokenization and synonym expansion."""
+
+    def test_tokenize_splits_names_and_camel_case(self):
+        """Test that underscores and camelCase split words."""
+        assert tokenize("jira_getIssue PROJ-1") == ["jira", "get", "issue", "proj"]
+
+    def test_plurals_share_a_term(self):
+        """Test that plural and singular words produce the same term."""
+        assert expand_terms(["issues"])[0] == expand_terms(["issue"])[0] == "issue"
+        assert expand_terms(["access"])[0] == "access"
+
+    def test_synonyms_add_concept_terms(self):
+        """Test that synonyms map to canonical action and entity terms."""
+        terms = expand_terms(["fetch", "tickets"])
+
+        assert "action:get" in terms
+        assert "entity:issue" in terms
+
+    def test_phrases_add_concept_terms(self):
+        """Test that two-word synonyms are recognized."""
+        assert "entity:pr" in expand_terms(["merge", "request"])
+
+
+class TestBM25Ranker:
+    """Tests for BM25 scoring and ranking."""
+
+    def test_scores_are_normalized(self, ranker):
+        """Test that every score is between 0 and 1."""
+        scores = ranker.score("get jira issue details")
+
+        assert len(scores) == len(ranker.names)
+        assert all(0.0 <= s <= 1.0 for s in scores)
+        assert max(scores) > 0.0
+
+    def test_synonym_query_finds_tool(self, ranker):
+        """Test that synonyms match tools through concept terms."""
+        results = ranker.rank("fetch a ticket", ranker.names, 3)
+
+        assert results[0][0] == "jira_get_issue"
+
+    def test_rare_terms_outweigh_common_ones(self, ranker):
+        """Test that inverse document frequency favours specific terms."""
+        results = ranker.rank("jira comment", ranker.names, 3)
+
+        assert results[0][0] == "jira_add_comment"
+
+    def test_use_cases_are_indexed(self, ranker):
+        """Test that use cases contribute to the ranking."""
+        results = ranker.rank("documentation", ranker.names, 3)
+
+        assert [name for name, _ in results] == ["confluence_get_page"]
+
+    def test_rank_respects_names_and_limit(self, ranker):
+        """Test that only the given tools are ranked, up to the limit."""
+        eligible = ["jira_add_comment", "confluence_get_page"]
+
+        results = ranker.rank("get issue", eligible, 1)
+
+        assert len(results) == 1
+        assert results[0][0] in eligible
+
+    def test_unmatched_query_returns_nothing(self, ranker):
+        """Test that queries sharing no term with any tool rank nothing."""
+        assert ranker.rank("xyzzy", ranker.names, 5) == []
+        assert ranker.rank("", ranker.names, 5) == []
+
+    def test_match_reasons(self, ranker):
+        """Test that match reasons list matched words and concepts."""
+        reasons = ranker.match_reasons("fetch jira tickets", "jira_get_issue")
+
+        assert "keyword match: jira, ticket" in reasons
+        assert "action match: get" in reasons
+        assert "entity match: issue" in reasons
+
+    def test_empty_corpus(self):
+        """Test that a ranker without tools scores nothing."""
+        ranker = BM25Ranker([])
+
+        assert ranker.score("issue") == []
+        assert ranker.rank("issue", [], 3) == []
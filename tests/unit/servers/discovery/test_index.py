@@ -1,10 +1,14 @@
 """Unit tests for the tool discovery index module."""
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.mcp_atlassian.servers.discovery.index import ToolDiscoveryIndex
+from src.mcp_atlassian.servers.discovery.index import (
+    ToolDiscoveryIndex,
+    get_ranker_from_env,
+)
+from src.mcp_atlassian.servers.discovery.scoring import extract_query_features
 from src.mcp_atlassian.servers.discovery.types import ToolIndexEntry, ToolRecommendation
 
 
@@ -410,3 +414,202 @@ class TestToolDiscoveryIndexKeywordExtraction:
         index = ToolDiscoveryIndex()
         keywords = index._extract_keywords_from_description("")
         assert keywords == set()
+
+
+class TestToolDiscoveryIndexPrecomputation:
+    """Tests for precomputed features, the inverted index and the query memo."""
+
+    def setup_method(self):
+        """Reset and populate the index."""
+        ToolDiscoveryIndex.reset()
+        self.index = ToolDiscoveryIndex()
+        self.index._tools = {
+            f"jira_tool_{i}": ToolIndexEntry(
+                name=f"jira_tool_{i}",
+                description=f"Get issue number {i}.",
+                service="jira",
+                is_write=False,
+                tags={"jira", "read"},
+                parameters=[],
+                use_cases=[],
+                examples=[],
+                keywords={"issue"},
+            )
+            for i in range(5)
+        }
+        self.index._tools["confluence_get_page"] = ToolIndexEntry(
+            name="confluence_get_page",
+            description="Get a Confluence page.",
+            service="confluence",
+            is_write=False,
+            tags={"confluence", "read"},
+            parameters=[],
+            use_cases=[],
+            examples=[],
+            keywords={"page"},
+        )
+        self.index._built = True
+
+    def teardown_method(self):
+        """Reset the singleton after each test."""
+        ToolDiscoveryIndex.reset()
+
+    def test_inverted_index_built_lazily(self):
+        """Test that features and index terms are computed for all tools."""
+        self.index.search("issue")
+
+        assert self.index._features.keys() == self.index._tools.keys()
+        assert "confluence_get_page" in self.index._inverted["page"]
+        assert "jira_tool_0" in self.index._inverted["entity:issue"]
+
+    def test_shortlist_skips_unrelated_tools(self):
+        """Test that only tools sharing a term are scored when enough match."""
+        self.index._ensure_indexed()
+        query = extract_query_features("jira issues")
+
+        candidates = self.index._candidates(
+            query, service_filter=None, include_write=True, limit=3
+        )
+
+        assert "confluence_get_page" not in candidates
+        assert len(candidates) == 5
+
+    def test_short_shortlist_falls_back_to_all_eligible(self):
+        """Test that every eligible tool is scored if the shortlist is short."""
+        self.index._ensure_indexed()
+        query = extract_query_features("confluence page")
+
+        candidates = self.index._candidates(
+            query, service_filter="jira", include_write=True, limit=3
+        )
+
+        assert candidates == [f"jira_tool_{i}" for i in range(5)]
+
+    def test_search_results_are_memoized(self):
+        """Test that repeated queries are answered from the memo."""
+        first = self.index.search("get issue")
+
+        with patch(
+            "src.mcp_atlassian.servers.discovery.index.score_features"
+        ) as mock_score:
+            second = self.index.search("  Get Issue ")
+
+        mock_score.assert_not_called()
+        assert second == first
+        assert second is not first
+
+    def test_memo_cleared_when_tools_change(self):
+        """Test that changing the registered tools invalidates the memo."""
+        self.index.search("page")
+        self.index._tools["confluence_search"] = ToolIndexEntry(
+            name="confluence_search",
+            description="Search Confluence pages.",
+            service="confluence",
+            is_write=False,
+            tags={"confluence", "read"},
+            parameters=[],
+            use_cases=[],
+            examples=[],
+            keywords={"page", "search"},
+        )
+
+        results = self.index.search("page")
+
+        assert "confluence_search" in [r.name for r in results]
+
+
+class TestToolDiscoveryIndexRanker:
+    """Tests for selecting the ranking engine."""
+
+    def setup_method(self):
+        """Reset the singleton."""
+        ToolDiscoveryIndex.reset()
+
+    def teardown_method(self):
+        """Reset the singleton after each test."""
+        ToolDiscoveryIndex.reset()
+
+    def make_index(self) -> ToolDiscoveryIndex:
+        """Create an index with two tools."""
+        index = ToolDiscoveryIndex()
+        index._tools = {
+            "jira_get_issue": ToolIndexEntry(
+                name="jira_get_issue",
+                description="Get details of a Jira issue.",
+                service="jira",
+                is_write=False,
+                tags={"jira", "read"},
+                parameters=[],
+                keywords={"ticket"},
+            ),
+            "jira_delete_issue": ToolIndexEntry(
+                name="jira_delete_issue",
+                description="Delete a Jira issue.",
+                service="jira",
+                is_write=True,
+                tags={"jira", "write"},
+                parameters=[],
+            ),
+        }
+        index._built = True
+        return index
+
+    def test_default_ranker_is_heuristic(self, monkeypatch):
+        """Test that the heuristic ranker is used by default."""
+        monkeypatch.delenv("TOOL_DISCOVERY_RANKER", raising=False)
+
+        assert ToolDiscoveryIndex().ranker == "heuristic"
+
+    def test_ranker_from_env(self, monkeypatch):
+        """Test that TOOL_DISCOVERY_RANKER selects the ranker."""
+        monkeypatch.setenv("TOOL_DISCOVERY_RANKER", "BM25")
+
+        assert ToolDiscoveryIndex().ranker == "bm25"
+
+    def test_unknown_ranker_from_env_falls_back(self, monkeypatch):
+        """Test that an unknown ranker falls back to the heuristic one."""
+        monkeypatch.setenv("TOOL_DISCOVERY_RANKER", "neural")
+
+        assert get_ranker_from_env() == "heuristic"
+
+    def test_set_ranker_validates_and_clears_memo(self):
+        """Test that switching rankers invalidates memoized results."""
+        index = self.make_index()
+        index.search("get issue")
+
+        index.set_ranker("bm25")
+
+        assert not index._query_cache
+        with pytest.raises(ValueError, match="Unknown tool discovery ranker"):
+            index.set_ranker("neural")
+
+    def test_bm25_search(self):
+        """Test searching with the BM25 ranker and filters."""
+        index = self.make_index()
+        index.set_ranker("bm25")
+
+        results = index.search("fetch ticket")
+        read_only = index.search("delete issue", include_write=False)
+
+        assert results[0].name == "jira_get_issue"
+        assert "action match: get" in results[0].match_reasons
+        assert 0.0 < results[0].relevance_score <= 1.0
+        assert all(not r.is_write for r in read_only)
+
+    def test_bm25_rebuilt_when_tools_change(self):
+        """Test that the BM25 matrix is rebuilt after tools are added."""
+        index = self.make_index()
+        index.set_ranker("bm25")
+        index.search("issue")
+        index._tools["confluence_get_page"] = ToolIndexEntry(
+            name="confluence_get_page",
+            description="Get a Confluence page.",
+            service="confluence",
+            is_write=False,
+            tags={"confluence", "read"},
+            parameters=[],
+        )
+
+        results = index.search("confluence page")
+
+        assert results[0].name == "confluence_get_page"
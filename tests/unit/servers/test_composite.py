@@ -1,6 +1,8 @@
 """Unit tests for the Composite FastMCP server implementation."""
 
 import json
+import threading
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -530,7 +532,8 @@ async def test_resolve_with_depth_2(
         for issue in linked:
             if "issue" in issue:
                 assert (
-                    "development_context" in issue or "development_context_error" in issue
+                    "development_context" in issue
+                    or "development_context_error" in issue
                 )
 
 
@@ -642,3 +645,113 @@ async def test_resolve_development_links_bitbucket_service_unavailable(mock_cont
     # Should have error about Bitbucket being unavailable (propagated from inner call)
     assert content["data"] is not None
     assert len(content["data"]["errors"]) > 0
+
+
+@pytest.mark.anyio
+async def test_project_scan_reports_partial_results(
+    mock_context, mock_jira_fetcher, mock_bitbucket_fetcher, monkeypatch
+):
+    """Test that repositories are scanned concurrently with per-repo timeouts."""
+    monkeypatch.setenv("ATLASSIAN_FANOUT_BRANCH_TIMEOUT", "0.5")
+    mock_jira_fetcher.get_development_information.side_effect = Exception("No dev info")
+    repos = []
+    for slug in ("good", "broken", "stuck", "other"):
+        repo = MagicMock()
+        repo.slug = slug
+        repos.append(repo)
+    mock_bitbucket_fetcher.get_repositories.return_value = repos
+    both_scanning = threading.Barrier(2, timeout=5)
+    release = threading.Event()
+
+    def get_prs(project_key, repo_slug, state="OPEN", limit=50):
+        if repo_slug in ("good", "other"):
+            # Only passes if the two repositories are scanned at once
+            both_scanning.wait()
+        if repo_slug == "broken":
+            raise Exception("Repository not found")
+        if repo_slug == "stuck":
+            release.wait(5)
+        mock_pr = MagicMock()
+        mock_pr.to_simplified_dict.return_value = MOCK_BITBUCKET_PR.copy()
+        return [mock_pr] if repo_slug == "good" else []
+
+    mock_bitbucket_fetcher.get_pull_requests.side_effect = get_prs
+
+    with (
+        patch(
+            "src.mcp_atlassian.servers.composite.get_jira_fetcher",
+            AsyncMock(return_value=mock_jira_fetcher),
+        ),
+        patch(
+            "src.mcp_atlassian.servers.composite.get_bitbucket_fetcher",
+            AsyncMock(return_value=mock_bitbucket_fetcher),
+        ),
+    ):
+        start = time.monotonic()
+        response = await _get_issue_with_development_context(
+            ctx=mock_context,
+            issue_key="PROJ-123",
+            bitbucket_project_key="PROJ",
+        )
+        elapsed = time.monotonic() - start
+    release.set()
+
+    content = json.loads(response)
+    assert elapsed < 3
+    assert [pr["repository_slug"] for pr in content["pull_requests"]] == ["good"]
+    assert content["incomplete"] == [
+        {"branch": "PROJ/broken", "error": "Repository not found", "timed_out": False},
+        {"branch": "PROJ/stuck", "error": "Timed out after 0.5s", "timed_out": True},
+    ]
+    assert content["summary"]["partial"] is True
+
+
+@pytest.mark.anyio
+async def test_get_issue_uses_key_index(
+    mock_context, mock_jira_fetcher, mock_bitbucket_fetcher, monkeypatch, tmp_path
+):
+    """Test that PRs are looked up in the Jira key index instead of scanned."""
+    monkeypatch.setenv("BITBUCKET_KEY_INDEX_PATH", str(tmp_path / "keys.db"))
+    monkeypatch.setenv("BITBUCKET_KEY_INDEX_REFRESH_INTERVAL", "120")
+    mock_jira_fetcher.get_development_information.side_effect = Exception("No dev info")
+    indexed_pr = {
+        "project_key": "PROJ",
+        "repository_slug": "my-repo",
+        "id": 456,
+        "title": "PROJ-123: Fix the important bug",
+    }
+    mock_bitbucket_fetcher.refresh_key_index_async = AsyncMock(
+        return_value={"incomplete": []}
+    )
+    mock_bitbucket_fetcher.find_jira_key_references.return_value = {
+        "pull_requests": [indexed_pr],
+        "branches": [{"name": "feature/PROJ-123-fix"}],
+        "commits": [],
+    }
+
+    with (
+        patch(
+            "src.mcp_atlassian.servers.composite.get_jira_fetcher",
+            AsyncMock(return_value=mock_jira_fetcher),
+        ),
+        patch(
+            "src.mcp_atlassian.servers.composite.get_bitbucket_fetcher",
+            AsyncMock(return_value=mock_bitbucket_fetcher),
+        ),
+    ):
+        response = await _get_issue_with_development_context(
+            ctx=mock_context,
+            issue_key="PROJ-123",
+            bitbucket_project_key="PROJ",
+        )
+
+    content = json.loads(response)
+    assert content["pull_requests"] == [indexed_pr]
+    assert content["bitbucket_index"]["branches"] == [{"name": "feature/PROJ-123-fix"}]
+    mock_bitbucket_fetcher.refresh_key_index_async.assert_awaited_once_with(
+        "PROJ", max_age=120
+    )
+    mock_bitbucket_fetcher.find_jira_key_references.assert_called_once_with(
+        "PROJ-123", "PROJ"
+    )
+    mock_bitbucket_fetcher.get_pull_requests.assert_not_called()
@@ -127,6 +127,7 @@ def test_confluence_mcp(mock_confluence_fetcher, mock_base_confluence_config):
         get_page,
         get_page_children,
         search,
+        search_all,
         search_user,
         update_page,
     )
@@ -149,6 +150,7 @@ def test_confluence_mcp(mock_confluence_fetcher, mock_base_confluence_config):
     # Use .fn to get underlying function from FunctionTool objects
     confluence_sub_mcp = FastMCP(name="TestConfluenceSubMCP")
     confluence_sub_mcp.tool()(search.fn)
+    confluence_sub_mcp.tool()(search_all.fn)
     confluence_sub_mcp.tool()(get_page.fn)
     confluence_sub_mcp.tool()(get_page_children.fn)
     confluence_sub_mcp.tool()(get_comments.fn)
@@ -273,6 +275,35 @@ async def test_search(client, mock_confluence_fetcher):
     assert result_data[0]["title"] == "Test Page Mock Title"
 
 
+@pytest.mark.anyio
+async def test_search_all_falls_back_to_text_search(client, mock_confluence_fetcher):
+    """Test that search_all retries a failing siteSearch as a text search."""
+
+    def iter_search(cql, **kwargs):
+        if cql.startswith("siteSearch"):
+            raise ValueError("siteSearch is not supported")
+        yield ConfluencePage(id="1", title="Runbook")
+
+    mock_confluence_fetcher.iter_search.side_effect = iter_search
+    progress = []
+
+    async def on_progress(value, total, message):
+        progress.append(json.loads(message))
+
+    response = await client.call_tool(
+        "confluence_search_all",
+        {"query": "runbook", "max_items": 5},
+        progress_handler=on_progress,
+    )
+
+    result_data = json.loads(response.content[0].text)
+    assert result_data["count"] == 1
+    assert result_data["max_items_reached"] is False
+    assert progress[0][0]["title"] == "Runbook"
+    queries = [c.args[0] for c in mock_confluence_fetcher.iter_search.call_args_list]
+    assert queries == ['siteSearch ~ "runbook"', 'text ~ "runbook"']
+
+
 @pytest.mark.anyio
 async def test_get_page(client, mock_confluence_fetcher):
     """Test the get_page tool with default parameters."""
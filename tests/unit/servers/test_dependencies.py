@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -11,6 +11,12 @@ from mcp_atlassian.jira import JiraConfig, JiraFetcher
 from mcp_atlassian.servers.context import MainAppContext
 from mcp_atlassian.servers.dependencies import (
     _create_user_config_for_fetcher,
+    _fetcher_cache_key,
+    _CachedFetcher,
+    clear_fetcher_cache,
+    close_fetcher_cache,
+    close_retired_fetchers,
+    fetcher_cache,
     get_confluence_fetcher,
     get_jira_fetcher,
 )
@@ -23,6 +29,14 @@ from tests.utils.mocks import MockFastMCP
 pytestmark = pytest.mark.anyio
 
 
+@pytest.fixture(autouse=True)
+def reset_fetcher_cache():
+    """Ensure fetchers cached by one test are not reused by another."""
+    clear_fetcher_cache()
+    yield
+    clear_fetcher_cache()
+
+
 @pytest.fixture
 def config_factory():
     """Factory for creating various configuration objects."""
@@ -814,3 +828,176 @@ class TestGetConfluenceFetcher:
 
         with pytest.raises(ValueError, match=expected_error_match):
             await get_confluence_fetcher(mock_context)
+
+
+class TestFetcherCache:
+    """Tests for reuse of fetchers across tool calls."""
+
+    @staticmethod
+    def _jira_fetcher_with_async_client():
+        fetcher = JiraFetcher.__new__(JiraFetcher)
+        client = MagicMock(aclose=AsyncMock())
+        fetcher._async_client = client
+        return fetcher, client
+
+    async def test_dropped_fetchers_closed_after_grace_period(self):
+        """Test that async clients of dropped fetchers are closed, but not early."""
+        fetcher, client = self._jira_fetcher_with_async_client()
+        key = _fetcher_cache_key("jira", "global")
+        fetcher_cache[key] = _CachedFetcher(base_config=None, fetcher=fetcher)
+
+        fetcher_cache.pop(key)
+        await close_retired_fetchers()
+        client.aclose.assert_not_awaited()
+
+        with patch(
+            "mcp_atlassian.servers.dependencies.RETIRED_FETCHER_GRACE_PERIOD", 0
+        ):
+            await close_retired_fetchers()
+        client.aclose.assert_awaited_once()
+        assert fetcher._async_client is None
+        assert fetcher_cache.retired == []
+
+    async def test_close_fetcher_cache_closes_cached_fetchers(self):
+        """Test that shutdown closes the async clients of cached fetchers."""
+        fetcher, client = self._jira_fetcher_with_async_client()
+        fetcher_cache[_fetcher_cache_key("jira", "global")] = _CachedFetcher(
+            base_config=None, fetcher=fetcher
+        )
+
+        await close_fetcher_cache()
+
+        client.aclose.assert_awaited_once()
+        assert len(fetcher_cache) == 0
+
+    def test_cache_key_hashes_token(self):
+        """Test that raw tokens never appear in cache keys."""
+        key = _fetcher_cache_key("jira", "pat", "secret-token", "cloud-1")
+
+        assert "secret-token" not in key
+        assert key[0] == "jira"
+        assert key[1] == "pat"
+        assert key[3] == "cloud-1"
+        assert key != _fetcher_cache_key("jira", "pat", "other-token", "cloud-1")
+        assert key != _fetcher_cache_key("jira", "pat", "secret-token", "cloud-2")
+        assert key != _fetcher_cache_key("jira", "oauth", "secret-token", "cloud-1")
+
+    @patch("mcp_atlassian.servers.dependencies.get_http_request")
+    @patch("mcp_atlassian.servers.dependencies.JiraFetcher")
+    async def test_user_fetcher_reused_for_same_token(
+        self,
+        mock_jira_fetcher_class,
+        mock_get_http_request,
+        mock_context,
+        config_factory,
+        auth_scenarios,
+    ):
+        """Test that a validated user fetcher is reused by later requests."""
+        app_context = config_factory.create_app_context(
+            config_factory.create_jira_config(auth_type="pat")
+        )
+        _setup_mock_context(mock_context, app_context)
+        mock_fetcher = _create_mock_fetcher(JiraFetcher)
+        mock_jira_fetcher_class.return_value = mock_fetcher
+
+        results = []
+        for _ in range(2):
+            request = MockFastMCP.create_request({"user_atlassian_cloud_id": None})
+            _setup_mock_request_state(request, auth_scenarios["pat"])
+            mock_get_http_request.return_value = request
+            results.append(await get_jira_fetcher(mock_context))
+            assert request.state.jira_fetcher is mock_fetcher
+
+        assert results == [mock_fetcher, mock_fetcher]
+        mock_jira_fetcher_class.assert_called_once()
+        mock_fetcher.get_current_user_account_id.assert_called_once()
+
+    @patch("mcp_atlassian.servers.dependencies.get_http_request")
+    @patch("mcp_atlassian.servers.dependencies.JiraFetcher")
+    async def test_different_tokens_get_different_fetchers(
+        self,
+        mock_jira_fetcher_class,
+        mock_get_http_request,
+        mock_context,
+        config_factory,
+        auth_scenarios,
+    ):
+        """Test that fetchers are isolated per credential."""
+        app_context = config_factory.create_app_context(
+            config_factory.create_jira_config(auth_type="pat")
+        )
+        _setup_mock_context(mock_context, app_context)
+        first, second = (
+            _create_mock_fetcher(JiraFetcher),
+            _create_mock_fetcher(JiraFetcher),
+        )
+        mock_jira_fetcher_class.side_effect = [first, second]
+
+        results = []
+        for token in ["token-a", "token-b"]:
+            request = MockFastMCP.create_request({"user_atlassian_cloud_id": None})
+            _setup_mock_request_state(
+                request, {**auth_scenarios["pat"], "token": token}
+            )
+            mock_get_http_request.return_value = request
+            results.append(await get_jira_fetcher(mock_context))
+
+        assert results == [first, second]
+        assert len(fetcher_cache) == 2
+
+    @patch("mcp_atlassian.servers.dependencies.get_http_request")
+    @patch("mcp_atlassian.servers.dependencies.ConfluenceFetcher")
+    async def test_global_fetcher_reused_until_config_changes(
+        self,
+        mock_confluence_fetcher_class,
+        mock_get_http_request,
+        mock_context,
+        config_factory,
+    ):
+        """Test that the global fetcher is reused for the same configuration."""
+        mock_get_http_request.side_effect = RuntimeError("No HTTP context")
+        app_context = config_factory.create_app_context()
+        _setup_mock_context(mock_context, app_context)
+        mock_confluence_fetcher_class.side_effect = lambda config: MagicMock(
+            spec=ConfluenceFetcher
+        )
+
+        first = await get_confluence_fetcher(mock_context)
+        second = await get_confluence_fetcher(mock_context)
+        assert first is second
+        mock_confluence_fetcher_class.assert_called_once()
+
+        _setup_mock_context(mock_context, config_factory.create_app_context())
+        third = await get_confluence_fetcher(mock_context)
+        assert third is not first
+        assert mock_confluence_fetcher_class.call_count == 2
+
+    @patch("mcp_atlassian.servers.dependencies.get_http_request")
+    @patch("mcp_atlassian.servers.dependencies.ConfluenceFetcher")
+    async def test_cached_confluence_fetcher_restores_derived_email(
+        self,
+        mock_confluence_fetcher_class,
+        mock_get_http_request,
+        mock_context,
+        config_factory,
+        auth_scenarios,
+    ):
+        """Test that the email derived during validation is reapplied on reuse."""
+        app_context = config_factory.create_app_context(
+            confluence_config=config_factory.create_confluence_config(auth_type="pat")
+        )
+        _setup_mock_context(mock_context, app_context)
+        mock_confluence_fetcher_class.return_value = _create_mock_fetcher(
+            ConfluenceFetcher,
+            validation_return={"email": "derived@example.com", "displayName": "U"},
+        )
+        scenario = {**auth_scenarios["pat"], "email": None}
+
+        for _ in range(2):
+            request = MockFastMCP.create_request({"user_atlassian_cloud_id": None})
+            _setup_mock_request_state(request, scenario)
+            mock_get_http_request.return_value = request
+            await get_confluence_fetcher(mock_context)
+            assert request.state.user_atlassian_email == "derived@example.com"
+
+        mock_confluence_fetcher_class.assert_called_once()
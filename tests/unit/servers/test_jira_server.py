@@ -2,9 +2,10 @@
 
 import json
 import logging
+import threading
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 from fastmcp import Client, FastMCP
@@ -14,6 +15,7 @@ from starlette.requests import Request
 
 from src.mcp_atlassian.jira import JiraFetcher
 from src.mcp_atlassian.jira.config import JiraConfig
+from src.mcp_atlassian.models.jira import JiraIssue
 from src.mcp_atlassian.servers.context import MainAppContext
 from src.mcp_atlassian.servers.main import AtlassianMCP
 from src.mcp_atlassian.utils.oauth import OAuthConfig
@@ -279,6 +281,7 @@ def test_jira_mcp(mock_jira_fetcher, mock_base_jira_config):
         batch_create_issues,
         batch_create_versions,
         batch_get_changelogs,
+        batch_get_issues,
         create_issue,
         create_issue_link,
         delete_issue,
@@ -298,6 +301,7 @@ def test_jira_mcp(mock_jira_fetcher, mock_base_jira_config):
         link_to_epic,
         remove_issue_link,
         search,
+        search_all,
         search_fields,
         transition_issue,
         update_issue,
@@ -308,6 +312,7 @@ def test_jira_mcp(mock_jira_fetcher, mock_base_jira_config):
     # Use .fn to get underlying function from FunctionTool objects
     jira_sub_mcp.tool()(get_issue.fn)
     jira_sub_mcp.tool()(search.fn)
+    jira_sub_mcp.tool()(search_all.fn)
     jira_sub_mcp.tool()(search_fields.fn)
     jira_sub_mcp.tool()(get_project_issues.fn)
     jira_sub_mcp.tool()(get_project_versions.fn)
@@ -324,6 +329,7 @@ def test_jira_mcp(mock_jira_fetcher, mock_base_jira_config):
     jira_sub_mcp.tool()(create_issue.fn)
     jira_sub_mcp.tool()(batch_create_issues.fn)
     jira_sub_mcp.tool()(batch_get_changelogs.fn)
+    jira_sub_mcp.tool()(batch_get_issues.fn)
     jira_sub_mcp.tool()(update_issue.fn)
     jira_sub_mcp.tool()(delete_issue.fn)
     jira_sub_mcp.tool()(add_comment.fn)
@@ -460,6 +466,48 @@ async def test_search(jira_client, mock_jira_fetcher):
         start=0,
         projects_filter=None,
         expand=None,
+        total_mode="approximate",
+    )
+
+
+@pytest.mark.anyio
+async def test_search_all_streams_pages(jira_client, mock_jira_fetcher):
+    """Test that search_all sends each page as a progress notification."""
+    issues = [
+        JiraIssue(id=str(n), key=f"PROJ-{n}", summary=f"Issue {n}") for n in range(3)
+    ]
+    mock_jira_fetcher.iter_issues.return_value = iter(issues)
+    progress = []
+
+    async def on_progress(value, total, message):
+        progress.append((value, json.loads(message)))
+
+    response = await jira_client.call_tool(
+        "jira_search_all",
+        {"jql": "project = PROJ", "max_items": 3, "page_size": 2},
+        progress_handler=on_progress,
+    )
+
+    content = json.loads(response.content[0].text)
+    assert content == {
+        "count": 3,
+        "chunks": 2,
+        "streamed": True,
+        "max_items_reached": True,
+    }
+    assert [value for value, _ in progress] == [2, 3]
+    assert [issue["key"] for _, page in progress for issue in page] == [
+        "PROJ-0",
+        "PROJ-1",
+        "PROJ-2",
+    ]
+    mock_jira_fetcher.iter_issues.assert_called_once_with(
+        "project = PROJ",
+        fields=ANY,
+        expand=None,
+        projects_filter=None,
+        page_size=2,
+        max_items=3,
     )
 
 
@@ -542,6 +590,115 @@ async def test_batch_create_issues(jira_client, mock_jira_fetcher):
     assert call_kwargs["validate_only"] is False
 
 
+@pytest.mark.anyio
+async def test_batch_get_issues_fetches_chunks_concurrently(
+    jira_client, mock_jira_fetcher
+):
+    """Test that key chunks are fetched in parallel and merged in input order."""
+    both_chunks_running = threading.Barrier(2, timeout=5)
+
+    def get_issues_by_key(keys, fields=None, expand=None):
+        both_chunks_running.wait()
+        return {
+            key: MagicMock(to_simplified_dict=MagicMock(return_value={"key": key}))
+            for key in keys
+            if key != "TEST-3"
+        }
+
+    mock_jira_fetcher.uses_async_backend = False
+    mock_jira_fetcher.get_issues_by_key.side_effect = get_issues_by_key
+    with patch("src.mcp_atlassian.servers.jira.BATCH_GET_ISSUES_CHUNK_SIZE", 2):
+        response = await jira_client.call_tool(
+            "jira_batch_get_issues",
+            {"issue_keys": ["TEST-4", "TEST-3", "TEST-2", "TEST-1"]},
+        )
+
+    content = json.loads(response.content[0].text)
+    assert [issue["key"] for issue in content["issues"]] == [
+        "TEST-4",
+        "TEST-2",
+        "TEST-1",
+    ]
+    assert content["not_found"] == ["TEST-3"]
+    assert mock_jira_fetcher.get_issues_by_key.call_count == 2
+
+
+@pytest.mark.anyio
+async def test_update_issue_uploads_attachments_after_update(
+    jira_client, mock_jira_fetcher
+):
+    """Test that attachments are only uploaded once the fields were updated."""
+    calls = []
+
+    def update_issue(**kwargs):
+        calls.append("update")
+        return MagicMock(to_simplified_dict=MagicMock(return_value={"key": "TEST-1"}))
+
+    async def upload_attachments_async(issue_key, file_paths):
+        calls.append("upload")
+        return {"success": True, "uploaded": file_paths}
+
+    mock_jira_fetcher.update_issue.side_effect = update_issue
+    mock_jira_fetcher.upload_attachments_async.side_effect = upload_attachments_async
+    response = await jira_client.call_tool(
+        "jira_update_issue",
+        {
+            "issue_key": "TEST-1",
+            "fields": {"summary": "New"},
+            "attachments": "/tmp/a.txt",
+        },
+    )
+
+    content = json.loads(response.content[0].text)
+    assert calls == ["update", "upload"]
+    assert content["issue"]["attachment_results"]["uploaded"] == ["/tmp/a.txt"]
+
+
+@pytest.mark.anyio
+async def test_update_issue_reports_attachment_errors(jira_client, mock_jira_fetcher):
+    """Test that a failed upload is reported without failing the update."""
+    mock_jira_fetcher.update_issue.return_value = MagicMock(
+        to_simplified_dict=MagicMock(return_value={"key": "TEST-1"})
+    )
+    mock_jira_fetcher.upload_attachments_async.side_effect = OSError("disk error")
+
+    response = await jira_client.call_tool(
+        "jira_update_issue",
+        {
+            "issue_key": "TEST-1",
+            "fields": {"summary": "New"},
+            "attachments": "/tmp/a.txt",
+        },
+    )
+
+    content = json.loads(response.content[0].text)
+    assert content["message"] == "Issue updated successfully"
+    assert content["issue"]["attachment_results"] == {
+        "success": False,
+        "error": "disk error",
+    }
+
+
+@pytest.mark.anyio
+async def test_update_issue_skips_attachments_when_update_fails(
+    jira_client, mock_jira_fetcher
+):
+    """Test that nothing is uploaded when the field update fails."""
+    mock_jira_fetcher.update_issue.side_effect = ValueError("invalid field")
+
+    with pytest.raises(ToolError):
+        await jira_client.call_tool(
+            "jira_update_issue",
+            {
+                "issue_key": "TEST-1",
+                "fields": {"summary": "New"},
+                "attachments": "/tmp/a.txt",
+            },
+        )
+
+    mock_jira_fetcher.upload_attachments_async.assert_not_called()
+
+
 @pytest.mark.anyio
 async def test_batch_create_issues_invalid_json(jira_client):
     """Test error handling for invalid JSON in batch issue creation."""
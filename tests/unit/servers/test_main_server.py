@@ -1,13 +1,15 @@
 """Tests for the main MCP server implementation."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 import httpx
 import pytest
+from fastmcp import FastMCP
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
-from mcp_atlassian.servers.main import UserTokenMiddleware, main_mcp
+from mcp_atlassian.servers.context import MainAppContext
+from mcp_atlassian.servers.main import AtlassianMCP, UserTokenMiddleware, main_mcp
 
 
 @pytest.mark.anyio
@@ -142,3 +144,68 @@ class TestUserTokenMiddleware:
         # Verify the request was processed normally
         mock_call_next.assert_called_once_with(mock_request)
         assert result is not None
+
+
+class TestListToolsCache:
+    """Test caching of the filtered tool list."""
+
+    @pytest.fixture
+    def server(self):
+        """Create a server with one read and one write Jira tool."""
+        jira = FastMCP("jira")
+
+        @jira.tool(tags={"jira", "read"})
+        def get_issue() -> str:
+            return ""
+
+        @jira.tool(tags={"jira", "write"})
+        def create_issue() -> str:
+            return ""
+
+        server = AtlassianMCP(name="test")
+        server.mount(jira, prefix="jira")
+        return server, jira
+
+    @staticmethod
+    async def list_tools(server, *, read_only=False):
+        app_context = MainAppContext(full_jira_config=MagicMock(), read_only=read_only)
+        request_context = MagicMock(
+            lifespan_context={"app_lifespan_context": app_context}
+        )
+        with patch.object(
+            type(server._mcp_server),
+            "request_context",
+            new_callable=PropertyMock,
+            return_value=request_context,
+        ):
+            return [tool.name for tool in await server._list_tools_mcp()]
+
+    @pytest.mark.anyio
+    async def test_list_is_built_once_per_settings(self, server):
+        """Test that repeated listings reuse the list built for their settings."""
+        server, _ = server
+        with patch.object(server, "get_tools", wraps=server.get_tools) as get_tools:
+            first = await self.list_tools(server)
+            second = await self.list_tools(server)
+            read_only = await self.list_tools(server, read_only=True)
+            await self.list_tools(server, read_only=True)
+
+        assert first == second == ["jira_get_issue", "jira_create_issue"]
+        assert read_only == ["jira_get_issue"]
+        assert get_tools.await_count == 2
+
+    @pytest.mark.anyio
+    async def test_registering_a_tool_invalidates_the_list(self, server):
+        """Test that tools registered on a mounted server are listed."""
+        server, jira = server
+        await self.list_tools(server)
+
+        @jira.tool(tags={"jira", "read"})
+        def search() -> str:
+            return ""
+
+        assert "jira_search" in await self.list_tools(server)
+
+        jira.remove_tool("search")
+
+        assert "jira_search" not in await self.list_tools(server)
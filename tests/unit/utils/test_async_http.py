@@ -0,0 +1,448 @@
+"""Tests for the native async HTTP backend."""
+
+import base64
+import json
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from mcp_atlassian.bitbucket.config import BitbucketConfig
+from mcp_atlassian.confluence.config import ConfluenceConfig
+from mcp_atlassian.jira.config import JiraConfig
+from mcp_atlassian.utils.async_http import (
+    AsyncAtlassianClient,
+    AsyncHTTPSettings,
+    OAuthBearerAuth,
+    _build_proxy_mounts,
+    create_async_client,
+    get_http_backend,
+    get_settings_from_env,
+)
+from mcp_atlassian.utils.oauth import BYOAccessTokenOAuthConfig, OAuthConfig
+from mcp_atlassian.utils.rate_limit import RateLimitConfig, get_rate_limiter_registry
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limiters():
+    """Reset the rate limiter registry around each test."""
+    get_rate_limiter_registry().reset()
+    yield
+    get_rate_limiter_registry().reset()
+
+
+class Recorder:
+    """Mock transport handler that records requests and replays responses."""
+
+    def __init__(self, *responses: httpx.Response) -> None:
+        self.responses = list(responses)
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if len(self.responses) > 1:
+            return self.responses.pop(0)
+        return self.responses[0]
+
+    @property
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self)
+
+
+class TestGetHttpBackend:
+    """Test backend selection from the environment."""
+
+    def test_default_is_sync(self, monkeypatch):
+        """Test that the synchronous backend is the default."""
+        monkeypatch.delenv("ATLASSIAN_HTTP_BACKEND", raising=False)
+        monkeypatch.delenv("JIRA_HTTP_BACKEND", raising=False)
+
+        assert get_http_backend("jira") == "sync"
+
+    def test_service_override(self, monkeypatch):
+        """Test that the service-specific variable takes precedence."""
+        monkeypatch.setenv("ATLASSIAN_HTTP_BACKEND", "async")
+        monkeypatch.setenv("BITBUCKET_HTTP_BACKEND", "sync")
+
+        assert get_http_backend("jira") == "async"
+        assert get_http_backend("bitbucket") == "sync"
+
+    def test_invalid_value_is_ignored(self, monkeypatch):
+        """Test that unknown backends are ignored with a warning."""
+        monkeypatch.setenv("ATLASSIAN_HTTP_BACKEND", "aiohttp")
+
+        with patch("mcp_atlassian.utils.async_http.logger") as mock_logger:
+            assert get_http_backend("jira") == "sync"
+            mock_logger.warning.assert_called_once()
+
+    def test_config_from_env_reads_backend(self, monkeypatch):
+        """Test that service configs pick up the backend selection."""
+        monkeypatch.setenv("JIRA_URL", "https://jira.example.com")
+        monkeypatch.setenv("JIRA_PERSONAL_TOKEN", "token")
+        monkeypatch.setenv("JIRA_HTTP_BACKEND", "async")
+
+        assert JiraConfig.from_env().http_backend == "async"
+
+
+class TestGetSettingsFromEnv:
+    """Test connection settings loaded from the environment."""
+
+    def test_defaults(self, monkeypatch):
+        """Test default connection settings."""
+        for key in (
+            "ATLASSIAN_HTTP2",
+            "ATLASSIAN_HTTP_MAX_CONNECTIONS",
+            "ATLASSIAN_HTTP_MAX_KEEPALIVE",
+            "ATLASSIAN_HTTP_TIMEOUT",
+        ):
+            monkeypatch.delenv(key, raising=False)
+
+        assert get_settings_from_env() == AsyncHTTPSettings()
+
+    def test_overrides(self, monkeypatch):
+        """Test that pool size and timeout are read from the environment."""
+        monkeypatch.setenv("ATLASSIAN_HTTP_MAX_CONNECTIONS", "250")
+        monkeypatch.setenv("ATLASSIAN_HTTP_MAX_KEEPALIVE", "50")
+        monkeypatch.setenv("ATLASSIAN_HTTP_TIMEOUT", "5")
+
+        settings = get_settings_from_env()
+
+        assert settings.max_connections == 250
+        assert settings.max_keepalive_connections == 50
+        assert settings.timeout == 5.0
+
+    def test_http2_requires_h2(self, monkeypatch):
+        """Test that HTTP/2 is disabled when h2 is not installed."""
+        monkeypatch.setenv("ATLASSIAN_HTTP2", "true")
+
+        with patch(
+            "mcp_atlassian.utils.async_http.importlib.util.find_spec",
+            return_value=None,
+        ):
+            assert get_settings_from_env().http2 is False
+
+        with patch(
+            "mcp_atlassian.utils.async_http.importlib.util.find_spec",
+            return_value=MagicMock(),
+        ):
+            assert get_settings_from_env().http2 is True
+
+
+class TestCreateAsyncClient:
+    """Test building async clients from service configurations."""
+
+    @pytest.mark.anyio
+    async def test_basic_auth_and_custom_headers(self):
+        """Test that basic credentials and custom headers are applied."""
+        recorder = Recorder(httpx.Response(200, json={"key": "PROJ-1"}))
+        config = JiraConfig(
+            url="https://test.atlassian.net",
+            auth_type="basic",
+            username="user@example.com",
+            api_token="secret",
+            custom_headers={"X-Custom": "value"},
+        )
+
+        async with create_async_client(
+            "jira", config, transport=recorder.transport
+        ) as client:
+            result = await client.get("/rest/api/2/issue/PROJ-1")
+
+        assert result == {"key": "PROJ-1"}
+        request = recorder.requests[0]
+        assert str(request.url) == "https://test.atlassian.net/rest/api/2/issue/PROJ-1"
+        expected = base64.b64encode(b"user@example.com:secret").decode()
+        assert request.headers["Authorization"] == f"Basic {expected}"
+        assert request.headers["X-Custom"] == "value"
+
+    @pytest.mark.anyio
+    async def test_pat_auth_uses_bearer_token(self):
+        """Test that personal access tokens are sent as Bearer tokens."""
+        recorder = Recorder(httpx.Response(200, json=[]))
+        config = BitbucketConfig(
+            url="https://bitbucket.example.com",
+            auth_type="pat",
+            personal_token=" pat-token ",
+        )
+
+        async with create_async_client(
+            "bitbucket", config, transport=recorder.transport
+        ) as client:
+            await client.get("/rest/api/1.0/projects")
+
+        assert recorder.requests[0].headers["Authorization"] == "Bearer pat-token"
+
+    @pytest.mark.anyio
+    async def test_oauth_uses_gateway_url(self):
+        """Test that OAuth clients target the api.atlassian.com gateway."""
+        recorder = Recorder(httpx.Response(200, json={}))
+        config = ConfluenceConfig(
+            url="https://test.atlassian.net/wiki",
+            auth_type="oauth",
+            oauth_config=BYOAccessTokenOAuthConfig(
+                cloud_id="cloud-123", access_token="access"
+            ),
+        )
+
+        async with create_async_client(
+            "confluence", config, transport=recorder.transport
+        ) as client:
+            await client.get("/rest/api/space")
+
+        request = recorder.requests[0]
+        assert str(request.url) == (
+            "https://api.atlassian.com/ex/confluence/cloud-123/rest/api/space"
+        )
+        assert request.headers["Authorization"] == "Bearer access"
+
+    def test_oauth_requires_cloud_id(self):
+        """Test that OAuth without a cloud_id is rejected."""
+        config = JiraConfig(
+            url="https://test.atlassian.net",
+            auth_type="oauth",
+            oauth_config=OAuthConfig(
+                client_id="id",
+                client_secret="secret",
+                redirect_uri="http://localhost",
+                scope="read:jira-work",
+            ),
+        )
+
+        with pytest.raises(ValueError, match="cloud_id"):
+            create_async_client("jira", config)
+
+    @pytest.mark.anyio
+    async def test_oauth_refreshes_expired_token(self):
+        """Test that expired refreshable tokens are refreshed before sending."""
+        oauth_config = MagicMock(spec=OAuthConfig)
+        oauth_config.refresh_token = "refresh"
+        oauth_config.is_token_expired = True
+        oauth_config.access_token = "new-token"
+        oauth_config.ensure_valid_token.return_value = True
+        recorder = Recorder(httpx.Response(200, json={}))
+
+        async with httpx.AsyncClient(
+            auth=OAuthBearerAuth(oauth_config), transport=recorder.transport
+        ) as client:
+            await client.get("https://api.atlassian.com/me")
+
+        oauth_config.ensure_valid_token.assert_called_once()
+        assert recorder.requests[0].headers["Authorization"] == "Bearer new-token"
+
+
+class TestProxyMounts:
+    """Test proxy transport mounts."""
+
+    def test_no_proxies(self):
+        """Test that no mounts are created without proxy settings."""
+        config = JiraConfig(url="https://jira.example.com", auth_type="pat")
+
+        assert _build_proxy_mounts("Jira", config, AsyncHTTPSettings()) == {}
+
+    def test_proxies_and_no_proxy(self):
+        """Test that proxies are mounted and no_proxy hosts bypass them."""
+        config = JiraConfig(
+            url="https://jira.example.com",
+            auth_type="pat",
+            http_proxy="http://proxy:8080",
+            https_proxy="http://secure-proxy:8443",
+            no_proxy="localhost, .internal.example.com",
+        )
+
+        mounts = _build_proxy_mounts("Jira", config, AsyncHTTPSettings())
+
+        assert isinstance(mounts["http://"], httpx.AsyncHTTPTransport)
+        assert isinstance(mounts["https://"], httpx.AsyncHTTPTransport)
+        assert mounts["all://localhost"] is None
+        assert mounts["all://internal.example.com"] is None
+        assert mounts["all://*.internal.example.com"] is None
+
+    def test_proxy_transports_use_connection_settings(self):
+        """Test that proxy transports get the pool and HTTP/2 settings."""
+        config = JiraConfig(
+            url="https://jira.example.com",
+            auth_type="pat",
+            https_proxy="http://secure-proxy:8443",
+        )
+        settings = AsyncHTTPSettings(
+            http2=True, max_connections=7, max_keepalive_connections=3
+        )
+
+        with patch("mcp_atlassian.utils.async_http.httpx.AsyncHTTPTransport") as cls:
+            _build_proxy_mounts("Jira", config, settings)
+
+        kwargs = cls.call_args.kwargs
+        assert kwargs["proxy"] == "http://secure-proxy:8443"
+        assert kwargs["http2"] is True
+        assert kwargs["limits"] == httpx.Limits(
+            max_connections=7, max_keepalive_connections=3, keepalive_expiry=30.0
+        )
+
+
+class TestAsyncAtlassianClient:
+    """Test request handling of the async client."""
+
+    @pytest.mark.anyio
+    async def test_retries_on_429_with_retry_after(self):
+        """Test that 429 responses are retried honoring Retry-After."""
+        recorder = Recorder(
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, json={"ok": True}),
+        )
+        client = AsyncAtlassianClient(
+            "jira",
+            "https://jira.example.com",
+            transport=recorder.transport,
+            settings=AsyncHTTPSettings(),
+        )
+
+        async with client:
+            result = await client.post("/rest/api/2/search", json={"jql": ""})
+
+        assert result == {"ok": True}
+        assert len(recorder.requests) == 2
+
+    @pytest.mark.anyio
+    async def test_returns_last_429_after_max_retries(self):
+        """Test that retries stop after max_retries."""
+        recorder = Recorder(httpx.Response(429, headers={"Retry-After": "0"}))
+        client = AsyncAtlassianClient(
+            "jira",
+            "https://jira.example.com",
+            transport=recorder.transport,
+            settings=AsyncHTTPSettings(),
+            rate_limit_config=RateLimitConfig(max_retries=2),
+        )
+
+        async with client:
+            response = await client.send("GET", "/rest/api/2/myself")
+
+        assert response.status_code == 429
+        assert len(recorder.requests) == 3
+
+    @pytest.mark.anyio
+    async def test_error_status_raises(self):
+        """Test that error responses raise HTTPStatusError."""
+        recorder = Recorder(httpx.Response(404, json={"errorMessages": ["nope"]}))
+        client = AsyncAtlassianClient(
+            "jira", "https://jira.example.com", transport=recorder.transport
+        )
+
+        async with client:
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.get("/rest/api/2/issue/NOPE-1")
+
+    @pytest.mark.anyio
+    async def test_non_json_and_empty_bodies(self):
+        """Test decoding of text and empty responses."""
+        recorder = Recorder(
+            httpx.Response(200, text="diff --git a b"),
+            httpx.Response(204),
+        )
+        client = AsyncAtlassianClient(
+            "bitbucket", "https://bitbucket.example.com", transport=recorder.transport
+        )
+
+        async with client:
+            assert await client.get("/diff") == "diff --git a b"
+            assert await client.delete("/rest/api/1.0/thing") is None
+
+        assert client.is_closed
+
+
+class TestClientIntegration:
+    """Test the async client hooks on the service clients."""
+
+    def test_jira_client_get_async_client_is_cached(self):
+        """Test that JiraClient creates one async client and reuses it."""
+        from mcp_atlassian.jira.client import JiraClient
+
+        config = JiraConfig(
+            url="https://jira.example.com",
+            auth_type="pat",
+            personal_token="token",
+            http_backend="async",
+        )
+        with patch("mcp_atlassian.jira.client.Jira"):
+            client = JiraClient(config=config)
+
+        async_client = client.get_async_client()
+
+        assert client.uses_async_backend is True
+        assert client.get_async_client() is async_client
+        assert async_client.base_url == "https://jira.example.com"
+
+    @pytest.mark.anyio
+    async def test_jira_batch_get_issues_uses_async_backend(self):
+        """Test that batch issue fetches go through the async client."""
+        from mcp_atlassian.jira import JiraFetcher
+
+        def bulkfetch(request: httpx.Request) -> httpx.Response:
+            payload = json.loads(request.content)
+            return httpx.Response(
+                200,
+                json={
+                    "issues": [
+                        {"id": key.split("-")[1], "key": key, "fields": {}}
+                        for key in reversed(payload["issueIdsOrKeys"])
+                    ]
+                },
+            )
+
+        config = JiraConfig(
+            url="https://test.atlassian.net",
+            auth_type="pat",
+            personal_token="token",
+            http_backend="async",
+        )
+        with patch("mcp_atlassian.jira.client.Jira"):
+            fetcher = JiraFetcher(config=config)
+        fetcher.jira.resource_url.side_effect = lambda r: f"rest/api/2/{r}"
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return bulkfetch(request)
+
+        fetcher._async_client = create_async_client(
+            "jira", config, transport=httpx.MockTransport(handler)
+        )
+        keys = [f"PROJ-{i}" for i in range(1, 6)]
+
+        result = await fetcher.get_issues_by_key_async(
+            keys, fields="summary", chunk_size=2
+        )
+
+        assert list(result) == keys
+        assert [issue.key for issue in result.values()] == keys
+        assert len(requests) == 3
+        assert {r.url.path for r in requests} == {"/rest/api/2/issue/bulkfetch"}
+        assert all(r.headers["Authorization"] == "Bearer token" for r in requests)
+        fetcher.jira.post.assert_not_called()
+        await fetcher._async_client.aclose()
+
+    @pytest.mark.anyio
+    async def test_jira_batch_get_issues_async_authentication_error(self):
+        """Test that 401 responses of the async backend raise auth errors."""
+        from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
+        from mcp_atlassian.jira import JiraFetcher
+
+        config = JiraConfig(
+            url="https://jira.example.com",
+            auth_type="pat",
+            personal_token="token",
+            http_backend="async",
+        )
+        with patch("mcp_atlassian.jira.client.Jira"):
+            fetcher = JiraFetcher(config=config)
+        fetcher.jira.resource_url.side_effect = lambda r: f"rest/api/2/{r}"
+        recorder = Recorder(httpx.Response(401, json={}))
+        fetcher._async_client = create_async_client(
+            "jira", config, transport=recorder.transport
+        )
+
+        with pytest.raises(MCPAtlassianAuthenticationError):
+            await fetcher.get_issues_by_key_async(["PROJ-1"])
+
+        assert recorder.requests[0].url.path == "/rest/api/2/search"
+        await fetcher._async_client.aclose()
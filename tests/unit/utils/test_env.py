@@ -1,6 +1,8 @@
 """Tests for environment variable utility functions."""
 
 from mcp_atlassian.utils.env import (
+    get_env_float,
+    get_env_int,
     is_env_extended_truthy,
     is_env_ssl_verify,
     is_env_truthy,
@@ -215,3 +217,29 @@ class TestEdgeCases:
                 assert is_env_truthy("TEST_VAR") is False
                 assert is_env_extended_truthy("TEST_VAR") is False
             assert is_env_ssl_verify("TEST_VAR") is True  # Not in false values
+
+
+class TestGetEnvNumbers:
+    """Test the get_env_int and get_env_float functions."""
+
+    def test_unset_returns_default(self, monkeypatch):
+        """Test that the default is used when the variable is unset."""
+        monkeypatch.delenv("TEST_VAR", raising=False)
+        assert get_env_int("TEST_VAR", 7) == 7
+        assert get_env_float("TEST_VAR", 1.5) == 1.5
+
+    def test_valid_values_are_parsed(self, monkeypatch):
+        """Test that valid numbers are parsed."""
+        monkeypatch.setenv("TEST_VAR", "42")
+        assert get_env_int("TEST_VAR", 7) == 42
+        assert get_env_float("TEST_VAR", 1.5) == 42.0
+
+    def test_invalid_and_below_minimum_fall_back(self, monkeypatch):
+        """Test that invalid or too-small values fall back to the default."""
+        monkeypatch.setenv("TEST_VAR", "abc")
+        assert get_env_int("TEST_VAR", 7) == 7
+        assert get_env_float("TEST_VAR", 1.5) == 1.5
+
+        monkeypatch.setenv("TEST_VAR", "0")
+        assert get_env_int("TEST_VAR", 7, minimum=1) == 7
+        assert get_env_float("TEST_VAR", 1.5, minimum=0.5) == 1.5
@@ -0,0 +1,250 @@
+"""Tests for the worker pool utilities module."""
+
+import threading
+import time
+from unittest.mock import patch
+
+import anyio
+import pytest
+
+from mcp_atlassian.utils.executor import (
+    ExecutorConfig,
+    ExecutorRegistry,
+    ServiceExecutor,
+    get_config_from_env,
+    get_executor_registry,
+    run_blocking,
+    run_blocking_cancellable,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    """Reset the executor registry around each test."""
+    get_executor_registry().reset()
+    yield
+    get_executor_registry().reset()
+
+
+class TestGetConfigFromEnv:
+    """Test the get_config_from_env function."""
+
+    def test_default_values_no_env(self, monkeypatch):
+        """Test default values when no environment variables are set."""
+        monkeypatch.delenv("ATLASSIAN_MAX_WORKERS", raising=False)
+        monkeypatch.delenv("JIRA_MAX_WORKERS", raising=False)
+
+        assert get_config_from_env("jira").max_workers == 8
+
+    def test_global_env_var(self, monkeypatch):
+        """Test that the global environment variable is read."""
+        monkeypatch.setenv("ATLASSIAN_MAX_WORKERS", "4")
+
+        assert get_config_from_env().max_workers == 4
+
+    def test_service_specific_env_var_overrides_global(self, monkeypatch):
+        """Test that service-specific variables take precedence."""
+        monkeypatch.setenv("ATLASSIAN_MAX_WORKERS", "4")
+        monkeypatch.setenv("CONFLUENCE_MAX_WORKERS", "16")
+
+        assert get_config_from_env("confluence").max_workers == 16
+        assert get_config_from_env("jira").max_workers == 4
+
+    @pytest.mark.parametrize("value", ["invalid", "0", "-2"])
+    def test_invalid_env_values_use_default(self, monkeypatch, value):
+        """Test that invalid or non-positive values fall back to defaults."""
+        monkeypatch.setenv("ATLASSIAN_MAX_WORKERS", value)
+
+        with patch("mcp_atlassian.utils.executor.logger") as mock_logger:
+            assert get_config_from_env().max_workers == 8
+            mock_logger.warning.assert_called_once()
+
+
+class TestServiceExecutor:
+    """Test the ServiceExecutor class."""
+
+    @pytest.mark.anyio
+    async def test_run_returns_result_and_passes_arguments(self):
+        """Test that run forwards positional and keyword arguments."""
+        executor = ServiceExecutor("jira", ExecutorConfig(max_workers=2))
+
+        result = await executor.run(lambda a, b=0: a + b, 1, b=2)
+
+        assert result == 3
+        stats = executor.get_stats()
+        assert stats.submitted == 1
+        assert stats.completed == 1
+        assert stats.active == 0
+        assert stats.queued == 0
+
+    @pytest.mark.anyio
+    async def test_run_executes_off_event_loop_thread(self):
+        """Test that blocking calls run in a worker thread."""
+        executor = ServiceExecutor("jira", ExecutorConfig())
+        loop_thread = threading.get_ident()
+
+        worker_thread = await executor.run(threading.get_ident)
+
+        assert worker_thread != loop_thread
+
+    @pytest.mark.anyio
+    async def test_run_propagates_exceptions(self):
+        """Test that exceptions from the callable are raised and counted."""
+        executor = ServiceExecutor("jira", ExecutorConfig())
+
+        def fail() -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            await executor.run(fail)
+
+        stats = executor.get_stats()
+        assert stats.failed == 1
+        assert stats.completed == 0
+        assert stats.active == 0
+
+    @pytest.mark.anyio
+    async def test_concurrency_is_bounded(self):
+        """Test that no more than max_workers calls run at once."""
+        executor = ServiceExecutor("jira", ExecutorConfig(max_workers=2))
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def work() -> None:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(6):
+                tg.start_soon(executor.run, work)
+
+        assert peak == 2
+        stats = executor.get_stats()
+        assert stats.completed == 6
+        assert stats.max_wait_time > 0
+        assert stats.avg_wait_time > 0
+
+    @pytest.mark.anyio
+    async def test_run_cancellable_returns_on_cancel(self):
+        """Test that a cancelled call does not wait for its worker thread."""
+        executor = ServiceExecutor("jira", ExecutorConfig())
+        release = threading.Event()
+
+        start = time.monotonic()
+        with anyio.move_on_after(0.1):
+            await executor.run_cancellable(release.wait, 5)
+        elapsed = time.monotonic() - start
+        release.set()
+
+        assert elapsed < 2
+
+    @pytest.mark.anyio
+    async def test_abandoned_thread_keeps_its_slot(self):
+        """Test that an abandoned call still occupies its worker until it ends."""
+        executor = ServiceExecutor("jira", ExecutorConfig(max_workers=1))
+        release = threading.Event()
+
+        with anyio.move_on_after(0.1):
+            await executor.run_cancellable(release.wait, 5)
+
+        with anyio.move_on_after(0.2) as scope:
+            await executor.run_cancellable(lambda: "next")
+        assert scope.cancelled_caught
+        assert executor.get_stats().active == 1
+
+        release.set()
+        with anyio.fail_after(2):
+            assert await executor.run_cancellable(lambda: "next") == "next"
+            assert await executor.run(lambda: "again") == "again"
+
+    @pytest.mark.anyio
+    async def test_cancelled_before_start_releases_slot(self):
+        """Test that a call cancelled while queued does not leak its slot."""
+        executor = ServiceExecutor("jira", ExecutorConfig(max_workers=1))
+
+        with anyio.CancelScope() as scope:
+            scope.cancel()
+            await executor.run_cancellable(lambda: "never")
+
+        with anyio.fail_after(2):
+            assert await executor.run_cancellable(lambda: "next") == "next"
+        assert executor.get_stats().queued == 0
+
+    @pytest.mark.anyio
+    async def test_blocking_call_does_not_stall_event_loop(self):
+        """Test that other tasks keep running while a call blocks."""
+        executor = ServiceExecutor("jira", ExecutorConfig())
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            for _ in range(5):
+                await anyio.sleep(0.01)
+                ticks += 1
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(ticker)
+            await executor.run(time.sleep, 0.2)
+
+        assert ticks == 5
+
+    def test_stats_to_dict(self):
+        """Test the dictionary form of the stats snapshot."""
+        executor = ServiceExecutor("jira", ExecutorConfig(max_workers=3))
+
+        stats = executor.get_stats().to_dict()
+
+        assert stats["max_workers"] == 3
+        assert stats["queued"] == 0
+        assert stats["avg_wait_time"] == 0.0
+
+
+class TestExecutorRegistry:
+    """Test the ExecutorRegistry class."""
+
+    def test_singleton(self):
+        """Test that the registry is a singleton."""
+        assert ExecutorRegistry() is get_executor_registry()
+
+    def test_get_executor_is_per_service_and_case_insensitive(self):
+        """Test that each service gets one shared executor."""
+        registry = get_executor_registry()
+
+        jira = registry.get_executor("JIRA")
+
+        assert registry.get_executor("jira") is jira
+        assert registry.get_executor("confluence") is not jira
+
+    def test_configure_replaces_executor(self):
+        """Test that configure applies to existing and future executors."""
+        registry = get_executor_registry()
+        original = registry.get_executor("jira")
+
+        registry.configure("jira", ExecutorConfig(max_workers=3))
+        registry.configure("bitbucket", ExecutorConfig(max_workers=5))
+
+        assert registry.get_executor("jira") is not original
+        assert registry.get_executor("jira").config.max_workers == 3
+        assert registry.get_executor("bitbucket").config.max_workers == 5
+
+    @pytest.mark.anyio
+    async def test_run_blocking_uses_service_executor(self):
+        """Test that run_blocking routes calls through the service pool."""
+        result = await run_blocking("confluence", max, 1, 5, key=abs)
+
+        assert result == 5
+        stats = get_executor_registry().get_stats()
+        assert stats["confluence"].completed == 1
+        assert "jira" not in stats
+
+    @pytest.mark.anyio
+    async def test_run_blocking_cancellable_uses_service_executor(self):
+        """Test that run_blocking_cancellable routes calls through the pool."""
+        assert await run_blocking_cancellable("bitbucket", min, 3, 4) == 3
+        assert get_executor_registry().get_stats()["bitbucket"].completed == 1
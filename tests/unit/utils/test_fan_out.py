@@ -0,0 +1,121 @@
+"""Tests for the fan-out utilities module."""
+
+import threading
+import time
+
+import anyio
+import pytest
+
+from mcp_atlassian.utils.executor import (
+    get_executor_registry,
+    run_blocking_cancellable,
+)
+from mcp_atlassian.utils.fan_out import (
+    DEFAULT_BRANCH_TIMEOUT,
+    fan_out,
+    get_branch_timeout,
+    get_max_concurrency,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    """Reset the executor registry around each test."""
+    get_executor_registry().reset()
+    yield
+    get_executor_registry().reset()
+
+
+def returning(value):
+    """Build an async branch returning a value."""
+
+    async def branch():
+        return value
+
+    return branch
+
+
+class TestFanOut:
+    """Test the fan_out function."""
+
+    @pytest.mark.anyio
+    async def test_results_keep_branch_order(self):
+        """Test that results are returned in the order of the branches."""
+
+        async def slow():
+            await anyio.sleep(0.05)
+            return "slow"
+
+        results = await fan_out([("a", slow), ("b", returning("fast"))])
+
+        assert [(r.name, r.value, r.ok) for r in results] == [
+            ("a", "slow", True),
+            ("b", "fast", True),
+        ]
+
+    @pytest.mark.anyio
+    async def test_errors_are_captured_per_branch(self):
+        """Test that a failing branch does not affect the others."""
+
+        async def failing():
+            raise RuntimeError("repository gone")
+
+        failed, succeeded = await fan_out([("a", failing), ("b", returning(1))])
+
+        assert failed.error == "repository gone"
+        assert not failed.ok
+        assert not failed.timed_out
+        assert succeeded.value == 1
+        assert failed.to_dict() == {
+            "branch": "a",
+            "error": "repository gone",
+            "timed_out": False,
+        }
+
+    @pytest.mark.anyio
+    async def test_concurrency_is_bounded(self):
+        """Test that no more than max_concurrency branches run at once."""
+        running = 0
+        peak = 0
+
+        async def branch():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await anyio.sleep(0.02)
+            running -= 1
+
+        await fan_out([(str(n), branch) for n in range(10)], max_concurrency=3)
+
+        assert peak == 3
+
+    @pytest.mark.anyio
+    async def test_timeout_abandons_blocking_call(self):
+        """Test that a timed out branch returns while its request still runs."""
+        release = threading.Event()
+
+        async def stuck():
+            return await run_blocking_cancellable("bitbucket", release.wait, 5)
+
+        start = time.monotonic()
+        stuck_result, other = await fan_out(
+            [("stuck", stuck), ("other", returning("ok"))], timeout=0.1
+        )
+        release.set()
+
+        assert time.monotonic() - start < 2
+        assert stuck_result.timed_out
+        assert stuck_result.error == "Timed out after 0.1s"
+        assert other.value == "ok"
+
+
+def test_config_from_env(monkeypatch):
+    """Test the concurrency and timeout settings."""
+    monkeypatch.delenv("ATLASSIAN_FANOUT_MAX_CONCURRENCY", raising=False)
+    monkeypatch.delenv("ATLASSIAN_FANOUT_BRANCH_TIMEOUT", raising=False)
+    assert get_branch_timeout() == DEFAULT_BRANCH_TIMEOUT
+
+    monkeypatch.setenv("ATLASSIAN_FANOUT_MAX_CONCURRENCY", "4")
+    monkeypatch.setenv("ATLASSIAN_FANOUT_BRANCH_TIMEOUT", "0")
+    assert get_max_concurrency() == 4
+    assert get_branch_timeout() is None
@@ -0,0 +1,226 @@
+"""Tests for the pagination utilities module."""
+
+import json
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import anyio
+import pytest
+
+from mcp_atlassian.utils.executor import get_executor_registry
+from mcp_atlassian.utils.paging import (
+    collect_results,
+    iter_paged,
+    next_offset,
+    stream_chunks,
+    stream_results,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    """Reset the executor registry around each test."""
+    get_executor_registry().reset()
+    yield
+    get_executor_registry().reset()
+
+
+def offset_fetcher(total: int, calls: list):
+    """Build a fetch_page callable over the items 0..total-1, paged by offset."""
+
+    def fetch_page(start: int, limit: int):
+        calls.append((start, limit))
+        items = list(range(start, min(start + limit, total)))
+        return items, next_offset(start, len(items), total, is_last=False)
+
+    return fetch_page
+
+
+class TestIterPaged:
+    """Test the iter_paged function."""
+
+    def test_follows_pages_until_the_end(self):
+        """Test that all pages are requested and their items yielded in order."""
+        calls = []
+
+        items = list(iter_paged(offset_fetcher(5, calls), 0, page_size=2))
+
+        assert items == [0, 1, 2, 3, 4]
+        assert calls == [(0, 2), (2, 2), (4, 2)]
+
+    def test_max_items_limits_requests(self):
+        """Test that the budget caps the last request and stops paging."""
+        calls = []
+
+        items = list(
+            iter_paged(offset_fetcher(100, calls), 0, page_size=4, max_items=6)
+        )
+
+        assert items == [0, 1, 2, 3, 4, 5]
+        assert calls == [(0, 4), (4, 2)]
+
+    def test_pages_are_fetched_lazily(self):
+        """Test that a page is only requested once its items are needed."""
+        calls = []
+        items = iter_paged(offset_fetcher(10, calls), 0, page_size=3)
+
+        assert calls == []
+        assert [next(items) for _ in range(3)] == [0, 1, 2]
+        assert calls == [(0, 3)]
+        next(items)
+        assert calls == [(0, 3), (3, 3)]
+
+    def test_token_cursor(self):
+        """Test paging with opaque tokens and an empty first cursor."""
+        pages = {"": (["a", "b"], "t1"), "t1": (["c"], None)}
+        fetch_page = MagicMock(side_effect=lambda token, limit: pages[token])
+
+        assert list(iter_paged(fetch_page, "", page_size=2)) == ["a", "b", "c"]
+        assert fetch_page.call_count == 2
+
+    def test_empty_page_stops(self):
+        """Test that an empty page ends the iteration even with a cursor."""
+        fetch_page = MagicMock(return_value=([], 10))
+
+        assert list(iter_paged(fetch_page, 0, page_size=10)) == []
+        fetch_page.assert_called_once_with(0, 10)
+
+
+@pytest.mark.parametrize(
+    ("start", "count", "total", "is_last", "expected"),
+    [
+        (0, 50, 120, False, 50),
+        (100, 20, 120, False, None),
+        (0, 50, None, False, 50),
+        (0, 50, None, True, None),
+        (50, 0, None, False, None),
+    ],
+)
+def test_next_offset(start, count, total, is_last, expected):
+    """Test the start index of the next page."""
+    assert next_offset(start, count, total, is_last=is_last) == expected
+
+
+class TestStreamChunks:
+    """Test the stream_chunks function."""
+
+    @pytest.mark.anyio
+    async def test_handles_chunks_in_order(self):
+        """Test that every item is handled once, in chunks of the given size."""
+        handled = []
+
+        async def handle(chunk):
+            handled.append(chunk)
+
+        count = await stream_chunks("jira", iter(range(5)), 2, handle)
+
+        assert count == 5
+        assert handled == [[0, 1], [2, 3], [4]]
+
+    @pytest.mark.anyio
+    async def test_prefetches_next_chunk(self):
+        """Test that the next page is fetched while a chunk is being handled."""
+        second_page_fetched = threading.Event()
+
+        def fetch_page(start, limit):
+            if start == 2:
+                second_page_fetched.set()
+            items = list(range(start, min(start + limit, 4)))
+            return items, next_offset(start, len(items), 4, is_last=False)
+
+        async def handle(chunk):
+            if chunk == [0, 1]:
+                with anyio.fail_after(5):
+                    while not second_page_fetched.is_set():
+                        await anyio.sleep(0.01)
+
+        items = iter_paged(fetch_page, 0, page_size=2)
+
+        assert await stream_chunks("jira", items, 2, handle) == 4
+
+    @pytest.mark.anyio
+    async def test_iterator_error_is_unwrapped(self):
+        """Test that an error raised while paging is raised as is."""
+
+        def items():
+            yield 1
+            raise ValueError("page failed")
+
+        with pytest.raises(ValueError, match="page failed"):
+            await stream_chunks("jira", items(), 1, AsyncMock())
+
+    @pytest.mark.anyio
+    async def test_handler_error_is_unwrapped(self):
+        """Test that an error raised by the handler is raised as is."""
+        handle = AsyncMock(side_effect=RuntimeError("send failed"))
+
+        with pytest.raises(RuntimeError, match="send failed"):
+            await stream_chunks("jira", iter(range(10)), 2, handle)
+        handle.assert_awaited_once()
+
+
+class TestStreamResults:
+    """Test the stream_results function."""
+
+    @staticmethod
+    def make_ctx(progress_token):
+        ctx = MagicMock()
+        ctx.request_context.meta.progressToken = progress_token
+        ctx.report_progress = AsyncMock()
+        return ctx
+
+    @staticmethod
+    def models(count):
+        return iter(
+            [
+                MagicMock(to_simplified_dict=MagicMock(return_value={"n": n}))
+                for n in range(count)
+            ]
+        )
+
+    @pytest.mark.anyio
+    async def test_streams_chunks_as_progress(self):
+        """Test that chunks are sent as progress notifications when requested."""
+        ctx = self.make_ctx("token-1")
+
+        result = await stream_results(ctx, "jira", self.models(3), 2, 3)
+
+        assert result == {
+            "count": 3,
+            "chunks": 2,
+            "streamed": True,
+            "max_items_reached": True,
+        }
+        calls = ctx.report_progress.await_args_list
+        assert [call.args[0] for call in calls] == [2, 3]
+        assert json.loads(calls[0].kwargs["message"]) == [{"n": 0}, {"n": 1}]
+        assert json.loads(calls[1].kwargs["message"]) == [{"n": 2}]
+
+    @pytest.mark.anyio
+    async def test_returns_items_without_progress_token(self):
+        """Test that items are returned when the client did not ask for progress."""
+        ctx = self.make_ctx(None)
+
+        result = await stream_results(ctx, "jira", self.models(3), 2, 10)
+
+        assert result == {
+            "count": 3,
+            "chunks": 2,
+            "streamed": False,
+            "max_items_reached": False,
+            "items": [{"n": 0}, {"n": 1}, {"n": 2}],
+        }
+        ctx.report_progress.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_collect_results():
+    """Test that the simplified items of every chunk are returned in order."""
+    items = iter(
+        [
+            MagicMock(to_simplified_dict=MagicMock(return_value={"n": n}))
+            for n in range(5)
+        ]
+    )
+
+    assert await collect_results("bitbucket", items, 2) == [{"n": n} for n in range(5)]
@@ -1,10 +1,14 @@
 """Tests for the rate limiting utilities module."""
 
 import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
 from unittest.mock import MagicMock, patch
 
+import anyio
 import pytest
 from requests import PreparedRequest, Response, Session
+from requests.structures import CaseInsensitiveDict
 
 from mcp_atlassian.utils.rate_limit import (
     RateLimitConfig,
@@ -12,8 +16,12 @@ from mcp_atlassian.utils.rate_limit import (
     RateLimiterRegistry,
     TokenBucket,
     configure_rate_limiting,
+    get_backoff_delay,
     get_config_from_env,
     get_rate_limiter_registry,
+    get_retry_after,
+    parse_rate_limit_reset,
+    parse_retry_after,
 )
 
 
@@ -203,6 +211,228 @@ class TestTokenBucket:
         # Should have waited approximately 0.02s
         assert elapsed >= 0.01
 
+    def test_reserve_schedules_consecutive_slots(self):
+        """Test that reservations are spaced by the refill interval."""
+        config = RateLimitConfig(burst_capacity=1, requests_per_second=10.0)
+        bucket = TokenBucket(config)
+
+        waits = [bucket.reserve() for _ in range(4)]
+
+        assert waits[0] == 0.0
+        assert waits[1] == pytest.approx(0.1, abs=0.01)
+        assert waits[2] == pytest.approx(0.2, abs=0.01)
+        assert waits[3] == pytest.approx(0.3, abs=0.01)
+        assert bucket.try_acquire() is False
+
+    def test_cancel_reservation_returns_slot(self):
+        """Test that a cancelled reservation frees its slot."""
+        config = RateLimitConfig(burst_capacity=1, requests_per_second=10.0)
+        bucket = TokenBucket(config)
+        bucket.reserve()
+        bucket.reserve()
+
+        bucket.cancel_reservation()
+
+        assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+
+    @pytest.mark.anyio
+    async def test_acquire_async_waiters_sleep_concurrently(self):
+        """Test that async waiters do not queue behind one another."""
+        config = RateLimitConfig(burst_capacity=1, requests_per_second=20.0)
+        bucket = TokenBucket(config)
+        finished: list[float] = []
+        start_time = time.monotonic()
+
+        async def worker() -> None:
+            await bucket.acquire_async()
+            finished.append(time.monotonic() - start_time)
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(5):
+                tg.start_soon(worker)
+
+        # 1 immediate token plus 4 slots at 20 RPS: about 0.2s in total
+        assert len(finished) == 5
+        assert max(finished) >= 0.15
+        assert max(finished) < 0.5
+
+    @pytest.mark.anyio
+    async def test_acquire_async_cancelled_releases_reservation(self):
+        """Test that cancelling a waiting task hands its slot back."""
+        config = RateLimitConfig(burst_capacity=1, requests_per_second=1.0)
+        bucket = TokenBucket(config)
+        bucket.try_acquire()
+
+        with anyio.move_on_after(0.01):
+            await bucket.acquire_async()
+
+        # The slot ~1s out was released rather than left reserved
+        assert bucket.get_wait_time() < 1.0
+
+
+class TestRetryHeaderParsing:
+    """Test parsing of Retry-After and X-RateLimit-Reset headers."""
+
+    def test_retry_after_http_date(self):
+        """Test that HTTP-date Retry-After values are converted to seconds."""
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+        delay = parse_retry_after(format_datetime(retry_at, usegmt=True))
+
+        assert delay == pytest.approx(30, abs=2)
+
+    def test_retry_after_date_in_past(self):
+        """Test that dates in the past mean no delay."""
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_beta_retry_after_fallback(self):
+        """Test that Beta-Retry-After is used when Retry-After is absent."""
+        headers = CaseInsensitiveDict({"beta-retry-after": "12"})
+
+        assert get_retry_after(headers) == 12.0
+        assert get_retry_after(CaseInsensitiveDict({"Retry-After": "3"})) == 3.0
+
+    def test_rate_limit_reset_iso_timestamp(self):
+        """Test parsing the ISO 8601 reset timestamp sent by Jira Cloud."""
+        reset_at = datetime.now(timezone.utc) + timedelta(seconds=60)
+
+        reset_in = parse_rate_limit_reset(reset_at.strftime("%Y-%m-%dT%H:%M:%SZ"))
+
+        assert reset_in == pytest.approx(60, abs=2)
+
+    def test_rate_limit_reset_epoch_and_invalid(self):
+        """Test epoch seconds and unparseable reset values."""
+        assert parse_rate_limit_reset(str(time.time() + 10)) == pytest.approx(10, abs=1)
+        assert parse_rate_limit_reset("soon") is None
+        assert parse_rate_limit_reset(None) is None
+
+
+class TestAdaptiveRateLimiting:
+    """Test adaptive tuning of the token bucket refill rate."""
+
+    @staticmethod
+    def make_bucket(**kwargs) -> TokenBucket:
+        config = RateLimitConfig(
+            requests_per_second=10.0,
+            adaptive=True,
+            min_requests_per_second=1.0,
+            max_requests_per_second=20.0,
+            **kwargs,
+        )
+        return TokenBucket(config)
+
+    def test_observe_is_noop_when_not_adaptive(self):
+        """Test that static configurations ignore response headers."""
+        bucket = TokenBucket(RateLimitConfig())
+
+        bucket.observe(429, CaseInsensitiveDict({"Retry-After": "5"}))
+
+        assert bucket.rate == 10.0
+        assert bucket.get_wait_time() == 0.0
+
+    def test_additive_increase_on_success(self):
+        """Test that successful responses raise the rate up to the ceiling."""
+        bucket = self.make_bucket(additive_increase=1.0)
+
+        bucket.observe(200, CaseInsensitiveDict())
+        assert bucket.rate == 11.0
+
+        for _ in range(20):
+            bucket.observe(200, CaseInsensitiveDict())
+        assert bucket.rate == 20.0
+
+    def test_multiplicative_decrease_on_429(self):
+        """Test that 429 responses halve the rate and defer new requests."""
+        bucket = self.make_bucket()
+
+        bucket.observe(
+            429,
+            CaseInsensitiveDict(
+                {"Retry-After": "2", "RateLimit-Reason": "jira-quota-global-based"}
+            ),
+        )
+
+        assert bucket.rate == 5.0
+        assert bucket.get_wait_time() == pytest.approx(2.0, abs=0.05)
+
+    def test_rate_never_drops_below_floor(self):
+        """Test that repeated throttling stops at min_requests_per_second."""
+        bucket = self.make_bucket()
+
+        for _ in range(10):
+            bucket.observe(429, CaseInsensitiveDict())
+
+        assert bucket.rate == 1.0
+
+    def test_remaining_quota_sets_rate(self):
+        """Test that the remaining quota is spread over the reset window."""
+        bucket = self.make_bucket()
+        reset_at = datetime.now(timezone.utc) + timedelta(seconds=100)
+
+        bucket.observe(
+            200,
+            CaseInsensitiveDict(
+                {
+                    "X-RateLimit-Remaining": "300",
+                    "X-RateLimit-Reset": reset_at.isoformat(),
+                }
+            ),
+        )
+
+        assert bucket.rate == pytest.approx(3.0, abs=0.2)
+
+    def test_near_limit_decreases_rate(self):
+        """Test that X-RateLimit-NearLimit is treated as a throttling signal."""
+        bucket = self.make_bucket()
+
+        bucket.observe(200, CaseInsensitiveDict({"X-RateLimit-NearLimit": "true"}))
+
+        assert bucket.rate == 5.0
+
+    def test_adapter_feeds_responses_to_bucket(self):
+        """Test that RateLimitedAdapter reports responses in adaptive mode."""
+        bucket = self.make_bucket(additive_increase=1.0)
+        adapter = RateLimitedAdapter(bucket)
+        request = MagicMock(spec=PreparedRequest)
+        request.url = "https://example.com/api"
+        response = MagicMock(spec=Response)
+        response.status_code = 200
+        response.headers = CaseInsensitiveDict()
+
+        with patch.object(
+            adapter.__class__.__bases__[0], "send", return_value=response
+        ):
+            adapter.send(request)
+
+        assert bucket.rate == 11.0
+
+    def test_adaptive_env_vars(self, monkeypatch):
+        """Test that adaptive settings are read from the environment."""
+        monkeypatch.setenv("ATLASSIAN_RATE_LIMIT_ADAPTIVE", "true")
+        monkeypatch.setenv("JIRA_RATE_LIMIT_MAX_RPS", "50")
+        monkeypatch.setenv("ATLASSIAN_RATE_LIMIT_MIN_RPS", "2")
+
+        config = get_config_from_env("jira")
+
+        assert config.adaptive is True
+        assert config.max_requests_per_second == 50.0
+        assert config.min_requests_per_second == 2.0
+        assert get_config_from_env("confluence").max_requests_per_second == 100.0
+
+
+class TestGetBackoffDelay:
+    """Test the get_backoff_delay function."""
+
+    def test_retry_after_takes_precedence(self):
+        """Test that a server-provided delay is used as-is."""
+        assert get_backoff_delay(RateLimitConfig(), 3, retry_after=7.0) == 7.0
+
+    def test_exponential_backoff(self):
+        """Test exponential backoff from backoff_base."""
+        config = RateLimitConfig(backoff_base=0.5)
+
+        assert [get_backoff_delay(config, n) for n in (1, 2, 3)] == [0.5, 1.0, 2.0]
+
 
 class TestRateLimitedAdapter:
     """Test the RateLimitedAdapter class."""
@@ -0,0 +1,318 @@
+"""Tests for the shared rate limit backends."""
+
+import multiprocessing
+import sys
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from requests import Session
+
+from mcp_atlassian.utils.rate_limit import (
+    DistributedTokenBucket,
+    RateLimitConfig,
+    RateLimitedAdapter,
+    TokenBucket,
+    configure_rate_limiting,
+    get_rate_limiter_registry,
+)
+from mcp_atlassian.utils.rate_limit_backends import (
+    RedisBackend,
+    SharedMemoryBackend,
+    apply_bucket_op,
+    get_backend_from_env,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    """Reset the rate limiter registry around each test."""
+    get_rate_limiter_registry().reset()
+    yield
+    get_rate_limiter_registry().reset()
+
+
+@pytest.fixture
+def shared_backend(tmp_path):
+    """Shared-memory backend in a temporary directory."""
+    backend = SharedMemoryBackend(tmp_path)
+    yield backend
+    backend.close()
+
+
+@pytest.fixture
+def redis_server():
+    """Local Redis stand-in with Lua scripting support."""
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    return fakeredis.FakeServer()
+
+
+def make_redis_backend(server, **kwargs) -> RedisBackend:
+    """Create a Redis backend connected to the stand-in server."""
+    import fakeredis
+
+    return RedisBackend(client=fakeredis.FakeRedis(server=server), **kwargs)
+
+
+def _take_tokens(directory: str, attempts: int, queue) -> None:
+    """Child process: try to take tokens from the shared bucket."""
+    backend = SharedMemoryBackend(directory)
+    taken = 0
+    for _ in range(attempts):
+        before, after = backend.execute("jira", 0.001, 10.0, "try")
+        taken += after < before
+    backend.close()
+    queue.put(taken)
+
+
+class TestApplyBucketOp:
+    """Test the reference bucket operation."""
+
+    def test_refill_is_capped(self):
+        """Test that refilling never exceeds capacity."""
+        assert apply_bucket_op(1.0, 0.0, 100.0, 10.0, 5.0, "peek", 1.0) == (5.0, 5.0)
+
+    @pytest.mark.parametrize(
+        ("tokens", "op", "amount", "expected"),
+        [
+            (0.5, "reserve", 1.0, -0.5),
+            (0.5, "try", 1.0, 0.5),
+            (2.0, "try", 1.0, 1.0),
+            (4.5, "refund", 1.0, 5.0),
+            (3.0, "cap", -2.0, -2.0),
+            (-3.0, "cap", 1.0, -3.0),
+        ],
+    )
+    def test_operations(self, tokens, op, amount, expected):
+        """Test each operation on a bucket without elapsed time."""
+        before, after = apply_bucket_op(tokens, 0.0, 0.0, 10.0, 5.0, op, amount)
+
+        assert before == tokens
+        assert after == pytest.approx(expected)
+
+
+class TestSharedMemoryBackend:
+    """Test the shared-memory backend."""
+
+    def test_new_bucket_starts_full(self, shared_backend):
+        """Test that an unused bucket starts at capacity."""
+        assert shared_backend.execute("jira", 1.0, 5.0, "reserve") == (5.0, 4.0)
+
+    def test_state_is_shared_between_instances(self, shared_backend, tmp_path):
+        """Test that two backends on the same directory share one bucket."""
+        other = SharedMemoryBackend(tmp_path)
+        try:
+            shared_backend.execute("jira", 0.001, 2.0, "reserve")
+            shared_backend.execute("jira", 0.001, 2.0, "reserve")
+
+            before, after = other.execute("jira", 0.001, 2.0, "try")
+        finally:
+            other.close()
+
+        assert before == pytest.approx(0.0, abs=0.01)
+        assert after == before
+
+    def test_keys_are_independent(self, shared_backend):
+        """Test that services get separate buckets."""
+        shared_backend.execute("jira", 0.001, 1.0, "reserve")
+
+        assert shared_backend.execute("confluence", 0.001, 1.0, "try")[1] == 0.0
+
+    def test_reset(self, shared_backend):
+        """Test that reset makes the bucket full again."""
+        shared_backend.execute("jira", 0.001, 3.0, "reserve", 3.0)
+        shared_backend.reset("jira")
+
+        assert shared_backend.execute("jira", 0.001, 3.0, "peek")[0] == 3.0
+
+    @pytest.mark.skipif(
+        sys.platform != "linux", reason="uses fork to start processes quickly"
+    )
+    def test_processes_share_one_budget(self, tmp_path):
+        """Test that concurrent processes never exceed the shared budget."""
+        context = multiprocessing.get_context("fork")
+        queue = context.Queue()
+        processes = [
+            context.Process(target=_take_tokens, args=(str(tmp_path), 8, queue))
+            for _ in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=10)
+
+        taken = sum(queue.get(timeout=5) for _ in processes)
+
+        assert taken == 10
+
+
+class TestRedisBackend:
+    """Test the Redis backend against a local stand-in server."""
+
+    def test_replicas_share_one_budget(self, redis_server):
+        """Test that backends on separate connections share a bucket."""
+        replica_a = make_redis_backend(redis_server)
+        replica_b = make_redis_backend(redis_server)
+
+        taken = 0
+        for backend in (replica_a, replica_b) * 5:
+            before, after = backend.execute("jira", 0.001, 6.0, "try")
+            taken += after < before
+
+        assert taken == 6
+
+    def test_key_prefix_isolates_deployments(self, redis_server):
+        """Test that different key prefixes use different buckets."""
+        first = make_redis_backend(redis_server, key_prefix="tenant-a")
+        second = make_redis_backend(redis_server, key_prefix="tenant-b")
+
+        first.execute("jira", 0.001, 1.0, "reserve")
+
+        assert second.execute("jira", 0.001, 1.0, "try")[1] == 0.0
+
+    def test_bucket_expires_and_resets(self, redis_server):
+        """Test that bucket keys get a TTL and reset deletes them."""
+        backend = make_redis_backend(redis_server)
+        backend.execute("jira", 10.0, 5.0, "reserve")
+
+        assert backend.client.pttl("mcp-atlassian:ratelimit:jira") > 0
+
+        backend.reset("jira")
+        assert backend.client.exists("mcp-atlassian:ratelimit:jira") == 0
+
+    def test_requires_url_or_client(self):
+        """Test that a URL or client is required."""
+        with pytest.raises(ValueError, match="requires a URL"):
+            RedisBackend()
+
+
+class TestDistributedTokenBucket:
+    """Test token buckets backed by a shared backend."""
+
+    def test_reservations_use_shared_state(self, shared_backend):
+        """Test that two buckets on one backend schedule shared slots."""
+        config = RateLimitConfig(requests_per_second=10.0, burst_capacity=1)
+        first = DistributedTokenBucket(config, shared_backend, "jira")
+        second = DistributedTokenBucket(config, shared_backend, "jira")
+
+        assert first.reserve() == 0.0
+        assert second.reserve() == pytest.approx(0.1, abs=0.01)
+        assert first.try_acquire() is False
+        assert second.get_wait_time() > 0.1
+
+        second.cancel_reservation()
+        assert first.get_wait_time() == pytest.approx(0.1, abs=0.01)
+
+    def test_defer_applies_to_all_replicas(self, shared_backend):
+        """Test that a deferral seen by one replica holds back the others."""
+        config = RateLimitConfig(requests_per_second=10.0, burst_capacity=5)
+        first = DistributedTokenBucket(config, shared_backend, "jira")
+        second = DistributedTokenBucket(config, shared_backend, "jira")
+
+        first.defer(2.0)
+
+        assert second.reserve() == pytest.approx(2.0, abs=0.05)
+
+    def test_falls_back_to_local_state_on_backend_error(self):
+        """Test that backend failures do not block requests."""
+        backend = MagicMock()
+        backend.name = "redis"
+        backend.execute.side_effect = ConnectionError("down")
+        bucket = DistributedTokenBucket(
+            RateLimitConfig(burst_capacity=2), backend, "jira"
+        )
+
+        with patch("mcp_atlassian.utils.rate_limit.logger") as mock_logger:
+            assert bucket.try_acquire() is True
+            assert bucket.reserve() == 0.0
+            assert bucket.try_acquire() is False
+
+        mock_logger.warning.assert_called_once()
+
+    @pytest.mark.anyio
+    async def test_acquire_async_runs_backend_off_event_loop(self, shared_backend):
+        """Test that backend I/O for async callers runs in a worker thread."""
+        loop_thread = threading.current_thread()
+        threads: list[threading.Thread] = []
+        execute = shared_backend.execute
+
+        def recording_execute(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return execute(*args, **kwargs)
+
+        shared_backend.execute = recording_execute
+        config = RateLimitConfig(requests_per_second=100.0, burst_capacity=1)
+        bucket = DistributedTokenBucket(config, shared_backend, "jira")
+
+        await bucket.acquire_async()
+        await bucket.observe_async(429, {"Retry-After": "0.01"})
+
+        assert len(threads) == 1
+        assert threads[0] is not loop_thread
+
+        config.adaptive = True
+        await bucket.observe_async(429, {"Retry-After": "0.01"})
+
+        assert len(threads) == 2
+        assert threads[1] is not loop_thread
+
+
+class TestBackendSelection:
+    """Test selecting a backend through the registry."""
+
+    def test_default_is_in_memory(self, monkeypatch):
+        """Test that limiters are process-local by default."""
+        monkeypatch.delenv("ATLASSIAN_RATE_LIMIT_BACKEND", raising=False)
+
+        limiter = get_rate_limiter_registry().get_limiter("jira")
+
+        assert type(limiter) is TokenBucket
+
+    def test_env_selects_shared_backend(self, monkeypatch, tmp_path):
+        """Test that ATLASSIAN_RATE_LIMIT_BACKEND selects the backend."""
+        monkeypatch.setenv("ATLASSIAN_RATE_LIMIT_BACKEND", "shared")
+        monkeypatch.setenv("ATLASSIAN_RATE_LIMIT_SHM_DIR", str(tmp_path))
+
+        limiter = get_rate_limiter_registry().get_limiter("jira")
+
+        assert isinstance(limiter, DistributedTokenBucket)
+        assert isinstance(limiter.backend, SharedMemoryBackend)
+        assert limiter.key == "jira"
+        limiter.backend.close()
+
+    @pytest.mark.parametrize("value", ["redis", "carrier-pigeon"])
+    def test_invalid_backend_config_falls_back(self, monkeypatch, value):
+        """Test that a misconfigured backend falls back to in-memory."""
+        monkeypatch.setenv("ATLASSIAN_RATE_LIMIT_BACKEND", value)
+        monkeypatch.delenv("ATLASSIAN_RATE_LIMIT_REDIS_URL", raising=False)
+
+        assert get_backend_from_env() is None
+
+    def test_configure_rate_limiting_selects_backend(self, shared_backend):
+        """Test that configure_rate_limiting can select a backend."""
+        registry = get_rate_limiter_registry()
+        existing = registry.get_limiter("confluence")
+        session = Session()
+
+        configure_rate_limiting(session, "jira", backend=shared_backend)
+
+        adapter = session.get_adapter("https://example.com")
+        assert isinstance(adapter, RateLimitedAdapter)
+        assert isinstance(adapter.rate_limiter, DistributedTokenBucket)
+        assert adapter.rate_limiter.backend is shared_backend
+        # Limiters created earlier are moved onto the backend too
+        assert registry.get_limiter("confluence") is not existing
+        assert isinstance(registry.get_limiter("confluence"), DistributedTokenBucket)
+
+    def test_set_backend_applies_to_mounted_sessions(self, shared_backend):
+        """Test that sessions configured earlier use a backend selected later."""
+        session = Session()
+        configure_rate_limiting(session, "jira")
+        adapter = session.get_adapter("https://example.com")
+        assert type(adapter.rate_limiter) is TokenBucket
+
+        get_rate_limiter_registry().set_backend(shared_backend)
+
+        assert isinstance(adapter.rate_limiter, DistributedTokenBucket)
+        assert adapter.rate_limiter.backend is shared_backend
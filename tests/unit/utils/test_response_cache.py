@@ -0,0 +1,477 @@
+"""Tests for the read-through response cache."""
+
+import io
+import json
+import os
+import stat
+
+import pytest
+from requests import PreparedRequest, Response, Session
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from mcp_atlassian.utils.rate_limit import (
+    RateLimitConfig,
+    RateLimitedAdapter,
+    TokenBucket,
+)
+from mcp_atlassian.utils.response_cache import (
+    CACHE_STATUS_HEADER,
+    CachingAdapter,
+    ResponseCache,
+    ResponseCacheConfig,
+    configure_response_cache,
+    find_rule,
+    get_config_from_env,
+    get_response_cache,
+    invalidate_cached_responses,
+    reset_response_cache,
+    resource_tags,
+)
+
+JIRA = "https://jira.example.com"
+ISSUE_URL = f"{JIRA}/rest/api/2/issue/PROJ-1"
+
+
+class ScriptedAdapter(BaseAdapter):
+    """Adapter that records requests and replays scripted responses."""
+
+    def __init__(self, *responses: tuple) -> None:
+        super().__init__()
+        self.responses = list(responses)
+        self.requests: list[PreparedRequest] = []
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        self.requests.append(request)
+        status, body, headers = (
+            self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+        )
+        response = Response()
+        response.status_code = status
+        response._content = (
+            body if isinstance(body, bytes) else json.dumps(body).encode()
+        )
+        response.raw = io.BytesIO(response._content)
+        response.headers = CaseInsensitiveDict(headers)
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def issue(updated: str = "2024-01-01T00:00:00.000+0000", **fields) -> dict:
+    """Jira issue body."""
+    return {"id": "10001", "key": "PROJ-1", "fields": {"updated": updated, **fields}}
+
+
+def make_session(
+    adapter: BaseAdapter, cache: ResponseCache, service: str = "jira"
+) -> Session:
+    """Session with the scripted adapter wrapped by the cache."""
+    session = Session()
+    session.mount("https://", adapter)
+    configure_response_cache(session, service, cache=cache)
+    return session
+
+
+@pytest.fixture
+def cache() -> ResponseCache:
+    """Memory-only cache."""
+    return ResponseCache(ResponseCacheConfig(enabled=True))
+
+
+@pytest.fixture
+def stale_cache() -> ResponseCache:
+    """Memory-only cache whose entries are stale as soon as they are stored."""
+    return ResponseCache(
+        ResponseCacheConfig(enabled=True, ttl_overrides={"issue": 0, "page": 0})
+    )
+
+
+@pytest.fixture(autouse=True)
+def reset_global_cache():
+    """Forget the process-wide cache around each test."""
+    reset_response_cache()
+    yield
+    reset_response_cache()
+
+
+class TestRules:
+    """Test cache rule and resource identity matching."""
+
+    @pytest.mark.parametrize(
+        ("service", "path", "resource"),
+        [
+            ("jira", "/rest/api/2/issue/PROJ-1", "issue"),
+            ("jira", "/jira/rest/api/3/issue/PROJ-1/comment", "issue_detail"),
+            ("jira", "/rest/api/2/search", None),
+            ("confluence", "/wiki/rest/api/content/123", "page"),
+            ("confluence", "/rest/api/content/search", None),
+            (
+                "bitbucket",
+                "/rest/api/1.0/projects/P/repos/r/pull-requests/5",
+                "pull_request",
+            ),
+            (
+                "bitbucket",
+                "/2.0/repositories/ws/r/pullrequests/5/diff",
+                "pull_request_detail",
+            ),
+            ("bitbucket", "/2.0/repositories/ws/r/pullrequests/5/merge", None),
+        ],
+    )
+    def test_find_rule(self, service, path, resource):
+        """Test which paths are cacheable."""
+        rule = find_rule(service, path)
+
+        assert (rule.resource if rule else None) == resource
+
+    def test_resource_tags(self):
+        """Test that sub-resources share the identity of their parent."""
+        assert resource_tags("jira", "/rest/api/2/issue/PROJ-1/comment") == {
+            "jira:issue:PROJ-1"
+        }
+        assert resource_tags(
+            "bitbucket", "/rest/api/1.0/projects/P/repos/r/pull-requests/5/merge"
+        ) == {"bitbucket:pull_request:P/r/5"}
+        assert resource_tags("jira", "/rest/api/2/issueLink") == set()
+
+
+class TestCachingAdapter:
+    """Test read-through caching in the adapter."""
+
+    def test_repeated_get_served_from_cache(self, cache):
+        """Test that a repeated read does not reach the server."""
+        server = ScriptedAdapter((200, issue(), {"Content-Type": "application/json"}))
+        session = make_session(server, cache)
+
+        first = session.get(ISSUE_URL)
+        second = session.get(ISSUE_URL)
+
+        assert len(server.requests) == 1
+        assert second.json() == first.json() == issue()
+        assert second.headers[CACHE_STATUS_HEADER] == "hit"
+        assert CACHE_STATUS_HEADER not in first.headers
+
+    def test_uncacheable_requests_pass_through(self, cache):
+        """Test that searches and error responses are not cached."""
+        server = ScriptedAdapter(
+            (200, {"issues": []}, {}),
+            (200, {"issues": []}, {}),
+            (404, {"errorMessages": ["nope"]}, {}),
+        )
+        session = make_session(server, cache)
+
+        session.get(f"{JIRA}/rest/api/2/search?jql=project=PROJ")
+        session.get(f"{JIRA}/rest/api/2/search?jql=project=PROJ")
+        session.get(ISSUE_URL)
+        session.get(ISSUE_URL)
+
+        assert len(server.requests) == 4
+
+    def test_no_store_and_large_bodies_are_not_cached(self):
+        """Test that no-store responses and oversized bodies are skipped."""
+        cache = ResponseCache(ResponseCacheConfig(enabled=True, max_entry_bytes=100))
+        server = ScriptedAdapter(
+            (200, issue(), {"Cache-Control": "no-store"}),
+            (200, issue(description="x" * 200), {}),
+        )
+        session = make_session(server, cache)
+
+        for _ in range(2):
+            session.get(ISSUE_URL)
+        session.get(ISSUE_URL)
+
+        assert len(server.requests) == 3
+
+    def test_credential_scopes_are_separate(self, cache):
+        """Test that users never share cached responses."""
+        server = ScriptedAdapter((200, issue(), {}))
+        session = make_session(server, cache)
+
+        session.get(ISSUE_URL, headers={"Authorization": "Bearer alice"})
+        session.get(ISSUE_URL, headers={"Authorization": "Bearer bob"})
+        session.get(ISSUE_URL, headers={"Authorization": "Bearer alice"})
+
+        assert len(server.requests) == 2
+
+    def test_etag_revalidation(self, stale_cache):
+        """Test that stale entries are revalidated with If-None-Match."""
+        server = ScriptedAdapter(
+            (200, issue(), {"ETag": '"v1"'}),
+            (304, b"", {"ETag": '"v1"'}),
+        )
+        session = make_session(server, stale_cache)
+
+        session.get(ISSUE_URL)
+        response = session.get(ISSUE_URL)
+
+        assert server.requests[1].headers["If-None-Match"] == '"v1"'
+        assert response.status_code == 200
+        assert response.json() == issue()
+        assert response.headers[CACHE_STATUS_HEADER] == "revalidated"
+
+    def test_etag_revalidation_with_changed_resource(self, stale_cache):
+        """Test that a changed resource replaces the cached response."""
+        changed = issue(summary="changed")
+        server = ScriptedAdapter(
+            (200, issue(), {"ETag": '"v1"'}),
+            (200, changed, {"ETag": '"v2"'}),
+            (304, b"", {}),
+        )
+        session = make_session(server, stale_cache)
+
+        session.get(ISSUE_URL)
+        assert session.get(ISSUE_URL).json() == changed
+        response = session.get(ISSUE_URL)
+
+        assert server.requests[2].headers["If-None-Match"] == '"v2"'
+        assert response.json() == changed
+
+    def test_updated_probe_revalidation(self, stale_cache):
+        """Test that entries without ETag are revalidated by their updated field."""
+        full = issue(description="long text")
+        server = ScriptedAdapter(
+            (200, full, {}),
+            (200, issue(), {}),
+        )
+        session = make_session(server, stale_cache)
+
+        session.get(f"{ISSUE_URL}?expand=renderedFields")
+        response = session.get(f"{ISSUE_URL}?expand=renderedFields")
+
+        assert server.requests[1].url == f"{ISSUE_URL}?fields=updated"
+        assert response.json() == full
+        assert response.headers[CACHE_STATUS_HEADER] == "revalidated"
+
+    def test_updated_probe_detects_change(self, stale_cache):
+        """Test that a newer updated timestamp triggers a full fetch."""
+        server = ScriptedAdapter(
+            (200, issue(), {}),
+            (200, issue(updated="2024-02-01T00:00:00.000+0000"), {}),
+            (200, issue(updated="2024-02-01T00:00:00.000+0000", summary="new"), {}),
+        )
+        session = make_session(server, stale_cache)
+
+        session.get(ISSUE_URL)
+        response = session.get(ISSUE_URL)
+
+        assert len(server.requests) == 3
+        assert response.json()["fields"]["summary"] == "new"
+
+    def test_wrapped_adapter_attributes_are_exposed(self, cache):
+        """Test that the rate limiter of the wrapped adapter stays reachable."""
+        limiter = TokenBucket(RateLimitConfig())
+        adapter = CachingAdapter(RateLimitedAdapter(limiter), cache, "jira")
+
+        assert adapter.rate_limiter is limiter
+
+
+class TestInvalidation:
+    """Test invalidation by write requests."""
+
+    def test_write_invalidates_resource(self, cache):
+        """Test that updating an issue drops its cached reads only."""
+        server = ScriptedAdapter((200, {"fields": {}}, {}))
+        session = make_session(server, cache)
+        other_url = f"{JIRA}/rest/api/2/issue/PROJ-2"
+        session.get(ISSUE_URL)
+        session.get(f"{ISSUE_URL}/comment")
+        session.get(other_url)
+
+        session.put(ISSUE_URL, json={"fields": {"summary": "new"}})
+        session.get(ISSUE_URL)
+        session.get(f"{ISSUE_URL}/comment")
+        session.get(other_url)
+
+        paths = [r.path_url for r in server.requests if r.method == "GET"]
+        assert paths.count("/rest/api/2/issue/PROJ-1") == 2
+        assert paths.count("/rest/api/2/issue/PROJ-1/comment") == 2
+        assert paths.count("/rest/api/2/issue/PROJ-2") == 1
+
+    def test_write_by_key_invalidates_read_by_id(self, cache):
+        """Test that entries are tagged with the ids found in their body."""
+        server = ScriptedAdapter((200, issue(), {}))
+        session = make_session(server, cache)
+        session.get(f"{JIRA}/rest/api/2/issue/10001")
+
+        session.post(f"{ISSUE_URL}/comment", json={"body": "hi"})
+        session.get(f"{JIRA}/rest/api/2/issue/10001")
+
+        assert len(server.requests) == 3
+
+    def test_unidentified_write_clears_service(self, cache):
+        """Test that writes to unknown resources clear the whole service."""
+        jira = ScriptedAdapter((200, issue(), {}))
+        confluence = ScriptedAdapter((200, {"id": "123", "version": {"number": 1}}, {}))
+        jira_session = make_session(jira, cache)
+        confluence_session = make_session(confluence, cache, "confluence")
+        page_url = "https://wiki.example.com/rest/api/content/123"
+        jira_session.get(ISSUE_URL)
+        confluence_session.get(page_url)
+
+        jira_session.post(f"{JIRA}/rest/api/2/issueLink", json={})
+        jira_session.get(ISSUE_URL)
+        confluence_session.get(page_url)
+
+        assert len(jira.requests) == 3
+        assert len(confluence.requests) == 1
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "/rest/api/3/search/approximate-count",
+            "/rest/api/3/search/jql",
+            "/rest/api/2/search",
+            "/rest/api/3/issue/bulkfetch",
+            "/rest/api/3/changelog/bulkfetch",
+        ],
+    )
+    def test_read_only_post_keeps_entries(self, cache, path):
+        """Test that searches and counts sent as POST invalidate nothing."""
+        server = ScriptedAdapter((200, issue(), {}))
+        session = make_session(server, cache)
+        session.get(ISSUE_URL)
+        session.get(f"{ISSUE_URL}/comment")
+
+        session.post(f"{JIRA}{path}", json={"jql": "project = PROJ"})
+        session.get(ISSUE_URL)
+        session.get(f"{ISSUE_URL}/comment")
+
+        assert [r.method for r in server.requests] == ["GET", "GET", "POST"]
+
+    def test_failed_write_keeps_entries(self, cache):
+        """Test that failed writes do not invalidate anything."""
+        server = ScriptedAdapter((200, issue(), {}), (400, {"errors": {}}, {}))
+        session = make_session(server, cache)
+        session.get(ISSUE_URL)
+
+        session.put(ISSUE_URL, json={})
+        session.get(ISSUE_URL)
+
+        assert len(server.requests) == 2
+
+    def test_invalidate_cached_responses_uses_global_cache(self):
+        """Test invalidation of writes sent outside a caching session."""
+        cache = get_response_cache()
+        server = ScriptedAdapter((200, issue(), {}))
+        session = make_session(server, cache)
+        session.get(ISSUE_URL)
+
+        invalidate_cached_responses("jira", "DELETE", ISSUE_URL)
+        session.get(ISSUE_URL)
+
+        assert len(server.requests) == 2
+
+
+class TestSQLiteTier:
+    """Test the on-disk tier."""
+
+    def test_entries_shared_between_caches(self, tmp_path):
+        """Test that caches on one database share entries and invalidations."""
+        path = tmp_path / "responses.db"
+        config = ResponseCacheConfig(enabled=True, path=str(path))
+        first, second = ResponseCache(config), ResponseCache(config)
+        server = ScriptedAdapter((200, issue(), {"ETag": '"v1"'}))
+        try:
+            make_session(server, first).get(ISSUE_URL)
+            response = make_session(server, second).get(ISSUE_URL)
+
+            assert response.headers[CACHE_STATUS_HEADER] == "hit"
+            assert response.headers["ETag"] == '"v1"'
+            assert response.json() == issue()
+            assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+            first.invalidate("jira", {"jira:issue:PROJ-1"})
+            second.clear()
+            make_session(server, second).get(ISSUE_URL)
+            assert len(server.requests) == 2
+        finally:
+            first.close()
+            second.close()
+
+    def test_invalidation_reaches_memory_tier_of_other_caches(self, tmp_path):
+        """Test that a write in one process is not hidden by another's memory."""
+        config = ResponseCacheConfig(enabled=True, path=str(tmp_path / "r.db"))
+        first, second = ResponseCache(config), ResponseCache(config)
+        other = {"id": "10002", "key": "PROJ-2", "fields": {}}
+        server = ScriptedAdapter(
+            (200, issue(), {}), (200, other, {}), (200, issue(), {})
+        )
+        other_url = f"{JIRA}/rest/api/2/issue/PROJ-2"
+        try:
+            session = make_session(server, second)
+            session.get(ISSUE_URL)
+            make_session(server, first).get(other_url)
+
+            first.invalidate("jira", {"jira:issue:PROJ-1"})
+            response = session.get(ISSUE_URL)
+
+            assert response.headers.get(CACHE_STATUS_HEADER) != "hit"
+            assert len(server.requests) == 3
+            # The process that invalidated keeps its unrelated memory entries
+            assert len(first._memory) == 1
+        finally:
+            first.close()
+            second.close()
+
+    def test_unusable_path_falls_back_to_memory(self, tmp_path):
+        """Test that a bad database path does not break caching."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+
+        cache = ResponseCache(
+            ResponseCacheConfig(enabled=True, path=str(blocker / "responses.db"))
+        )
+
+        assert cache.store is None
+
+
+class TestConfig:
+    """Test configuration from the environment."""
+
+    def test_disabled_by_default(self, monkeypatch):
+        """Test that sessions are left alone unless the cache is enabled."""
+        monkeypatch.delenv("ATLASSIAN_RESPONSE_CACHE", raising=False)
+        monkeypatch.delenv("JIRA_RESPONSE_CACHE", raising=False)
+        session = Session()
+
+        configure_response_cache(session, "jira")
+
+        assert not any(isinstance(a, CachingAdapter) for a in session.adapters.values())
+
+    def test_service_override(self, monkeypatch):
+        """Test that the service switch overrides the global one."""
+        monkeypatch.setenv("ATLASSIAN_RESPONSE_CACHE", "true")
+        monkeypatch.setenv("BITBUCKET_RESPONSE_CACHE", "false")
+
+        assert get_config_from_env("jira").enabled is True
+        assert get_config_from_env("bitbucket").enabled is False
+
+    def test_settings(self, monkeypatch):
+        """Test size, path and TTL overrides."""
+        monkeypatch.setenv("ATLASSIAN_RESPONSE_CACHE_SIZE", "64")
+        monkeypatch.setenv("ATLASSIAN_RESPONSE_CACHE_PATH", "/tmp/cache.db")
+        monkeypatch.setenv("ATLASSIAN_RESPONSE_CACHE_TTLS", "issue=5, Page=10,bad")
+
+        config = get_config_from_env()
+
+        assert config.max_entries == 64
+        assert config.path == "/tmp/cache.db"
+        assert config.ttl_overrides == {"issue": 5.0, "page": 10.0}
+
+    def test_enabled_session_is_wrapped(self, monkeypatch):
+        """Test that every mounted adapter is wrapped once."""
+        monkeypatch.setenv("JIRA_RESPONSE_CACHE", "true")
+        session = Session()
+
+        configure_response_cache(session, "jira")
+        configure_response_cache(session, "jira")
+
+        adapter = session.get_adapter(ISSUE_URL)
+        assert isinstance(adapter, CachingAdapter)
+        assert not isinstance(adapter.inner, CachingAdapter)
+        assert adapter.cache is get_response_cache()